@@ -16,14 +16,7 @@ from trading_agent.backtest.models import BacktestConfig
 from trading_agent.backtest.status import equity_deployment, last_trade_date, summarize_cycles
 from trading_agent.config import config_summary, get_config, validate_config
 from trading_agent.models import serialize_for_json
-from trading_agent.storage import (
-    AnalysisConfigStore,
-    PreferencesStore,
-    RebalanceConfigStore,
-    SignalConfigStore,
-    StrategyConfigStore,
-    WatchlistStore,
-)
+from trading_agent.storage import load_config_bundle
 
 LOG_DIR = Path("logs")
 
@@ -52,12 +45,13 @@ def _load_json_arg(raw: Optional[str]) -> Dict[str, Any]:
 
 
 def build_config_from_stores(args) -> BacktestConfig:
-    preferences = PreferencesStore().load_preferences().to_dict()
-    analysis_params = AnalysisConfigStore().load()
-    strategy_params = StrategyConfigStore().load()
-    rebalance_params = RebalanceConfigStore().load()
-    signal_config = SignalConfigStore().load_config().to_dict()
-    watchlist = WatchlistStore().load_watchlist()
+    bundle = load_config_bundle()
+    preferences = bundle.preferences.to_dict()
+    analysis_params = bundle.analysis_params
+    strategy_params = bundle.strategy_params
+    rebalance_params = bundle.rebalance_params
+    signal_config = bundle.signal_config.to_dict()
+    watchlist = bundle.watchlist
 
     strategy_params = {**strategy_params, **_load_json_arg(args.override_strategy)}
     analysis_params = {**analysis_params, **_load_json_arg(args.override_analysis)}
@@ -92,6 +86,7 @@ def build_config_from_stores(args) -> BacktestConfig:
         llm_fallback_model=app_config.llm_fallback_model,
         llm_max_retries=app_config.llm_max_retries,
         llm_pause_seconds=args.llm_pause_seconds,
+        decision_policy=getattr(args, "policy", "llm"),
     )
 
 
@@ -206,6 +201,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.0,
         help="Sleep between LLM rebalance cycles to reduce rate-limit pressure",
     )
+    parser.add_argument(
+        "--policy",
+        choices=["llm", "rules"],
+        default="llm",
+        help=(
+            "Decision policy: the LLM agent (default) or the rule-based surrogate "
+            "(no LLM calls; fast screening proxy, see trading_agent.backtest.surrogate)"
+        ),
+    )
     parser.add_argument("--override-strategy", help="JSON object merged into strategy params")
     parser.add_argument("--override-analysis", help="JSON object merged into analysis params")
     parser.add_argument("--override-preferences", help="JSON object merged into preferences")
@@ -215,6 +219,11 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="ARTIFACT",
         help="Compare two or more saved backtest JSON artifacts",
     )
+    parser.add_argument(
+        "--no-result-store",
+        action="store_true",
+        help="Do not index this run in logs/sweep_results.sqlite3 (cross-sweep result store)",
+    )
     parser.add_argument(
         "--feedback",
         nargs="?",
@@ -258,10 +267,10 @@ def main() -> None:
         parser.error("--start and --end are required unless using --compare or --feedback ARTIFACT")
 
     try:
-        if not args.prefetch_only:
+        if not args.prefetch_only and args.policy == "llm":
             validate_config(app_config)
     except ValueError as exc:
-        # Prefetch can run with only Alpaca/Finnhub keys; full run needs LLM config.
+        # Prefetch and rules runs need only Alpaca/Finnhub keys; LLM runs need LLM config.
         if not args.prefetch_only:
             logger.error("Configuration error: %s", exc)
             raise SystemExit(1) from exc
@@ -287,6 +296,11 @@ def main() -> None:
     logger.info("Backtest artifact saved to %s", artifact)
     print_summary(payload)
     print(f"Artifact: {artifact}")
+    if not args.no_result_store:
+        from strategy_learning.sweep.operator_cli import record_result
+        from strategy_learning.sweep.result_store import STORE_FILENAME, SweepResultStore
+
+        record_result(SweepResultStore(LOG_DIR / STORE_FILENAME), artifact, kind="backtest")
 
     if args.feedback is not None:
         from strategy_learning.knowledge import (
@@ -6,7 +6,6 @@ from __future__ import annotations
 import argparse
 import json
 import logging
-from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -18,19 +17,32 @@ from strategy_learning.retrospection import (
     mark_consumed,
 )
 from strategy_learning.sweep import (
+    MAX_UNBUDGETED_GRID,
+    SEARCH_STRATEGIES,
     ParamSweepRunner,
     config_snapshot_from_sections,
+    open_sweep_checkpoint,
 )
 from strategy_learning.sweep.operator_cli import (
     LOG_DIR,
+    CandidateBacktest,
+    add_planner_arguments,
+    add_result_store_arguments,
+    add_walk_forward_arguments,
+    apply_walk_forward,
     default_sweep_window,
     load_json_arg,
+    open_result_store,
     parse_date,
-    save_backtest_artifact,
+    parse_max_workers,
+    planner_kwargs_from_args,
+    record_result,
     save_sweep_artifact,
+    search_from_args,
     setup_logging,
+    sweep_checkpoint_root,
+    walk_forward_backtest,
 )
-from trading_agent.backtest.engine import BacktestEngine
 from trading_agent.backtest.models import BacktestConfig
 from trading_agent.config import config_summary, get_config, validate_config
 from trading_agent.models import serialize_for_json
@@ -146,7 +158,89 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--override-strategy", help="JSON object merged into baseline strategy params")
     parser.add_argument("--override-analysis", help="JSON object merged into analysis params")
     parser.add_argument("--override-preferences", help="JSON object merged into baseline preferences")
-    parser.add_argument("--max-workers", type=int, default=1)
+    parser.add_argument(
+        "--max-workers",
+        type=parse_max_workers,
+        default=1,
+        help="Parallel candidate backtests, or 'auto' to meet --deadline within --rate-limit-rpm",
+    )
+    add_planner_arguments(parser)
+    add_walk_forward_arguments(parser)
+    add_result_store_arguments(parser)
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process", "lockstep"],
+        default="thread",
+        help=(
+            "Overlap candidates with threads or worker processes (with --max-workers >1), "
+            "or run them in lockstep over one day loop"
+        ),
+    )
+    parser.add_argument(
+        "--search",
+        choices=list(SEARCH_STRATEGIES),
+        default="oat",
+        help=(
+            "Candidate search: oat (one field at a time), grid (all combinations, or "
+            "--grid-fraction of them), random, or tpe (samples near the best results so far)"
+        ),
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help=(
+            "Max candidate backtests (baseline extra); required for random / tpe "
+            f"and for grids over {MAX_UNBUDGETED_GRID} configs"
+        ),
+    )
+    parser.add_argument(
+        "--grid-fraction",
+        type=float,
+        default=1.0,
+        help="Balanced fraction of the full grid to run, e.g. 0.25 (default 1 = full grid)",
+    )
+    parser.add_argument(
+        "--search-fields",
+        help="Comma-separated section.key fields to search (default: the whole whitelist)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random / tpe search seed")
+    parser.add_argument(
+        "--halving-rungs",
+        type=int,
+        default=0,
+        help=(
+            "Successive halving: score candidates on N shorter prefixes of the period "
+            "first and only run the best 1/--halving-eta of each rung further (default 0 = off)"
+        ),
+    )
+    parser.add_argument(
+        "--halving-eta",
+        type=int,
+        default=3,
+        help="Keep the top 1/ETA candidates at each halving rung (default 3)",
+    )
+    parser.add_argument(
+        "--screen-top",
+        type=int,
+        default=0,
+        metavar="K",
+        help=(
+            "Screen all candidates with the rule-based surrogate policy (no LLM) first "
+            "and run only the top K as LLM backtests (default 0 = off)"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="?",
+        const=True,
+        default=None,
+        metavar="SWEEP_ID",
+        help=(
+            "Continue an interrupted sweep from logs/sweeps/: finished backtests are "
+            "skipped and partial ones continue from their last rebalance date. "
+            "Without SWEEP_ID, the newest unfinished sweep with the same baseline config"
+        ),
+    )
     parser.add_argument(
         "--write-kb",
         action="store_true",
@@ -170,6 +264,10 @@ def resolve_trigger_path(args) -> Path:
         if not path.exists():
             raise SystemExit(f"Trigger not found: {path}")
         return path
+    if getattr(args, "resume", None):
+        interrupted = list_trigger_paths(LOG_DIR, status="in_progress")
+        if interrupted:
+            return interrupted[0]
     pending = list_trigger_paths(LOG_DIR, status="pending")
     if not pending:
         raise SystemExit("No pending retrospection triggers in logs/")
@@ -177,10 +275,13 @@ def resolve_trigger_path(args) -> Path:
 
 
 def run_sweep_for_trigger(args, trigger_path: Path, logger: logging.Logger) -> None:
-    try:
-        claim_trigger(trigger_path)
-    except ValueError as exc:
-        raise SystemExit(str(exc)) from exc
+    resume = getattr(args, "resume", None)
+    # A crashed run leaves its trigger in_progress; --resume picks it back up.
+    if not (resume and load_trigger(trigger_path).status == "in_progress"):
+        try:
+            claim_trigger(trigger_path)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
 
     trigger = load_trigger(trigger_path)
     base = build_base_config(args)
@@ -197,24 +298,33 @@ def run_sweep_for_trigger(args, trigger_path: Path, logger: logging.Logger) -> N
     baseline_snapshot["start"] = base.start.isoformat()
     baseline_snapshot["end"] = base.end.isoformat()
 
-    def run_backtest(config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
-        cfg = deepcopy(base)
-        cfg.run_label = run_label
-        cfg.strategy_params = dict(config_snapshot.get("strategy_params") or {})
-        cfg.preferences = dict(config_snapshot.get("preferences") or {})
-        cfg.rebalance_params = dict(config_snapshot.get("rebalance_params") or {})
-        result = BacktestEngine().run(cfg)
-        payload = result.to_dict()
-        artifact = save_backtest_artifact(payload, run_label, log_dir=LOG_DIR)
-        payload["artifact_path"] = str(artifact)
-        logger.info("Candidate artifact %s → %s", run_label, artifact)
-        return payload
+    try:
+        apply_walk_forward(args, baseline_snapshot)
+        search = search_from_args(args, baseline_snapshot)
+        checkpoint = open_sweep_checkpoint(
+            sweep_checkpoint_root(LOG_DIR),
+            baseline_snapshot,
+            run_label=args.run_label,
+            resume=resume,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    logger.info("Sweep checkpoint: %s", checkpoint.directory)
 
+    result_store = open_result_store(args, base, log_dir=LOG_DIR)
     runner = ParamSweepRunner(
         knowledge_base=KnowledgeBase() if args.write_kb else None,
-        run_backtest=run_backtest,
+        run_backtest=walk_forward_backtest(
+            args, CandidateBacktest(base, log_dir=LOG_DIR, checkpoint_dir=checkpoint.engine_dir)
+        ),
         max_workers=args.max_workers,
         rebalance_frequency=args.rebalance,
+        executor=args.executor,
+        halving_rungs=args.halving_rungs,
+        halving_eta=args.halving_eta,
+        screen_top=args.screen_top,
+        result_store=result_store if getattr(args, "skip_evaluated", False) else None,
+        **planner_kwargs_from_args(args, log_dir=LOG_DIR),
     )
     result = runner.run(
         baseline_snapshot,
@@ -222,6 +332,8 @@ def run_sweep_for_trigger(args, trigger_path: Path, logger: logging.Logger) -> N
         period_end=base.end.isoformat(),
         run_label=args.run_label,
         write_kb=False,
+        checkpoint=checkpoint,
+        search=search,
     )
     payload = result.to_dict()
     artifact = save_sweep_artifact(payload, args.run_label, log_dir=LOG_DIR)
@@ -253,6 +365,7 @@ def run_sweep_for_trigger(args, trigger_path: Path, logger: logging.Logger) -> N
             json.dump(serialize_for_json(payload), f, indent=2)
             f.write("\n")
 
+    record_result(result_store, artifact)
     mark_consumed(
         trigger_path,
         sweep_artifact_path=str(artifact),
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Measure cold-start import time of the CLI entry points.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` so the
+numbers reflect a container restart or a one-off operator command. Heavy SDKs
+that a module should not load at import time are reported too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+
+ENTRY_POINTS = (
+    "run_account_history",
+    "run_agent",
+    "run_backtest",
+    "run_retrospection",
+    "run_sweep",
+    "trading_service",
+)
+
+# Provider SDKs that are only needed once a client is actually built.
+LAZY_SDKS = ("anthropic", "openai", "google.generativeai", "huggingface_hub")
+
+# A plain import statement: -X importtime does not report importlib.import_module().
+_PROBE = (
+    "import {module}; import json, sys; "
+    "print(json.dumps(sorted(m for m in json.loads(sys.argv[1]) if m in sys.modules)))"
+)
+
+
+def measure(module: str, python: Optional[str] = None) -> Dict[str, object]:
+    """Cold-import ``module``; return total seconds, top self-time modules and loaded SDKs."""
+    proc = subprocess.run(
+        [
+            python or sys.executable, "-X", "importtime",
+            "-c", _PROBE.format(module=module), json.dumps(LAZY_SDKS),
+        ],
+        cwd=str(ROOT),
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+    rows = _parse_importtime(proc.stderr)
+    total_us = next((cum for name, _, cum in rows if name == module), 0)
+    slowest = sorted(rows, key=lambda r: r[1], reverse=True)[:5]
+    return {
+        "module": module,
+        "seconds": round(total_us / 1e6, 3),
+        "slowest": [{"module": name, "self_ms": round(us / 1e3, 1)} for name, us, _ in slowest],
+        "sdks_loaded": json.loads(proc.stdout.strip().splitlines()[-1]),
+    }
+
+
+def _parse_importtime(stderr: str) -> List[tuple]:
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold-start import time of CLI entry points")
+    parser.add_argument("modules", nargs="*", default=list(ENTRY_POINTS))
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Exit non-zero if any module takes longer (seconds)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = [measure(m) for m in args.modules]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            top = ", ".join(f"{s['module']} {s['self_ms']}ms" for s in r["slowest"][:3])
+            sdks = ", ".join(r["sdks_loaded"]) or "-"
+            print(f"{r['module']:<22} {r['seconds']:6.3f}s  sdks={sdks}  slowest: {top}")
+
+    if args.budget is not None:
+        over = [r["module"] for r in results if r["seconds"] > args.budget]
+        if over:
+            raise SystemExit(f"Over {args.budget}s budget: {', '.join(over)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Import knowledge_base.json into the SQLite KB engine (KB_BACKEND=sqlite)."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from strategy_learning.knowledge.sqlite_store import SqliteKnowledgeStore, import_json_file
+from trading_agent.storage.paths import get_data_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import a v1/v2 JSON KB into SQLite")
+    parser.add_argument("--data-dir", type=Path, help="Directory holding the KB files")
+    parser.add_argument("--source", type=Path, help="JSON file (default: <data-dir>/knowledge_base.json)")
+    parser.add_argument("--user-id", default="default")
+    parser.add_argument("--force", action="store_true", help="Overwrite an existing SQLite KB")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or get_data_dir()
+    source = args.source or data_dir / "knowledge_base.json"
+    if not source.exists():
+        raise SystemExit(f"Source not found: {source}")
+
+    store = SqliteKnowledgeStore(data_dir=data_dir, user_id=args.user_id)
+    if store.path.exists() and not args.force:
+        raise SystemExit(f"{store.path} already exists (use --force to replace it)")
+
+    counts = import_json_file(source, store)
+    summary = ", ".join(f"{name}={count}" for name, count in counts.items())
+    print(f"Imported {source} → {store.path} ({summary})")
+
+
+if __name__ == "__main__":
+    main()
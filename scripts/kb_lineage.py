@@ -52,8 +52,48 @@ def _format_event(event: Dict[str, Any], indent: str = "       ") -> List[str]:
     return lines
 
 
+def _format_history(kb: KnowledgeBase, record_id: str, indent: str) -> List[str]:
+    """Write history from the KB event log (KB_BACKEND=eventlog); empty otherwise."""
+    lines: List[str] = []
+    for entry in kb.history(record_id):
+        record = entry.get("record") or {}
+        detail = f"status={record['status']}" if record.get("status") else ""
+        lines.append(
+            f"{indent}  #{entry.get('seq')} {entry.get('at')} {entry.get('op')} {detail}".rstrip()
+        )
+    if lines:
+        lines.insert(0, f"{indent}history:")
+    return lines
+
+
+_KIND_LABELS = {
+    "lessons": "Lesson",
+    "backtest_validations": "BacktestValidation",
+    "config_recommendations": "ConfigRecommendation",
+    "promotions": "Promotion",
+}
+
+
+def _format_ancestors(kb: KnowledgeBase, record_id: str) -> List[str]:
+    """Full provenance chain (superseded recs, validations, lessons), one walk over the index."""
+    index = kb.index()
+    lines: List[str] = []
+    for step in kb.lineage(record_id):
+        record = index.get(step.record_id) or {}
+        status = f" ({record['status']})" if record.get("status") else ""
+        indent = "    " + "  " * (step.depth - 1)
+        lines.append(
+            f"{indent}└─ {_KIND_LABELS.get(step.collection, step.collection)} "
+            f"{step.record_id}{status} via {step.via}"
+        )
+    if lines:
+        lines.insert(0, "  ancestors:")
+    return lines
+
+
 def format_lineage(kb: KnowledgeBase, recommendation_id: str) -> str:
-    rec = kb.find_record(recommendation_id)
+    index = kb.index()
+    rec = index.get(recommendation_id)
     if rec is None:
         raise SystemExit(f"Record not found: {recommendation_id}")
 
@@ -61,11 +101,12 @@ def format_lineage(kb: KnowledgeBase, recommendation_id: str) -> str:
         f"ConfigRecommendation {rec.get('id')} ({rec.get('status')})",
         f"  summary: {rec.get('summary')}",
     ]
+    lines.extend(_format_history(kb, recommendation_id, indent="  "))
     provenance = rec.get("provenance") or {}
     lineage = provenance.get("kb_lineage") or {}
     vid = lineage.get("backtest_validation_id")
     if vid:
-        validation = kb.find_record(vid)
+        validation = index.get(vid)
         if validation:
             lines.append(f"  └─ BacktestValidation {vid}")
             lines.append(f"       summary: {validation.get('summary')}")
@@ -77,6 +118,7 @@ def format_lineage(kb: KnowledgeBase, recommendation_id: str) -> str:
             )
             trigger = (validation.get("provenance") or {}).get("trigger_event") or {}
             lines.extend(_format_event(trigger, indent="       "))
+            lines.extend(_format_history(kb, vid, indent="       "))
         else:
             lines.append(f"  └─ BacktestValidation {vid} (missing)")
 
@@ -89,6 +131,7 @@ def format_lineage(kb: KnowledgeBase, recommendation_id: str) -> str:
         lines.append("  └─ evidence")
         lines.extend(_format_event(event, indent="       "))
 
+    lines.extend(_format_ancestors(kb, recommendation_id))
     return "\n".join(lines)
 
 
@@ -96,11 +139,18 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="KB recommendation lineage")
     parser.add_argument("--recommendation-id", required=True)
     parser.add_argument("--data-dir", type=Path)
+    parser.add_argument(
+        "--backend",
+        choices=["json", "sqlite", "eventlog"],
+        help="KB storage engine (default: KB_BACKEND or json)",
+    )
     args = parser.parse_args()
 
     kb_kwargs = {}
     if args.data_dir:
         kb_kwargs["data_dir"] = args.data_dir
+    if args.backend:
+        kb_kwargs["backend"] = args.backend
     kb = KnowledgeBase(**kb_kwargs)
     print(format_lineage(kb, args.recommendation_id))
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Query backtest and sweep results across sweeps (logs/sweep_results.sqlite3).
+
+    python scripts/sweep_results.py ingest
+    python scripts/sweep_results.py query --param risk_management=aggressive \\
+        --since 2025-01-01 --until 2025-12-31 --order-by sharpe --limit 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from strategy_learning.sweep.result_store import ORDER_COLUMNS, STORE_FILENAME, SweepResultStore
+
+
+def _parse_param(value: str) -> tuple[str, str]:
+    key, sep, raw = value.partition("=")
+    if not sep or not key.strip():
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {value!r}")
+    return key.strip(), raw.strip()
+
+
+def _fmt(value: Any, pattern: str = "{:.3f}") -> str:
+    return "-" if value is None else pattern.format(value)
+
+
+def format_rows(rows: List[Dict[str, Any]]) -> str:
+    if not rows:
+        return "No matching runs."
+    lines = [
+        f"{'period':<23} {'sharpe':>7} {'alpha':>7} {'max_dd':>7} {'return':>7}  label",
+    ]
+    for row in rows:
+        period = f"{row['period_start'] or '?'}→{row['period_end'] or '?'}"
+        label = row.get("label") or row.get("run_id") or ""
+        if row.get("sweep_id"):
+            label += f" [{row['sweep_id']}]"
+        lines.append(
+            f"{period:<23} {_fmt(row['sharpe']):>7} {_fmt(row['alpha_vs_spy']):>7} "
+            f"{_fmt(row['max_drawdown'], '{:.1%}'):>7} {_fmt(row['total_return'], '{:.1%}'):>7}  {label}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cross-sweep backtest result store")
+    parser.add_argument("--log-dir", type=Path, default=Path("logs"), help="Artifact directory")
+    parser.add_argument("--db", type=Path, help=f"Store path (default: <log-dir>/{STORE_FILENAME})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("ingest", help="Index new or changed backtest_*.json / sweep_*.json artifacts")
+    query = sub.add_parser("query", help="Best runs matching params and a period range")
+    query.add_argument(
+        "--param",
+        action="append",
+        type=_parse_param,
+        default=[],
+        metavar="KEY=VALUE",
+        help="risk_management=aggressive or strategy_params.risk_management=aggressive (repeatable)",
+    )
+    query.add_argument("--since", help="Only runs starting on or after this date")
+    query.add_argument("--until", help="Only runs ending on or before this date")
+    query.add_argument("--order-by", choices=ORDER_COLUMNS, default="sharpe")
+    query.add_argument("--status", default="success", help="Run status filter ('' for any)")
+    query.add_argument("--limit", type=int, default=20)
+    query.add_argument("--no-ingest", action="store_true", help="Query without ingesting first")
+    query.add_argument("--json", action="store_true", help="Print matching rows as JSON")
+    args = parser.parse_args()
+
+    store = SweepResultStore(args.db or args.log_dir / STORE_FILENAME)
+    if args.command == "ingest" or not args.no_ingest:
+        counts = store.ingest_dir(args.log_dir)
+        if args.command == "ingest":
+            summary = ", ".join(f"{name}={count}" for name, count in counts.items())
+            print(f"Ingested {args.log_dir} → {store.path} ({summary})")
+            return
+
+    rows = store.query(
+        params=dict(args.param),
+        since=args.since,
+        until=args.until,
+        status=args.status or None,
+        order_by=args.order_by,
+        limit=args.limit,
+    )
+    if args.json:
+        print(json.dumps(rows, indent=2, default=str))
+    else:
+        print(format_rows(rows))
+
+
+if __name__ == "__main__":
+    main()
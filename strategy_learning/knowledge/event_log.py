@@ -0,0 +1,263 @@
+"""Append-only event log storage engine for the knowledge base.
+
+``KB_BACKEND=eventlog`` keeps ``knowledge_base.json`` as a periodically
+compacted snapshot and records every save as one JSON line in
+``knowledge_base.events.jsonl``::
+
+    {"seq": 12, "at": "...", "changes": [
+        {"op": "put", "collection": "lessons", "record": {...}},
+        {"op": "delete", "collection": "lessons", "id": "les-..."},
+        {"op": "derived_state", "value": {...}}]}
+
+A write is an O(1) append of the changes since the last load/save. Loading
+replays the log from the byte offset stored in the snapshot, and later loads
+only read the new tail. The log is never truncated, so it holds the full
+write history (``iter_events`` / ``record_history``).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from strategy_learning.knowledge.records import ensure_v2, utc_now_iso
+from trading_agent.storage.base import JsonFileStore
+
+logger = logging.getLogger(__name__)
+
+COLLECTIONS = (
+    "lessons",
+    "backtest_validations",
+    "config_recommendations",
+    "promotions",
+)
+DEFAULT_COMPACT_EVERY = 100
+
+
+class EventLogKnowledgeStore:
+    """Snapshot + JSON-lines event log with the ``JsonFileStore`` load/save contract."""
+
+    def __init__(
+        self,
+        filename: str = "knowledge_base.json",
+        data_dir: Optional[Path] = None,
+        example_dir: Optional[Path] = None,
+        compact_every: Optional[int] = None,
+        user_id: str = "default",
+    ):
+        self._snapshot = JsonFileStore(filename, data_dir=data_dir, example_dir=example_dir)
+        self.path = self._snapshot.path
+        self.log_path = self.path.with_name(f"{Path(filename).stem}.events.jsonl")
+        self.user_id = user_id
+        self.compact_every = compact_every or _env_int("KB_COMPACT_EVERY", DEFAULT_COMPACT_EVERY)
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._snapshot_signature: Optional[Tuple[int, ...]] = None
+        self._offset = 0
+        self._seq = 0
+        self._since_snapshot = 0
+
+    def ensure_exists(self) -> None:
+        self._snapshot.ensure_exists()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        with self._snapshot.locked():
+            yield
+
+    def signature(self) -> Optional[Tuple[int, ...]]:
+        snapshot = self._snapshot.signature()
+        if snapshot is None:
+            return None
+        try:
+            st = self.log_path.stat()
+            log = (st.st_ino, st.st_size)
+        except FileNotFoundError:
+            log = (0, 0)
+        return snapshot + log
+
+    def load(self) -> Dict[str, Any]:
+        self.ensure_exists()
+        with self._lock:
+            snapshot_signature = self._snapshot.signature()
+            if self._state is None or snapshot_signature != self._snapshot_signature:
+                self._load_snapshot()
+            self._replay_tail()
+            return copy.deepcopy(self._state)
+
+    def save(self, data: Dict[str, Any]) -> None:
+        """Append the difference between ``data`` and the last loaded state."""
+        with self._lock:
+            if self._state is None:
+                self._load_snapshot()
+            # Pick up writes from other processes first so our diff is minimal.
+            self._replay_tail()
+            new = ensure_v2(copy.deepcopy(data), user_id=self.user_id)
+            changes = diff_documents(self._state, new)
+            if not changes:
+                return
+            event = {"seq": self._seq + 1, "at": utc_now_iso(), "changes": changes}
+            self._append(event)
+            apply_changes(self._state, changes)
+            self._state["updated_at"] = data.get("updated_at") or event["at"]
+            self._seq = event["seq"]
+            self._since_snapshot += 1
+            if self._since_snapshot >= self.compact_every:
+                self._write_snapshot()
+
+    def compact(self) -> None:
+        """Write the materialized state as the snapshot (log is kept for history)."""
+        self.ensure_exists()
+        with self._lock:
+            if self._state is None:
+                self._load_snapshot()
+            self._replay_tail()
+            self._write_snapshot()
+
+    def iter_events(self) -> Iterator[Dict[str, Any]]:
+        """Every event in the log, oldest first."""
+        try:
+            with self.log_path.open("rb") as f:
+                for raw in f:
+                    event = _parse_line(raw)
+                    if event is not None:
+                        yield event
+        except FileNotFoundError:
+            return
+
+    def record_history(self, record_id: str) -> List[Dict[str, Any]]:
+        """Log entries that wrote ``record_id``: ``[{seq, at, op, collection, record?}]``."""
+        history: List[Dict[str, Any]] = []
+        for event in self.iter_events():
+            for change in event.get("changes") or []:
+                rid = change.get("id") or (change.get("record") or {}).get("id")
+                if rid == record_id:
+                    history.append({"seq": event.get("seq"), "at": event.get("at"), **change})
+        return history
+
+    def _load_snapshot(self) -> None:
+        raw = self._snapshot.load()
+        self._snapshot_signature = self._snapshot.signature()
+        self._offset = int(raw.pop("log_offset", 0) or 0)
+        self._seq = int(raw.pop("log_seq", 0) or 0)
+        self._since_snapshot = 0
+        self._state = ensure_v2(raw, user_id=self.user_id)
+        for name in COLLECTIONS:
+            self._state[name] = [r for r in self._state.get(name) or [] if isinstance(r, dict)]
+
+    def _replay_tail(self) -> None:
+        try:
+            size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size < self._offset:
+            # Log replaced or truncated under us: rebuild from the snapshot.
+            logger.warning("KB event log %s shrank; replaying from snapshot", self.log_path)
+            self._load_snapshot()
+            self._offset = min(self._offset, size)
+        if size == self._offset:
+            return
+        with self.log_path.open("rb") as f:
+            f.seek(self._offset)
+            tail = f.read(size - self._offset)
+        # Only consume complete lines; a torn final write is retried next time.
+        end = tail.rfind(b"\n") + 1
+        for raw in tail[:end].splitlines():
+            event = _parse_line(raw)
+            if event is None or int(event.get("seq") or 0) <= self._seq:
+                continue
+            apply_changes(self._state, event.get("changes") or [])
+            self._state["updated_at"] = event.get("at") or self._state.get("updated_at")
+            self._seq = int(event["seq"])
+            self._since_snapshot += 1
+        self._offset += end
+
+    def _append(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n"
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            size = os.fstat(fd).st_size
+            if size > self._offset:
+                # A torn line from a crashed writer: terminate it so ours parses.
+                line = b"\n" + line
+            os.write(fd, line)
+            os.fsync(fd)
+            self._offset = size + len(line)
+        finally:
+            os.close(fd)
+
+    def _write_snapshot(self) -> None:
+        payload = copy.deepcopy(self._state)
+        derived = payload.get("derived_state") or {}
+        # Keep the compat mirrors in step for readers of the plain JSON file.
+        payload["signal_weights"] = dict(derived.get("signal_weights") or {})
+        payload["strategy_preferences"] = dict(derived.get("strategy_preferences") or {})
+        payload["log_offset"] = self._offset
+        payload["log_seq"] = self._seq
+        self._snapshot.save(payload)
+        self._snapshot_signature = self._snapshot.signature()
+        self._since_snapshot = 0
+
+
+def diff_documents(before: Dict[str, Any], after: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Changes that turn ``before`` into ``after`` (records matched by id)."""
+    changes: List[Dict[str, Any]] = []
+    for name in COLLECTIONS:
+        old = {r.get("id"): r for r in before.get(name) or [] if isinstance(r, dict)}
+        new = [r for r in after.get(name) or [] if isinstance(r, dict)]
+        new_ids = {r.get("id") for r in new}
+        for rid in old:
+            if rid not in new_ids:
+                changes.append({"op": "delete", "collection": name, "id": rid})
+        for record in new:
+            if old.get(record.get("id")) != record:
+                changes.append({"op": "put", "collection": name, "record": record})
+    if (before.get("derived_state") or {}) != (after.get("derived_state") or {}):
+        changes.append({"op": "derived_state", "value": after.get("derived_state") or {}})
+    return changes
+
+
+def apply_changes(doc: Dict[str, Any], changes: List[Dict[str, Any]]) -> None:
+    """Apply ``diff_documents`` output to ``doc`` in place."""
+    for change in changes:
+        op = change.get("op")
+        if op == "derived_state":
+            doc["derived_state"] = copy.deepcopy(change.get("value") or {})
+            continue
+        records = doc.setdefault(change.get("collection"), [])
+        if op == "delete":
+            records[:] = [r for r in records if r.get("id") != change.get("id")]
+        elif op == "put":
+            record = copy.deepcopy(change["record"])
+            for i, existing in enumerate(records):
+                if existing.get("id") == record.get("id"):
+                    records[i] = record
+                    break
+            else:
+                records.append(record)
+
+
+def _parse_line(raw: bytes) -> Optional[Dict[str, Any]]:
+    raw = raw.strip()
+    if not raw:
+        return None
+    try:
+        event = json.loads(raw)
+    except json.JSONDecodeError:
+        logger.warning("Skipping unreadable KB event log line")
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name) or default))
+    except ValueError:
+        return default
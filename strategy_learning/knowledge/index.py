@@ -0,0 +1,149 @@
+"""In-memory indexes over a loaded KB document and provenance traversal.
+
+Built once per document version (``KnowledgeBase.index()``) so id lookups,
+status filters and lineage walks are dict operations instead of scans over
+every record list.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+COLLECTIONS = (
+    "lessons",
+    "backtest_validations",
+    "config_recommendations",
+    "promotions",
+)
+
+
+@dataclass(frozen=True)
+class LineageStep:
+    """One ancestor reached while walking provenance from a record."""
+
+    record_id: str
+    collection: str
+    depth: int
+    child_id: str
+    via: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "record_id": self.record_id,
+            "collection": self.collection,
+            "depth": self.depth,
+            "child_id": self.child_id,
+            "via": self.via,
+        }
+
+
+@dataclass
+class KBIndex:
+    doc: Dict[str, Any]
+    by_id: Dict[str, Tuple[str, int]] = field(default_factory=dict)
+    by_status: Dict[Tuple[str, str], List[str]] = field(default_factory=dict)
+    parents: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    children: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, doc: Dict[str, Any]) -> "KBIndex":
+        index = cls(doc=doc)
+        for name in COLLECTIONS:
+            for pos, record in enumerate(doc.get(name) or []):
+                if not isinstance(record, dict) or not record.get("id"):
+                    continue
+                rid = record["id"]
+                index.by_id[rid] = (name, pos)
+                status = record.get("status")
+                if status:
+                    index.by_status.setdefault((name, status), []).append(rid)
+        # Edges only to records that exist; sweep/candidate ids are external.
+        for rid, (name, pos) in index.by_id.items():
+            edges = [
+                (target, via)
+                for target, via in provenance_links(doc[name][pos])
+                if target in index.by_id and target != rid
+            ]
+            if edges:
+                index.parents[rid] = edges
+                for target, _ in edges:
+                    index.children.setdefault(target, []).append(rid)
+        return index
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """The indexed record (shared — copy before mutating)."""
+        loc = self.by_id.get(record_id)
+        if loc is None:
+            return None
+        return self.doc[loc[0]][loc[1]]
+
+    def locate(self, record_id: str) -> Optional[Tuple[str, int]]:
+        """(collection, position) — also valid for a deep copy of the same document."""
+        return self.by_id.get(record_id)
+
+    def ids_with_status(self, collection: str, status: str) -> List[str]:
+        return list(self.by_status.get((collection, status), []))
+
+    def referencing(self, record_id: str) -> List[str]:
+        """Records whose provenance points at ``record_id`` (e.g. recs citing a lesson)."""
+        return list(self.children.get(record_id, []))
+
+    def referenced_lesson_ids(self) -> Set[str]:
+        """Lesson ids linked from the active or any pending recommendation (survive trim)."""
+        derived = self.doc.get("derived_state") or {}
+        rec_ids = set(self.ids_with_status("config_recommendations", "pending_review"))
+        active_id = derived.get("active_recommendation_id")
+        if active_id in self.by_id:
+            rec_ids.add(active_id)
+        keep: Set[str] = set()
+        for rec_id in rec_ids:
+            lineage = (self.get(rec_id).get("provenance") or {}).get("kb_lineage") or {}
+            if not isinstance(lineage, dict):
+                continue
+            for key in ("lesson_id", "lesson_ids"):
+                val = lineage.get(key)
+                if isinstance(val, str):
+                    keep.add(val)
+                elif isinstance(val, list):
+                    keep.update(str(x) for x in val)
+        return keep
+
+    def ancestors(self, record_id: str, max_depth: Optional[int] = None) -> List[LineageStep]:
+        """Breadth-first provenance walk; each ancestor is reported once, nearest first."""
+        steps: List[LineageStep] = []
+        seen = {record_id}
+        queue = deque([(record_id, 0)])
+        while queue:
+            current, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for parent, via in self.parents.get(current, []):
+                if parent in seen:
+                    continue
+                seen.add(parent)
+                steps.append(LineageStep(parent, self.by_id[parent][0], depth + 1, current, via))
+                queue.append((parent, depth + 1))
+        return steps
+
+
+def provenance_links(record: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(target id, via) pairs a record's provenance points at."""
+    links: List[Tuple[str, str]] = []
+    provenance = record.get("provenance") or {}
+    lineage = provenance.get("kb_lineage")
+    if isinstance(lineage, dict):
+        for key, value in lineage.items():
+            if isinstance(value, str) and key.endswith("_id"):
+                links.append((value, f"kb_lineage.{key}"))
+            elif isinstance(value, list) and key.endswith("_ids"):
+                links.extend((str(v), f"kb_lineage.{key}") for v in value)
+    elif isinstance(lineage, list):
+        links.extend((str(v), "kb_lineage") for v in lineage if v)
+    rec_id = provenance.get("config_recommendation_id")
+    if isinstance(rec_id, str):
+        links.append((rec_id, "config_recommendation_id"))
+    if isinstance(record.get("supersedes"), str):
+        links.append((record["supersedes"], "supersedes"))
+    return links
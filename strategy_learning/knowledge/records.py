@@ -111,6 +111,7 @@ def require_hard_event_ref(event: Optional[Dict[str, Any]], *, context: str) ->
 
 
 def config_hash(snapshot: Dict[str, Any]) -> str:
+    """Stable content hash of a JSON-able config snapshot (key order independent)."""
     canonical = json.dumps(snapshot, sort_keys=True, separators=(",", ":"), default=str)
     digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
     return f"sha256:{digest}"
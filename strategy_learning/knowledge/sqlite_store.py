@@ -0,0 +1,303 @@
+"""SQLite storage engine for the knowledge base.
+
+Drop-in for ``JsonFileStore`` behind ``KnowledgeBase``: one table per record
+kind (indexed on id, status and created_at) plus a ``meta`` table for
+``user_id``, ``updated_at``, ``derived_state`` and a revision counter.
+``save()`` diffs the new document against the last one this store loaded or
+saved and applies only the changed rows in a single transaction, so an append
+is O(1) rows and concurrent writers (sweep workers, the live service) merge
+instead of overwriting each other. Records come back in insertion order.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from strategy_learning.knowledge.records import KnowledgeBaseError, ensure_v2, new_id
+from trading_agent.storage.locking import file_lock
+from trading_agent.storage.paths import get_data_dir, get_example_data_dir
+
+logger = logging.getLogger(__name__)
+
+COLLECTIONS = (
+    "lessons",
+    "backtest_validations",
+    "config_recommendations",
+    "promotions",
+)
+_ID_PREFIX = {
+    "lessons": "les",
+    "backtest_validations": "bv",
+    "config_recommendations": "cr",
+    "promotions": "prom",
+}
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class SqliteKnowledgeStore:
+    """Knowledge-base document persisted in SQLite (same load/save contract as JsonFileStore)."""
+
+    def __init__(
+        self,
+        filename: str = "knowledge_base.sqlite3",
+        data_dir: Optional[Path] = None,
+        example_dir: Optional[Path] = None,
+        seed_filename: str = "knowledge_base.json",
+        user_id: str = "default",
+    ):
+        self.data_dir = data_dir or get_data_dir()
+        self.example_dir = example_dir or get_example_data_dir()
+        self.path = self.data_dir / filename
+        self.seed_paths = [self.data_dir / seed_filename, self.example_dir / seed_filename]
+        self.user_id = user_id
+        self._lock = threading.Lock()
+        # Document as of the last load/save — the base save() diffs against.
+        self._baseline: Optional[Dict[str, Any]] = None
+        # WAL mode and tables are set up once per instance, not per connection.
+        self._schema_ready = False
+
+    def load(self) -> Dict[str, Any]:
+        self.ensure_exists()
+        with self._connect() as conn:
+            doc = _read_document(conn)
+        with self._lock:
+            self._baseline = copy.deepcopy(doc)
+        return doc
+
+    def save(self, data: Dict[str, Any]) -> None:
+        self.ensure_exists()
+        doc = _normalize(data)
+        with self._lock:
+            baseline = self._baseline
+        with self._transaction() as conn:
+            if baseline is None:
+                _replace_all(conn, doc)
+            else:
+                _apply_diff(conn, baseline, doc)
+            _write_meta(conn, doc)
+        with self._lock:
+            self._baseline = copy.deepcopy(doc)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        with file_lock(self.path):
+            yield
+
+    def signature(self) -> Optional[Tuple[int]]:
+        """Revision counter; bumps on every committed save from any process."""
+        if not self.path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        return (int(json.loads(row[0])) if row else 0,)
+
+    def find_record(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """One record by id via the per-table id index, without loading the document."""
+        self.ensure_exists()
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'user_id'").fetchone()
+            stored_user = json.loads(row[0]) if row else None
+            if stored_user and stored_user != self.user_id:
+                raise KnowledgeBaseError(
+                    f"KB user_id mismatch: file has {stored_user!r}, "
+                    f"instance expects {self.user_id!r}"
+                )
+            for table in COLLECTIONS:
+                row = conn.execute(
+                    f"SELECT body FROM {table} WHERE id = ?", (record_id,)
+                ).fetchone()
+                if row:
+                    return json.loads(row[0])
+        return None
+
+    def ensure_exists(self) -> None:
+        if self.path.exists():
+            return
+        self._schema_ready = False  # the file was removed; recreate tables too
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        seed: Dict[str, Any] = {}
+        for candidate in self.seed_paths:
+            if candidate.exists():
+                with candidate.open(encoding="utf-8") as f:
+                    seed = json.load(f)
+                logger.info("Seeding %s from %s", self.path, candidate)
+                break
+        doc = _normalize(ensure_v2(seed, user_id=self.user_id))
+        with self._transaction() as conn:
+            # Another process may have seeded it between our check and BEGIN.
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'revision'").fetchone():
+                return
+            _replace_all(conn, doc)
+            _write_meta(conn, doc)
+
+    def import_document(self, data: Dict[str, Any]) -> Dict[str, int]:
+        """Replace the database contents with a (v1 or v2) JSON document."""
+        doc = _normalize(ensure_v2(data, user_id=self.user_id))
+        with self._transaction() as conn:
+            _replace_all(conn, doc)
+            _write_meta(conn, doc)
+        with self._lock:
+            self._baseline = copy.deepcopy(doc)
+        return {name: len(doc[name]) for name in COLLECTIONS}
+
+    def _connect(self, *, write: bool = False) -> "_ClosingConnection":
+        if not self._schema_ready:
+            self._prepare()
+        conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        if write:
+            # Per-connection setting; WAL mode itself persists in the file.
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return _ClosingConnection(conn)
+
+    def _prepare(self) -> None:
+        with self._lock:
+            if self._schema_ready:
+                return
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None
+            )
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                _ensure_schema(conn)
+            finally:
+                conn.close()
+            self._schema_ready = True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect(write=True) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+
+class _ClosingConnection:
+    """Context manager that closes (not just commits) the connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, *exc: Any) -> None:
+        self._conn.close()
+
+
+def import_json_file(json_path: Path, store: SqliteKnowledgeStore) -> Dict[str, int]:
+    """Load a ``knowledge_base.json`` file into ``store``; returns row counts."""
+    with Path(json_path).open(encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected object in {json_path}")
+    return store.import_document(data)
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    for table in COLLECTIONS:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " id TEXT NOT NULL UNIQUE,"
+            " status TEXT,"
+            " created_at TEXT,"
+            " body TEXT NOT NULL)"
+        )
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_status ON {table} (status)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_created_at ON {table} (created_at)")
+
+
+def _normalize(data: Dict[str, Any]) -> Dict[str, Any]:
+    doc = copy.deepcopy(data)
+    for name in COLLECTIONS:
+        records = []
+        for item in doc.get(name) or []:
+            if not isinstance(item, dict):
+                continue
+            if not item.get("id"):
+                item["id"] = new_id(_ID_PREFIX[name])
+            records.append(item)
+        doc[name] = records
+    return doc
+
+
+def _read_document(conn: sqlite3.Connection) -> Dict[str, Any]:
+    meta = {
+        key: json.loads(value)
+        for key, value in conn.execute("SELECT key, value FROM meta").fetchall()
+    }
+    doc: Dict[str, Any] = {
+        "schema_version": 2,
+        "user_id": meta.get("user_id"),
+        "updated_at": meta.get("updated_at"),
+        "derived_state": meta.get("derived_state") or {},
+    }
+    for table in COLLECTIONS:
+        rows = conn.execute(f"SELECT body FROM {table} ORDER BY seq").fetchall()
+        doc[table] = [json.loads(body) for (body,) in rows]
+    return doc
+
+
+def _row(record: Dict[str, Any]) -> Tuple[str, Optional[str], Optional[str], str]:
+    return (
+        record["id"],
+        record.get("status"),
+        record.get("created_at"),
+        json.dumps(record, separators=(",", ":")),
+    )
+
+
+def _upsert(conn: sqlite3.Connection, table: str, records: List[Dict[str, Any]]) -> None:
+    if records:
+        conn.executemany(
+            f"INSERT INTO {table} (id, status, created_at, body) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET status = excluded.status, "
+            "created_at = excluded.created_at, body = excluded.body",
+            [_row(r) for r in records],
+        )
+
+
+def _replace_all(conn: sqlite3.Connection, doc: Dict[str, Any]) -> None:
+    for table in COLLECTIONS:
+        conn.execute(f"DELETE FROM {table}")
+        _upsert(conn, table, doc[table])
+
+
+def _apply_diff(conn: sqlite3.Connection, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+    for table in COLLECTIONS:
+        old = {r["id"]: r for r in before.get(table) or []}
+        new = {r["id"]: r for r in after[table]}
+        changed = [r for rid, r in new.items() if old.get(rid) != r]
+        removed = [(rid,) for rid in old if rid not in new]
+        if removed:
+            conn.executemany(f"DELETE FROM {table} WHERE id = ?", removed)
+        _upsert(conn, table, changed)
+
+
+def _write_meta(conn: sqlite3.Connection, doc: Dict[str, Any]) -> None:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+    revision = (int(json.loads(row[0])) if row else 0) + 1
+    values = {
+        "user_id": doc.get("user_id"),
+        "updated_at": doc.get("updated_at"),
+        "derived_state": doc.get("derived_state") or {},
+        "revision": revision,
+    }
+    conn.executemany(
+        "INSERT INTO meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        [(key, json.dumps(value)) for key, value in values.items()],
+    )
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
 
 from strategy_learning.knowledge.records import (
     KnowledgeBaseError,
@@ -15,41 +20,162 @@ from strategy_learning.knowledge.records import (
     make_event_ref,
     new_id,
     require_hard_event_ref,
-    referenced_lesson_ids,
     select_lessons_for_prompt,
     trim_lessons,
     utc_now_iso,
 )
+from strategy_learning.knowledge.index import KBIndex, LineageStep
 from trading_agent.storage.base import JsonFileStore
 
 MAX_LESSONS = 100
 MAX_VALIDATIONS = 50
 MAX_RECOMMENDATIONS = 50
 MAX_PROMOTIONS = 100
+BACKENDS = ("json", "sqlite", "eventlog")
+_TRUTHY = {"1", "true", "yes"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _exclusive(method: F) -> F:
+    """Run a load → mutate → save method under the KB file lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: "KnowledgeBase", *args: Any, **kwargs: Any) -> Any:
+        with self.locked():
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
 
 
 class KnowledgeBase:
+    """Per-user KB document with an in-memory cache.
+
+    The parsed, migrated document is cached and reused until the file's
+    (mtime, size, inode) signature changes, so repeated reads within a cycle
+    (or across backtest rebalance dates) are dict lookups. Derived views such
+    as prompt lessons and signal weights are memoized against the same
+    document. ``load()`` returns a private deep copy safe to mutate.
+
+    ``backend`` (or ``KB_BACKEND``) picks the storage engine: ``json``
+    (default, ``knowledge_base.json``), ``sqlite``
+    (``knowledge_base.sqlite3``, seeded from the JSON file on first use) or
+    ``eventlog`` (JSON snapshot + append-only ``knowledge_base.events.jsonl``).
+    Mutating methods hold an advisory file lock so parallel sweep workers and
+    the live service don't lose each other's appends. ``compact`` (or
+    ``KB_COMPACT_JSON=true``) writes the JSON backend without indentation.
+    """
+
     def __init__(
         self,
         filename: str = "knowledge_base.json",
         data_dir: Optional[Path] = None,
         example_dir: Optional[Path] = None,
         user_id: str = "default",
+        backend: Optional[str] = None,
+        compact: Optional[bool] = None,
     ):
         self.user_id = user_id
-        self._store = JsonFileStore(filename, data_dir=data_dir, example_dir=example_dir)
+        self.backend = (backend or os.getenv("KB_BACKEND") or "json").lower()
+        if self.backend == "sqlite":
+            from strategy_learning.knowledge.sqlite_store import SqliteKnowledgeStore
 
-    def load(self) -> Dict[str, Any]:
-        raw = self._store.load()
-        doc = ensure_v2(raw, user_id=self.user_id)
-        # Enforce scoped user — never return another user's document.
-        if doc.get("user_id") and doc["user_id"] != self.user_id:
+            self._store = SqliteKnowledgeStore(
+                f"{Path(filename).stem}.sqlite3",
+                data_dir=data_dir,
+                example_dir=example_dir,
+                seed_filename=filename,
+                user_id=user_id,
+            )
+        elif self.backend == "eventlog":
+            from strategy_learning.knowledge.event_log import EventLogKnowledgeStore
+
+            self._store = EventLogKnowledgeStore(
+                filename, data_dir=data_dir, example_dir=example_dir, user_id=user_id
+            )
+        elif self.backend == "json":
+            if compact is None:
+                compact = os.getenv("KB_COMPACT_JSON", "false").lower() in _TRUTHY
+            self._store = JsonFileStore(
+                filename, data_dir=data_dir, example_dir=example_dir, compact=compact
+            )
+        else:
             raise KnowledgeBaseError(
-                f"KB user_id mismatch: file has {doc['user_id']!r}, "
-                f"instance expects {self.user_id!r}"
+                f"Unknown KB backend {self.backend!r}; expected one of {BACKENDS}"
             )
-        doc["user_id"] = self.user_id
-        return doc
+        self._lock = threading.RLock()
+        self._doc: Optional[Dict[str, Any]] = None
+        self._doc_signature: Optional[Tuple[int, ...]] = None
+        self._views: Dict[Hashable, Any] = {}
+
+    def load(self) -> Dict[str, Any]:
+        return copy.deepcopy(self._document())
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the KB write lock; use around external ``load()``/``save()`` pairs."""
+        with self._store.locked():
+            yield
+
+    def compact(self) -> None:
+        """Fold the event log into the snapshot (``eventlog`` backend; no-op otherwise)."""
+        compact = getattr(self._store, "compact", None)
+        if compact is not None:
+            with self.locked():
+                compact()
+
+    def index(self) -> KBIndex:
+        """Id/status/provenance indexes for the current document (read-only, memoized)."""
+        return self._view("index", KBIndex.build)
+
+    def lineage(self, record_id: str, max_depth: Optional[int] = None) -> List[LineageStep]:
+        """Provenance ancestors of ``record_id`` (validations, lessons, superseded recs)."""
+        return self.index().ancestors(record_id, max_depth=max_depth)
+
+    def history(self, record_id: str) -> List[Dict[str, Any]]:
+        """Write history of one record from the event log; empty on other backends."""
+        record_history = getattr(self._store, "record_history", None)
+        return record_history(record_id) if record_history is not None else []
+
+    def invalidate(self) -> None:
+        """Drop the cached document; the next read re-parses the file."""
+        with self._lock:
+            self._doc = None
+            self._doc_signature = None
+            self._views = {}
+
+    def _document(self) -> Dict[str, Any]:
+        """Cached v2 document. Shared across readers — never mutate it."""
+        self._store.ensure_exists()
+        signature = self._store.signature()
+        with self._lock:
+            if self._doc is not None and signature == self._doc_signature:
+                return self._doc
+            raw = self._store.load()
+            doc = ensure_v2(raw, user_id=self.user_id)
+            # Enforce scoped user — never return another user's document.
+            if doc.get("user_id") and doc["user_id"] != self.user_id:
+                raise KnowledgeBaseError(
+                    f"KB user_id mismatch: file has {doc['user_id']!r}, "
+                    f"instance expects {self.user_id!r}"
+                )
+            doc["user_id"] = self.user_id
+            # Signature taken before the read: a concurrent rewrite in between
+            # just causes one extra reload on the next call.
+            self._doc = doc
+            self._doc_signature = signature
+            self._views = {}
+            return doc
+
+    def _view(self, key: Hashable, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        doc = self._document()
+        with self._lock:
+            if self._doc is doc and key in self._views:
+                return self._views[key]
+            value = build(doc)
+            if self._doc is doc:
+                self._views[key] = value
+            return value
 
     def save(self, data: Dict[str, Any]) -> None:
         doc = ensure_v2(data, user_id=self.user_id)
@@ -74,37 +200,41 @@ class KnowledgeBase:
             "strategy_preferences": dict(derived.get("strategy_preferences") or {}),
         }
         self._store.save(payload)
+        with self._lock:
+            # Adopt what we just wrote instead of re-reading it.
+            self._doc = ensure_v2(copy.deepcopy(payload), user_id=self.user_id)
+            self._doc_signature = self._store.signature()
+            self._views = {}
 
     def lessons(self, limit: int = 10) -> List[str]:
-        return lesson_summaries(self.load().get("lessons") or [], limit=limit)
+        return list(self._view(
+            ("lessons", limit),
+            lambda doc: lesson_summaries(doc.get("lessons") or [], limit=limit),
+        ))
 
     def lessons_for_prompt(self, limit: int = 10) -> List[str]:
-        doc = self.load()
-        prefs = (doc.get("derived_state") or {}).get("strategy_preferences") or {}
-        return select_lessons_for_prompt(
-            [l for l in (doc.get("lessons") or []) if isinstance(l, dict)],
-            last_validated_backtest_id=prefs.get("last_validated_backtest_id"),
-            max_total=limit,
-        )
+        return list(self._view(
+            ("lessons_for_prompt", limit),
+            lambda doc: _prompt_lessons(doc, limit),
+        ))
 
     def signal_weights(self) -> Dict[str, float]:
-        derived = self.load().get("derived_state") or {}
-        return dict(derived.get("signal_weights") or {})
+        return dict(self._view(
+            "signal_weights",
+            lambda doc: dict((doc.get("derived_state") or {}).get("signal_weights") or {}),
+        ))
 
     def strategy_preferences(self) -> Dict[str, Any]:
-        derived = self.load().get("derived_state") or {}
-        return dict(derived.get("strategy_preferences") or {})
+        return dict(self._view(
+            "strategy_preferences",
+            lambda doc: dict(
+                (doc.get("derived_state") or {}).get("strategy_preferences") or {}
+            ),
+        ))
 
     def active_backtest_validation(self) -> Optional[Dict[str, Any]]:
-        doc = self.load()
-        prefs = (doc.get("derived_state") or {}).get("strategy_preferences") or {}
-        vid = prefs.get("last_validated_backtest_id")
-        if not vid:
-            return None
-        for item in doc.get("backtest_validations") or []:
-            if isinstance(item, dict) and item.get("id") == vid:
-                return dict(item)
-        return None
+        found = self._view("active_backtest_validation", _active_validation)
+        return copy.deepcopy(found) if found is not None else None
 
     def append_lesson(self, lesson: str, max_lessons: int = MAX_LESSONS) -> None:
         """Compat: append a simple live lesson string (v1 API)."""
@@ -117,6 +247,7 @@ class KnowledgeBase:
             max_lessons=max_lessons,
         )
 
+    @_exclusive
     def append_live_lesson(
         self,
         *,
@@ -150,11 +281,12 @@ class KnowledgeBase:
         }
         doc = self.load()
         doc["lessons"].append(record)
-        keep = referenced_lesson_ids(doc)
+        keep = self.index().referenced_lesson_ids()
         doc["lessons"] = trim_lessons(doc["lessons"], max_lessons, keep)
         self.save(doc)
         return record
 
+    @_exclusive
     def update_weights_and_prefs(
         self,
         signal_weights: Optional[Dict[str, float]] = None,
@@ -174,6 +306,7 @@ class KnowledgeBase:
         doc["derived_state"] = derived
         self.save(doc)
 
+    @_exclusive
     def append_backtest_validation(self, record: Dict[str, Any]) -> Dict[str, Any]:
         record = dict(record)
         record.setdefault("id", new_id("bv"))
@@ -201,6 +334,7 @@ class KnowledgeBase:
         self.save(doc)
         return record
 
+    @_exclusive
     def append_lesson_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         record = dict(record)
         record.setdefault("id", new_id("les"))
@@ -212,11 +346,12 @@ class KnowledgeBase:
             require_hard_event_ref(trigger, context="backtest lesson")
         doc = self.load()
         doc["lessons"].append(record)
-        keep = referenced_lesson_ids(doc)
+        keep = self.index().referenced_lesson_ids()
         doc["lessons"] = trim_lessons(doc["lessons"], MAX_LESSONS, keep)
         self.save(doc)
         return record
 
+    @_exclusive
     def append_config_recommendation(self, record: Dict[str, Any]) -> Dict[str, Any]:
         record = dict(record)
         record.setdefault("id", new_id("cr"))
@@ -258,18 +393,15 @@ class KnowledgeBase:
         return record
 
     def get_pending_recommendation(self) -> Optional[Dict[str, Any]]:
-        doc = self.load()
-        active_id = (doc.get("derived_state") or {}).get("active_recommendation_id")
-        pending = None
-        for rec in doc.get("config_recommendations") or []:
-            if not isinstance(rec, dict):
-                continue
-            if rec.get("status") == "pending_review":
-                if active_id and rec.get("id") == active_id:
-                    return dict(rec)
-                pending = dict(rec)
-        return pending
+        index = self.index()
+        pending_ids = index.ids_with_status("config_recommendations", "pending_review")
+        if not pending_ids:
+            return None
+        active_id = (index.doc.get("derived_state") or {}).get("active_recommendation_id")
+        chosen = active_id if active_id in pending_ids else pending_ids[-1]
+        return copy.deepcopy(index.get(chosen))
 
+    @_exclusive
     def update_recommendation_review(
         self,
         recommendation_id: str,
@@ -281,27 +413,26 @@ class KnowledgeBase:
         if status not in RECOMMENDATION_STATUSES:
             raise KnowledgeBaseError(f"Invalid status: {status}")
         doc = self.load()
-        found = None
-        for rec in doc.get("config_recommendations") or []:
-            if isinstance(rec, dict) and rec.get("id") == recommendation_id:
-                # Immutable fields stay; only status/review mutate.
-                rec["status"] = status
-                review = dict(rec.get("review") or {})
-                review["reviewed_at"] = utc_now_iso()
-                review["reviewed_by"] = reviewed_by
-                review["decision"] = status
-                review["reject_reason"] = reject_reason
-                rec["review"] = review
-                found = dict(rec)
-                break
-        if found is None:
+        loc = self.index().locate(recommendation_id)
+        if loc is None or loc[0] != "config_recommendations":
             raise KnowledgeBaseError(f"Recommendation not found: {recommendation_id}")
+        rec = doc["config_recommendations"][loc[1]]
+        # Immutable fields stay; only status/review mutate.
+        rec["status"] = status
+        review = dict(rec.get("review") or {})
+        review["reviewed_at"] = utc_now_iso()
+        review["reviewed_by"] = reviewed_by
+        review["decision"] = status
+        review["reject_reason"] = reject_reason
+        rec["review"] = review
+        found = dict(rec)
         if status != "pending_review":
             if doc["derived_state"].get("active_recommendation_id") == recommendation_id:
                 doc["derived_state"]["active_recommendation_id"] = None
         self.save(doc)
         return found
 
+    @_exclusive
     def append_promotion(self, record: Dict[str, Any]) -> Dict[str, Any]:
         record = dict(record)
         record.setdefault("id", new_id("prom"))
@@ -328,14 +459,29 @@ class KnowledgeBase:
         return record
 
     def find_record(self, record_id: str) -> Optional[Dict[str, Any]]:
-        doc = self.load()
-        for key in (
-            "lessons",
-            "backtest_validations",
-            "config_recommendations",
-            "promotions",
-        ):
-            for item in doc.get(key) or []:
-                if isinstance(item, dict) and item.get("id") == record_id:
-                    return dict(item)
+        # The sqlite engine answers from its id index without loading the document.
+        find = getattr(self._store, "find_record", None)
+        if find is not None:
+            return find(record_id)
+        record = self.index().get(record_id)
+        return copy.deepcopy(record) if record is not None else None
+
+
+def _prompt_lessons(doc: Dict[str, Any], limit: int) -> List[str]:
+    prefs = (doc.get("derived_state") or {}).get("strategy_preferences") or {}
+    return select_lessons_for_prompt(
+        [l for l in (doc.get("lessons") or []) if isinstance(l, dict)],
+        last_validated_backtest_id=prefs.get("last_validated_backtest_id"),
+        max_total=limit,
+    )
+
+
+def _active_validation(doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    prefs = (doc.get("derived_state") or {}).get("strategy_preferences") or {}
+    vid = prefs.get("last_validated_backtest_id")
+    if not vid:
         return None
+    for item in doc.get("backtest_validations") or []:
+        if isinstance(item, dict) and item.get("id") == vid:
+            return item
+    return None
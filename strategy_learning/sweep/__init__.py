@@ -9,30 +9,94 @@ from strategy_learning.sweep.candidates import (
     expand_oat_candidates,
     merge_proposed_changes,
 )
+from strategy_learning.sweep.checkpoint import (
+    SweepCheckpoint,
+    find_resumable_sweep,
+    open_sweep_checkpoint,
+)
 from strategy_learning.sweep.models import (
     SweepCandidateResult,
     SweepResult,
     beats_baseline,
     metric_rank_key,
 )
+from strategy_learning.sweep.planner import (
+    CallProfile,
+    SweepEstimate,
+    choose_max_workers,
+    estimate_sweep,
+    profile_backtest_artifacts,
+    profile_recent_backtests,
+)
 from strategy_learning.sweep.recommend import maybe_write_recommendation, select_winner
+from strategy_learning.sweep.result_store import (
+    SweepResultStore,
+    evaluation_context,
+    evaluation_hash,
+)
+from strategy_learning.sweep.search import (
+    MAX_UNBUDGETED_GRID,
+    SEARCH_STRATEGIES,
+    GridSearch,
+    OATSearch,
+    RandomSearch,
+    SearchStrategy,
+    TPESearch,
+    build_search,
+    tunable_space,
+)
 from strategy_learning.sweep.runner import (
     ParamSweepRunner,
     estimate_rebalance_cycles,
     format_sweep_plan,
+    successive_halving_schedule,
+    sweep_run_equivalents,
+)
+from strategy_learning.sweep.walk_forward import (
+    WalkForwardBacktest,
+    WalkForwardWindow,
+    aggregate_window_metrics,
+    walk_forward_windows,
 )
 
 __all__ = [
+    "MAX_UNBUDGETED_GRID",
+    "SEARCH_STRATEGIES",
+    "CallProfile",
+    "GridSearch",
+    "OATSearch",
     "ParamSweepRunner",
+    "RandomSearch",
+    "SearchStrategy",
     "SweepCandidateResult",
+    "SweepCheckpoint",
+    "SweepEstimate",
     "SweepResult",
+    "SweepResultStore",
+    "TPESearch",
+    "WalkForwardBacktest",
+    "WalkForwardWindow",
+    "aggregate_window_metrics",
     "beats_baseline",
+    "build_search",
+    "choose_max_workers",
     "config_snapshot_from_sections",
     "estimate_rebalance_cycles",
+    "estimate_sweep",
+    "evaluation_context",
+    "evaluation_hash",
     "expand_oat_candidates",
+    "find_resumable_sweep",
     "format_sweep_plan",
     "maybe_write_recommendation",
     "merge_proposed_changes",
     "metric_rank_key",
+    "open_sweep_checkpoint",
+    "profile_backtest_artifacts",
+    "profile_recent_backtests",
     "select_winner",
+    "successive_halving_schedule",
+    "sweep_run_equivalents",
+    "tunable_space",
+    "walk_forward_windows",
 ]
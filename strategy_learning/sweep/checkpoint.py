@@ -0,0 +1,161 @@
+"""Sweep checkpoints — finished runs survive a crash and are skipped on resume.
+
+Layout under ``<root>/<sweep_id>/``::
+
+    manifest.json            sweep id, label, baseline config hash, status
+    runs/<config hash>.json  one SweepCandidateResult per finished backtest
+    engine/                  engine state per config, any end (BacktestEngine checkpoint_dir)
+
+Runs are keyed by the hash of the exact config snapshot they ran (period
+included), so candidate ids may differ between attempts. Only successful runs
+are checkpointed; failed ones are retried on resume.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from strategy_learning.knowledge.records import config_hash, new_id, utc_now_iso
+from strategy_learning.sweep.models import SweepCandidateResult
+from trading_agent.storage.atomic import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+
+
+class SweepCheckpoint:
+    """One sweep's checkpoint directory (see module docstring)."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        with (self.directory / MANIFEST).open(encoding="utf-8") as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+
+    @classmethod
+    def create(
+        cls, root: Path, baseline_config: Dict[str, Any], *, run_label: str
+    ) -> "SweepCheckpoint":
+        sweep_id = new_id("sw")
+        directory = Path(root) / sweep_id
+        atomic_write_json(
+            directory / MANIFEST,
+            {
+                "sweep_id": sweep_id,
+                "run_label": run_label,
+                "baseline_config_hash": config_hash(baseline_config),
+                "created_at": utc_now_iso(),
+                "status": "running",
+            },
+        )
+        return cls(directory)
+
+    @property
+    def sweep_id(self) -> str:
+        return str(self.manifest["sweep_id"])
+
+    @property
+    def complete(self) -> bool:
+        return self.manifest.get("status") == "complete"
+
+    @property
+    def engine_dir(self) -> Path:
+        return self.directory / "engine"
+
+    def _run_path(self, config_snapshot: Dict[str, Any]) -> Path:
+        return self.directory / "runs" / f"{config_hash(config_snapshot).split(':', 1)[1]}.json"
+
+    def load(
+        self,
+        config_snapshot: Dict[str, Any],
+        *,
+        candidate_id: str,
+        label: str,
+        proposed_changes: Dict[str, Any],
+        is_baseline: bool,
+    ) -> Optional[SweepCandidateResult]:
+        """Checkpointed result for this snapshot, relabelled for the current job."""
+        path = self._run_path(config_snapshot)
+        if not path.exists():
+            return None
+        try:
+            with path.open(encoding="utf-8") as f:
+                saved = SweepCandidateResult.from_dict(json.load(f))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable sweep checkpoint %s: %s", path, exc)
+            return None
+        return replace(
+            saved,
+            candidate_id=candidate_id,
+            label=label,
+            proposed_changes=dict(proposed_changes),
+            is_baseline=is_baseline,
+        )
+
+    def save(self, config_snapshot: Dict[str, Any], result: SweepCandidateResult) -> None:
+        if result.status != "success":
+            return
+        atomic_write_json(self._run_path(config_snapshot), result.to_dict())
+
+    def mark_complete(self) -> None:
+        self.manifest["status"] = "complete"
+        self.manifest["completed_at"] = utc_now_iso()
+        atomic_write_json(self.directory / MANIFEST, self.manifest)
+
+
+def find_resumable_sweep(
+    root: Path, baseline_config: Dict[str, Any], *, run_label: Optional[str] = None
+) -> Optional[SweepCheckpoint]:
+    """Newest unfinished sweep under ``root`` with the same baseline config (and label)."""
+    root = Path(root)
+    if not root.is_dir():
+        return None
+    wanted = config_hash(baseline_config)
+    matches = []
+    for manifest in root.glob(f"*/{MANIFEST}"):
+        try:
+            checkpoint = SweepCheckpoint(manifest.parent)
+        except (OSError, ValueError):
+            continue
+        if checkpoint.complete or checkpoint.manifest.get("baseline_config_hash") != wanted:
+            continue
+        if run_label is not None and checkpoint.manifest.get("run_label") != run_label:
+            continue
+        matches.append(checkpoint)
+    matches.sort(key=lambda c: str(c.manifest.get("created_at") or ""), reverse=True)
+    return matches[0] if matches else None
+
+
+def open_sweep_checkpoint(
+    root: Path,
+    baseline_config: Dict[str, Any],
+    *,
+    run_label: str,
+    resume: Union[bool, str, None] = None,
+) -> SweepCheckpoint:
+    """Checkpoint for this sweep: a new one, or the one ``resume`` points at.
+
+    ``resume`` is a sweep id, or True for the newest unfinished sweep with the
+    same baseline config and label (a new sweep when there is none).
+    """
+    if isinstance(resume, str):
+        directory = Path(root) / resume
+        if not (directory / MANIFEST).exists():
+            raise ValueError(f"No sweep checkpoint {resume!r} under {root}")
+        checkpoint = SweepCheckpoint(directory)
+        if checkpoint.manifest.get("baseline_config_hash") != config_hash(baseline_config):
+            raise ValueError(
+                f"Sweep {resume!r} was run with a different baseline config; "
+                "pass the same dates, symbols and overrides to resume it"
+            )
+        return checkpoint
+    if resume:
+        checkpoint = find_resumable_sweep(root, baseline_config, run_label=run_label)
+        if checkpoint is not None:
+            return checkpoint
+        logger.info("No unfinished sweep to resume under %s; starting a new one", root)
+    return SweepCheckpoint.create(root, baseline_config, run_label=run_label)
@@ -64,6 +64,20 @@ class SweepCandidateResult:
             "rank_key": list(self.rank_key()),
         }
 
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "SweepCandidateResult":
+        return cls(
+            candidate_id=str(raw.get("candidate_id") or ""),
+            label=str(raw.get("label") or ""),
+            proposed_changes=dict(raw.get("proposed_changes") or {}),
+            status=str(raw.get("status") or "unknown"),
+            run_id=raw.get("run_id"),
+            metrics=dict(raw.get("metrics") or {}),
+            artifact_path=raw.get("artifact_path"),
+            error=raw.get("error"),
+            is_baseline=bool(raw.get("is_baseline")),
+        )
+
 
 @dataclass
 class SweepResult:
@@ -96,19 +110,7 @@ class SweepResult:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SweepResult":
-        def _cand(raw: Dict[str, Any]) -> SweepCandidateResult:
-            return SweepCandidateResult(
-                candidate_id=str(raw.get("candidate_id") or ""),
-                label=str(raw.get("label") or ""),
-                proposed_changes=dict(raw.get("proposed_changes") or {}),
-                status=str(raw.get("status") or "unknown"),
-                run_id=raw.get("run_id"),
-                metrics=dict(raw.get("metrics") or {}),
-                artifact_path=raw.get("artifact_path"),
-                error=raw.get("error"),
-                is_baseline=bool(raw.get("is_baseline")),
-            )
-
+        _cand = SweepCandidateResult.from_dict
         winner_raw = data.get("winner")
         return cls(
             sweep_id=str(data.get("sweep_id") or ""),
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import logging
+import sqlite3
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from trading_agent.models import serialize_for_json
 
 LOG_DIR = Path("logs")
 
+logger = logging.getLogger(__name__)
+
 
 def setup_logging(log_level: str) -> None:
     LOG_DIR.mkdir(exist_ok=True)
@@ -42,6 +46,234 @@ def default_sweep_window(*, lookback_days: int = 90) -> tuple[date, date]:
     return start, end
 
 
+def search_from_args(args: Any, baseline_snapshot: Dict[str, Any]) -> Any:
+    """``SearchStrategy`` for the --search / --budget / --grid-fraction / --seed flags."""
+    from strategy_learning.sweep.search import build_search
+
+    kwargs: Dict[str, Any] = {"budget": args.budget, "seed": args.seed}
+    if args.search_fields:
+        kwargs["fields"] = [f.strip() for f in args.search_fields.split(",") if f.strip()]
+    if args.search == "grid":
+        kwargs["fraction"] = args.grid_fraction
+    return build_search(args.search, baseline_snapshot, **kwargs)
+
+
+def parse_max_workers(value: str) -> Any:
+    """argparse type for --max-workers: a positive int or ``auto``."""
+    if value == "auto":
+        return value
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an int or 'auto', got {value!r}") from None
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {workers}")
+    return workers
+
+
+def parse_duration(value: str) -> float:
+    """argparse type for durations: seconds, or a number with s / m / h (``90m``, ``1.5h``)."""
+    units = {"s": 1.0, "m": 60.0, "h": 3600.0}
+    raw = value.strip().lower()
+    scale = units.get(raw[-1:], None)
+    try:
+        seconds = float(raw[:-1] if scale else raw) * (scale or 1.0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected e.g. 3600, 90m or 1.5h, got {value!r}") from None
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"must be > 0, got {value!r}")
+    return seconds
+
+
+def parse_price_pair(value: str) -> Tuple[float, float]:
+    """argparse type for --price-per-mtok ``INPUT,OUTPUT`` (price per million tokens)."""
+    try:
+        price_in, price_out = (float(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected INPUT,OUTPUT prices, got {value!r}") from None
+    return price_in, price_out
+
+
+def add_planner_arguments(parser: argparse.ArgumentParser) -> None:
+    """--deadline / --rate-limit-rpm / --price-per-mtok (see ``sweep.planner``)."""
+    parser.add_argument(
+        "--deadline",
+        type=parse_duration,
+        help=(
+            "Target wall time (e.g. 90m, 2h). With --max-workers auto, the fewest workers "
+            "expected to finish in time; otherwise the plan warns when it will not"
+        ),
+    )
+    parser.add_argument(
+        "--rate-limit-rpm",
+        type=float,
+        help="Provider LLM requests per minute; caps --max-workers auto and the time estimate",
+    )
+    parser.add_argument(
+        "--price-per-mtok",
+        type=parse_price_pair,
+        metavar="INPUT,OUTPUT",
+        help="Provider price per million input,output tokens for the plan's cost estimate",
+    )
+
+
+def planner_kwargs_from_args(args: Any, *, log_dir: Path = LOG_DIR) -> Dict[str, Any]:
+    """``ParamSweepRunner`` planner kwargs: profile of recent artifacts + planner flags."""
+    from strategy_learning.sweep.planner import profile_recent_backtests
+
+    return {
+        "call_profile": profile_recent_backtests(log_dir),
+        "rate_limit_rpm": getattr(args, "rate_limit_rpm", None),
+        "deadline_seconds": getattr(args, "deadline", None),
+        "price_per_mtok": getattr(args, "price_per_mtok", None),
+    }
+
+
+def add_walk_forward_arguments(parser: argparse.ArgumentParser) -> None:
+    """--walk-forward / --wf-train-days / --wf-workers / --wf-dispersion-penalty."""
+    parser.add_argument(
+        "--walk-forward",
+        type=int,
+        default=0,
+        metavar="N",
+        help=(
+            "Score every config on N rolling train/test windows of the period instead of "
+            "one backtest; rank on out-of-sample mean Sharpe penalized by its spread "
+            "(default 0 = off)"
+        ),
+    )
+    parser.add_argument(
+        "--wf-train-days",
+        type=int,
+        help="Train segment length in days (default: same as the test segments)",
+    )
+    parser.add_argument(
+        "--wf-workers",
+        type=int,
+        default=1,
+        help="Window backtests of one config run at once (default 1)",
+    )
+    parser.add_argument(
+        "--wf-dispersion-penalty",
+        type=float,
+        default=None,
+        help="Sharpe std-dev penalty in the walk-forward rank score (default 0.5)",
+    )
+
+
+def apply_walk_forward(args: Any, baseline_snapshot: Dict[str, Any]) -> None:
+    """Put the --walk-forward spec into the baseline snapshot (before search / checkpoint).
+
+    Raises ValueError when the period is too short or the executor cannot wrap.
+    """
+    from strategy_learning.sweep.walk_forward import walk_forward_spec, walk_forward_windows
+
+    n_windows = getattr(args, "walk_forward", 0) or 0
+    if not n_windows:
+        return
+    if getattr(args, "executor", "thread") == "lockstep":
+        raise ValueError("--walk-forward runs windows per config; use --executor thread or process")
+    train_days = getattr(args, "wf_train_days", None)
+    windows = walk_forward_windows(
+        parse_date(baseline_snapshot["start"]),
+        parse_date(baseline_snapshot["end"]),
+        n_windows,
+        train_days=train_days,
+    )
+    for w in windows:
+        logger.info(
+            "Walk-forward window %d: train %s→%s, test %s→%s",
+            w.index, w.train_start, w.train_end, w.test_start, w.test_end,
+        )
+    baseline_snapshot["walk_forward"] = walk_forward_spec(n_windows, train_days=train_days)
+
+
+def walk_forward_backtest(args: Any, run_backtest: Any) -> Any:
+    """``run_backtest`` wrapped in ``WalkForwardBacktest`` when --walk-forward is set."""
+    if not getattr(args, "walk_forward", 0):
+        return run_backtest
+    from strategy_learning.sweep.walk_forward import (
+        DEFAULT_DISPERSION_PENALTY,
+        WalkForwardBacktest,
+    )
+
+    penalty = getattr(args, "wf_dispersion_penalty", None)
+    return WalkForwardBacktest(
+        run_backtest,
+        max_workers=getattr(args, "wf_workers", 1),
+        dispersion_penalty=DEFAULT_DISPERSION_PENALTY if penalty is None else penalty,
+    )
+
+
+def sweep_checkpoint_root(log_dir: Path = LOG_DIR) -> Path:
+    """Where sweep checkpoints live (``<log_dir>/sweeps/<sweep_id>/``)."""
+    return log_dir / "sweeps"
+
+
+def sweep_result_store_path(log_dir: Path = LOG_DIR) -> Path:
+    """The cross-sweep result index (``<log_dir>/sweep_results.sqlite3``)."""
+    from strategy_learning.sweep.result_store import STORE_FILENAME
+
+    return log_dir / STORE_FILENAME
+
+
+def add_result_store_arguments(parser: argparse.ArgumentParser) -> None:
+    """--skip-evaluated / --no-result-store."""
+    parser.add_argument(
+        "--skip-evaluated",
+        action="store_true",
+        help=(
+            "Reuse successful runs of the same config on the same window from the result "
+            "store (earlier sweeps and backtests) instead of backtesting them again"
+        ),
+    )
+    parser.add_argument(
+        "--no-result-store",
+        action="store_true",
+        help="Do not index this sweep's results in logs/sweep_results.sqlite3",
+    )
+
+
+def open_result_store(args: Any, base: Any, *, log_dir: Path = LOG_DIR) -> Any:
+    """``SweepResultStore`` for a sweep on ``base`` (a ``BacktestConfig``), or
+    None with --no-result-store.
+
+    With --skip-evaluated, artifacts in ``log_dir`` not yet indexed are
+    ingested first so the sweep can reuse them.
+    """
+    if getattr(args, "no_result_store", False):
+        return None
+    from strategy_learning.sweep.result_store import SweepResultStore, evaluation_context
+
+    store = SweepResultStore(
+        sweep_result_store_path(log_dir), context=evaluation_context(base.to_dict())
+    )
+    if getattr(args, "skip_evaluated", False):
+        try:
+            counts = store.ingest_dir(log_dir)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Result store unavailable, not skipping evaluated runs: %s", exc)
+            return None
+        logger.info(
+            "Result store %s: ingested %d backtest / %d sweep artifacts",
+            store.path, counts["backtest"], counts["sweep"],
+        )
+    return store
+
+
+def record_result(store: Any, artifact: Path, *, kind: str = "sweep") -> None:
+    """Index a saved sweep or backtest artifact; failures only log a warning."""
+    if store is None:
+        return
+    try:
+        if kind == "sweep":
+            store.ingest_sweep_artifact(artifact)
+        else:
+            store.ingest_backtest_artifact(artifact)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Could not index %s in the result store: %s", artifact, exc)
+
+
 def save_sweep_artifact(payload: Dict[str, Any], run_label: str, *, log_dir: Path = LOG_DIR) -> Path:
     log_dir.mkdir(exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -62,3 +294,80 @@ def save_backtest_artifact(run_dict: Dict[str, Any], run_label: str, *, log_dir:
         json.dump(serialize_for_json(run_dict), f, indent=2)
         f.write("\n")
     return path
+
+
+class CandidateBacktest:
+    """Sweep ``run_backtest`` callable: backtest one candidate on top of a base config.
+
+    A module-level class (not a closure) so ``ParamSweepRunner(executor="process")``
+    can pickle it into worker processes. One engine per call so parallel
+    candidates do not share mutable state; by default all calls share one
+    ``BacktestDataContext`` (history fetched and per-date signals computed once).
+    """
+
+    def __init__(
+        self,
+        base: Any,
+        *,
+        log_dir: Path = LOG_DIR,
+        data_context: Any = None,
+        checkpoint_dir: Optional[Path] = None,
+    ):
+        from trading_agent.backtest.data_context import BacktestDataContext
+
+        self.base = base  # trading_agent.backtest.models.BacktestConfig
+        self.log_dir = log_dir
+        self.data_context = data_context or BacktestDataContext()
+        # Engine state per rebalance date (SweepCheckpoint.engine_dir) for --resume.
+        self.checkpoint_dir = checkpoint_dir
+
+    def __call__(self, config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
+        result = self._engine().run(self._config_for(config_snapshot, run_label))
+        return self._save(result, run_label)
+
+    def run_many(
+        self, items: List[Tuple[Dict[str, Any], str]], *, max_workers: int = 1
+    ) -> List[Dict[str, Any]]:
+        """Lockstep batch (``ParamSweepRunner(executor="lockstep")``): one day loop for all."""
+        results = self._engine().run_many(
+            [self._config_for(snapshot, label) for snapshot, label in items],
+            max_workers=max_workers,
+        )
+        return [self._save(result, label) for result, (_, label) in zip(results, items)]
+
+    def _engine(self) -> Any:
+        from trading_agent.backtest.engine import BacktestEngine
+
+        return BacktestEngine(data_context=self.data_context, checkpoint_dir=self.checkpoint_dir)
+
+    def _config_for(self, config_snapshot: Dict[str, Any], run_label: str) -> Any:
+        from copy import deepcopy
+
+        cfg = deepcopy(self.base)
+        cfg.run_label = run_label
+        cfg.strategy_params = dict(config_snapshot.get("strategy_params") or {})
+        cfg.preferences = dict(config_snapshot.get("preferences") or {})
+        cfg.rebalance_params = dict(config_snapshot.get("rebalance_params") or {})
+        # Successive-halving rungs shorten the period through the snapshot.
+        if isinstance(config_snapshot.get("start"), str):
+            cfg.start = parse_date(config_snapshot["start"][:10])
+        if isinstance(config_snapshot.get("end"), str):
+            cfg.end = parse_date(config_snapshot["end"][:10])
+        # Surrogate screening (ParamSweepRunner(screen_top=...)) swaps the policy.
+        if config_snapshot.get("decision_policy"):
+            cfg.decision_policy = str(config_snapshot["decision_policy"])
+        # Walk-forward segments (WalkForwardBacktest) share answers to identical prompts.
+        if config_snapshot.get("reuse_llm_responses"):
+            cfg.reuse_llm_responses = True
+        # Keep analysis/signal/LLM from baseline; do not mutate data/*.json stores.
+        return cfg
+
+    def _save(self, result: Any, run_label: str) -> Dict[str, Any]:
+        payload = result.to_dict()
+        artifact = save_backtest_artifact(payload, run_label, log_dir=self.log_dir)
+        payload["artifact_path"] = str(artifact)
+        logger.info(
+            "Candidate artifact %s → %s (shared data %s)",
+            run_label, artifact, self.data_context.stats(),
+        )
+        return payload
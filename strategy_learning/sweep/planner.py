@@ -0,0 +1,299 @@
+"""Sweep cost / time planner from recorded backtest timings.
+
+Backtest artifacts keep each cycle's trace (``cycle_summaries[].timings``):
+every LLM call is an ``llm.*`` span with its latency and, for hosted
+providers, ``input_tokens`` / ``output_tokens``. ``profile_backtest_artifacts``
+averages those into a ``CallProfile``; ``estimate_sweep`` scales it to a sweep
+(cycles per run × full-run equivalents) for a given ``max_workers``, and
+``choose_max_workers`` picks the fewest workers that meet a deadline without
+exceeding the provider's requests-per-minute limit.
+
+Without usable artifacts the profile falls back to ``CallProfile.default()``
+(5 calls per cycle at an assumed latency), and the plan says so.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough LLM calls per rebalance cycle (3 analysis + strategy + optional rebalance).
+DEFAULT_LLM_CALLS_PER_CYCLE = 5.0
+# Assumed hosted-API latency when no artifact has been traced yet.
+DEFAULT_SECONDS_PER_CALL = 6.0
+# Upper bound for max_workers="auto" when no rate limit is given.
+AUTO_MAX_WORKERS_CAP = 16
+# Mock LLM spans say nothing about a real provider's latency or tokens.
+_IGNORED_LLM_SPANS = ("llm.mock",)
+
+
+@dataclass
+class CallProfile:
+    """Per-cycle LLM cost of one backtest, measured or assumed."""
+
+    llm_calls_per_cycle: float
+    seconds_per_call: float
+    seconds_per_cycle: float
+    input_tokens_per_call: Optional[float] = None
+    output_tokens_per_call: Optional[float] = None
+    cycles_sampled: int = 0
+    artifacts_sampled: int = 0
+
+    @classmethod
+    def default(cls) -> "CallProfile":
+        return cls(
+            llm_calls_per_cycle=DEFAULT_LLM_CALLS_PER_CYCLE,
+            seconds_per_call=DEFAULT_SECONDS_PER_CALL,
+            seconds_per_cycle=DEFAULT_LLM_CALLS_PER_CYCLE * DEFAULT_SECONDS_PER_CALL,
+        )
+
+    @property
+    def measured(self) -> bool:
+        return self.cycles_sampled > 0
+
+    def describe(self) -> str:
+        if not self.measured:
+            return f"assumed {self.seconds_per_call:g}s/call; no traced backtests found"
+        return (
+            f"measured: {self.llm_calls_per_cycle:.1f} calls/cycle, "
+            f"{self.seconds_per_call:.1f}s/call over {self.cycles_sampled} cycles "
+            f"in {self.artifacts_sampled} backtests"
+        )
+
+
+@dataclass
+class SweepEstimate:
+    """Predicted wall time, LLM calls, tokens and cost of a sweep."""
+
+    max_workers: int
+    seconds_per_run: float
+    wall_seconds: float
+    llm_calls: float
+    calls_per_minute: float
+    input_tokens: Optional[float] = None
+    output_tokens: Optional[float] = None
+    cost: Optional[float] = None
+    rate_limited: bool = False
+
+
+def _llm_spans(node: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Outermost ``llm.*`` spans (a failover span wraps its provider spans)."""
+    name = str(node.get("name") or "")
+    if name.startswith("llm."):
+        yield node
+        return
+    for child in node.get("children") or []:
+        yield from _llm_spans(child)
+
+
+def _span_tokens(node: Dict[str, Any], key: str) -> Optional[float]:
+    own = (node.get("attrs") or {}).get(key)
+    total = float(own) if isinstance(own, (int, float)) else None
+    for child in node.get("children") or []:
+        sub = _span_tokens(child, key)
+        if sub is not None:
+            total = (total or 0.0) + sub
+    return total
+
+
+def profile_backtest_artifacts(paths: Iterable[Path]) -> Optional[CallProfile]:
+    """Average LLM calls, latency and tokens per cycle over traced artifacts.
+
+    Cycles without a trace or without real (non-mock) LLM calls are skipped;
+    None when nothing usable is left.
+    """
+    cycles = calls = 0
+    call_seconds = cycle_seconds = 0.0
+    tokens: Dict[str, float] = {"input_tokens": 0.0, "output_tokens": 0.0}
+    token_calls = 0
+    artifacts = 0
+    for path in paths:
+        try:
+            with Path(path).open(encoding="utf-8") as f:
+                run = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.debug("Skipping backtest artifact %s: %s", path, exc)
+            continue
+        used = False
+        for cycle in run.get("cycle_summaries") or []:
+            timings = cycle.get("timings") or {}
+            spans = [s for s in _llm_spans(timings) if s.get("name") not in _IGNORED_LLM_SPANS]
+            if not spans or timings.get("duration_ms") is None:
+                continue
+            used = True
+            cycles += 1
+            calls += len(spans)
+            cycle_seconds += float(timings["duration_ms"]) / 1000.0
+            for s in spans:
+                call_seconds += float(s.get("duration_ms") or 0.0) / 1000.0
+                counted = False
+                for key in tokens:
+                    value = _span_tokens(s, key)
+                    if value is not None:
+                        tokens[key] += value
+                        counted = True
+                if counted:
+                    token_calls += 1
+        artifacts += used
+    if not cycles:
+        return None
+    return CallProfile(
+        llm_calls_per_cycle=calls / cycles,
+        seconds_per_call=call_seconds / calls,
+        seconds_per_cycle=cycle_seconds / cycles,
+        input_tokens_per_call=tokens["input_tokens"] / token_calls if token_calls else None,
+        output_tokens_per_call=tokens["output_tokens"] / token_calls if token_calls else None,
+        cycles_sampled=cycles,
+        artifacts_sampled=artifacts,
+    )
+
+
+def profile_recent_backtests(log_dir: Path, *, limit: int = 20) -> CallProfile:
+    """Profile of the newest ``limit`` ``backtest_*.json`` artifacts (default profile if none)."""
+    paths = sorted(
+        Path(log_dir).glob("backtest_*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    return profile_backtest_artifacts(paths[:limit]) or CallProfile.default()
+
+
+def estimate_sweep(
+    profile: CallProfile,
+    *,
+    cycles_per_run: int,
+    run_equivalents: float,
+    max_workers: int,
+    serial_baseline: bool = True,
+    rate_limit_rpm: Optional[float] = None,
+    price_per_mtok: Optional[Tuple[float, float]] = None,
+) -> SweepEstimate:
+    """Predict a sweep of ``run_equivalents`` full-period backtests.
+
+    Runs overlap ``max_workers`` at a time (after the baseline when
+    ``serial_baseline``, as with the thread / process executors). With
+    ``rate_limit_rpm`` the wall time is at least calls / limit.
+    ``price_per_mtok`` is ``(input, output)`` price per million tokens.
+    """
+    workers = max(1, int(max_workers))
+    seconds_per_run = cycles_per_run * profile.seconds_per_cycle
+    parallel_runs = run_equivalents - 1 if serial_baseline else run_equivalents
+    concurrency = max(1.0, min(float(workers), parallel_runs))
+    wall = (seconds_per_run if serial_baseline else 0.0) + (
+        max(0.0, parallel_runs) * seconds_per_run / concurrency
+    )
+    llm_calls = cycles_per_run * profile.llm_calls_per_cycle * run_equivalents
+    calls_per_minute = (
+        concurrency * profile.llm_calls_per_cycle / profile.seconds_per_cycle * 60.0
+        if profile.seconds_per_cycle > 0
+        else 0.0
+    )
+    rate_limited = False
+    if rate_limit_rpm and llm_calls / rate_limit_rpm * 60.0 > wall:
+        wall = llm_calls / rate_limit_rpm * 60.0
+        rate_limited = True
+    input_tokens = output_tokens = cost = None
+    if profile.input_tokens_per_call is not None:
+        input_tokens = llm_calls * profile.input_tokens_per_call
+        output_tokens = llm_calls * (profile.output_tokens_per_call or 0.0)
+        if price_per_mtok is not None:
+            cost = (input_tokens * price_per_mtok[0] + output_tokens * price_per_mtok[1]) / 1e6
+    return SweepEstimate(
+        max_workers=workers,
+        seconds_per_run=seconds_per_run,
+        wall_seconds=wall,
+        llm_calls=llm_calls,
+        calls_per_minute=calls_per_minute,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cost=cost,
+        rate_limited=rate_limited,
+    )
+
+
+def choose_max_workers(
+    profile: CallProfile,
+    *,
+    cycles_per_run: int,
+    run_equivalents: float,
+    deadline_seconds: Optional[float] = None,
+    rate_limit_rpm: Optional[float] = None,
+    cap: int = AUTO_MAX_WORKERS_CAP,
+    serial_baseline: bool = True,
+) -> Tuple[int, str]:
+    """``(max_workers, reason)``: fewest workers meeting the deadline within the rate limit.
+
+    Without a deadline, the most workers the rate limit allows (up to ``cap``).
+    """
+    per_worker_rpm = (
+        profile.llm_calls_per_cycle / profile.seconds_per_cycle * 60.0
+        if profile.seconds_per_cycle > 0
+        else 0.0
+    )
+    upper = max(1, int(cap))
+    if rate_limit_rpm and per_worker_rpm > 0:
+        upper = max(1, min(upper, math.floor(rate_limit_rpm / per_worker_rpm)))
+    limit = (
+        f"{rate_limit_rpm:g} rpm allows {upper} (~{per_worker_rpm:.0f} rpm/worker)"
+        if rate_limit_rpm
+        else f"cap {upper}"
+    )
+    if deadline_seconds is None:
+        return upper, f"auto max_workers={upper} ({limit})"
+    for workers in range(1, upper + 1):
+        estimate = estimate_sweep(
+            profile,
+            cycles_per_run=cycles_per_run,
+            run_equivalents=run_equivalents,
+            max_workers=workers,
+            serial_baseline=serial_baseline,
+            rate_limit_rpm=rate_limit_rpm,
+        )
+        if estimate.wall_seconds <= deadline_seconds:
+            return workers, (
+                f"auto max_workers={workers}: ~{format_duration(estimate.wall_seconds)} "
+                f"fits deadline {format_duration(deadline_seconds)} ({limit})"
+            )
+    return upper, (
+        f"auto max_workers={upper}: deadline {format_duration(deadline_seconds)} "
+        f"not reachable ({limit})"
+    )
+
+
+def format_duration(seconds: float) -> str:
+    seconds = max(0, int(round(seconds)))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+def format_estimate_lines(profile: CallProfile, estimate: SweepEstimate) -> List[str]:
+    """Plan banner lines for ``estimate`` (wall time, rate, tokens / cost)."""
+    lines = [
+        (
+            f"Est. wall time: ~{format_duration(estimate.wall_seconds)} at "
+            f"max_workers={estimate.max_workers} "
+            f"(~{format_duration(estimate.seconds_per_run)}/full run; {profile.describe()})"
+        ),
+        (
+            f"Est. peak LLM rate: ~{estimate.calls_per_minute:.0f} calls/min"
+            + (" — rate limit is the bottleneck" if estimate.rate_limited else "")
+        ),
+    ]
+    if estimate.input_tokens is not None:
+        tokens = (
+            f"Est. tokens: ~{estimate.input_tokens / 1e3:,.0f}k in / "
+            f"{(estimate.output_tokens or 0.0) / 1e3:,.0f}k out"
+        )
+        if estimate.cost is not None:
+            tokens += f" ≈ ${estimate.cost:,.2f}"
+        lines.append(tokens)
+    return lines
@@ -0,0 +1,497 @@
+"""SQLite index of backtest and sweep results across sweeps.
+
+Sweep and backtest artifacts are one JSON file per run; comparing candidates
+across sweeps used to mean loading every file. ``SweepResultStore`` ingests
+their metrics, config and proposed changes into one SQLite file:
+
+* ``runs`` — one row per backtest: status, period, the headline metrics as
+  columns (sharpe, alpha_vs_spy, max_drawdown, total_return), the full
+  metrics / config / proposed changes as JSON, and ``eval_hash`` — the
+  ``config_hash`` of the config snapshot without its period plus its
+  evaluation context (symbols, cash, rebalance frequency, analysis params,
+  LLM — what ``CandidateBacktest`` takes from the base config rather than
+  the snapshot), so the same config on the same window has the same
+  (eval_hash, period_start, period_end). Indexed on that triple and on the
+  period.
+* ``params`` — the snapshot's tunable sections flattened to
+  ``section.key = value`` rows, indexed for "all runs with
+  risk_management=aggressive" queries.
+* ``artifacts`` — ingested files and their mtime, so re-ingesting a log
+  directory only reads new or changed files.
+
+A backtest artifact is authoritative for its run's status, period and
+metrics; a sweep artifact adds sweep id, candidate id, label and proposed
+changes to the runs it points at (``artifact_path``), and adds its own rows
+for runs without a backtest artifact (walk-forward aggregates, pruned runs
+whose artifact is gone). Sweep artifacts do not record the evaluation
+context, so those rows only get one when ingested by a store opened with
+the sweep's ``context``; otherwise they are queryable but never reused.
+
+``ParamSweepRunner(result_store=...)`` looks up each job before running it
+and reuses a successful run of the same config on the same window in the
+store's context.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from strategy_learning.knowledge.records import config_hash, utc_now_iso
+from strategy_learning.sweep.candidates import (
+    config_snapshot_from_sections,
+    merge_proposed_changes,
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "sweep_results.sqlite3"
+BUSY_TIMEOUT_SECONDS = 30.0
+# Snapshot keys that describe the window, not the config.
+PERIOD_KEYS = ("start", "end")
+# BacktestConfig fields a sweep takes from its base config, not the snapshot.
+CONTEXT_KEYS = (
+    "symbols",
+    "initial_cash",
+    "rebalance_frequency",
+    "risk_free_rate",
+    "analysis_params",
+    "llm_provider",
+    "llm_model",
+)
+PARAM_SECTIONS = ("strategy_params", "preferences", "rebalance_params", "signal_config")
+METRIC_COLUMNS = ("sharpe", "alpha_vs_spy", "max_drawdown", "total_return")
+ORDER_COLUMNS = METRIC_COLUMNS + ("period_start", "period_end", "ingested_at")
+
+
+def evaluation_context(config: Dict[str, Any]) -> Dict[str, Any]:
+    """The ``CONTEXT_KEYS`` of a ``BacktestConfig.to_dict()`` (symbols upper-cased, sorted)."""
+    context = {key: config.get(key) for key in CONTEXT_KEYS}
+    context["symbols"] = sorted(str(s).upper() for s in context["symbols"] or [])
+    return context
+
+
+def evaluation_hash(
+    config_snapshot: Dict[str, Any], context: Optional[Dict[str, Any]] = None
+) -> Optional[str]:
+    """``config_hash`` of the snapshot without its period keys, in ``context``.
+
+    None without a context: such runs cannot be matched for reuse.
+    """
+    if context is None:
+        return None
+    return config_hash(
+        {
+            "config": {k: v for k, v in config_snapshot.items() if k not in PERIOD_KEYS},
+            "context": context,
+        }
+    )
+
+
+def backtest_snapshot(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Sweep-style config snapshot for a backtest artifact's ``config``.
+
+    Matches what ``ParamSweepRunner`` hands ``CandidateBacktest`` for the
+    same run, so both hash to the same ``evaluation_hash``.
+    """
+    snapshot = config_snapshot_from_sections(
+        strategy_params=config.get("strategy_params"),
+        preferences=config.get("preferences"),
+        rebalance_params=config.get("rebalance_params"),
+        signal_config=config.get("signal_config"),
+    )
+    if config.get("decision_policy", "llm") != "llm":
+        snapshot["decision_policy"] = config["decision_policy"]
+    for key in PERIOD_KEYS:
+        if config.get(key):
+            snapshot[key] = str(config[key])[:10]
+    return snapshot
+
+
+def param_text(value: Any) -> str:
+    """Canonical text for a param value (strings as-is, the rest as JSON)."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return value
+        if isinstance(value, str):
+            return value
+    return json.dumps(value, sort_keys=True)
+
+
+def _flatten_params(config_snapshot: Dict[str, Any]) -> List[Tuple[str, str]]:
+    rows: List[Tuple[str, str]] = []
+    for section in PARAM_SECTIONS:
+        for key, value in sorted((config_snapshot.get(section) or {}).items()):
+            rows.append((f"{section}.{key}", param_text(value)))
+    return rows
+
+
+def _metric(metrics: Dict[str, Any], key: str) -> Optional[float]:
+    value = metrics.get(key)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SweepResultStore:
+    """Cross-sweep result index in SQLite (see module docstring)."""
+
+    def __init__(self, path: Union[str, Path], *, context: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            path: SQLite file (created on first use)
+            context: ``evaluation_context`` of the sweep using the store;
+                ``lookup`` matches runs in this context only, and rows from
+                ``ingest_sweep_artifact`` without a backtest artifact get it
+        """
+        self.path = Path(path)
+        self.context = context
+        self._lock = threading.Lock()
+
+    # -- ingestion ---------------------------------------------------------
+
+    def ingest_dir(self, log_dir: Union[str, Path]) -> Dict[str, int]:
+        """Ingest every ``backtest_*.json`` and ``sweep_*.json`` new or changed since last time."""
+        counts = {"backtest": 0, "sweep": 0, "unchanged": 0, "unreadable": 0}
+        log_dir = Path(log_dir)
+        for pattern, kind in (("backtest_*.json", "backtest"), ("sweep_*.json", "sweep")):
+            for path in sorted(log_dir.glob(pattern)):
+                outcome = self._ingest_file(path, kind)
+                counts[outcome] += 1
+        return counts
+
+    def ingest_backtest_artifact(self, path: Union[str, Path]) -> bool:
+        """Index one backtest artifact; False when it is unreadable."""
+        return self._ingest_file(Path(path), "backtest", force=True) == "backtest"
+
+    def ingest_sweep_artifact(self, path: Union[str, Path]) -> bool:
+        """Index a sweep artifact (run in the store's context) and the backtest
+        artifacts its runs point at."""
+        return self._ingest_file(Path(path), "sweep", force=True, context=self.context) == "sweep"
+
+    def _ingest_file(
+        self,
+        path: Path,
+        kind: str,
+        *,
+        force: bool = False,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        key = str(path.resolve())
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return "unreadable"
+        if not force and self._ingested_mtime(key) == mtime:
+            return "unchanged"
+        try:
+            with path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("Result store: skipping unreadable %s: %s", path, exc)
+            return "unreadable"
+        if not isinstance(data, dict):
+            return "unreadable"
+        if kind == "sweep":
+            self._ingest_sweep(data, sweep_path=key, context=context)
+        else:
+            self._ingest_backtest(data, artifact_key=key)
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO artifacts (path, kind, mtime, ingested_at) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(path) DO UPDATE SET mtime = excluded.mtime,"
+                " ingested_at = excluded.ingested_at",
+                (key, kind, mtime, utc_now_iso()),
+            )
+        return kind
+
+    def _ingest_backtest(self, data: Dict[str, Any], *, artifact_key: str) -> None:
+        config = dict(data.get("config") or {})
+        snapshot = backtest_snapshot(config)
+        self._upsert(
+            run_key=artifact_key,
+            source="backtest",
+            snapshot=snapshot,
+            context=evaluation_context(config),
+            status=str(data.get("status") or "unknown"),
+            run_id=data.get("run_id"),
+            label=config.get("run_label"),
+            metrics=dict(data.get("metrics") or {}),
+            artifact_path=artifact_key,
+        )
+
+    def _ingest_sweep(
+        self, data: Dict[str, Any], *, sweep_path: str, context: Optional[Dict[str, Any]]
+    ) -> None:
+        sweep_id = str(data.get("sweep_id") or "")
+        baseline_config = dict(data.get("baseline_config") or {})
+        period = {
+            "start": data.get("period_start") or baseline_config.get("start"),
+            "end": data.get("period_end") or baseline_config.get("end"),
+        }
+        runs = [dict(data.get("baseline") or {}, is_baseline=True)]
+        runs += [dict(c) for c in data.get("candidates") or []]
+        for run in runs:
+            if not run.get("candidate_id"):
+                continue
+            proposed = dict(run.get("proposed_changes") or {})
+            snapshot = merge_proposed_changes(baseline_config, proposed)
+            snapshot.update({k: v for k, v in period.items() if v})
+            artifact = run.get("artifact_path")
+            artifact_key = str(Path(artifact).resolve()) if artifact else None
+            if artifact_key and Path(artifact_key).exists():
+                # The backtest artifact knows the run's real period (halving rungs).
+                self._ingest_file(Path(artifact_key), "backtest")
+            if artifact_key is None or not self._has_run(artifact_key):
+                self._upsert(
+                    run_key=artifact_key or f"{sweep_id}:{run['candidate_id']}",
+                    source="sweep",
+                    snapshot=snapshot,
+                    context=context,
+                    status=str(run.get("status") or "unknown"),
+                    run_id=run.get("run_id"),
+                    label=run.get("label"),
+                    metrics=dict(run.get("metrics") or {}),
+                    artifact_path=artifact_key,
+                )
+            with self._transaction() as conn:
+                conn.execute(
+                    "UPDATE runs SET sweep_id = ?, sweep_path = ?, candidate_id = ?, label = ?,"
+                    " is_baseline = ?, proposed_changes = ?"
+                    " WHERE run_key = ?",
+                    (
+                        sweep_id,
+                        sweep_path,
+                        run["candidate_id"],
+                        run.get("label"),
+                        1 if run.get("is_baseline") else 0,
+                        json.dumps(proposed, sort_keys=True),
+                        artifact_key or f"{sweep_id}:{run['candidate_id']}",
+                    ),
+                )
+
+    def _upsert(
+        self,
+        *,
+        run_key: str,
+        source: str,
+        snapshot: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        status: str,
+        run_id: Optional[str],
+        label: Optional[str],
+        metrics: Dict[str, Any],
+        artifact_path: Optional[str],
+    ) -> None:
+        row = {
+            "run_key": run_key,
+            "source": source,
+            "run_id": run_id,
+            "label": label,
+            "status": status,
+            "eval_hash": evaluation_hash(snapshot, context),
+            "period_start": snapshot.get("start"),
+            "period_end": snapshot.get("end"),
+            **{col: _metric(metrics, col) for col in METRIC_COLUMNS},
+            "config": json.dumps(snapshot, sort_keys=True, default=str),
+            "metrics": json.dumps(metrics, sort_keys=True, default=str),
+            "artifact_path": artifact_path,
+            "ingested_at": utc_now_iso(),
+        }
+        columns = ", ".join(row)
+        updates = ", ".join(
+            # A context-less re-ingest (ingest_dir) must not forget a known context.
+            "eval_hash = COALESCE(excluded.eval_hash, runs.eval_hash)"
+            if col == "eval_hash"
+            else f"{col} = excluded.{col}"
+            for col in row
+            if col != "run_key"
+        )
+        with self._transaction() as conn:
+            # No RETURNING: it needs SQLite 3.35, newer than some Python 3.9 builds ship.
+            conn.execute(
+                f"INSERT INTO runs ({columns}) VALUES ({', '.join('?' for _ in row)})"
+                f" ON CONFLICT(run_key) DO UPDATE SET {updates}",
+                tuple(row.values()),
+            )
+            seq = conn.execute(
+                "SELECT seq FROM runs WHERE run_key = ?", (run_key,)
+            ).fetchone()[0]
+            conn.execute("DELETE FROM params WHERE run_seq = ?", (seq,))
+            conn.executemany(
+                "INSERT INTO params (run_seq, path, value) VALUES (?, ?, ?)",
+                [(seq, path, value) for path, value in _flatten_params(snapshot)],
+            )
+
+    # -- queries -------------------------------------------------------------
+
+    def lookup(self, config_snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Newest successful run of exactly this config on exactly this window
+        (in the store's context; None without one)."""
+        start = config_snapshot.get("start")
+        end = config_snapshot.get("end")
+        eval_hash = evaluation_hash(config_snapshot, self.context)
+        if not start or not end or eval_hash is None:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM runs WHERE eval_hash = ? AND period_start = ? AND period_end = ?"
+                " AND status = 'success' ORDER BY ingested_at DESC LIMIT 1",
+                (eval_hash, str(start)[:10], str(end)[:10]),
+            ).fetchone()
+        return _row_dict(row) if row else None
+
+    def query(
+        self,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        status: Optional[str] = "success",
+        order_by: str = "sharpe",
+        limit: Optional[int] = 20,
+    ) -> List[Dict[str, Any]]:
+        """Runs matching every ``params`` entry whose period lies in ``[since, until]``.
+
+        ``params`` keys are ``section.key`` paths or bare keys (any section):
+        ``{"risk_management": "aggressive"}``. Ordered best first by
+        ``order_by`` (``max_drawdown``: smallest loss first).
+        """
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"order_by must be one of {ORDER_COLUMNS}, got {order_by!r}")
+        where: List[str] = []
+        args: List[Any] = []
+        for key, value in (params or {}).items():
+            path_clause = "p.path = ?" if "." in key else "p.path LIKE ?"
+            where.append(
+                "EXISTS (SELECT 1 FROM params p WHERE p.run_seq = runs.seq"
+                f" AND {path_clause} AND p.value = ?)"
+            )
+            args += [key if "." in key else f"%.{key}", param_text(value)]
+        if since:
+            where.append("period_start >= ?")
+            args.append(since)
+        if until:
+            where.append("period_end <= ?")
+            args.append(until)
+        if status:
+            where.append("status = ?")
+            args.append(status)
+        order = "ABS(max_drawdown) ASC" if order_by == "max_drawdown" else f"{order_by} DESC"
+        sql = "SELECT * FROM runs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order_by} IS NULL, {order}, seq"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(int(limit))
+        with self._connect() as conn:
+            return [_row_dict(row) for row in conn.execute(sql, args).fetchall()]
+
+    def _has_run(self, run_key: str) -> bool:
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM runs WHERE run_key = ?", (run_key,)).fetchone() is not None
+
+    def _ingested_mtime(self, path: str) -> Optional[float]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT mtime FROM artifacts WHERE path = ?", (path,)).fetchone()
+        return float(row[0]) if row else None
+
+    # -- connection ------------------------------------------------------------
+
+    def _connect(self) -> "_ClosingConnection":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _ensure_schema(conn)
+        return _ClosingConnection(conn)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+
+class _ClosingConnection:
+    """Context manager that closes (not just commits) the connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, *exc: Any) -> None:
+        self._conn.close()
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS runs ("
+        " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " run_key TEXT NOT NULL UNIQUE,"
+        " source TEXT NOT NULL,"
+        " sweep_id TEXT,"
+        " sweep_path TEXT,"
+        " run_id TEXT,"
+        " candidate_id TEXT,"
+        " label TEXT,"
+        " is_baseline INTEGER NOT NULL DEFAULT 0,"
+        " status TEXT NOT NULL,"
+        " eval_hash TEXT,"
+        " period_start TEXT,"
+        " period_end TEXT,"
+        " sharpe REAL,"
+        " alpha_vs_spy REAL,"
+        " max_drawdown REAL,"
+        " total_return REAL,"
+        " proposed_changes TEXT NOT NULL DEFAULT '{}',"
+        " config TEXT NOT NULL,"
+        " metrics TEXT NOT NULL,"
+        " artifact_path TEXT,"
+        " ingested_at TEXT NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS runs_eval ON runs (eval_hash, period_start, period_end)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS runs_period ON runs (period_start, period_end)")
+    conn.execute("CREATE INDEX IF NOT EXISTS runs_sweep ON runs (sweep_id)")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS params ("
+        " run_seq INTEGER NOT NULL REFERENCES runs (seq) ON DELETE CASCADE,"
+        " path TEXT NOT NULL,"
+        " value TEXT NOT NULL,"
+        " PRIMARY KEY (run_seq, path))"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS params_path_value ON params (path, value)")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS artifacts ("
+        " path TEXT PRIMARY KEY,"
+        " kind TEXT NOT NULL,"
+        " mtime REAL NOT NULL,"
+        " ingested_at TEXT NOT NULL)"
+    )
+
+
+def _row_dict(row: sqlite3.Row) -> Dict[str, Any]:
+    out = dict(row)
+    for key in ("config", "metrics", "proposed_changes"):
+        out[key] = json.loads(out[key]) if out.get(key) else {}
+    out["is_baseline"] = bool(out.get("is_baseline"))
+    return out
@@ -3,23 +3,39 @@
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import date, datetime
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from strategy_learning.knowledge.records import new_id, utc_now_iso
 from strategy_learning.knowledge.store import KnowledgeBase
 from strategy_learning.sweep.candidates import expand_oat_candidates, merge_proposed_changes
+from strategy_learning.sweep.checkpoint import SweepCheckpoint
 from strategy_learning.sweep.models import SweepCandidateResult, SweepResult
+from strategy_learning.sweep.planner import (
+    AUTO_MAX_WORKERS_CAP,
+    CallProfile,
+    SweepEstimate,
+    choose_max_workers,
+    estimate_sweep,
+    format_duration,
+    format_estimate_lines,
+)
+from strategy_learning.sweep.search import SearchStrategy
 from strategy_learning.sweep.recommend import maybe_write_recommendation, select_winner
 
 logger = logging.getLogger(__name__)
 
-# Rough LLM calls per rebalance cycle (3 analysis + strategy + optional rebalance).
-_EST_LLM_CALLS_PER_CYCLE = 5
-
-# (proposed_changes, run_label) → run-like object with run_id/status/metrics (+ optional artifact_path)
+# (proposed_changes, run_label) → run-like object with run_id/status/metrics (+ optional artifact_path).
+# executor="process" pickles it into worker processes: use a module-level function or class.
+# executor="lockstep" also needs ``run_many([(snapshot, run_label), ...], max_workers=N) -> [run, ...]``.
+# Successive-halving rungs pass snapshots whose "end" is the rung's prefix end date;
+# surrogate screening (screen_top) passes snapshots with "decision_policy": "rules".
 BacktestCallable = Callable[[Dict[str, Any], str], Any]
 
 
@@ -67,6 +83,41 @@ def estimate_rebalance_cycles(
     return max(1, days // 7)
 
 
+def successive_halving_schedule(
+    n_candidates: int, *, rungs: int, eta: int = 3
+) -> List[Tuple[float, int]]:
+    """``(fraction of period, candidates run)`` per rung, ending with the full period.
+
+    Rung ``i`` of ``rungs`` covers ``eta ** -(rungs - i)`` of the period and
+    keeps the top ``ceil(n / eta)`` candidates for the next one. Rungs stop
+    early once a single candidate is left.
+    """
+    schedule: List[Tuple[float, int]] = []
+    alive = n_candidates
+    for i in range(max(0, rungs)):
+        if alive <= 1:
+            break
+        schedule.append((float(eta) ** -(rungs - i), alive))
+        alive = math.ceil(alive / eta)
+    schedule.append((1.0, alive))
+    return schedule
+
+
+def sweep_run_equivalents(
+    n_candidates: int, *, halving_rungs: int = 0, halving_eta: int = 3, adaptive_candidates: int = 0
+) -> float:
+    """Full-period backtest equivalents: baseline + candidates, rungs by the days they add.
+
+    A survivor's next rung continues from its previous rung's engine
+    checkpoint, so each rung only costs the part of the period it adds.
+    """
+    schedule = successive_halving_schedule(n_candidates, rungs=halving_rungs, eta=halving_eta)
+    covered = [0.0] + [fraction for fraction, _ in schedule]
+    return 1 + adaptive_candidates + sum(
+        (fraction - prev) * count for prev, (fraction, count) in zip(covered, schedule)
+    )
+
+
 def format_sweep_plan(
     *,
     candidate_labels: List[str],
@@ -74,11 +125,45 @@ def format_sweep_plan(
     period_start: Optional[str] = None,
     period_end: Optional[str] = None,
     rebalance_frequency: str = "weekly",
+    executor: str = "thread",
+    halving_rungs: int = 0,
+    halving_eta: int = 3,
+    screen_top: int = 0,
+    search_name: str = "oat",
+    adaptive_candidates: int = 0,
+    call_profile: Optional[CallProfile] = None,
+    rate_limit_rpm: Optional[float] = None,
+    price_per_mtok: Optional[Tuple[float, float]] = None,
+    deadline_seconds: Optional[float] = None,
+    workers_note: Optional[str] = None,
 ) -> str:
-    """Human-readable plan banner for operators."""
-    n_candidates = len(candidate_labels)
+    """Human-readable plan banner for operators.
+
+    ``adaptive_candidates``: extra candidates an adaptive search (TPE) picks
+    while the sweep runs, so they are not in ``candidate_labels`` yet.
+    ``screen_top``: only that many candidates survive the no-LLM rules
+    screen; screening runs do not count towards LLM time or cost.
+    Time / token / cost estimates come from ``call_profile`` (see
+    ``strategy_learning.sweep.planner``; default: assumed latency).
+    """
+    n_candidates = len(candidate_labels) + adaptive_candidates
     n_backtests = n_candidates + 1  # baseline + candidates
-    mode = "SEQUENTIAL" if max_workers <= 1 else f"PARALLEL (max_workers={max_workers})"
+    n_screened = _screened_count(len(candidate_labels), screen_top)
+    schedule = successive_halving_schedule(n_screened, rungs=halving_rungs, eta=halving_eta)
+    # Full-period backtest equivalents (each rung counts by the days it adds).
+    run_equivalents = sweep_run_equivalents(
+        n_screened,
+        halving_rungs=halving_rungs,
+        halving_eta=halving_eta,
+        adaptive_candidates=adaptive_candidates,
+    )
+    profile = call_profile or CallProfile.default()
+    if executor == "lockstep":
+        mode = f"LOCKSTEP (one day loop for all runs, max_workers={max_workers} decisions at once)"
+    elif max_workers <= 1:
+        mode = "SEQUENTIAL"
+    else:
+        mode = f"PARALLEL (max_workers={max_workers}, {executor} pool)"
     cycles = estimate_rebalance_cycles(
         period_start, period_end, rebalance_frequency=rebalance_frequency
     )
@@ -87,7 +172,11 @@ def format_sweep_plan(
         "PARAM SWEEP PLAN",
         "=" * 72,
         f"Execution mode: {mode}",
-        f"Backtest runs: {n_backtests} (1 baseline + {n_candidates} OAT candidates)",
+        *([workers_note] if workers_note else []),
+        (
+            f"Backtest runs: {n_backtests} "
+            f"(1 baseline + {n_candidates} {search_name.upper()} candidates)"
+        ),
         (
             "Note: default --max-workers=1 runs candidates one after another. "
             "Pass --max-workers N to overlap candidate backtests."
@@ -95,9 +184,23 @@ def format_sweep_plan(
             else "Candidate backtests may overlap; LLM calls within each backtest stay sequential."
         ),
     ]
+    if n_screened < len(candidate_labels):
+        lines.append(
+            f"Surrogate screen: {len(candidate_labels)} candidates on the rules policy "
+            f"(no LLM) → top {n_screened} go on to LLM backtests"
+        )
+    if len(schedule) > 1:
+        lines.append(
+            "Successive halving: "
+            + " → ".join(
+                f"{count} on {'full period' if fraction == 1.0 else f'first {fraction:.0%}'}"
+                for fraction, count in schedule
+            )
+            + f" (top 1/{halving_eta} kept per rung; ≈{run_equivalents:.1f} full-run equivalents)"
+        )
     if cycles is not None:
-        est_llm_per_run = cycles * _EST_LLM_CALLS_PER_CYCLE
-        est_llm_total = est_llm_per_run * n_backtests
+        est_llm_per_run = round(cycles * profile.llm_calls_per_cycle)
+        est_llm_total = round(est_llm_per_run * run_equivalents)
         lines.extend(
             [
                 (
@@ -105,38 +208,133 @@ def format_sweep_plan(
                     f"({rebalance_frequency}, calendar estimate)"
                 ),
                 (
-                    f"Est. LLM invocations: ~{est_llm_per_run}/run × {n_backtests} runs "
-                    f"≈ {est_llm_total} total (rough; actual varies)"
+                    f"Est. LLM invocations: ~{est_llm_per_run}/run × "
+                    f"{round(run_equivalents, 1):g} runs ≈ {est_llm_total} total "
+                    "(rough; actual varies)"
                 ),
             ]
         )
+        estimate = estimate_sweep(
+            profile,
+            cycles_per_run=cycles,
+            run_equivalents=run_equivalents,
+            max_workers=max_workers,
+            serial_baseline=executor != "lockstep",
+            rate_limit_rpm=rate_limit_rpm,
+            price_per_mtok=price_per_mtok,
+        )
+        lines.extend(format_estimate_lines(profile, estimate))
+        if deadline_seconds is not None and estimate.wall_seconds > deadline_seconds:
+            lines.append(
+                f"WARNING: estimate exceeds deadline {format_duration(deadline_seconds)}"
+            )
     lines.append("Candidates to test:")
     for i, label in enumerate(candidate_labels, start=1):
         lines.append(f"  {i:2d}. {label}")
-    if not candidate_labels:
+    if adaptive_candidates:
+        lines.append(f"  (up to {adaptive_candidates} chosen by {search_name} as results come in)")
+    elif not candidate_labels:
         lines.append("  (none — baseline only)")
     lines.append("=" * 72)
     return "\n".join(lines)
 
 
+EXECUTORS = ("thread", "process", "lockstep")
+
+
 class ParamSweepRunner:
-    """Run baseline + OAT candidates via an injected backtest callable."""
+    """Run baseline + candidates (OAT or a ``SearchStrategy``) via an injected backtest callable.
+
+    ``executor="thread"`` overlaps candidates in one process (fine while
+    backtests are LLM-bound). ``executor="process"`` runs each candidate in a
+    worker process with its own engine, providers and LLM clients, so CPU-bound
+    work (bar slicing, indicators, metrics, serialization) is not serialized on
+    the GIL. With those two the baseline runs in the calling process first.
+    ``executor="lockstep"`` hands baseline and candidates to
+    ``run_backtest.run_many`` in one batch so they share a single day loop
+    (see ``BacktestEngine.run_many``).
+
+    ``halving_rungs > 0`` turns on successive halving: candidates first run on
+    short prefixes of the period (``successive_halving_schedule``), only the
+    top ``1 / halving_eta`` by ``metric_rank_key`` advance to the next rung,
+    and only the last survivors run the full period. With an engine
+    ``checkpoint_dir`` (as the sweep CLIs set up) a survivor's next rung
+    continues the run it was scored on instead of replaying the prefix.
+    Pruned candidates keep
+    their partial metrics with ``status="pruned"``; the trace goes to
+    ``SweepResult.notes``.
+
+    ``screen_top > 0`` first backtests every candidate with the rule-based
+    surrogate policy (snapshot ``"decision_policy": "rules"``, no LLM; see
+    ``trading_agent.backtest.surrogate``) and sends only the top
+    ``screen_top`` on to LLM backtests (and halving, if on). Screened-out
+    candidates keep their surrogate metrics with ``status="pruned"``.
+
+    ``call_profile`` (measured LLM latency / tokens, see
+    ``planner.profile_recent_backtests``) drives the plan's wall-time and cost
+    estimate and the ETA shown before the first run finishes; after that the
+    ETA follows the observed pace. ``max_workers="auto"`` picks the fewest
+    workers that meet ``deadline_seconds`` within ``rate_limit_rpm``
+    (``planner.choose_max_workers``).
+
+    ``result_store`` (a ``SweepResultStore``) is consulted before each run,
+    after the checkpoint: a successful run of the same config snapshot on the
+    same window in any earlier sweep or backtest is reused instead of run.
+    """
 
     def __init__(
         self,
         *,
         knowledge_base: Optional[KnowledgeBase] = None,
         run_backtest: Optional[BacktestCallable] = None,
-        max_workers: int = 1,
+        max_workers: Union[int, str] = 1,
         rebalance_frequency: str = "weekly",
+        executor: str = "thread",
+        halving_rungs: int = 0,
+        halving_eta: int = 3,
+        screen_top: int = 0,
+        call_profile: Optional[CallProfile] = None,
+        rate_limit_rpm: Optional[float] = None,
+        deadline_seconds: Optional[float] = None,
+        price_per_mtok: Optional[Tuple[float, float]] = None,
+        result_store: Optional[Any] = None,
     ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+        if executor == "lockstep" and not callable(getattr(run_backtest, "run_many", None)):
+            raise ValueError("executor='lockstep' requires run_backtest with a run_many method")
+        if halving_rungs < 0:
+            raise ValueError(f"halving_rungs must be >= 0, got {halving_rungs}")
+        if halving_eta < 2:
+            raise ValueError(f"halving_eta must be >= 2, got {halving_eta}")
+        if screen_top < 0:
+            raise ValueError(f"screen_top must be >= 0, got {screen_top}")
+        if isinstance(max_workers, str) and max_workers != "auto":
+            raise ValueError(f"max_workers must be an int or 'auto', got {max_workers!r}")
+        if rate_limit_rpm is not None and rate_limit_rpm <= 0:
+            raise ValueError(f"rate_limit_rpm must be > 0, got {rate_limit_rpm}")
         self.knowledge_base = knowledge_base
         self.run_backtest = run_backtest
-        self.max_workers = max(1, int(max_workers))
+        self.auto_workers = max_workers == "auto"
+        self.max_workers = 1 if self.auto_workers else max(1, int(max_workers))
+        self.executor = executor
         self.rebalance_frequency = rebalance_frequency
+        self.halving_rungs = int(halving_rungs)
+        self.halving_eta = int(halving_eta)
+        self.screen_top = int(screen_top)
+        self.call_profile = call_profile or CallProfile.default()
+        self.rate_limit_rpm = rate_limit_rpm
+        self.deadline_seconds = deadline_seconds
+        self.price_per_mtok = price_per_mtok
+        self.result_store = result_store
+        self._estimate: Optional[SweepEstimate] = None
+        self._started = 0.0
         self._progress_lock = threading.Lock()
         self._completed = 0
         self._total_runs = 0
+        self._checkpoint: Optional[SweepCheckpoint] = None
+        self._resumed_runs = 0
+        self._stored_runs = 0
 
     def run(
         self,
@@ -149,64 +347,192 @@ class ParamSweepRunner:
         artifact_path: Optional[str] = None,
         validate_artifact_path: Optional[str] = None,
         candidates: Optional[List[Dict[str, Any]]] = None,
+        checkpoint: Optional[SweepCheckpoint] = None,
+        search: Optional[SearchStrategy] = None,
     ) -> SweepResult:
+        """Run the sweep; with ``checkpoint``, finished runs are saved as they
+        complete and runs already in it are not executed again (resume).
+
+        Candidates are ``candidates`` if given, else those of ``search``
+        (default: OAT). An adaptive ``search`` (TPE) is asked for
+        ``max_workers`` candidates at a time and told each batch's results.
+        """
         if self.run_backtest is None:
             raise ValueError("ParamSweepRunner requires run_backtest callable")
 
-        sweep_id = new_id("sw")
+        sweep_id = checkpoint.sweep_id if checkpoint is not None else new_id("sw")
+        self._checkpoint = checkpoint
         timestamp = utc_now_iso()
-        oat = candidates if candidates is not None else expand_oat_candidates(baseline_config)
+        adaptive = candidates is None and search is not None and search.adaptive
+        if candidates is not None:
+            oat = candidates
+        elif search is not None:
+            oat = [] if adaptive else search.candidates()
+        else:
+            oat = expand_oat_candidates(baseline_config)
         notes: List[str] = []
+        jobs = _jobs_for(oat, baseline_config)
 
-        jobs: List[Dict[str, Any]] = []
-        for raw in oat:
-            proposed = dict(raw.get("proposed_changes") or {})
-            if not proposed:
-                continue
-            jobs.append(
-                {
-                    "candidate_id": str(raw.get("candidate_id") or new_id("sc")),
-                    "label": str(raw.get("label") or "candidate"),
-                    "proposed_changes": proposed,
-                    "config_snapshot": merge_proposed_changes(baseline_config, proposed),
-                }
-            )
-
+        period_start = period_start or _snapshot_date(baseline_config, "start")
+        period_end = period_end or _snapshot_date(baseline_config, "end")
+        adaptive_budget = search.budget if adaptive else 0
+        workers_note = self._plan_workers(
+            _screened_count(len(jobs), self.screen_top), adaptive_budget, period_start, period_end
+        )
         plan = format_sweep_plan(
             candidate_labels=[j["label"] for j in jobs],
             max_workers=self.max_workers,
-            period_start=period_start
-            or (
-                baseline_config.get("start")
-                if isinstance(baseline_config.get("start"), str)
-                else None
-            ),
-            period_end=period_end
-            or (
-                baseline_config.get("end")
-                if isinstance(baseline_config.get("end"), str)
-                else None
-            ),
+            period_start=period_start,
+            period_end=period_end,
             rebalance_frequency=self.rebalance_frequency,
+            executor=self.executor,
+            halving_rungs=self.halving_rungs,
+            halving_eta=self.halving_eta,
+            screen_top=0 if adaptive else self.screen_top,
+            search_name=search.name if search is not None and candidates is None else "oat",
+            adaptive_candidates=adaptive_budget,
+            call_profile=self.call_profile,
+            rate_limit_rpm=self.rate_limit_rpm,
+            price_per_mtok=self.price_per_mtok,
+            deadline_seconds=self.deadline_seconds,
+            workers_note=workers_note,
         )
+        if workers_note:
+            notes.append(workers_note)
         logger.info("\n%s", plan)
         # Also print so progress is visible even when httpx INFO dominates logs.
         print(plan, flush=True)
 
+        if adaptive and self.halving_rungs:
+            notes.append(f"Successive halving not applied to adaptive {search.name} search")
+        if adaptive and self.screen_top:
+            notes.append(f"Surrogate screening not applied to adaptive {search.name} search")
+        n_screened = _screened_count(len(jobs), self.screen_top)
+        screening = n_screened < len(jobs)
+        rung_ends = self._rung_end_dates(n_screened, period_start, period_end, notes)
         self._completed = 0
-        self._total_runs = 1 + len(jobs)
-
-        baseline_result = self._execute_one(
-            candidate_id=f"{sweep_id}-baseline",
-            label="baseline",
-            proposed_changes={},
-            config_snapshot=baseline_config,
-            is_baseline=True,
-            run_label=f"{run_label}_baseline",
-            progress_index=1,
+        self._resumed_runs = 0
+        self._stored_runs = 0
+        self._started = time.monotonic()
+        self._total_runs = (
+            adaptive_budget
+            + 1
+            + (len(jobs) if screening else 0)
+            + sum(
+                count
+                for _, count in successive_halving_schedule(
+                    n_screened, rungs=len(rung_ends), eta=self.halving_eta
+                )
+            )
         )
 
-        candidate_results = self._execute_many(jobs, run_label=run_label)
+        baseline_job = {
+            "candidate_id": f"{sweep_id}-baseline",
+            "label": "baseline",
+            "proposed_changes": {},
+            "config_snapshot": baseline_config,
+        }
+        progress = 1
+        if self.executor != "lockstep":
+            baseline_result = self._execute_one(
+                **baseline_job,
+                is_baseline=True,
+                run_label=f"{run_label}_baseline",
+                progress_index=1,
+            )
+            progress = 2
+
+        survivors = jobs
+        pruned: Dict[str, SweepCandidateResult] = {}
+        if screening:
+            screen_jobs = [
+                dict(job, config_snapshot=dict(job["config_snapshot"], decision_policy="rules"))
+                for job in jobs
+            ]
+            if self.executor == "lockstep":
+                screened = self._execute_lockstep(
+                    screen_jobs,
+                    run_label=f"{run_label}_screen",
+                    progress_offset=progress,
+                    with_baseline=False,
+                )
+            else:
+                screened = self._execute_many(
+                    screen_jobs, run_label=f"{run_label}_screen", progress_offset=progress
+                )
+            progress += len(screen_jobs)
+            survivors, dropped = self._prune(survivors, screened, keep=n_screened)
+            for result in dropped:
+                if result.status == "success":
+                    result = replace(
+                        result, status="pruned", error="screened out by rules surrogate"
+                    )
+                pruned[result.candidate_id] = result
+            notes.append(_screen_note(survivors, dropped))
+        for rung, rung_end in enumerate(rung_ends, start=1):
+            if len(survivors) <= 1:
+                break
+            rung_jobs = [
+                dict(job, config_snapshot=dict(job["config_snapshot"], end=rung_end))
+                for job in survivors
+            ]
+            if self.executor == "lockstep":
+                partial = self._execute_lockstep(
+                    rung_jobs,
+                    run_label=f"{run_label}_r{rung}",
+                    progress_offset=progress,
+                    with_baseline=False,
+                )
+            else:
+                partial = self._execute_many(
+                    rung_jobs, run_label=f"{run_label}_r{rung}", progress_offset=progress
+                )
+            progress += len(rung_jobs)
+            survivors, dropped = self._prune(survivors, partial)
+            for result in dropped:
+                if result.status == "success":
+                    result = replace(
+                        result,
+                        status="pruned",
+                        error=f"pruned at rung {rung} ({period_start}→{rung_end})",
+                    )
+                pruned[result.candidate_id] = result
+            notes.append(_rung_note(rung, len(rung_ends), period_start, rung_end, survivors, dropped))
+            with self._progress_lock:
+                self._total_runs = progress - 1 + sum(
+                    count
+                    for _, count in successive_halving_schedule(
+                        len(survivors), rungs=len(rung_ends) - rung, eta=self.halving_eta
+                    )
+                )
+
+        if adaptive:
+            if self.executor == "lockstep":
+                baseline_result = self._execute_lockstep(
+                    [baseline_job], run_label=run_label, progress_offset=progress
+                )[0]
+                progress += 1
+            finished = self._run_adaptive(
+                search, baseline_config, run_label=run_label, progress_offset=progress
+            )
+        elif self.executor == "lockstep":
+            baseline_result, *finished = self._execute_lockstep(
+                [baseline_job] + survivors, run_label=run_label, progress_offset=progress
+            )
+        else:
+            finished = self._execute_many(survivors, run_label=run_label, progress_offset=progress)
+        by_id = {r.candidate_id: r for r in finished}
+        by_id.update(pruned)
+        candidate_results = (
+            finished
+            if adaptive
+            else [by_id[j["candidate_id"]] for j in jobs if j["candidate_id"] in by_id]
+        )
+        if search is not None and candidates is None and search.name != "oat":
+            notes.append(
+                f"Search {search.name}: {len(candidate_results)} candidates "
+                f"(budget {search.budget or 'none'}, space of {search.size} configs)"
+            )
         winner = select_winner(baseline_result, candidate_results)
         if winner.is_baseline:
             notes.append("No candidate beat baseline; no recommendation written")
@@ -217,14 +543,23 @@ class ParamSweepRunner:
             sweep_id=sweep_id,
             timestamp=timestamp,
             run_label=run_label,
-            period_start=period_start or (baseline_config.get("start") if isinstance(baseline_config.get("start"), str) else None),
-            period_end=period_end or (baseline_config.get("end") if isinstance(baseline_config.get("end"), str) else None),
+            period_start=period_start,
+            period_end=period_end,
             baseline_config=dict(baseline_config),
             baseline=baseline_result,
             candidates=candidate_results,
             winner=winner,
             notes=notes,
         )
+        if self._stored_runs:
+            notes.append(
+                f"Reused {self._stored_runs} runs already evaluated on the same window "
+                "(result store)"
+            )
+        if checkpoint is not None:
+            if self._resumed_runs:
+                notes.append(f"Resumed {self._resumed_runs} finished runs from checkpoint")
+            checkpoint.mark_complete()
 
         if write_kb:
             kb = self.knowledge_base or KnowledgeBase()
@@ -242,19 +577,142 @@ class ParamSweepRunner:
 
         return result
 
+    def _plan_workers(
+        self,
+        n_candidates: int,
+        adaptive_candidates: int,
+        period_start: Optional[str],
+        period_end: Optional[str],
+    ) -> Optional[str]:
+        """Resolve ``max_workers="auto"`` and remember the estimate for the first ETA."""
+        cycles = estimate_rebalance_cycles(
+            period_start, period_end, rebalance_frequency=self.rebalance_frequency
+        )
+        if cycles is None:
+            self._estimate = None
+            if self.auto_workers:
+                return "auto max_workers=1 (sweep period unknown; nothing to estimate from)"
+            return None
+        run_equivalents = sweep_run_equivalents(
+            n_candidates,
+            halving_rungs=self.halving_rungs,
+            halving_eta=self.halving_eta,
+            adaptive_candidates=adaptive_candidates,
+        )
+        note = None
+        if self.auto_workers:
+            self.max_workers, note = choose_max_workers(
+                self.call_profile,
+                cycles_per_run=cycles,
+                run_equivalents=run_equivalents,
+                deadline_seconds=self.deadline_seconds,
+                rate_limit_rpm=self.rate_limit_rpm,
+                cap=AUTO_MAX_WORKERS_CAP,
+                serial_baseline=self.executor != "lockstep",
+            )
+        self._estimate = estimate_sweep(
+            self.call_profile,
+            cycles_per_run=cycles,
+            run_equivalents=run_equivalents,
+            max_workers=self.max_workers,
+            serial_baseline=self.executor != "lockstep",
+            rate_limit_rpm=self.rate_limit_rpm,
+        )
+        return note
+
+    def _eta_seconds(self, done: int, resumed: int, total: int, elapsed: float) -> Optional[float]:
+        """Remaining seconds: observed pace once a run has finished here, else the plan."""
+        executed = done - resumed
+        if executed > 0:
+            return elapsed / executed * max(0, total - done)
+        if self._estimate is not None:
+            return max(0.0, self._estimate.wall_seconds - elapsed)
+        return None
+
     def _mark_complete(self, label: str, status: str, *, progress_index: Optional[int]) -> None:
         with self._progress_lock:
             self._completed += 1
             done = self._completed
             total = self._total_runs
+            resumed = self._resumed_runs + self._stored_runs
+        elapsed = time.monotonic() - self._started
+        eta = self._eta_seconds(done, resumed, total, elapsed)
         idx = f"{progress_index}/" if progress_index is not None else ""
         msg = (
             f"Sweep progress: completed {done}/{total} backtest runs "
-            f"({idx}{label} → {status})"
+            f"({idx}{label} → {status}); elapsed {format_duration(elapsed)}"
+            + (f", ETA ~{format_duration(eta)}" if eta is not None and done < total else "")
         )
         logger.info(msg)
         print(msg, flush=True)
 
+    def _resume(
+        self, job: Dict[str, Any], *, is_baseline: bool, progress_index: Optional[int]
+    ) -> Optional[SweepCandidateResult]:
+        """Result for ``job`` from the checkpoint or the result store (counted as
+        completed), if any."""
+        if self._checkpoint is not None:
+            result = self._checkpoint.load(
+                job["config_snapshot"],
+                candidate_id=job["candidate_id"],
+                label=job["label"],
+                proposed_changes=job["proposed_changes"],
+                is_baseline=is_baseline,
+            )
+            if result is not None:
+                with self._progress_lock:
+                    self._resumed_runs += 1
+                self._mark_complete(
+                    job["label"], f"{result.status} (checkpoint)", progress_index=progress_index
+                )
+                return result
+        if self.result_store is None:
+            return None
+        try:
+            stored = self.result_store.lookup(job["config_snapshot"])
+        except Exception as exc:  # noqa: BLE001 — a broken index must not stop the sweep
+            logger.warning("Result store lookup for %s failed: %s", job["label"], exc)
+            return None
+        if stored is None:
+            return None
+        result = SweepCandidateResult(
+            candidate_id=job["candidate_id"],
+            label=job["label"],
+            proposed_changes=dict(job["proposed_changes"]),
+            status=stored["status"],
+            run_id=stored.get("run_id"),
+            metrics=dict(stored.get("metrics") or {}),
+            artifact_path=stored.get("artifact_path"),
+            is_baseline=is_baseline,
+        )
+        with self._progress_lock:
+            self._stored_runs += 1
+        # Checkpoint it too, so a resume does not depend on the store.
+        self._record(
+            job["config_snapshot"],
+            result,
+            progress_index=progress_index,
+            status_suffix=" (result store)",
+        )
+        return result
+
+    def _record(
+        self,
+        config_snapshot: Dict[str, Any],
+        result: SweepCandidateResult,
+        *,
+        progress_index: Optional[int],
+        status_suffix: str = "",
+    ) -> None:
+        if self._checkpoint is not None:
+            try:
+                self._checkpoint.save(config_snapshot, result)
+            except OSError as exc:
+                logger.warning("Sweep checkpoint for %s failed: %s", result.label, exc)
+        self._mark_complete(
+            result.label, result.status + status_suffix, progress_index=progress_index
+        )
+
     def _execute_one(
         self,
         *,
@@ -267,56 +725,37 @@ class ParamSweepRunner:
         progress_index: Optional[int] = None,
     ) -> SweepCandidateResult:
         assert self.run_backtest is not None
-        start_msg = (
-            f"Sweep starting backtest "
-            f"{progress_index}/{self._total_runs}: {label}"
-            if progress_index is not None
-            else f"Sweep starting backtest: {label}"
+        resumed = self._resume(
+            {
+                "candidate_id": candidate_id,
+                "label": label,
+                "proposed_changes": proposed_changes,
+                "config_snapshot": config_snapshot,
+            },
+            is_baseline=is_baseline,
+            progress_index=progress_index,
         )
-        logger.info(start_msg)
-        print(start_msg, flush=True)
-        started = datetime.now()
-        try:
-            run = self.run_backtest(config_snapshot, run_label)
-            run_id, status, metrics, artifact_path, error = _as_run_fields(run)
-            result = SweepCandidateResult(
-                candidate_id=candidate_id,
-                label=label,
-                proposed_changes=proposed_changes,
-                status=status,
-                run_id=str(run_id) if run_id else None,
-                metrics=metrics,
-                artifact_path=artifact_path,
-                error=error,
-                is_baseline=is_baseline,
-            )
-        except Exception as exc:  # noqa: BLE001 — isolate one candidate failure
-            logger.exception("Sweep candidate %s failed", label)
-            result = SweepCandidateResult(
-                candidate_id=candidate_id,
-                label=label,
-                proposed_changes=proposed_changes,
-                status="failed",
-                error=str(exc),
-                is_baseline=is_baseline,
-            )
-        elapsed = (datetime.now() - started).total_seconds()
-        logger.info(
-            "Sweep finished backtest %s in %.1fs (status=%s sharpe=%s)",
-            label,
-            elapsed,
-            result.status,
-            (result.metrics or {}).get("sharpe"),
+        if resumed is not None:
+            return resumed
+        result = _run_candidate(
+            self.run_backtest,
+            candidate_id=candidate_id,
+            label=label,
+            proposed_changes=proposed_changes,
+            config_snapshot=config_snapshot,
+            is_baseline=is_baseline,
+            run_label=run_label,
+            progress=_progress_prefix(progress_index, self._total_runs),
         )
-        self._mark_complete(label, result.status, progress_index=progress_index)
+        self._record(config_snapshot, result, progress_index=progress_index)
         return result
 
     def _execute_many(
-        self, jobs: List[Dict[str, Any]], *, run_label: str
+        self, jobs: List[Dict[str, Any]], *, run_label: str, progress_offset: int = 2
     ) -> List[SweepCandidateResult]:
         if not jobs:
             return []
-        # progress_index: 1=baseline already done; candidates are 2..N
+        # progress_index: 1=baseline already done; candidates are progress_offset..N
         if self.max_workers == 1:
             return [
                 self._execute_one(
@@ -326,10 +765,14 @@ class ParamSweepRunner:
                     config_snapshot=job["config_snapshot"],
                     is_baseline=False,
                     run_label=f"{run_label}_{job['candidate_id']}",
-                    progress_index=i + 2,
+                    progress_index=i + progress_offset,
                 )
                 for i, job in enumerate(jobs)
             ]
+        if self.executor == "process":
+            return self._execute_in_processes(
+                jobs, run_label=run_label, progress_offset=progress_offset
+            )
 
         results: List[SweepCandidateResult] = []
         with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
@@ -342,7 +785,7 @@ class ParamSweepRunner:
                     config_snapshot=job["config_snapshot"],
                     is_baseline=False,
                     run_label=f"{run_label}_{job['candidate_id']}",
-                    progress_index=i + 2,
+                    progress_index=i + progress_offset,
                 ): job
                 for i, job in enumerate(jobs)
             }
@@ -351,3 +794,333 @@ class ParamSweepRunner:
         # Stable order: match input job order
         by_id = {r.candidate_id: r for r in results}
         return [by_id[job["candidate_id"]] for job in jobs if job["candidate_id"] in by_id]
+
+    def _execute_in_processes(
+        self, jobs: List[Dict[str, Any]], *, run_label: str, progress_offset: int = 2
+    ) -> List[SweepCandidateResult]:
+        """One candidate per worker process; results come back as plain dicts.
+
+        Workers are forked where the platform allows it, so the bar cache the
+        baseline run already parsed in this process is shared copy-on-write
+        instead of being re-read by every worker.
+        """
+        by_id: Dict[str, SweepCandidateResult] = {}
+        pending = []
+        for i, job in enumerate(jobs):
+            resumed = self._resume(job, is_baseline=False, progress_index=i + progress_offset)
+            if resumed is not None:
+                by_id[job["candidate_id"]] = resumed
+            else:
+                pending.append((i + progress_offset, job))
+        if not pending:
+            return [by_id[job["candidate_id"]] for job in jobs]
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)), mp_context=_process_context()
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _run_candidate_in_worker,
+                    self.run_backtest,
+                    {
+                        "candidate_id": job["candidate_id"],
+                        "label": job["label"],
+                        "proposed_changes": job["proposed_changes"],
+                        "config_snapshot": job["config_snapshot"],
+                        "is_baseline": False,
+                        "run_label": f"{run_label}_{job['candidate_id']}",
+                        "progress": _progress_prefix(progress_index, self._total_runs),
+                    },
+                ): (progress_index, job)
+                for progress_index, job in pending
+            }
+            for fut in as_completed(futures):
+                progress_index, job = futures[fut]
+                try:
+                    result = SweepCandidateResult.from_dict(fut.result())
+                except Exception as exc:  # noqa: BLE001 — worker died or result unpicklable
+                    logger.error("Sweep candidate %s failed in worker: %s", job["label"], exc)
+                    result = SweepCandidateResult(
+                        candidate_id=job["candidate_id"],
+                        label=job["label"],
+                        proposed_changes=job["proposed_changes"],
+                        status="failed",
+                        error=str(exc),
+                    )
+                self._record(job["config_snapshot"], result, progress_index=progress_index)
+                by_id[result.candidate_id] = result
+        return [by_id[job["candidate_id"]] for job in jobs if job["candidate_id"] in by_id]
+
+    def _execute_lockstep(
+        self,
+        jobs: List[Dict[str, Any]],
+        *,
+        run_label: str,
+        progress_offset: int = 1,
+        with_baseline: bool = True,
+    ) -> List[SweepCandidateResult]:
+        """Baseline (first job, if ``with_baseline``) + candidates as one ``run_many`` batch."""
+        flags = [with_baseline and i == 0 for i in range(len(jobs))]
+        results: List[Optional[SweepCandidateResult]] = [
+            self._resume(job, is_baseline=flag, progress_index=i + progress_offset)
+            for i, (job, flag) in enumerate(zip(jobs, flags))
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return list(results)
+        labels = {
+            i: f"{run_label}_baseline" if flags[i] else f"{run_label}_{jobs[i]['candidate_id']}"
+            for i in pending
+        }
+        msg = f"Sweep starting {len(pending)} backtests in lockstep"
+        logger.info(msg)
+        print(msg, flush=True)
+        started = datetime.now()
+        try:
+            runs = list(self.run_backtest.run_many(
+                [(jobs[i]["config_snapshot"], labels[i]) for i in pending],
+                max_workers=self.max_workers,
+            ))
+            if len(runs) != len(pending):
+                raise ValueError(f"run_many returned {len(runs)} runs for {len(pending)} jobs")
+            errors: List[Optional[str]] = [None] * len(pending)
+        except Exception as exc:  # noqa: BLE001 — the whole batch failed
+            logger.exception("Lockstep sweep batch failed")
+            runs = [None] * len(pending)
+            errors = [str(exc)] * len(pending)
+        logger.info(
+            "Sweep finished lockstep batch in %.1fs", (datetime.now() - started).total_seconds()
+        )
+
+        for i, run, error in zip(pending, runs, errors):
+            job = jobs[i]
+            if run is None:
+                result = SweepCandidateResult(
+                    candidate_id=job["candidate_id"],
+                    label=job["label"],
+                    proposed_changes=job["proposed_changes"],
+                    status="failed",
+                    error=error,
+                    is_baseline=flags[i],
+                )
+            else:
+                run_id, status, metrics, artifact_path, run_error = _as_run_fields(run)
+                result = SweepCandidateResult(
+                    candidate_id=job["candidate_id"],
+                    label=job["label"],
+                    proposed_changes=job["proposed_changes"],
+                    status=status,
+                    run_id=str(run_id) if run_id else None,
+                    metrics=metrics,
+                    artifact_path=artifact_path,
+                    error=run_error,
+                    is_baseline=flags[i],
+                )
+            self._record(job["config_snapshot"], result, progress_index=i + progress_offset)
+            results[i] = result
+        return list(results)
+
+    def _run_adaptive(
+        self,
+        search: SearchStrategy,
+        baseline_config: Dict[str, Any],
+        *,
+        run_label: str,
+        progress_offset: int,
+    ) -> List[SweepCandidateResult]:
+        """Ask/run/tell rounds of ``max_workers`` candidates until the search is done."""
+        results: List[SweepCandidateResult] = []
+        while True:
+            batch = _jobs_for(search.ask(self.max_workers), baseline_config)
+            if not batch:
+                return results
+            if self.executor == "lockstep":
+                finished = self._execute_lockstep(
+                    batch,
+                    run_label=run_label,
+                    progress_offset=progress_offset,
+                    with_baseline=False,
+                )
+            else:
+                finished = self._execute_many(
+                    batch, run_label=run_label, progress_offset=progress_offset
+                )
+            progress_offset += len(batch)
+            search.tell(finished)
+            results.extend(finished)
+
+    def _rung_end_dates(
+        self,
+        n_candidates: int,
+        period_start: Optional[str],
+        period_end: Optional[str],
+        notes: List[str],
+    ) -> List[str]:
+        """Prefix end date (ISO) per halving rung; empty when halving is off or impossible."""
+        if self.halving_rungs == 0 or n_candidates <= 1:
+            return []
+        start, end = _parse_iso_date(period_start), _parse_iso_date(period_end)
+        if start is None or end is None or end <= start:
+            notes.append("Successive halving skipped: sweep period unknown; ran all candidates fully")
+            return []
+        days = (end - start).days
+        ends: List[str] = []
+        for fraction, _ in successive_halving_schedule(
+            n_candidates, rungs=self.halving_rungs, eta=self.halving_eta
+        )[:-1]:
+            rung_end = start + timedelta(days=max(1, round(days * fraction)))
+            # Periods too short to split that finely collapse onto one rung.
+            if rung_end < end and (not ends or rung_end.isoformat() > ends[-1]):
+                ends.append(rung_end.isoformat())
+        if len(ends) < self.halving_rungs:
+            notes.append(
+                f"Successive halving: period too short for {self.halving_rungs} rungs; "
+                f"using {len(ends)}"
+            )
+        return ends
+
+    def _prune(
+        self,
+        jobs: List[Dict[str, Any]],
+        partial: List[SweepCandidateResult],
+        *,
+        keep: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[SweepCandidateResult]]:
+        """Top ``keep`` (default ``ceil(n / eta)``) successful runs survive; the rest are dropped."""
+        if keep is None:
+            keep = math.ceil(len(jobs) / self.halving_eta)
+        by_id = {r.candidate_id: r for r in partial}
+        ranked = sorted(jobs, key=lambda j: by_id[j["candidate_id"]].rank_key(), reverse=True)
+        kept_ids = {
+            j["candidate_id"] for j in ranked[:keep] if by_id[j["candidate_id"]].status == "success"
+        }
+        survivors = [j for j in jobs if j["candidate_id"] in kept_ids]
+        dropped = [by_id[j["candidate_id"]] for j in ranked if j["candidate_id"] not in kept_ids]
+        return survivors, dropped
+
+
+def _jobs_for(
+    raw_candidates: List[Dict[str, Any]], baseline_config: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    jobs: List[Dict[str, Any]] = []
+    for raw in raw_candidates:
+        proposed = dict(raw.get("proposed_changes") or {})
+        if not proposed:
+            continue
+        jobs.append(
+            {
+                "candidate_id": str(raw.get("candidate_id") or new_id("sc")),
+                "label": str(raw.get("label") or "candidate"),
+                "proposed_changes": proposed,
+                "config_snapshot": merge_proposed_changes(baseline_config, proposed),
+            }
+        )
+    return jobs
+
+
+def _screened_count(n_candidates: int, screen_top: int) -> int:
+    """Candidates left for LLM backtests after the surrogate screen (0 = no screen)."""
+    return min(n_candidates, screen_top) if screen_top else n_candidates
+
+
+def _snapshot_date(config_snapshot: Dict[str, Any], key: str) -> Optional[str]:
+    value = config_snapshot.get(key)
+    return value if isinstance(value, str) else None
+
+
+def _describe_dropped(result: SweepCandidateResult) -> str:
+    if result.status != "success":
+        return f"{result.label} ({result.status})"
+    return f"{result.label} (sharpe={result.metrics.get('sharpe')})"
+
+
+def _rung_note(
+    rung: int,
+    n_rungs: int,
+    period_start: Optional[str],
+    rung_end: str,
+    survivors: List[Dict[str, Any]],
+    dropped: List[SweepCandidateResult],
+) -> str:
+    return (
+        f"Successive halving rung {rung}/{n_rungs} ({period_start}→{rung_end}): "
+        f"kept {len(survivors)} [{', '.join(j['label'] for j in survivors)}]; "
+        f"pruned {len(dropped)} [{', '.join(_describe_dropped(r) for r in dropped)}]"
+    )
+
+
+def _screen_note(
+    survivors: List[Dict[str, Any]], dropped: List[SweepCandidateResult]
+) -> str:
+    return (
+        f"Surrogate screen (rules policy, no LLM): "
+        f"kept {len(survivors)} [{', '.join(j['label'] for j in survivors)}]; "
+        f"screened out {len(dropped)} [{', '.join(_describe_dropped(r) for r in dropped)}]"
+    )
+
+
+def _progress_prefix(progress_index: Optional[int], total_runs: int) -> Optional[str]:
+    return f"{progress_index}/{total_runs}" if progress_index is not None else None
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+
+def _run_candidate(
+    run_backtest: BacktestCallable,
+    *,
+    candidate_id: str,
+    label: str,
+    proposed_changes: Dict[str, Any],
+    config_snapshot: Dict[str, Any],
+    is_baseline: bool,
+    run_label: str,
+    progress: Optional[str] = None,
+) -> SweepCandidateResult:
+    start_msg = (
+        f"Sweep starting backtest {progress}: {label}"
+        if progress is not None
+        else f"Sweep starting backtest: {label}"
+    )
+    logger.info(start_msg)
+    print(start_msg, flush=True)
+    started = datetime.now()
+    try:
+        run = run_backtest(config_snapshot, run_label)
+        run_id, status, metrics, artifact_path, error = _as_run_fields(run)
+        result = SweepCandidateResult(
+            candidate_id=candidate_id,
+            label=label,
+            proposed_changes=proposed_changes,
+            status=status,
+            run_id=str(run_id) if run_id else None,
+            metrics=metrics,
+            artifact_path=artifact_path,
+            error=error,
+            is_baseline=is_baseline,
+        )
+    except Exception as exc:  # noqa: BLE001 — isolate one candidate failure
+        logger.exception("Sweep candidate %s failed", label)
+        result = SweepCandidateResult(
+            candidate_id=candidate_id,
+            label=label,
+            proposed_changes=proposed_changes,
+            status="failed",
+            error=str(exc),
+            is_baseline=is_baseline,
+        )
+    elapsed = (datetime.now() - started).total_seconds()
+    logger.info(
+        "Sweep finished backtest %s in %.1fs (status=%s sharpe=%s)",
+        label,
+        elapsed,
+        result.status,
+        (result.metrics or {}).get("sharpe"),
+    )
+    return result
+
+
+def _run_candidate_in_worker(run_backtest: BacktestCallable, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: run one candidate, return ``SweepCandidateResult.to_dict()``."""
+    return _run_candidate(run_backtest, **job).to_dict()
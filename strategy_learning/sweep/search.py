@@ -0,0 +1,330 @@
+"""Search strategies for param sweep — which whitelisted configs to backtest.
+
+Every strategy searches the same whitelist as ``expand_oat_candidates``
+(``TUNABLE_ENUMS`` plus ``MAX_POSITION_SIZE_STEPS`` and
+``REBALANCE_THRESHOLD_STEPS``) but may change several fields at once:
+
+- ``oat``    — one field at a time (``expand_oat_candidates``)
+- ``grid``   — full factorial, or a balanced ``fraction`` of it
+- ``random`` — uniform samples
+- ``tpe``    — Tree-structured Parzen Estimator: after a few random
+  candidates, samples where the best-ranked results cluster
+
+``budget`` caps the candidate backtests (the baseline is extra). ``random`` and
+``tpe`` require one, as does a ``grid`` over more than ``MAX_UNBUDGETED_GRID``
+configs, so no strategy silently expands to the whole space. Configs are
+deduplicated by ``config_hash`` of the merged snapshot, so the baseline and
+repeats are never proposed.
+
+Static strategies (``adaptive = False``) return all candidates up front from
+``candidates()``. Adaptive ones are driven by ``ParamSweepRunner``: ``ask(n)``
+for the next batch, ``tell(results)`` with their ``SweepCandidateResult``s.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from strategy_learning.knowledge.records import (
+    MAX_POSITION_SIZE_STEPS,
+    REBALANCE_THRESHOLD_STEPS,
+    TUNABLE_ENUMS,
+    config_hash,
+    new_id,
+)
+from strategy_learning.sweep.candidates import expand_oat_candidates, merge_proposed_changes
+from strategy_learning.sweep.models import SweepCandidateResult
+
+SEARCH_STRATEGIES = ("oat", "grid", "random", "tpe")
+# Largest grid (after ``fraction``) that may run without an explicit budget.
+MAX_UNBUDGETED_GRID = 64
+
+Field = Tuple[str, str]  # (section, key)
+
+
+def tunable_space(fields: Optional[Sequence[str]] = None) -> Dict[Field, Tuple[Any, ...]]:
+    """Whitelisted fields → allowed values; ``fields`` narrows it (``"section.key"``)."""
+    space: Dict[Field, Tuple[Any, ...]] = {}
+    for section, keys in TUNABLE_ENUMS.items():
+        for key, choices in keys.items():
+            if choices:
+                space[(section, key)] = tuple(choices)
+    space[("preferences", "max_position_size")] = tuple(float(v) for v in MAX_POSITION_SIZE_STEPS)
+    space[("rebalance_params", "threshold")] = tuple(float(v) for v in REBALANCE_THRESHOLD_STEPS)
+    if fields is None:
+        return space
+    wanted = {tuple(f.split(".", 1)) for f in fields}
+    unknown = wanted - set(space)
+    if unknown:
+        raise ValueError(f"Not tunable: {sorted('.'.join(f) for f in unknown)}")
+    return {f: values for f, values in space.items() if f in wanted}
+
+
+def _same(a: Any, b: Any) -> bool:
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return abs(float(a) - float(b)) < 1e-12
+    return a == b
+
+
+class SearchStrategy:
+    """Base: whitelist space, baseline, budget and ``config_hash`` dedup."""
+
+    name = "search"
+    adaptive = False
+
+    def __init__(
+        self,
+        baseline: Dict[str, Any],
+        *,
+        budget: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+        seed: int = 0,
+    ):
+        if budget is not None and budget < 1:
+            raise ValueError(f"budget must be >= 1, got {budget}")
+        self.baseline = baseline
+        self.budget = budget
+        self.space = tunable_space(fields)
+        self.fields: List[Field] = list(self.space)
+        self.rng = random.Random(seed)
+        self.proposed = 0
+        self._seen = {self._hash({})}
+
+    @property
+    def exhausted(self) -> bool:
+        return self.budget is not None and self.proposed >= self.budget
+
+    @property
+    def size(self) -> int:
+        """Configs in the space (including the baseline's own point)."""
+        return math.prod(len(v) for v in self.space.values())
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        """Static strategies: every candidate to run, within the budget."""
+        raise NotImplementedError
+
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        """Adaptive strategies: next ``n`` (or fewer) candidates; [] when done."""
+        raise NotImplementedError
+
+    def tell(self, results: List[SweepCandidateResult]) -> None:
+        """Feed back finished candidates (adaptive strategies learn from them)."""
+
+    def _hash(self, proposed_changes: Dict[str, Any]) -> str:
+        return config_hash(merge_proposed_changes(self.baseline, proposed_changes))
+
+    def _make(self, assignment: Dict[Field, Any]) -> Optional[Dict[str, Any]]:
+        """Candidate for ``assignment``, or None if over budget / seen / baseline."""
+        if self.exhausted:
+            return None
+        proposed: Dict[str, Dict[str, Any]] = {}
+        labels = []
+        for (section, key), value in assignment.items():
+            if _same(value, (self.baseline.get(section) or {}).get(key)):
+                continue
+            proposed.setdefault(section, {})[key] = value
+            labels.append(f"{section}.{key}={value}")
+        digest = self._hash(proposed)
+        if digest in self._seen:
+            return None
+        self._seen.add(digest)
+        self.proposed += 1
+        return {
+            "candidate_id": new_id("sc"),
+            "label": ", ".join(labels),
+            "proposed_changes": proposed,
+        }
+
+
+class OATSearch(SearchStrategy):
+    """``expand_oat_candidates`` with budget and dedup."""
+
+    name = "oat"
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        out = []
+        for cand in expand_oat_candidates(self.baseline):
+            if self.exhausted:
+                break
+            digest = self._hash(cand["proposed_changes"])
+            if digest in self._seen:
+                continue
+            self._seen.add(digest)
+            self.proposed += 1
+            out.append(cand)
+        return out
+
+
+class GridSearch(SearchStrategy):
+    """Full factorial over the space, or a balanced fraction of it.
+
+    ``fraction=1/m`` keeps the points whose level indices sum to 0 mod ``m``:
+    every level of every field still appears, about equally often (the
+    mixed-level analogue of a fractional factorial's defining relation).
+    """
+
+    name = "grid"
+
+    def __init__(self, baseline: Dict[str, Any], *, fraction: float = 1.0, **kwargs: Any):
+        super().__init__(baseline, **kwargs)
+        if not 0 < fraction <= 1:
+            raise ValueError(f"fraction must be in (0, 1], got {fraction}")
+        self.modulus = max(1, round(1 / fraction))
+        planned = math.ceil(self.size / self.modulus)
+        if self.budget is None and planned > MAX_UNBUDGETED_GRID:
+            raise ValueError(
+                f"grid search over ~{planned} configs needs a budget (over "
+                f"{MAX_UNBUDGETED_GRID} without one); narrow the fields or the fraction"
+            )
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        out = []
+        levels = [range(len(self.space[f])) for f in self.fields]
+        for idx in itertools.product(*levels):
+            if sum(idx) % self.modulus:
+                continue
+            cand = self._make({f: self.space[f][i] for f, i in zip(self.fields, idx)})
+            if cand is not None:
+                out.append(cand)
+            if self.exhausted:
+                break
+        return out
+
+
+class RandomSearch(SearchStrategy):
+    """Uniform random configs (distinct, seeded)."""
+
+    name = "random"
+
+    def __init__(self, baseline: Dict[str, Any], **kwargs: Any):
+        super().__init__(baseline, **kwargs)
+        if self.budget is None:
+            raise ValueError("random search needs a budget")
+
+    def candidates(self) -> List[Dict[str, Any]]:
+        target = min(self.budget, self.size - 1)
+        out: List[Dict[str, Any]] = []
+        attempts = 0
+        while len(out) < target and attempts < 50 * max(1, target):
+            attempts += 1
+            cand = self._make({f: self.rng.choice(self.space[f]) for f in self.fields})
+            if cand is not None:
+                out.append(cand)
+        return out
+
+
+class TPESearch(SearchStrategy):
+    """Tree-structured Parzen Estimator over the (discrete) whitelist.
+
+    The first ``n_startup`` candidates are random. After that, finished
+    results are split by ``metric_rank_key`` into the best ``gamma`` share
+    ("good") and the rest; per field, smoothed level frequencies give l(x)
+    for good and g(x) for the rest. Each proposal draws ``n_ei_candidates``
+    configs from l and keeps the unseen one with the highest l(x) / g(x).
+    """
+
+    name = "tpe"
+    adaptive = True
+
+    def __init__(
+        self,
+        baseline: Dict[str, Any],
+        *,
+        n_startup: int = 8,
+        gamma: float = 0.25,
+        n_ei_candidates: int = 24,
+        **kwargs: Any,
+    ):
+        super().__init__(baseline, **kwargs)
+        if self.budget is None:
+            raise ValueError("tpe search needs a budget")
+        self.n_startup = n_startup
+        self.gamma = gamma
+        self.n_ei_candidates = n_ei_candidates
+        self.history: List[Tuple[Dict[Field, Any], Tuple[float, float, float]]] = []
+        self._pending: Dict[str, Dict[Field, Any]] = {}
+
+    def ask(self, n: int) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        for _ in range(max(1, n)):
+            if self.exhausted:
+                break
+            assignment = (
+                self._suggest() if len(self.history) >= self.n_startup else self._random()
+            )
+            cand = self._make(assignment) if assignment is not None else None
+            if cand is None:
+                # Space (nearly) exhausted around the model's picks; fall back to random.
+                assignment = self._random()
+                cand = self._make(assignment) if assignment is not None else None
+            if cand is None:
+                break
+            self._pending[cand["candidate_id"]] = assignment
+            out.append(cand)
+        return out
+
+    def tell(self, results: List[SweepCandidateResult]) -> None:
+        for result in results:
+            assignment = self._pending.pop(result.candidate_id, None)
+            if assignment is not None:
+                self.history.append((assignment, result.rank_key()))
+
+    def _unseen(self, assignment: Dict[Field, Any]) -> bool:
+        proposed: Dict[str, Dict[str, Any]] = {}
+        for (section, key), value in assignment.items():
+            proposed.setdefault(section, {})[key] = value
+        return self._hash(proposed) not in self._seen
+
+    def _random(self, tries: int = 200) -> Optional[Dict[Field, Any]]:
+        for _ in range(tries):
+            assignment = {f: self.rng.choice(self.space[f]) for f in self.fields}
+            if self._unseen(assignment):
+                return assignment
+        return None
+
+    def _densities(self, observations: List[Dict[Field, Any]]) -> Dict[Field, List[float]]:
+        densities = {}
+        for f in self.fields:
+            values = self.space[f]
+            counts = [1.0] * len(values)  # uniform prior (Laplace smoothing)
+            for obs in observations:
+                for i, v in enumerate(values):
+                    if _same(obs[f], v):
+                        counts[i] += 1.0
+            total = sum(counts)
+            densities[f] = [c / total for c in counts]
+        return densities
+
+    def _suggest(self) -> Optional[Dict[Field, Any]]:
+        ranked = sorted(self.history, key=lambda h: h[1], reverse=True)
+        n_good = max(1, math.ceil(self.gamma * len(ranked)))
+        good = self._densities([a for a, _ in ranked[:n_good]])
+        bad = self._densities([a for a, _ in ranked[n_good:]])
+        best, best_score = None, float("-inf")
+        for _ in range(self.n_ei_candidates):
+            idx = {
+                f: self.rng.choices(range(len(self.space[f])), weights=good[f])[0]
+                for f in self.fields
+            }
+            assignment = {f: self.space[f][i] for f, i in idx.items()}
+            if not self._unseen(assignment):
+                continue
+            score = sum(math.log(good[f][i]) - math.log(bad[f][i]) for f, i in idx.items())
+            if score > best_score:
+                best, best_score = assignment, score
+        return best
+
+
+_STRATEGIES = {cls.name: cls for cls in (OATSearch, GridSearch, RandomSearch, TPESearch)}
+
+
+def build_search(name: str, baseline: Dict[str, Any], **kwargs: Any) -> SearchStrategy:
+    """Strategy by name (``SEARCH_STRATEGIES``); kwargs as the strategy's constructor."""
+    try:
+        cls = _STRATEGIES[name]
+    except KeyError:
+        raise ValueError(f"search must be one of {SEARCH_STRATEGIES}, got {name!r}") from None
+    return cls(baseline, **kwargs)
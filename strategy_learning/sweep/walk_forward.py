@@ -0,0 +1,280 @@
+"""Walk-forward evaluation: score a config on rolling train/test windows.
+
+A single ``[start, end]`` backtest rewards configs that happened to suit one
+period. In walk-forward mode each sweep run is split into windows, each a
+train segment followed by an out-of-sample test segment, stepping forward by
+the test length::
+
+    |-- train 1 --|-- test 1 --|
+                  |-- train 2 --|-- test 2 --|
+                                |-- train 3 --|-- test 3 --|
+
+By default train and test are the same length, so window ``k``'s train
+segment is window ``k - 1``'s test segment: the period splits into
+``n_windows + 1`` blocks and every block is backtested once per config.
+
+``WalkForwardBacktest`` wraps a sweep ``run_backtest`` callable. Snapshots
+carrying a ``"walk_forward"`` spec are split into segment backtests (run in
+parallel, identical segments once, all sharing the callable's data context
+and LLM responses to identical prompts); the result's metrics aggregate the
+test windows so ``metric_rank_key`` ranks on out-of-sample performance:
+
+* ``sharpe`` — mean test Sharpe minus ``dispersion_penalty`` × its standard
+  deviation (a config that is good in one window and poor in the next ranks
+  below a steady one); ``sharpe_mean`` / ``sharpe_std`` / ``sharpe_min`` /
+  ``sharpe_max`` keep the raw figures
+* ``alpha_vs_spy`` / ``total_return`` — means; ``max_drawdown`` — the worst
+* ``positive_windows`` — share of test windows with Sharpe > 0
+* ``train_sharpe_mean`` and ``overfit_gap`` (train minus test mean Sharpe)
+* ``walk_forward`` — per-window dates and metrics
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import statistics
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from strategy_learning.sweep.runner import BacktestCallable, _as_run_fields
+from trading_agent.concurrency import map_bounded
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISPERSION_PENALTY = 0.5
+# Shorter test segments have too few rebalance cycles for a meaningful Sharpe.
+MIN_TEST_DAYS = 14
+
+_Segment = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    index: int
+    train_start: str
+    train_end: str
+    test_start: str
+    test_end: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def walk_forward_windows(
+    start: date,
+    end: date,
+    n_windows: int,
+    *,
+    train_days: Optional[int] = None,
+) -> List[WalkForwardWindow]:
+    """``n_windows`` rolling train/test windows over ``[start, end]`` (see module docstring).
+
+    ``train_days`` defaults to the test length; the test length is whatever
+    is left after the first train segment, split evenly.
+    """
+    if n_windows < 1:
+        raise ValueError(f"n_windows must be >= 1, got {n_windows}")
+    span = (end - start).days + 1
+    if train_days is None:
+        test_days = span // (n_windows + 1)
+        train_days = test_days
+    else:
+        if train_days < 1:
+            raise ValueError(f"train_days must be >= 1, got {train_days}")
+        test_days = (span - train_days) // n_windows
+    if test_days < MIN_TEST_DAYS:
+        raise ValueError(
+            f"{start}→{end} is too short for {n_windows} walk-forward windows "
+            f"(test segments of {test_days} days; need >= {MIN_TEST_DAYS})"
+        )
+
+    windows: List[WalkForwardWindow] = []
+    for k in range(n_windows):
+        test_start = start + timedelta(days=train_days + k * test_days)
+        test_end = test_start + timedelta(days=test_days - 1)
+        if k == n_windows - 1:
+            test_end = end  # the remainder of an uneven split goes to the last test
+        windows.append(
+            WalkForwardWindow(
+                index=k + 1,
+                train_start=(test_start - timedelta(days=train_days)).isoformat(),
+                train_end=(test_start - timedelta(days=1)).isoformat(),
+                test_start=test_start.isoformat(),
+                test_end=test_end.isoformat(),
+            )
+        )
+    return windows
+
+
+def walk_forward_spec(n_windows: int, *, train_days: Optional[int] = None) -> Dict[str, Any]:
+    """Snapshot value for ``"walk_forward"`` (part of the config hash, so resume stays exact)."""
+    spec: Dict[str, Any] = {"windows": int(n_windows)}
+    if train_days is not None:
+        spec["train_days"] = int(train_days)
+    return spec
+
+
+def aggregate_window_metrics(
+    test_metrics: List[Dict[str, Any]],
+    train_metrics: List[Dict[str, Any]],
+    *,
+    dispersion_penalty: float = DEFAULT_DISPERSION_PENALTY,
+) -> Dict[str, Any]:
+    """Rank-ready metrics over test windows (see module docstring)."""
+
+    def values(rows: List[Dict[str, Any]], key: str) -> List[float]:
+        return [float(r[key]) for r in rows if r.get(key) is not None]
+
+    out: Dict[str, Any] = {"windows": len(test_metrics)}
+    sharpes = values(test_metrics, "sharpe")
+    if sharpes:
+        mean = statistics.fmean(sharpes)
+        std = statistics.pstdev(sharpes)
+        out.update(
+            sharpe=mean - dispersion_penalty * std,
+            sharpe_mean=mean,
+            sharpe_std=std,
+            sharpe_min=min(sharpes),
+            sharpe_max=max(sharpes),
+            positive_windows=sum(1 for s in sharpes if s > 0) / len(sharpes),
+        )
+    for key in ("alpha_vs_spy", "total_return"):
+        vals = values(test_metrics, key)
+        if vals:
+            out[key] = statistics.fmean(vals)
+    drawdowns = values(test_metrics, "max_drawdown")
+    if drawdowns:
+        out["max_drawdown"] = max(drawdowns, key=abs)
+    train_sharpes = values(train_metrics, "sharpe")
+    if train_sharpes:
+        out["train_sharpe_mean"] = statistics.fmean(train_sharpes)
+        if sharpes:
+            out["overfit_gap"] = out["train_sharpe_mean"] - out["sharpe_mean"]
+    return out
+
+
+def _fitting_windows(config_snapshot: Dict[str, Any], spec: Dict[str, Any]) -> List[WalkForwardWindow]:
+    """Windows for the snapshot's period; fewer than asked when it is too short.
+
+    Successive-halving rungs shorten ``end``, so early rungs score candidates
+    on as many windows as fit the prefix.
+    """
+    start = date.fromisoformat(str(config_snapshot["start"])[:10])
+    end = date.fromisoformat(str(config_snapshot["end"])[:10])
+    n_windows = int(spec["windows"])
+    for n in range(n_windows, 1, -1):
+        try:
+            return walk_forward_windows(start, end, n, train_days=spec.get("train_days"))
+        except ValueError:
+            continue
+    return walk_forward_windows(start, end, 1, train_days=spec.get("train_days"))
+
+
+class WalkForwardBacktest:
+    """Sweep ``run_backtest`` that scores snapshots on walk-forward windows.
+
+    Module-level and picklable like ``CandidateBacktest``, so it works with
+    ``ParamSweepRunner(executor="thread" | "process")``. Snapshots without a
+    ``"walk_forward"`` spec pass through to ``run_backtest`` unchanged.
+    ``max_workers`` bounds the segment backtests of one snapshot that run at
+    once (on top of the sweep's own ``max_workers``).
+    """
+
+    def __init__(
+        self,
+        run_backtest: BacktestCallable,
+        *,
+        max_workers: int = 1,
+        dispersion_penalty: float = DEFAULT_DISPERSION_PENALTY,
+    ):
+        if dispersion_penalty < 0:
+            raise ValueError(f"dispersion_penalty must be >= 0, got {dispersion_penalty}")
+        self.run_backtest = run_backtest
+        self.max_workers = max(1, int(max_workers))
+        self.dispersion_penalty = float(dispersion_penalty)
+
+    def __call__(self, config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
+        spec = config_snapshot.get("walk_forward")
+        if not spec:
+            return self.run_backtest(config_snapshot, run_label)
+        try:
+            windows = _fitting_windows(config_snapshot, spec)
+        except (KeyError, TypeError, ValueError) as exc:
+            return {"run_id": None, "status": "failed", "metrics": {}, "error": f"walk-forward: {exc}"}
+
+        segment_base = {k: v for k, v in config_snapshot.items() if k != "walk_forward"}
+        segment_base["reuse_llm_responses"] = True
+        segments: List[_Segment] = []
+        for w in windows:
+            for segment in ((w.train_start, w.train_end), (w.test_start, w.test_end)):
+                if segment not in segments:
+                    segments.append(segment)
+
+        def run_segment(segment: _Segment) -> Tuple[str, Dict[str, Any], Optional[str]]:
+            seg_start, seg_end = segment
+            run = self.run_backtest(
+                dict(segment_base, start=seg_start, end=seg_end),
+                f"{run_label}_{seg_start}_{seg_end}",
+            )
+            _, status, metrics, _, error = _as_run_fields(run)
+            return status, metrics, error
+
+        results = dict(zip(segments, map_bounded(run_segment, segments, self.max_workers)))
+        return self._aggregate(windows, results, run_label)
+
+    def _aggregate(
+        self,
+        windows: List[WalkForwardWindow],
+        results: Dict[_Segment, Tuple[str, Dict[str, Any], Optional[str]]],
+        run_label: str,
+    ) -> Dict[str, Any]:
+        per_window: List[Dict[str, Any]] = []
+        test_metrics: List[Dict[str, Any]] = []
+        train_metrics: List[Dict[str, Any]] = []
+        errors: List[str] = []
+        statuses: List[str] = []
+        for w in windows:
+            train_status, train, _ = results[(w.train_start, w.train_end)]
+            test_status, test, test_error = results[(w.test_start, w.test_end)]
+            statuses.append(test_status)
+            if test_status == "failed":
+                errors.append(f"window {w.index} ({w.test_start}→{w.test_end}): {test_error}")
+            else:
+                test_metrics.append(test)
+            if train_status != "failed":
+                train_metrics.append(train)
+            per_window.append(
+                dict(
+                    w.to_dict(),
+                    status=test_status,
+                    sharpe=test.get("sharpe"),
+                    total_return=test.get("total_return"),
+                    max_drawdown=test.get("max_drawdown"),
+                    train_sharpe=train.get("sharpe"),
+                )
+            )
+
+        metrics = aggregate_window_metrics(
+            test_metrics, train_metrics, dispersion_penalty=self.dispersion_penalty
+        )
+        metrics["walk_forward"] = per_window
+        if "failed" in statuses:
+            status = "failed"
+        elif all(s == "success" for s in statuses):
+            status = "success"
+        else:
+            status = "degraded"
+        if status == "success" and not math.isfinite(float(metrics.get("sharpe", math.nan))):
+            status, errors = "failed", ["no test window produced a Sharpe ratio"]
+        logger.info(
+            "Walk-forward %s: %d windows, sharpe mean=%s std=%s",
+            run_label, len(windows), metrics.get("sharpe_mean"), metrics.get("sharpe_std"),
+        )
+        return {
+            "run_id": f"wf-{run_label}",
+            "status": status,
+            "metrics": metrics,
+            "error": "; ".join(errors) or None,
+        }
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from strategy_learning.knowledge import KnowledgeBase, KnowledgeBaseError, make_event_ref
 
@@ -147,5 +150,59 @@ class TestKnowledgeBaseStore(unittest.TestCase):
             self.assertEqual(older["superseded_by"], second["id"])
 
 
+
+class TestKnowledgeBaseCache(unittest.TestCase):
+    def test_repeated_reads_parse_file_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _seed_kb(tmp)
+            kb.append_lesson("cached lesson")
+            with patch.object(kb._store, "load", wraps=kb._store.load) as mock_load:
+                for _ in range(5):
+                    kb.lessons_for_prompt()
+                    kb.signal_weights()
+                    kb.strategy_preferences()
+                    kb.active_backtest_validation()
+            mock_load.assert_not_called()
+
+    def test_external_rewrite_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _seed_kb(tmp)
+            self.assertEqual(kb.signal_weights(), {})
+            other = KnowledgeBase(data_dir=Path(tmp), example_dir=Path(tmp) / "example")
+            other.update_weights_and_prefs(signal_weights={"news": 1.3})
+            # Guarantee a distinct mtime even on coarse-grained filesystems.
+            st = kb._store.path.stat()
+            os.utime(kb._store.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(kb.signal_weights(), {"news": 1.3})
+
+    def test_returned_documents_do_not_alias_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _seed_kb(tmp)
+            kb.update_weights_and_prefs(signal_weights={"news": 1.1})
+            doc = kb.load()
+            doc["derived_state"]["signal_weights"]["news"] = 9.9
+            weights = kb.signal_weights()
+            weights["news"] = 5.0
+            self.assertEqual(kb.signal_weights(), {"news": 1.1})
+            self.assertEqual(kb.load()["derived_state"]["signal_weights"], {"news": 1.1})
+
+    def test_concurrent_appends_are_not_lost(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            _seed_kb(tmp)
+
+            def worker(n: int) -> None:
+                kb = KnowledgeBase(data_dir=Path(tmp), example_dir=Path(tmp) / "example")
+                for i in range(5):
+                    kb.append_lesson(f"w{n}-{i}")
+
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            kb = KnowledgeBase(data_dir=Path(tmp), example_dir=Path(tmp) / "example")
+            self.assertEqual(len(kb.load()["lessons"]), 20)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,128 @@
+"""Tests for the append-only KB event log engine (KB_BACKEND=eventlog)."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from strategy_learning.knowledge import KnowledgeBase, make_event_ref
+from strategy_learning.knowledge.event_log import EventLogKnowledgeStore
+from strategy_learning.tests.test_knowledge import _seed_kb
+
+
+def _eventlog_kb(tmp: str) -> KnowledgeBase:
+    _seed_kb(tmp)
+    return KnowledgeBase(
+        data_dir=Path(tmp), example_dir=Path(tmp) / "example", backend="eventlog"
+    )
+
+
+def _recommendation(summary: str):
+    event = make_event_ref(
+        event_type="backtest_run",
+        event_id="bt-1",
+        artifact_path="logs/backtest_1.json",
+        summary="bt",
+    )
+    return {
+        "summary": summary,
+        "rationale": summary,
+        "provenance": {
+            "generated_by": "test",
+            "trigger_event": event,
+            "evidence_events": [event],
+            "kb_lineage": {},
+        },
+        "proposed_changes": {"strategy_params": {"risk_management": "aggressive"}},
+    }
+
+
+class TestEventLogKnowledgeStore(unittest.TestCase):
+    def test_writes_append_events_not_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _eventlog_kb(tmp)
+            kb.lessons()
+            snapshot = Path(tmp) / "knowledge_base.json"
+            before = snapshot.read_text()
+            kb.append_lesson("first")
+            kb.update_weights_and_prefs(signal_weights={"news": 1.2})
+
+            self.assertEqual(snapshot.read_text(), before)
+            lines = (Path(tmp) / "knowledge_base.events.jsonl").read_text().splitlines()
+            self.assertEqual(len(lines), 2)
+            ops = [c["op"] for c in json.loads(lines[1])["changes"]]
+            self.assertEqual(ops, ["derived_state"])
+
+    def test_fresh_instance_replays_snapshot_plus_tail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _eventlog_kb(tmp)
+            kb.append_lesson("first")
+            kb.update_weights_and_prefs(signal_weights={"news": 1.2})
+            kb.compact()
+            kb.append_lesson("second")
+
+            snapshot = json.loads((Path(tmp) / "knowledge_base.json").read_text())
+            self.assertEqual(snapshot["log_seq"], 2)
+            self.assertEqual(snapshot["signal_weights"], {"news": 1.2})
+
+            fresh = KnowledgeBase(data_dir=Path(tmp), backend="eventlog")
+            self.assertEqual(fresh.lessons(), ["first", "second"])
+            self.assertEqual(fresh.signal_weights(), {"news": 1.2})
+
+    def test_other_instance_sees_new_events_incrementally(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = _eventlog_kb(tmp)
+            reader = KnowledgeBase(data_dir=Path(tmp), backend="eventlog")
+            self.assertEqual(reader.lessons(), [])
+            writer.append_lesson("from writer")
+            self.assertEqual(reader.lessons(), ["from writer"])
+
+    def test_periodic_compaction(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            _seed_kb(tmp)
+            store = EventLogKnowledgeStore(
+                data_dir=Path(tmp), example_dir=Path(tmp) / "example", compact_every=3
+            )
+            doc = store.load()
+            for i in range(3):
+                doc["lessons"].append({"id": f"les-{i}", "kind": "lesson", "summary": str(i)})
+                store.save(doc)
+            snapshot = json.loads(store.path.read_text())
+            self.assertEqual(snapshot["log_seq"], 3)
+            self.assertEqual(len(snapshot["lessons"]), 3)
+            self.assertEqual(snapshot["log_offset"], store.log_path.stat().st_size)
+
+    def test_torn_trailing_line_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _eventlog_kb(tmp)
+            kb.append_lesson("kept")
+            with (Path(tmp) / "knowledge_base.events.jsonl").open("ab") as f:
+                f.write(b'{"seq": 2, "changes": [')
+            fresh = KnowledgeBase(data_dir=Path(tmp), backend="eventlog")
+            self.assertEqual(fresh.lessons(), ["kept"])
+            fresh.append_lesson("after crash")
+            self.assertEqual(
+                KnowledgeBase(data_dir=Path(tmp), backend="eventlog").lessons(),
+                ["kept", "after crash"],
+            )
+
+    def test_history_feeds_kb_lineage(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _eventlog_kb(tmp)
+            first = kb.append_config_recommendation(_recommendation("first"))
+            kb.append_config_recommendation(_recommendation("second"))
+
+            statuses = [h["record"]["status"] for h in kb.history(first["id"])]
+            self.assertEqual(statuses, ["pending_review", "superseded"])
+
+            from scripts.kb_lineage import format_lineage
+
+            text = format_lineage(kb, first["id"])
+            self.assertIn("history:", text)
+            self.assertIn("status=superseded", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
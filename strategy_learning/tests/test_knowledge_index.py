@@ -0,0 +1,111 @@
+"""Tests for KB id/status indexes and provenance traversal."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+
+from strategy_learning.knowledge import make_event_ref
+from strategy_learning.knowledge.index import KBIndex
+from strategy_learning.knowledge.records import referenced_lesson_ids
+from strategy_learning.tests.test_knowledge import _seed_kb
+
+
+def _event(event_id: str = "bt-1"):
+    return make_event_ref(
+        event_type="backtest_run",
+        event_id=event_id,
+        artifact_path=f"logs/{event_id}.json",
+        summary="bt",
+    )
+
+
+def _recommendation(summary: str, **lineage):
+    return {
+        "summary": summary,
+        "rationale": summary,
+        "provenance": {
+            "generated_by": "test",
+            "trigger_event": _event(),
+            "evidence_events": [_event()],
+            "kb_lineage": lineage,
+        },
+        "proposed_changes": {"strategy_params": {"risk_management": "aggressive"}},
+    }
+
+
+class TestKBIndex(unittest.TestCase):
+    def test_lineage_walks_validations_lessons_and_superseded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _seed_kb(tmp)
+            validation = kb.append_backtest_validation({
+                "summary": "bt validation",
+                "provenance": {"trigger_event": _event()},
+            })
+            lesson = kb.append_lesson_record({
+                "summary": "lesson",
+                "source": "backtest",
+                "provenance": {
+                    "trigger_event": _event(),
+                    "kb_lineage": {"backtest_validation_id": validation["id"]},
+                },
+            })
+            first = kb.append_config_recommendation(
+                _recommendation("first", lesson_id=lesson["id"])
+            )
+            second = kb.append_config_recommendation(
+                _recommendation("second", backtest_validation_id=validation["id"])
+            )
+
+            steps = {s.record_id: s for s in kb.lineage(second["id"])}
+            self.assertEqual(steps[first["id"]].via, "supersedes")
+            self.assertEqual(steps[validation["id"]].depth, 1)
+            self.assertEqual(steps[lesson["id"]].depth, 2)
+            self.assertEqual(steps[lesson["id"]].child_id, first["id"])
+            self.assertEqual(kb.index().referencing(lesson["id"]), [first["id"]])
+            self.assertEqual(len(kb.lineage(second["id"], max_depth=1)), 2)
+
+    def test_status_index_and_pending_lookup(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _seed_kb(tmp)
+            first = kb.append_config_recommendation(_recommendation("first"))
+            second = kb.append_config_recommendation(_recommendation("second"))
+            index = kb.index()
+            self.assertEqual(
+                index.ids_with_status("config_recommendations", "superseded"), [first["id"]]
+            )
+            self.assertEqual(kb.get_pending_recommendation()["id"], second["id"])
+            kb.update_recommendation_review(second["id"], status="rejected")
+            self.assertIsNone(kb.get_pending_recommendation())
+            self.assertEqual(kb.find_record(second["id"])["status"], "rejected")
+
+    def test_referenced_lesson_ids_matches_scan(self):
+        doc = {
+            "derived_state": {"active_recommendation_id": "cr-2"},
+            "config_recommendations": [
+                {"id": "cr-1", "status": "pending_review",
+                 "provenance": {"kb_lineage": {"lesson_ids": ["les-1", "les-2"]}}},
+                {"id": "cr-2", "status": "approved",
+                 "provenance": {"kb_lineage": {"lesson_id": "les-3"}}},
+                {"id": "cr-3", "status": "rejected",
+                 "provenance": {"kb_lineage": {"lesson_id": "les-4"}}},
+            ],
+        }
+        self.assertEqual(KBIndex.build(doc).referenced_lesson_ids(), referenced_lesson_ids(doc))
+
+    def test_long_supersede_chain_is_linear(self):
+        recs = [{"id": "cr-0", "status": "superseded"}]
+        for i in range(1, 2000):
+            recs.append({"id": f"cr-{i}", "status": "superseded", "supersedes": f"cr-{i - 1}"})
+        index = KBIndex.build({"config_recommendations": recs})
+        started = time.perf_counter()
+        steps = index.ancestors("cr-1999")
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(len(steps), 1999)
+        self.assertEqual(steps[-1].record_id, "cr-0")
+        self.assertEqual(steps[-1].depth, 1999)
+
+
+if __name__ == "__main__":
+    unittest.main()
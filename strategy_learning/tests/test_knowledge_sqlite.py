@@ -0,0 +1,147 @@
+"""Tests for the SQLite knowledge-base engine (KB_BACKEND=sqlite)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from strategy_learning.knowledge import KnowledgeBase, KnowledgeBaseError, make_event_ref
+from strategy_learning.knowledge import sqlite_store
+from strategy_learning.knowledge.sqlite_store import SqliteKnowledgeStore, import_json_file
+from strategy_learning.tests.test_knowledge import _seed_kb
+
+
+def _sqlite_kb(tmp: str, user_id: str = "default") -> KnowledgeBase:
+    _seed_kb(tmp, user_id=user_id)
+    return KnowledgeBase(
+        data_dir=Path(tmp),
+        example_dir=Path(tmp) / "example",
+        user_id=user_id,
+        backend="sqlite",
+    )
+
+
+def _event():
+    return make_event_ref(
+        event_type="backtest_run",
+        event_id="bt-1",
+        artifact_path="logs/backtest_1.json",
+        summary="bt",
+    )
+
+
+def _recommendation(summary: str):
+    return {
+        "summary": summary,
+        "rationale": summary,
+        "provenance": {
+            "generated_by": "test",
+            "trigger_event": _event(),
+            "evidence_events": [_event()],
+            "kb_lineage": {},
+        },
+        "proposed_changes": {"strategy_params": {"risk_management": "aggressive"}},
+    }
+
+
+class TestSqliteKnowledgeStore(unittest.TestCase):
+    def test_round_trip_through_kb_api(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _sqlite_kb(tmp)
+            kb.append_lesson("first lesson")
+            kb.update_weights_and_prefs(signal_weights={"news": 1.2})
+            first = kb.append_config_recommendation(_recommendation("first"))
+            second = kb.append_config_recommendation(_recommendation("second"))
+
+            fresh = KnowledgeBase(data_dir=Path(tmp), backend="sqlite")
+            self.assertEqual(fresh.lessons(), ["first lesson"])
+            self.assertEqual(fresh.signal_weights()["news"], 1.2)
+            self.assertEqual(fresh.get_pending_recommendation()["id"], second["id"])
+            self.assertEqual(fresh.find_record(first["id"])["status"], "superseded")
+            self.assertFalse((Path(tmp) / "knowledge_base.json").exists())
+
+    def test_append_touches_only_changed_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _sqlite_kb(tmp)
+            for i in range(3):
+                kb.append_lesson(f"lesson {i}")
+            path = Path(tmp) / "knowledge_base.sqlite3"
+            with sqlite3.connect(path) as conn:
+                seqs_before = conn.execute("SELECT id, seq FROM lessons").fetchall()
+            kb.append_lesson("lesson 3")
+            with sqlite3.connect(path) as conn:
+                seqs_after = dict(conn.execute("SELECT id, seq FROM lessons").fetchall())
+            for lesson_id, seq in seqs_before:
+                self.assertEqual(seqs_after[lesson_id], seq)
+            self.assertEqual(len(seqs_after), 4)
+
+    def test_concurrent_instances_merge_appends(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb_a = _sqlite_kb(tmp)
+            kb_b = KnowledgeBase(data_dir=Path(tmp), backend="sqlite")
+            kb_a.lessons()
+            kb_b.lessons()
+            kb_a.append_lesson("from a")
+            kb_b.append_lesson("from b")
+            merged = KnowledgeBase(data_dir=Path(tmp), backend="sqlite")
+            self.assertEqual(sorted(merged.lessons()), ["from a", "from b"])
+
+    def test_user_isolation_mismatch(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            _sqlite_kb(tmp).append_lesson("alice lesson")
+            with self.assertRaises(KnowledgeBaseError):
+                KnowledgeBase(data_dir=Path(tmp), user_id="bob", backend="sqlite").load()
+
+    def test_schema_set_up_once_per_store(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            kb = _sqlite_kb(tmp)
+            kb.append_lesson("first")
+            with mock.patch.object(
+                sqlite_store, "_ensure_schema", wraps=sqlite_store._ensure_schema
+            ) as ensure:
+                for _ in range(3):
+                    kb.lessons()  # signature check per read
+                kb.append_lesson("second")
+            ensure.assert_not_called()
+            self.assertEqual(kb.lessons(), ["first", "second"])
+
+    def test_find_record_uses_id_index_without_loading_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rec = _sqlite_kb(tmp).append_config_recommendation(_recommendation("only"))
+            kb = KnowledgeBase(data_dir=Path(tmp), backend="sqlite")
+            with mock.patch.object(SqliteKnowledgeStore, "load", side_effect=AssertionError):
+                self.assertEqual(kb.find_record(rec["id"])["summary"], "only")
+                self.assertIsNone(kb.find_record("cr-missing"))
+            with self.assertRaises(KnowledgeBaseError):
+                KnowledgeBase(data_dir=Path(tmp), user_id="bob", backend="sqlite").find_record(
+                    rec["id"]
+                )
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(KnowledgeBaseError):
+            KnowledgeBase(backend="mongo")
+
+    def test_import_json_document(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "kb.json"
+            source.write_text(json.dumps({
+                "lessons": ["old string lesson"],
+                "signal_weights": {"news": 0.9},
+            }))
+            store = SqliteKnowledgeStore(data_dir=Path(tmp) / "db", example_dir=Path(tmp))
+            counts = import_json_file(source, store)
+            self.assertEqual(counts["lessons"], 1)
+
+            kb = KnowledgeBase(
+                data_dir=Path(tmp) / "db", example_dir=Path(tmp), backend="sqlite"
+            )
+            self.assertEqual(kb.lessons(), ["old string lesson"])
+            self.assertEqual(kb.signal_weights(), {"news": 0.9})
+
+
+if __name__ == "__main__":
+    unittest.main()
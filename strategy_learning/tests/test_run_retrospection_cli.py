@@ -167,6 +167,16 @@ class TestConsumeWithMockSweep(unittest.TestCase):
                 override_analysis=None,
                 override_preferences=None,
                 max_workers=1,
+                executor="thread",
+                search="oat",
+                budget=None,
+                grid_fraction=1.0,
+                search_fields=None,
+                seed=0,
+                halving_rungs=0,
+                halving_eta=3,
+                screen_top=0,
+                resume=None,
                 write_kb=False,
                 validate_artifact=None,
             )
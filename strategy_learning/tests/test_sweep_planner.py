@@ -0,0 +1,203 @@
+"""Tests for the sweep cost / time planner and live ETA."""
+
+from __future__ import annotations
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Dict
+
+from strategy_learning.sweep import (
+    CallProfile,
+    ParamSweepRunner,
+    choose_max_workers,
+    estimate_sweep,
+    profile_backtest_artifacts,
+    profile_recent_backtests,
+)
+from strategy_learning.sweep.runner import format_sweep_plan
+
+
+def _cycle(*llm_spans: Dict[str, Any], total_ms: float) -> Dict[str, Any]:
+    return {
+        "status": "success",
+        "timings": {
+            "name": "cycle",
+            "duration_ms": total_ms,
+            "children": [{"name": "agent.strategy", "duration_ms": total_ms, "children": list(llm_spans)}],
+        },
+    }
+
+
+def _write_artifact(log_dir: Path, name: str, cycles) -> Path:
+    path = log_dir / f"backtest_{name}.json"
+    path.write_text(json.dumps({"status": "success", "cycle_summaries": cycles}))
+    return path
+
+
+class TestCallProfile(unittest.TestCase):
+    def test_profiles_latency_and_tokens_from_traces(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp)
+            # Failover wraps the provider span: one call, tokens from the child.
+            failover = {
+                "name": "llm.failover",
+                "duration_ms": 3000.0,
+                "children": [
+                    {
+                        "name": "llm.claude",
+                        "duration_ms": 2900.0,
+                        "attrs": {"input_tokens": 1000, "output_tokens": 200},
+                    }
+                ],
+            }
+            direct = {
+                "name": "llm.claude",
+                "duration_ms": 1000.0,
+                "attrs": {"input_tokens": 600, "output_tokens": 100},
+            }
+            _write_artifact(log_dir, "a", [_cycle(failover, direct, total_ms=5000.0)])
+            # Mock-LLM and untraced cycles say nothing about the provider.
+            _write_artifact(
+                log_dir,
+                "b",
+                [_cycle({"name": "llm.mock", "duration_ms": 1.0}, total_ms=5.0), {"status": "success"}],
+            )
+            (log_dir / "backtest_broken.json").write_text("{not json")
+
+            profile = profile_recent_backtests(log_dir)
+
+        self.assertTrue(profile.measured)
+        self.assertEqual((profile.cycles_sampled, profile.artifacts_sampled), (1, 1))
+        self.assertEqual(profile.llm_calls_per_cycle, 2)
+        self.assertAlmostEqual(profile.seconds_per_call, 2.0)
+        self.assertAlmostEqual(profile.seconds_per_cycle, 5.0)
+        self.assertAlmostEqual(profile.input_tokens_per_call, 800)
+        self.assertAlmostEqual(profile.output_tokens_per_call, 150)
+
+    def test_falls_back_to_default_without_traces(self):
+        self.assertIsNone(profile_backtest_artifacts([]))
+        with tempfile.TemporaryDirectory() as tmp:
+            profile = profile_recent_backtests(Path(tmp))
+        self.assertFalse(profile.measured)
+        self.assertIn("assumed", profile.describe())
+
+
+class TestEstimate(unittest.TestCase):
+    PROFILE = CallProfile(
+        llm_calls_per_cycle=5,
+        seconds_per_call=2.0,
+        seconds_per_cycle=10.0,
+        input_tokens_per_call=1000,
+        output_tokens_per_call=100,
+        cycles_sampled=10,
+        artifacts_sampled=2,
+    )
+
+    def test_wall_time_scales_with_workers_and_rate_limit(self):
+        # 8 cycles × 10s = 80s per run; baseline alone, then 8 candidates.
+        serial = estimate_sweep(self.PROFILE, cycles_per_run=8, run_equivalents=9, max_workers=1)
+        self.assertAlmostEqual(serial.wall_seconds, 720.0)
+        parallel = estimate_sweep(self.PROFILE, cycles_per_run=8, run_equivalents=9, max_workers=4)
+        self.assertAlmostEqual(parallel.wall_seconds, 80.0 + 2 * 80.0)
+        self.assertAlmostEqual(parallel.calls_per_minute, 4 * 30.0)
+        self.assertEqual(parallel.llm_calls, 360)
+
+        # 360 calls at 60 rpm take at least 6 minutes.
+        limited = estimate_sweep(
+            self.PROFILE, cycles_per_run=8, run_equivalents=9, max_workers=4, rate_limit_rpm=60
+        )
+        self.assertTrue(limited.rate_limited)
+        self.assertAlmostEqual(limited.wall_seconds, 360.0)
+
+    def test_tokens_and_cost(self):
+        est = estimate_sweep(
+            self.PROFILE,
+            cycles_per_run=8,
+            run_equivalents=9,
+            max_workers=2,
+            price_per_mtok=(3.0, 15.0),
+        )
+        self.assertAlmostEqual(est.input_tokens, 360_000)
+        self.assertAlmostEqual(est.output_tokens, 36_000)
+        self.assertAlmostEqual(est.cost, 360_000 * 3 / 1e6 + 36_000 * 15 / 1e6)
+
+    def test_choose_max_workers_meets_deadline_within_rate_limit(self):
+        workers, reason = choose_max_workers(
+            self.PROFILE, cycles_per_run=8, run_equivalents=9, deadline_seconds=250
+        )
+        self.assertEqual(workers, 4)
+        self.assertIn("fits deadline", reason)
+
+        # 30 rpm per worker: 100 rpm allows 3 workers, too few for the deadline.
+        workers, reason = choose_max_workers(
+            self.PROFILE,
+            cycles_per_run=8,
+            run_equivalents=9,
+            deadline_seconds=250,
+            rate_limit_rpm=100,
+        )
+        self.assertEqual(workers, 3)
+        self.assertIn("not reachable", reason)
+
+        workers, _ = choose_max_workers(
+            self.PROFILE, cycles_per_run=8, run_equivalents=9, rate_limit_rpm=100
+        )
+        self.assertEqual(workers, 3)
+
+    def test_plan_shows_estimate(self):
+        plan = format_sweep_plan(
+            candidate_labels=["a", "b"],
+            max_workers=2,
+            period_start="2026-05-01",
+            period_end="2026-06-30",
+            call_profile=self.PROFILE,
+            price_per_mtok=(3.0, 15.0),
+            deadline_seconds=60,
+        )
+        self.assertIn("Est. wall time: ~2m40s at max_workers=2", plan)
+        self.assertIn("measured: 5.0 calls/cycle", plan)
+        self.assertIn("Est. tokens:", plan)
+        self.assertIn("WARNING: estimate exceeds deadline 1m00s", plan)
+
+
+def _quick_backtest(config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
+    return {"run_id": run_label, "status": "success", "metrics": {"sharpe": 0.1}}
+
+
+class TestRunnerPlanning(unittest.TestCase):
+    def test_auto_workers_and_eta_in_progress(self):
+        baseline = {
+            "strategy_params": {"risk_management": "standard"},
+            "preferences": {"max_position_size": 0.25},
+            "rebalance_params": {"threshold": 0.05},
+            "start": "2026-05-01",
+            "end": "2026-06-30",
+        }
+        runner = ParamSweepRunner(
+            run_backtest=_quick_backtest,
+            max_workers="auto",
+            call_profile=TestEstimate.PROFILE,
+            rate_limit_rpm=100,
+        )
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            result = runner.run(baseline, run_label="plan")
+        out = buf.getvalue()
+
+        self.assertEqual(runner.max_workers, 3)
+        self.assertIn("auto max_workers=3", out)
+        self.assertTrue(any(n.startswith("auto max_workers=3") for n in result.notes))
+        self.assertIn("ETA ~", out)
+        self.assertIn("elapsed", out)
+
+    def test_rejects_bad_max_workers(self):
+        with self.assertRaises(ValueError):
+            ParamSweepRunner(run_backtest=_quick_backtest, max_workers="many")
+
+
+if __name__ == "__main__":
+    unittest.main()
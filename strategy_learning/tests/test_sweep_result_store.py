@@ -0,0 +1,226 @@
+"""Tests for the cross-sweep SQLite result store."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from strategy_learning.sweep import (
+    ParamSweepRunner,
+    SweepResultStore,
+    evaluation_context,
+    merge_proposed_changes,
+)
+from strategy_learning.sweep.result_store import backtest_snapshot
+
+
+def _config(risk: str, start: str, end: str, **overrides: Any) -> Dict[str, Any]:
+    config = {
+        "start": start,
+        "end": end,
+        "initial_cash": 100_000.0,
+        "rebalance_frequency": "weekly",
+        "run_label": f"bt-{risk}-{start}",
+        "symbols": ["AAPL", "MSFT"],
+        "risk_free_rate": 0.04,
+        "analysis_params": {"lookback_days": 30},
+        "strategy_params": {"risk_management": risk, "timeframe": "short-term"},
+        "rebalance_params": {"threshold": 0.05},
+        "preferences": {"risk_tolerance": "moderate"},
+        "signal_config": {"enabled_sources": ["technical"]},
+        "llm_provider": "gemini",
+        "llm_model": "test-model",
+        "decision_policy": "llm",
+    }
+    config.update(overrides)
+    return config
+
+
+def _write(log_dir: Path, name: str, payload: Dict[str, Any]) -> Path:
+    path = log_dir / name
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def _backtest(
+    log_dir: Path,
+    name: str,
+    config: Dict[str, Any],
+    sharpe: Optional[float],
+    *,
+    status: str = "success",
+) -> Path:
+    metrics = {} if sharpe is None else {"sharpe": sharpe, "max_drawdown": -0.1 * sharpe}
+    return _write(
+        log_dir,
+        f"backtest_{name}.json",
+        {"run_id": f"run-{name}", "config": config, "status": status, "metrics": metrics},
+    )
+
+
+class TestSweepResultStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self._tmp.name)
+        self.store = SweepResultStore(self.log_dir / "results.sqlite3")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_query_best_sharpe_by_param_over_period(self):
+        _backtest(self.log_dir, "a1", _config("aggressive", "2025-01-01", "2025-06-30"), 1.2)
+        _backtest(self.log_dir, "a2", _config("aggressive", "2025-07-01", "2025-12-31"), 0.8)
+        _backtest(self.log_dir, "a0", _config("aggressive", "2024-01-01", "2024-12-31"), 2.0)
+        _backtest(self.log_dir, "s1", _config("standard", "2025-01-01", "2025-06-30"), 1.5)
+        _backtest(self.log_dir, "f1", _config("aggressive", "2025-01-01", "2025-03-31"), None,
+                  status="failed")
+        counts = self.store.ingest_dir(self.log_dir)
+        self.assertEqual(counts["backtest"], 5)
+
+        rows = self.store.query(
+            params={"risk_management": "aggressive"}, since="2025-01-01", until="2025-12-31"
+        )
+        self.assertEqual([r["sharpe"] for r in rows], [1.2, 0.8])
+        self.assertEqual(rows[0]["config"]["strategy_params"]["risk_management"], "aggressive")
+
+        full_key = self.store.query(
+            params={"strategy_params.risk_management": "aggressive"}, order_by="max_drawdown"
+        )
+        self.assertEqual([r["sharpe"] for r in full_key], [0.8, 1.2, 2.0])
+        self.assertEqual(len(self.store.query(status=None)), 5)
+        with self.assertRaises(ValueError):
+            self.store.query(order_by="sharpe; DROP TABLE runs")
+
+    def test_sweep_artifact_annotates_its_backtests_once(self):
+        base = _backtest(self.log_dir, "base", _config("standard", "2025-01-01", "2025-06-30"), 0.5)
+        # A halving rung: the candidate's backtest ran on a shorter prefix.
+        rung = _backtest(self.log_dir, "rung", _config("aggressive", "2025-01-01", "2025-02-28"), 0.9)
+        baseline_config = backtest_snapshot(_config("standard", "2025-01-01", "2025-06-30"))
+        _write(
+            self.log_dir,
+            "sweep_s1.json",
+            {
+                "sweep_id": "sweep-1",
+                "period_start": "2025-01-01",
+                "period_end": "2025-06-30",
+                "baseline_config": baseline_config,
+                "baseline": {
+                    "candidate_id": "sweep-1-baseline",
+                    "label": "baseline",
+                    "status": "success",
+                    "metrics": {"sharpe": 0.5},
+                    "artifact_path": str(base),
+                },
+                "candidates": [
+                    {
+                        "candidate_id": "sc-aggr",
+                        "label": "strategy_params.risk_management=aggressive",
+                        "proposed_changes": {"strategy_params": {"risk_management": "aggressive"}},
+                        "status": "pruned",
+                        "metrics": {"sharpe": 0.9},
+                        "artifact_path": str(rung),
+                    },
+                    {
+                        "candidate_id": "sc-cons",
+                        "label": "strategy_params.risk_management=conservative",
+                        "proposed_changes": {"strategy_params": {"risk_management": "conservative"}},
+                        "status": "success",
+                        "metrics": {"sharpe": 0.7, "windows": 3},
+                        "artifact_path": None,
+                    },
+                ],
+            },
+        )
+        self.store.ingest_dir(self.log_dir)
+
+        rows = {r["candidate_id"]: r for r in self.store.query(status=None)}
+        self.assertEqual(set(rows), {"sweep-1-baseline", "sc-aggr", "sc-cons"})
+        self.assertTrue(rows["sweep-1-baseline"]["is_baseline"])
+        self.assertEqual(rows["sc-aggr"]["source"], "backtest")
+        self.assertEqual(rows["sc-aggr"]["period_end"], "2025-02-28")
+        self.assertEqual(rows["sc-aggr"]["sweep_id"], "sweep-1")
+        self.assertEqual(rows["sc-cons"]["source"], "sweep")
+        self.assertEqual(rows["sc-cons"]["period_end"], "2025-06-30")
+        self.assertEqual(rows["sc-cons"]["metrics"]["windows"], 3)
+        # Sweep artifacts carry no evaluation context: queryable, never reused.
+        self.assertIsNone(rows["sc-cons"]["eval_hash"])
+
+    def test_reingest_reads_only_changed_files(self):
+        path = _backtest(self.log_dir, "a", _config("standard", "2025-01-01", "2025-06-30"), 0.5)
+        self.assertEqual(self.store.ingest_dir(self.log_dir)["backtest"], 1)
+        self.assertEqual(self.store.ingest_dir(self.log_dir)["unchanged"], 1)
+
+        _backtest(self.log_dir, "a", _config("standard", "2025-01-01", "2025-06-30"), 0.6)
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+        self.assertEqual(self.store.ingest_dir(self.log_dir)["backtest"], 1)
+        self.assertEqual([r["sharpe"] for r in self.store.query()], [0.6])
+
+    def test_lookup_needs_same_config_window_and_context(self):
+        config = _config("standard", "2025-01-01", "2025-06-30")
+        _backtest(self.log_dir, "a", config, 0.5)
+        self.store.ingest_dir(self.log_dir)
+        snapshot = backtest_snapshot(config)
+
+        store = SweepResultStore(self.store.path, context=evaluation_context(config))
+        self.assertEqual(store.lookup(snapshot)["sharpe"], 0.5)
+        self.assertIsNone(store.lookup(dict(snapshot, end="2025-03-31")))
+        self.assertIsNone(
+            store.lookup(merge_proposed_changes(snapshot, {"strategy_params": {"timeframe": "long-term"}}))
+        )
+        daily = SweepResultStore(
+            self.store.path, context=evaluation_context(dict(config, rebalance_frequency="daily"))
+        )
+        self.assertIsNone(daily.lookup(snapshot))
+        self.assertIsNone(self.store.lookup(snapshot))
+
+
+class _CountingBacktest:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, config_snapshot, run_label):
+        value = config_snapshot["strategy_params"]["risk_management"]
+        self.calls.append(value)
+        return {"run_id": run_label, "status": "success", "metrics": {"sharpe": float(value[1:])}}
+
+
+class TestRunnerSkipsEvaluated(unittest.TestCase):
+    def test_runner_reuses_stored_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_dir = Path(tmp)
+            config = _config("v0", "2025-01-01", "2025-06-30")
+            _backtest(log_dir, "v0", config, 0.0)
+            _backtest(log_dir, "v2", _config("v2", "2025-01-01", "2025-06-30"), 9.0)
+            # Same config, other window: not reused.
+            _backtest(log_dir, "v1", _config("v1", "2024-01-01", "2024-06-30"), 5.0)
+            store = SweepResultStore(log_dir / "results.sqlite3", context=evaluation_context(config))
+            store.ingest_dir(log_dir)
+
+            candidates = [
+                {
+                    "candidate_id": f"sc-v{i}",
+                    "label": f"strategy_params.risk_management=v{i}",
+                    "proposed_changes": {"strategy_params": {"risk_management": f"v{i}"}},
+                }
+                for i in (1, 2, 3)
+            ]
+            backtest = _CountingBacktest()
+            result = ParamSweepRunner(run_backtest=backtest, result_store=store).run(
+                backtest_snapshot(config), run_label="rs", candidates=candidates
+            )
+
+        self.assertEqual(sorted(backtest.calls), ["v1", "v3"])
+        by_id = {c.candidate_id: c for c in result.candidates}
+        self.assertEqual(by_id["sc-v2"].metrics["sharpe"], 9.0)
+        self.assertEqual(by_id["sc-v2"].run_id, "run-v2")
+        self.assertEqual(result.winner.candidate_id, "sc-v2")
+        self.assertIn("Reused 2 runs already evaluated on the same window (result store)", result.notes)
+
+
+if __name__ == "__main__":
+    unittest.main()
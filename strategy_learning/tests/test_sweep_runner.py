@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from typing import Any, Dict
 
 from strategy_learning.knowledge import KnowledgeBase
-from strategy_learning.sweep import ParamSweepRunner
+from strategy_learning.sweep import (
+    ParamSweepRunner,
+    open_sweep_checkpoint,
+    successive_halving_schedule,
+    sweep_run_equivalents,
+)
 from trading_agent.storage import (
     PreferencesStore,
     RebalanceConfigStore,
@@ -66,6 +72,54 @@ def _mock_runner_factory(scores: Dict[str, float]):
     return run_backtest
 
 
+def _pid_backtest(config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
+    """Module-level so the process executor can pickle it."""
+    if "explode" in run_label:
+        raise RuntimeError("candidate blew up")
+    rm = (config_snapshot.get("strategy_params") or {}).get("risk_management")
+    return {
+        "run_id": f"{run_label}-{os.getpid()}",
+        "status": "success",
+        "metrics": {"sharpe": 0.9 if rm == "aggressive" else 0.1, "pid": os.getpid()},
+    }
+
+
+class _BatchBacktest:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, config_snapshot, run_label):
+        return self.run_many([(config_snapshot, run_label)])[0]
+
+    def run_many(self, items, max_workers=1):
+        self.batches.append(([label for _, label in items], max_workers))
+        return [_pid_backtest(snapshot, label) for snapshot, label in items]
+
+
+class _PrefixBacktest:
+    """Sharpe = candidate index; records which period end each run used."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, config_snapshot, run_label):
+        value = (config_snapshot.get("strategy_params") or {}).get("risk_management")
+        self.calls.append((value, config_snapshot.get("end")))
+        sharpe = float(value[1:]) if value.startswith("v") else 0.5
+        return {"run_id": run_label, "status": "success", "metrics": {"sharpe": sharpe}}
+
+
+def _indexed_candidates(n: int):
+    return [
+        {
+            "candidate_id": f"sc-v{i}",
+            "label": f"strategy_params.risk_management=v{i}",
+            "proposed_changes": {"strategy_params": {"risk_management": f"v{i}"}},
+        }
+        for i in range(n)
+    ]
+
+
 class TestParamSweepRunner(unittest.TestCase):
     def test_ranks_winner_and_writes_sweep_recommendation(self):
         baseline = {
@@ -196,6 +250,195 @@ class TestParamSweepRunner(unittest.TestCase):
             self.assertIsNone(result.recommendation_id)
             self.assertIsNone(kb.get_pending_recommendation())
 
+    def test_process_executor_runs_candidates_in_worker_processes(self):
+        baseline = {"strategy_params": {"risk_management": "standard"}}
+        candidates = [
+            {
+                "candidate_id": f"sc-{value}",
+                "label": f"strategy_params.risk_management={value}",
+                "proposed_changes": {"strategy_params": {"risk_management": value}},
+            }
+            for value in ("aggressive", "conservative", "explode")
+        ]
+        runner = ParamSweepRunner(run_backtest=_pid_backtest, max_workers=2, executor="process")
+        result = runner.run(baseline, run_label="proc", candidates=candidates)
+
+        self.assertEqual(runner._completed, 4)
+        self.assertEqual(
+            [c.candidate_id for c in result.candidates],
+            ["sc-aggressive", "sc-conservative", "sc-explode"],
+        )
+        self.assertEqual(result.baseline.metrics["pid"], os.getpid())
+        for cand in result.candidates[:2]:
+            self.assertNotEqual(cand.metrics["pid"], os.getpid())
+        self.assertEqual(result.candidates[2].status, "failed")
+        self.assertIn("blew up", result.candidates[2].error)
+        self.assertEqual(result.winner.candidate_id, "sc-aggressive")
+
+    def test_lockstep_executor_batches_baseline_and_candidates(self):
+        baseline = {"strategy_params": {"risk_management": "standard"}}
+        candidates = [
+            {
+                "candidate_id": f"sc-{value}",
+                "label": f"strategy_params.risk_management={value}",
+                "proposed_changes": {"strategy_params": {"risk_management": value}},
+            }
+            for value in ("aggressive", "conservative")
+        ]
+        backtest = _BatchBacktest()
+        runner = ParamSweepRunner(run_backtest=backtest, max_workers=3, executor="lockstep")
+        result = runner.run(baseline, run_label="ls", candidates=candidates)
+
+        self.assertEqual(
+            backtest.batches, [(["ls_baseline", "ls_sc-aggressive", "ls_sc-conservative"], 3)]
+        )
+        self.assertTrue(result.baseline.is_baseline)
+        self.assertEqual(runner._completed, 3)
+        self.assertEqual(result.winner.candidate_id, "sc-aggressive")
+
+        with self.assertRaises(ValueError):
+            ParamSweepRunner(run_backtest=_pid_backtest, executor="lockstep")
+
+    def test_successive_halving_prunes_on_period_prefixes(self):
+        self.assertEqual(
+            successive_halving_schedule(9, rungs=2, eta=3), [(1 / 9, 9), (1 / 3, 3), (1.0, 1)]
+        )
+        # Baseline + 9 on the first ninth + 3 adding two ninths + 1 adding two thirds.
+        self.assertAlmostEqual(sweep_run_equivalents(9, halving_rungs=2), 1 + 1 + 2 / 3 + 2 / 3)
+        baseline = {
+            "strategy_params": {"risk_management": "standard"},
+            "start": "2024-01-01",
+            "end": "2024-03-31",
+        }
+        backtest = _PrefixBacktest()
+        runner = ParamSweepRunner(run_backtest=backtest, max_workers=3, halving_rungs=2)
+        result = runner.run(baseline, run_label="sh", candidates=_indexed_candidates(9))
+
+        ends = [end for _, end in backtest.calls]
+        self.assertEqual(
+            (ends.count("2024-01-11"), ends.count("2024-01-31"), ends.count("2024-03-31")),
+            (9, 3, 2),  # baseline + the last survivor run the full period
+        )
+        self.assertEqual(runner._completed, 14)
+        self.assertEqual(runner._total_runs, 14)
+        self.assertEqual(result.winner.candidate_id, "sc-v8")
+        self.assertEqual([c.status for c in result.candidates], ["pruned"] * 8 + ["success"])
+        self.assertEqual(result.candidates[7].metrics["sharpe"], 7.0)
+        self.assertIn("pruned at rung 2 (2024-01-01→2024-01-31)", result.candidates[7].error)
+        self.assertTrue(result.notes[0].startswith("Successive halving rung 1/2"))
+        self.assertIn("kept 3 [strategy_params.risk_management=v6", result.notes[0])
+
+    def test_successive_halving_in_lockstep_batches_each_rung(self):
+        baseline = {"strategy_params": {"risk_management": "standard"}}
+        backtest = _BatchBacktest()
+        runner = ParamSweepRunner(
+            run_backtest=backtest, executor="lockstep", halving_rungs=1, halving_eta=2
+        )
+        candidates = [
+            {
+                "candidate_id": f"sc-{value}",
+                "label": f"strategy_params.risk_management={value}",
+                "proposed_changes": {"strategy_params": {"risk_management": value}},
+            }
+            for value in ("aggressive", "conservative", "moderate")
+        ]
+        result = runner.run(
+            baseline,
+            period_start="2024-01-01",
+            period_end="2024-03-01",
+            run_label="ls",
+            candidates=candidates,
+        )
+        self.assertEqual(
+            [labels for labels, _ in backtest.batches],
+            [
+                ["ls_r1_sc-aggressive", "ls_r1_sc-conservative", "ls_r1_sc-moderate"],
+                ["ls_baseline", "ls_sc-aggressive", "ls_sc-conservative"],
+            ],
+        )
+        self.assertEqual(result.winner.candidate_id, "sc-aggressive")
+
+    def test_successive_halving_needs_a_period(self):
+        runner = ParamSweepRunner(run_backtest=_PrefixBacktest(), halving_rungs=2)
+        result = runner.run(
+            {"strategy_params": {"risk_management": "standard"}},
+            candidates=_indexed_candidates(3),
+        )
+        self.assertEqual(runner._completed, 4)
+        self.assertIn("Successive halving skipped", result.notes[0])
+
+    def test_surrogate_screen_sends_top_k_to_llm_runs(self):
+        calls = []
+
+        def backtest(config_snapshot, run_label):
+            value = config_snapshot["strategy_params"]["risk_management"]
+            policy = config_snapshot.get("decision_policy", "llm")
+            calls.append((value, policy))
+            index = float(value[1:]) if value.startswith("v") else 0.5
+            # The surrogate prefers low indices, the LLM high ones.
+            sharpe = -index if policy == "rules" else index
+            return {"run_id": run_label, "status": "success", "metrics": {"sharpe": sharpe}}
+
+        runner = ParamSweepRunner(run_backtest=backtest, screen_top=3)
+        result = runner.run(
+            {"strategy_params": {"risk_management": "standard"}},
+            candidates=_indexed_candidates(6),
+        )
+
+        self.assertEqual(sum(1 for _, p in calls if p == "rules"), 6)
+        self.assertEqual(
+            sorted(v for v, p in calls if p == "llm"), ["standard", "v0", "v1", "v2"]
+        )
+        self.assertEqual(runner._total_runs, 10)
+        self.assertEqual(result.winner.candidate_id, "sc-v2")
+        self.assertEqual(
+            [c.status for c in result.candidates], ["success"] * 3 + ["pruned"] * 3
+        )
+        self.assertEqual(result.candidates[5].error, "screened out by rules surrogate")
+        self.assertTrue(result.notes[0].startswith("Surrogate screen (rules policy, no LLM): kept 3"))
+
+    def test_resume_skips_checkpointed_runs(self):
+        baseline = {"strategy_params": {"risk_management": "standard"}, "end": "2024-03-31"}
+
+        class _CrashingBacktest(_PrefixBacktest):
+            def __call__(self, config_snapshot, run_label):
+                if (config_snapshot.get("strategy_params") or {}).get("risk_management") == "v2":
+                    raise KeyboardInterrupt  # the sweep process dies mid-run
+                return super().__call__(config_snapshot, run_label)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = open_sweep_checkpoint(tmp, baseline, run_label="rs")
+            with self.assertRaises(KeyboardInterrupt):
+                ParamSweepRunner(run_backtest=_CrashingBacktest()).run(
+                    baseline, run_label="rs", candidates=_indexed_candidates(4),
+                    checkpoint=checkpoint,
+                )
+
+            resumed = open_sweep_checkpoint(tmp, baseline, run_label="rs", resume=True)
+            self.assertEqual(resumed.sweep_id, checkpoint.sweep_id)
+            backtest = _PrefixBacktest()
+            # Fresh candidate ids: runs are matched by config, not by id.
+            candidates = [
+                dict(c, candidate_id=f"new-{c['candidate_id']}") for c in _indexed_candidates(4)
+            ]
+            result = ParamSweepRunner(run_backtest=backtest).run(
+                baseline, run_label="rs", candidates=candidates, checkpoint=resumed
+            )
+            self.assertEqual([value for value, _ in backtest.calls], ["v2", "v3"])
+            self.assertEqual(result.sweep_id, checkpoint.sweep_id)
+            self.assertEqual(result.baseline.candidate_id, f"{checkpoint.sweep_id}-baseline")
+            self.assertEqual(result.candidates[0].candidate_id, "new-sc-v0")
+            self.assertEqual(result.winner.candidate_id, "new-sc-v3")
+            self.assertIn("Resumed 3 finished runs from checkpoint", result.notes)
+            self.assertTrue(resumed.complete)
+            # Nothing left to resume; a new sweep starts.
+            fresh = open_sweep_checkpoint(tmp, baseline, run_label="rs", resume=True)
+            self.assertNotEqual(fresh.sweep_id, checkpoint.sweep_id)
+
+    def test_rejects_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            ParamSweepRunner(run_backtest=_pid_backtest, executor="gpu")
+
 
 if __name__ == "__main__":
     unittest.main()
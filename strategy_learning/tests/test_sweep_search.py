@@ -0,0 +1,111 @@
+"""Tests for sweep search strategies (grid / random / TPE)."""
+
+from __future__ import annotations
+
+import unittest
+from typing import Any, Dict
+
+from strategy_learning.knowledge.records import config_hash
+from strategy_learning.sweep import (
+    GridSearch,
+    ParamSweepRunner,
+    RandomSearch,
+    TPESearch,
+    build_search,
+    merge_proposed_changes,
+)
+
+BASELINE = {
+    "strategy_params": {
+        "risk_management": "standard",
+        "position_sizing": "dynamic",
+        "timeframe": "short-term",
+    },
+    "preferences": {"risk_tolerance": "moderate", "max_position_size": 0.25},
+    "rebalance_params": {"threshold": 0.05},
+}
+FIELDS = ["strategy_params.risk_management", "rebalance_params.threshold"]
+
+
+def _hashes(candidates):
+    return {config_hash(merge_proposed_changes(BASELINE, c["proposed_changes"])) for c in candidates}
+
+
+def _scored_backtest(config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
+    """Best at aggressive + 0.02; both fields matter."""
+    rm = config_snapshot["strategy_params"]["risk_management"]
+    thr = config_snapshot["rebalance_params"]["threshold"]
+    sharpe = {"conservative": 0.0, "standard": 0.5, "aggressive": 1.0}[rm] - 4 * thr
+    return {"run_id": run_label, "status": "success", "metrics": {"sharpe": sharpe}}
+
+
+class TestSearchStrategies(unittest.TestCase):
+    def test_full_grid_covers_interactions_without_baseline(self):
+        candidates = GridSearch(BASELINE, fields=FIELDS).candidates()
+        self.assertEqual(len(candidates), 3 * 5 - 1)
+        self.assertEqual(len(_hashes(candidates)), len(candidates))
+        self.assertNotIn(config_hash(BASELINE), _hashes(candidates))
+        self.assertIn(
+            "strategy_params.risk_management=aggressive, rebalance_params.threshold=0.02",
+            [c["label"] for c in candidates],
+        )
+
+    def test_fractional_grid_keeps_every_level(self):
+        candidates = GridSearch(BASELINE, fields=FIELDS, fraction=1 / 3).candidates()
+        self.assertLess(len(candidates), 8)
+        assignments = [merge_proposed_changes(BASELINE, c["proposed_changes"]) for c in candidates]
+        self.assertEqual(
+            {a["strategy_params"]["risk_management"] for a in assignments},
+            {"conservative", "standard", "aggressive"},
+        )
+        self.assertEqual(
+            {a["rebalance_params"]["threshold"] for a in assignments},
+            {0.02, 0.05, 0.08, 0.10, 0.15},
+        )
+
+    def test_random_is_seeded_budgeted_and_distinct(self):
+        first = RandomSearch(BASELINE, budget=40, seed=7).candidates()
+        again = RandomSearch(BASELINE, budget=40, seed=7).candidates()
+        self.assertEqual(len(first), 40)
+        self.assertEqual(len(_hashes(first)), 40)
+        self.assertEqual([c["label"] for c in first], [c["label"] for c in again])
+        # A budget above the space size stops at the space.
+        self.assertEqual(len(RandomSearch(BASELINE, budget=99, fields=FIELDS).candidates()), 14)
+
+    def test_tpe_drives_sweep_within_budget(self):
+        search = TPESearch(BASELINE, budget=10, fields=FIELDS, n_startup=4, seed=3)
+        runner = ParamSweepRunner(run_backtest=_scored_backtest, max_workers=2)
+        result = runner.run(BASELINE, run_label="tpe", search=search)
+
+        self.assertEqual(len(result.candidates), 10)
+        self.assertEqual(runner._completed, 11)
+        self.assertEqual(len(search.history), 10)
+        self.assertEqual(
+            len(_hashes([c.to_dict() for c in result.candidates])), 10
+        )
+        self.assertEqual(
+            result.winner.proposed_changes,
+            {"strategy_params": {"risk_management": "aggressive"}, "rebalance_params": {"threshold": 0.02}},
+        )
+        self.assertIn("Search tpe: 10 candidates (budget 10, space of 15 configs)", result.notes)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            build_search("tpe", BASELINE)  # needs a budget
+        with self.assertRaises(ValueError):
+            build_search("grid", BASELINE, fields=["preferences.investment_goal"])
+        with self.assertRaises(ValueError):
+            build_search("anneal", BASELINE, budget=5)
+
+    def test_unbudgeted_search_never_expands_to_the_whole_space(self):
+        with self.assertRaisesRegex(ValueError, "random search needs a budget"):
+            build_search("random", BASELINE, budget=None)
+        with self.assertRaisesRegex(ValueError, "needs a budget"):
+            build_search("grid", BASELINE, budget=None)
+        # A small grid may run without one; a large one with a budget stays within it.
+        self.assertEqual(len(build_search("grid", BASELINE, fields=FIELDS).candidates()), 14)
+        self.assertEqual(len(build_search("grid", BASELINE, budget=20).candidates()), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
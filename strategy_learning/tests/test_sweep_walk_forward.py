@@ -0,0 +1,145 @@
+"""Tests for walk-forward windows and the WalkForwardBacktest sweep wrapper."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+from datetime import date
+from typing import Any, Dict
+
+from strategy_learning.sweep import (
+    ParamSweepRunner,
+    WalkForwardBacktest,
+    aggregate_window_metrics,
+    walk_forward_windows,
+)
+from strategy_learning.sweep.walk_forward import walk_forward_spec
+
+# Test-window Sharpe per risk_management value, by segment start month.
+_STEADY = {"04": 1.0, "07": 1.0, "09": 1.0}
+_SPIKY = {"04": 3.0, "07": -0.5, "09": 0.5}
+
+
+class _SegmentBacktest:
+    def __init__(self, fail_start: str = ""):
+        self.calls = []
+        self.fail_start = fail_start
+        self._lock = threading.Lock()
+
+    def __call__(self, config_snapshot: Dict[str, Any], run_label: str) -> Dict[str, Any]:
+        with self._lock:
+            self.calls.append(config_snapshot)
+        start = config_snapshot["start"]
+        if start == self.fail_start:
+            return {"run_id": run_label, "status": "failed", "error": "boom", "metrics": {}}
+        value = config_snapshot["strategy_params"]["risk_management"]
+        table = {"steady": _STEADY, "spiky": _SPIKY}.get(value, {})
+        sharpe = table.get(start[5:7], 0.2)
+        return {
+            "run_id": run_label,
+            "status": "success",
+            "metrics": {"sharpe": sharpe, "total_return": sharpe / 10, "max_drawdown": -0.05 * sharpe},
+        }
+
+
+def _snapshot(value: str) -> Dict[str, Any]:
+    return {
+        "strategy_params": {"risk_management": value},
+        "start": "2024-01-01",
+        "end": "2024-12-30",
+        "walk_forward": walk_forward_spec(3),
+    }
+
+
+class TestWalkForwardWindows(unittest.TestCase):
+    def test_equal_blocks_chain_train_onto_previous_test(self):
+        windows = walk_forward_windows(date(2024, 1, 1), date(2024, 12, 30), 3)
+        self.assertEqual(
+            [(w.train_start, w.test_start, w.test_end) for w in windows],
+            [
+                ("2024-01-01", "2024-04-01", "2024-06-30"),
+                ("2024-04-01", "2024-07-01", "2024-09-29"),
+                ("2024-07-01", "2024-09-30", "2024-12-30"),
+            ],
+        )
+        for prev, nxt in zip(windows, windows[1:]):
+            self.assertEqual((nxt.train_start, nxt.train_end), (prev.test_start, prev.test_end))
+
+    def test_explicit_train_length_and_validation(self):
+        windows = walk_forward_windows(date(2024, 1, 1), date(2024, 12, 31), 2, train_days=180)
+        self.assertEqual(windows[0].test_start, "2024-06-29")
+        self.assertEqual(windows[-1].test_end, "2024-12-31")
+        with self.assertRaises(ValueError):
+            walk_forward_windows(date(2024, 1, 1), date(2024, 2, 1), 4)
+
+
+class TestAggregate(unittest.TestCase):
+    def test_dispersion_penalizes_rank_score(self):
+        metrics = aggregate_window_metrics(
+            [{"sharpe": 3.0, "max_drawdown": -0.1}, {"sharpe": -1.0, "max_drawdown": -0.3}],
+            [{"sharpe": 2.0}],
+            dispersion_penalty=0.5,
+        )
+        self.assertAlmostEqual(metrics["sharpe_mean"], 1.0)
+        self.assertAlmostEqual(metrics["sharpe_std"], 2.0)
+        self.assertAlmostEqual(metrics["sharpe"], 0.0)
+        self.assertEqual(metrics["max_drawdown"], -0.3)
+        self.assertEqual(metrics["positive_windows"], 0.5)
+        self.assertAlmostEqual(metrics["overfit_gap"], 1.0)
+
+
+class TestWalkForwardBacktest(unittest.TestCase):
+    def test_runs_each_block_once_with_shared_llm_responses(self):
+        backtest = _SegmentBacktest()
+        run = WalkForwardBacktest(backtest, max_workers=4)(_snapshot("steady"), "wf")
+
+        self.assertEqual(run["status"], "success", run["error"])
+        # 3 windows over 4 equal blocks: each block backtested once.
+        self.assertEqual(len(backtest.calls), 4)
+        for snapshot in backtest.calls:
+            self.assertNotIn("walk_forward", snapshot)
+            self.assertTrue(snapshot["reuse_llm_responses"])
+        self.assertEqual(run["metrics"]["windows"], 3)
+        self.assertAlmostEqual(run["metrics"]["sharpe"], 1.0)
+        self.assertEqual(len(run["metrics"]["walk_forward"]), 3)
+
+    def test_failed_window_fails_the_run(self):
+        run = WalkForwardBacktest(_SegmentBacktest(fail_start="2024-07-01"))(_snapshot("steady"), "wf")
+        self.assertEqual(run["status"], "failed")
+        self.assertIn("window 2", run["error"])
+        self.assertEqual(run["metrics"]["windows"], 2)
+
+    def test_sweep_prefers_steady_over_spiky_config(self):
+        baseline = _snapshot("standard")
+        candidates = [
+            {
+                "candidate_id": f"sc-{value}",
+                "label": f"strategy_params.risk_management={value}",
+                "proposed_changes": {"strategy_params": {"risk_management": value}},
+            }
+            for value in ("spiky", "steady")
+        ]
+        runner = ParamSweepRunner(run_backtest=WalkForwardBacktest(_SegmentBacktest()))
+        result = runner.run(baseline, run_label="wf", candidates=candidates)
+
+        by_id = {c.candidate_id: c for c in result.candidates}
+        # Same mean test Sharpe (1.0); spiky loses on its spread.
+        self.assertGreater(by_id["sc-spiky"].metrics["sharpe_std"], 0)
+        self.assertEqual(result.winner.candidate_id, "sc-steady")
+
+    def test_halving_prefix_uses_fewer_windows(self):
+        snapshot = dict(_snapshot("steady"), end="2024-02-20")
+        run = WalkForwardBacktest(_SegmentBacktest())(snapshot, "wf")
+        self.assertEqual(run["status"], "success", run["error"])
+        self.assertEqual(run["metrics"]["windows"], 2)
+
+    def test_snapshot_without_spec_passes_through(self):
+        backtest = _SegmentBacktest()
+        snapshot = {"strategy_params": {"risk_management": "steady"}, "start": "2024-04-01"}
+        run = WalkForwardBacktest(backtest)(snapshot, "plain")
+        self.assertEqual(run["metrics"]["sharpe"], 1.0)
+        self.assertEqual(backtest.calls, [snapshot])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,17 @@
 """Cycle coordinator — runs Phase 4 agents in order and returns CycleResult dict."""
 
+import json
 import logging
 import uuid
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Optional
 
+from trading_agent.agents.base import Agent
 from trading_agent.agents.registry import AgentRegistry
 from trading_agent.domain.cycle import CycleResult
+from trading_agent.storage.atomic import atomic_write_json
+from trading_agent.tracing import maybe_profile, span, start_trace
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,22 @@ class CycleCoordinator:
         }
         self.last_ctx = ctx
 
+        with maybe_profile(cycle_id[:8]) as profile:
+            with start_trace("cycle", cycle_id=cycle_id) as tracer:
+                result = self._run_pipeline(ctx, cycle_id, timestamp)
+        result["timings"] = tracer.to_dict()
+        if profile.get("path"):
+            result["profile_path"] = profile["path"]
+        self._attach_timings_to_artifact(ctx, result)
+        return result
+
+    def _run_agent(self, agent: Agent, ctx: Dict[str, Any]) -> Any:
+        with span(f"agent.{agent.name}"):
+            return agent.run(ctx)
+
+    def _run_pipeline(
+        self, ctx: Dict[str, Any], cycle_id: str, timestamp: str
+    ) -> Dict[str, Any]:
         try:
             for agent in self.registry.enabled_pipeline():
                 if agent.name == "trading_strategizer":
@@ -44,7 +65,7 @@ class CycleCoordinator:
                         for name in ("decision_logger", "live_lesson"):
                             follow = self.registry.get(name)
                             if follow and follow.is_enabled():
-                                follow.run(ctx)
+                                self._run_agent(follow, ctx)
                         return ctx.get("cycle_result") or CycleResult(
                             status="failed",
                             cycle_id=cycle_id,
@@ -52,7 +73,7 @@ class CycleCoordinator:
                             error=ctx["error"],
                         ).to_dict()
 
-                agent.run(ctx)
+                self._run_agent(agent, ctx)
 
             return ctx.get("cycle_result") or CycleResult(
                 status=ctx.get("status", "failed"),
@@ -68,7 +89,7 @@ class CycleCoordinator:
             logger_agent = self.registry.get("decision_logger")
             if logger_agent and logger_agent.is_enabled():
                 try:
-                    logger_agent.run(ctx)
+                    self._run_agent(logger_agent, ctx)
                     if "cycle_result" in ctx:
                         return ctx["cycle_result"]
                 except Exception:
@@ -76,7 +97,7 @@ class CycleCoordinator:
             live_lesson = self.registry.get("live_lesson")
             if live_lesson and live_lesson.is_enabled():
                 try:
-                    live_lesson.run(ctx)
+                    self._run_agent(live_lesson, ctx)
                 except Exception:
                     logger.exception("LiveLessonAgent failed during error handling")
             return CycleResult(
@@ -85,3 +106,26 @@ class CycleCoordinator:
                 timestamp=timestamp,
                 error=str(exc),
             ).to_dict()
+
+    def _attach_timings_to_artifact(
+        self, ctx: Dict[str, Any], result: Dict[str, Any]
+    ) -> None:
+        """Patch cycle artifact with the stage trace once the pipeline has finished."""
+        artifact_path = result.get("artifact_path")
+        if not artifact_path:
+            decision_log = ctx.get("decision_log")
+            artifact_path = getattr(decision_log, "artifact_path", None)
+        if not artifact_path:
+            return
+        path = Path(artifact_path)
+        if not path.exists():
+            return
+        try:
+            with path.open(encoding="utf-8") as f:
+                payload = json.load(f)
+            payload["timings"] = result["timings"]
+            if result.get("profile_path"):
+                payload["profile_path"] = result["profile_path"]
+            atomic_write_json(path, payload, fsync=False)
+        except (OSError, json.JSONDecodeError, TypeError) as exc:
+            logger.warning("Could not append timings to %s: %s", path, exc)
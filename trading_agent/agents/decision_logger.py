@@ -1,6 +1,5 @@
 """Decision Logger — build DecisionLog and optionally write cycle artifact."""
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +9,8 @@ from trading_agent.agents.base import ConfigurableAgent
 from trading_agent.agents.messages import DecisionLog
 from trading_agent.domain.cycle import CycleResult
 from trading_agent.models import serialize_for_json
+from trading_agent.storage.atomic import atomic_write_json
+from trading_agent.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +87,8 @@ class DecisionLoggerAgent(ConfigurableAgent):
 
         artifact_path = None
         if self.write_artifact:
-            artifact_path = self._write_artifact(cycle_dict)
+            with span("artifact.write"):
+                artifact_path = self._write_artifact(cycle_dict)
             cycle_dict["artifact_path"] = str(artifact_path)
 
         decision_log = DecisionLog(
@@ -108,7 +110,6 @@ class DecisionLoggerAgent(ConfigurableAgent):
         cycle_id = cycle_dict.get("cycle_id", "unknown")
         path = self.log_dir / f"cycle_{stamp}_{str(cycle_id)[:8]}.json"
         payload = serialize_for_json(cycle_dict)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        atomic_write_json(path, payload, fsync=False)
         logger.info("Decision logger wrote cycle artifact to %s", path)
         return path
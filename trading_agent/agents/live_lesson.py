@@ -13,6 +13,8 @@ from strategy_learning.knowledge import KnowledgeBase
 from trading_agent.agents.base import ConfigurableAgent
 from trading_agent.agents.messages import LessonsUpdate
 from trading_agent.models import serialize_for_json
+from trading_agent.storage.atomic import atomic_write_json
+from trading_agent.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +92,8 @@ class LiveLessonAgent(ConfigurableAgent):
             lesson_records=[lesson_record] if lesson_record else [],
         )
         ctx["lessons_update"] = update
-        self._append_lessons_to_artifact(ctx, update)
+        with span("artifact.patch"):
+            self._append_lessons_to_artifact(ctx, update)
         return {"lessons_update": update}
 
     def _append_lessons_to_artifact(
@@ -115,8 +118,7 @@ class LiveLessonAgent(ConfigurableAgent):
                 payload = json.load(f)
             agents = payload.setdefault("agents", {})
             agents["lessons_update"] = serialize_for_json(update.to_dict())
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
+            atomic_write_json(path, payload, fsync=False)
             logger.debug("Appended lessons_update to %s", path)
         except (OSError, json.JSONDecodeError, TypeError) as exc:
             logger.warning("Could not append lessons_update to %s: %s", path, exc)
@@ -10,6 +10,7 @@ from trading_agent.analysis.runner import AnalysisRunner
 from trading_agent.domain.user.user_preferences import UserPreferences
 from trading_agent.execution.snapshot_builder import PortfolioSnapshotBuilder
 from trading_agent.signals.aggregator import SignalAggregator
+from trading_agent.tracing import span
 
 
 def _derive_trend(market_conditions) -> str:
@@ -85,24 +86,29 @@ class MarketAnalyzerAgent(ConfigurableAgent):
 
     def run(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         analysis_params = dict(ctx.get("analysis_params") or {})
-        lessons = self.knowledge_base.lessons_for_prompt()
-        weights = self.knowledge_base.signal_weights()
+        with span("knowledge.read"):
+            lessons = self.knowledge_base.lessons_for_prompt()
+            weights = self.knowledge_base.signal_weights()
         if lessons:
             analysis_params["knowledge_lessons"] = lessons
         if weights:
             analysis_params["signal_weights"] = weights
 
-        raw_conditions = self.market_data_provider.get_market_conditions()
+        with span("market_conditions"):
+            raw_conditions = self.market_data_provider.get_market_conditions()
         market_conditions = self.signal_aggregator.market_conditions_from_dict(raw_conditions)
-        portfolio = self.snapshot_builder.build(self.broker_client)
-        signals = self.signal_aggregator.collect(market_conditions, portfolio)
-        market_analysis = self.analysis_runner.run(
-            portfolio=portfolio,
-            signals=signals,
-            market_conditions=market_conditions,
-            user_preferences=self.user_preferences,
-            analysis_params=analysis_params,
-        )
+        with span("portfolio_snapshot"):
+            portfolio = self.snapshot_builder.build(self.broker_client)
+        with span("signals"):
+            signals = self.signal_aggregator.collect(market_conditions, portfolio)
+        with span("analysis"):
+            market_analysis = self.analysis_runner.run(
+                portfolio=portfolio,
+                signals=signals,
+                market_conditions=market_conditions,
+                user_preferences=self.user_preferences,
+                analysis_params=analysis_params,
+            )
 
         summary = MarketSummary(
             market_conditions=market_conditions,
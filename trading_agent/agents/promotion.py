@@ -9,10 +9,13 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from strategy_learning.knowledge import KnowledgeBase, config_hash, make_event_ref
+from trading_agent.domain.user.user_preferences import UserPreferences
 from trading_agent.storage import (
     PreferencesStore,
     RebalanceConfigStore,
     StrategyConfigStore,
+    atomic_write_json,
+    load_config_bundle,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,42 +26,36 @@ SOFT_PREF_KEYS = frozenset({"recent_trade_bias", "last_validated_backtest_id"})
 
 
 def snapshot_active_config() -> Dict[str, Any]:
-    return {
-        "strategy_params": StrategyConfigStore().load(),
-        "preferences": PreferencesStore().load_preferences().to_dict(),
-        "rebalance_params": RebalanceConfigStore().load(),
-    }
+    return load_config_bundle().active_snapshot()
 
 
 def apply_proposed_changes(proposed: Dict[str, Any]) -> Dict[str, Any]:
     """Merge whitelist proposed_changes into config stores; preserve other keys."""
     applied: Dict[str, Any] = {}
     if "strategy_params" in proposed:
-        store = StrategyConfigStore()
-        current = store.load()
-        merged = {**current, **dict(proposed["strategy_params"])}
-        store.save(merged)
-        applied["strategy_params"] = dict(proposed["strategy_params"])
+        changes = dict(proposed["strategy_params"])
+        StrategyConfigStore().update(lambda current: {**current, **changes})
+        applied["strategy_params"] = changes
     if "preferences" in proposed:
-        store = PreferencesStore()
-        prefs = store.load_preferences()
-        data = prefs.to_dict()
-        for key, value in dict(proposed["preferences"]).items():
-            if key in SOFT_PREF_KEYS:
-                continue
-            data[key] = value
-        store.save(data)
+
+        def merge_preferences(current: Dict[str, Any]) -> Dict[str, Any]:
+            data = UserPreferences.from_dict(current).to_dict()
+            for key, value in dict(proposed["preferences"]).items():
+                if key in SOFT_PREF_KEYS:
+                    continue
+                data[key] = value
+            return data
+
+        PreferencesStore().update(merge_preferences)
         applied["preferences"] = {
             k: v
             for k, v in dict(proposed["preferences"]).items()
             if k not in SOFT_PREF_KEYS
         }
     if "rebalance_params" in proposed:
-        store = RebalanceConfigStore()
-        current = store.load()
-        merged = {**current, **dict(proposed["rebalance_params"])}
-        store.save(merged)
-        applied["rebalance_params"] = dict(proposed["rebalance_params"])
+        changes = dict(proposed["rebalance_params"])
+        RebalanceConfigStore().update(lambda current: {**current, **changes})
+        applied["rebalance_params"] = changes
     return applied
 
 
@@ -66,9 +63,7 @@ def write_promotion_audit(record: Dict[str, Any]) -> Path:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     path = LOG_DIR / f"config_promotions_{stamp}.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(record, f, indent=2)
-        f.write("\n")
+    atomic_write_json(path, record)
     return path
 
 
@@ -11,6 +11,7 @@ from trading_agent.domain.signals.market_conditions import MarketConditions
 from trading_agent.domain.signals.market_signals import MarketSignals
 from trading_agent.domain.user.user_preferences import UserPreferences
 from trading_agent.llm.client import LLMClient
+from trading_agent.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +51,12 @@ class AnalysisRunner:
                 )
                 continue
             try:
-                raw = strategy.analyze(
-                    portfolio=portfolio,
-                    user_preferences=user_preferences,
-                    analysis_params=merged_params,
-                )
+                with span(f"analysis.{key}"):
+                    raw = strategy.analyze(
+                        portfolio=portfolio,
+                        user_preferences=user_preferences,
+                        analysis_params=merged_params,
+                    )
                 results[key] = self._to_result(strategy.get_strategy_name(), raw)
             except Exception as exc:
                 logger.error("Analysis failed for %s: %s", strategy.get_strategy_name(), exc)
@@ -1,9 +1,11 @@
 from trading_agent.backtest.comparison import compare_runs, format_comparison
+from trading_agent.backtest.data_context import BacktestDataContext
 from trading_agent.backtest.engine import BacktestEngine, ensure_historical_data
 from trading_agent.backtest.models import BacktestConfig, BacktestRun
 
 __all__ = [
     "BacktestConfig",
+    "BacktestDataContext",
     "BacktestEngine",
     "BacktestRun",
     "compare_runs",
@@ -14,6 +14,7 @@ from trading_agent.domain.broker import (
     OrderStatus,
     PortfolioHistory,
 )
+from trading_agent.tracing import traced
 
 
 class BacktestBroker:
@@ -49,6 +50,33 @@ class BacktestBroker:
             }
         self.mark_to_market()
 
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-able cash / positions / order history (for engine checkpoints)."""
+        return {
+            "cash": self.cash,
+            "positions": {s: dict(p) for s, p in self.positions.items()},
+            "orders": [
+                {**o, "filled_at": o["filled_at"].isoformat()}
+                if isinstance(o.get("filled_at"), datetime)
+                else dict(o)
+                for o in self.orders
+            ],
+            "order_seq": self._order_seq,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Inverse of ``to_state``; marks to market at the current ``as_of_date``."""
+        self.cash = float(state["cash"])
+        self.positions = {s: dict(p) for s, p in (state.get("positions") or {}).items()}
+        self.orders = [
+            {**o, "filled_at": datetime.fromisoformat(o["filled_at"])}
+            if isinstance(o.get("filled_at"), str)
+            else dict(o)
+            for o in state.get("orders") or []
+        ]
+        self._order_seq = int(state.get("order_seq") or len(self.orders))
+        self.mark_to_market()
+
     def set_price_fn(self, price_fn: Callable[[str], Optional[float]]) -> None:
         self.price_fn = price_fn
 
@@ -83,6 +111,7 @@ class BacktestBroker:
     def equity(self) -> float:
         return float(getattr(self, "_equity", self.cash))
 
+    @traced("broker.backtest.get_account")
     def get_account(self) -> BrokerAccount:
         self.mark_to_market()
         return BrokerAccount(
@@ -98,6 +127,7 @@ class BacktestBroker:
             long_market_value=getattr(self, "_long_market_value", 0.0),
         )
 
+    @traced("broker.backtest.get_positions")
     def get_positions(self) -> List[BrokerPosition]:
         self.mark_to_market()
         return [
@@ -113,9 +143,11 @@ class BacktestBroker:
             if p["qty"] > 0
         ]
 
+    @traced("broker.backtest.get_orders")
     def get_orders(self) -> List:
         return []
 
+    @traced("broker.backtest.get_portfolio_history")
     def get_portfolio_history(
         self,
         period: str = "1M",
@@ -134,6 +166,7 @@ class BacktestBroker:
             timeframe=timeframe or "1D",
         )
 
+    @traced("broker.backtest.place_market_order")
     def place_market_order(
         self, symbol: str, qty: int, side: OrderSide
     ) -> BrokerOrderResult:
@@ -0,0 +1,59 @@
+"""Per-rebalance-date engine checkpoints so an interrupted backtest can continue.
+
+``BacktestEngine(checkpoint_dir=...)`` writes one JSON file per config after
+every rebalance date: broker cash / positions / orders plus the equity curve,
+trade log and cycle summaries so far. A later run of the same config with the
+same directory restores that state and replays only the remaining days.
+
+Files are keyed by the config's content (``run_label``, ``end`` and operational
+knobs such as ``refresh_cache`` excluded), so use one directory per sweep or run
+family. Leaving out ``end`` lets a longer run continue a shorter one: a
+successive-halving survivor picks up its next rung, and then the full period,
+from where the previous rung stopped. A checkpoint past the new ``end`` is
+left alone and the run starts from ``start``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from trading_agent.backtest.models import BacktestConfig
+from trading_agent.storage.atomic import atomic_write_json
+from trading_agent.storage.config_bundle import config_hash
+
+logger = logging.getLogger(__name__)
+
+# Do not change what the replay computes up to a given day, so a resumed run
+# may differ in them (a longer ``end`` only adds days).
+_UNKEYED_FIELDS = ("run_label", "end", "refresh_cache", "llm_pause_seconds")
+
+
+def checkpoint_key(config: BacktestConfig) -> str:
+    """File stem for ``config``'s checkpoint."""
+    keyed = {k: v for k, v in config.to_dict().items() if k not in _UNKEYED_FIELDS}
+    return config_hash(keyed).split(":", 1)[1][:24]
+
+
+def checkpoint_path(directory: Path, config: BacktestConfig) -> Path:
+    return Path(directory) / f"backtest_{checkpoint_key(config)}.json"
+
+
+def save_engine_checkpoint(directory: Path, config: BacktestConfig, state: Dict[str, Any]) -> None:
+    """Replace ``config``'s checkpoint with ``state`` (compact JSON, atomic)."""
+    atomic_write_json(checkpoint_path(directory, config), state, indent=None)
+
+
+def load_engine_checkpoint(directory: Path, config: BacktestConfig) -> Optional[Dict[str, Any]]:
+    """Last saved state for ``config``, or None (missing or unreadable file)."""
+    path = checkpoint_path(directory, config)
+    if not path.exists():
+        return None
+    try:
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable backtest checkpoint %s: %s", path, exc)
+        return None
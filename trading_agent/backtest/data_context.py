@@ -0,0 +1,199 @@
+"""Historical data shared by every candidate backtest of a sweep.
+
+OAT sweep candidates only differ in strategy / preference / rebalance params,
+so the cache fetch, per-date market conditions, bar slices, close prices,
+news windows, technical indicators and passive benchmarks are identical
+across them. A ``BacktestDataContext`` computes each of those once (single
+flight, so concurrent candidates wait for the first) and hands every engine
+read-only copies through point-in-time provider views.
+
+Each engine still owns its providers' ``as_of_date``; only the per-date
+results are shared.
+"""
+
+from __future__ import annotations
+
+import copy
+import itertools
+import threading
+import weakref
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from trading_agent.concurrency import SingleFlightMemo
+from trading_agent.market_data.alpaca_historical import (
+    HistoricalAlpacaProvider,
+    get_alpaca_cache_dir,
+)
+from trading_agent.market_data.finnhub_historical import (
+    HistoricalFinnhubProvider,
+    get_finnhub_cache_dir,
+)
+from trading_agent.market_data.news_base import NewsResult
+
+
+class SharedHistoricalAlpacaProvider(HistoricalAlpacaProvider):
+    """``HistoricalAlpacaProvider`` whose per-date results come from a shared memo."""
+
+    def __init__(self, memo: SingleFlightMemo, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.memo = memo
+        self._scope = (str(self.cache_dir), tuple(self.sector_etfs), tuple(self.indices))
+
+    def get_market_conditions(self) -> Dict[str, Any]:
+        key = ("conditions", self._scope, self.as_of_date)
+        return copy.deepcopy(self.memo.get_or_compute(key, super().get_market_conditions))
+
+    def get_bars(self, symbol: str, days: int = 100) -> Optional[pd.DataFrame]:
+        # Slices are fresh frames; callers only read them (indicators, last close).
+        key = ("bars", self._scope[0], symbol.upper(), days, self.as_of_date)
+        return self.memo.get_or_compute(
+            key, lambda: super(SharedHistoricalAlpacaProvider, self).get_bars(symbol, days)
+        )
+
+    def get_close_price(self, symbol: str) -> Optional[float]:
+        key = ("close", self._scope[0], symbol.upper(), self.as_of_date)
+        return self.memo.get_or_compute(
+            key, lambda: super(SharedHistoricalAlpacaProvider, self).get_close_price(symbol)
+        )
+
+    def trading_days(self, start: date, end: date, symbol: str = "SPY") -> List[date]:
+        key = ("trading_days", self._scope[0], symbol.upper(), start, end)
+        days = self.memo.get_or_compute(
+            key,
+            lambda: super(SharedHistoricalAlpacaProvider, self).trading_days(start, end, symbol),
+        )
+        return list(days)
+
+
+class SharedHistoricalFinnhubProvider(HistoricalFinnhubProvider):
+    """``HistoricalFinnhubProvider`` whose news windows come from a shared memo."""
+
+    def __init__(self, memo: SingleFlightMemo, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.memo = memo
+
+    def get_news_as_of(
+        self,
+        symbols: List[str],
+        as_of: Optional[date] = None,
+        lookback_days: Optional[int] = None,
+    ) -> NewsResult:
+        as_of = as_of or self.as_of_date
+        lookback = lookback_days if lookback_days is not None else self.lookback_days
+        key = ("news", str(self.cache_dir), tuple(s.upper() for s in symbols), as_of, lookback)
+        news = self.memo.get_or_compute(
+            key,
+            lambda: super(SharedHistoricalFinnhubProvider, self).get_news_as_of(
+                symbols, as_of, lookback
+            ),
+        )
+        return NewsResult(copy.deepcopy(dict(news)))
+
+
+# Contexts by token so worker processes forked from the sweep process reuse the
+# parent's (already warm) context instead of unpickling an empty copy.
+_CONTEXTS: "weakref.WeakValueDictionary[str, BacktestDataContext]" = weakref.WeakValueDictionary()
+_CONTEXT_IDS = itertools.count(1)
+
+
+def _restore_context(
+    token: str, alpaca_cache_dir: Optional[str], finnhub_cache_dir: Optional[str]
+) -> "BacktestDataContext":
+    context = _CONTEXTS.get(token)
+    if context is None:
+        context = BacktestDataContext(
+            alpaca_cache_dir=Path(alpaca_cache_dir) if alpaca_cache_dir else None,
+            finnhub_cache_dir=Path(finnhub_cache_dir) if finnhub_cache_dir else None,
+            _token=token,
+        )
+    return context
+
+
+class BacktestDataContext:
+    """Sweep-scoped, read-only historical data for many ``BacktestEngine`` runs.
+
+    Pass the same instance to every candidate's ``BacktestEngine(data_context=...)``.
+    Picklable: a forked worker gets the parent's context back; a spawned one
+    gets a fresh context for the same caches.
+    """
+
+    def __init__(
+        self,
+        alpaca_cache_dir: Optional[Path] = None,
+        finnhub_cache_dir: Optional[Path] = None,
+        _token: Optional[str] = None,
+    ):
+        self.alpaca_cache_dir = Path(alpaca_cache_dir) if alpaca_cache_dir else None
+        self.finnhub_cache_dir = Path(finnhub_cache_dir) if finnhub_cache_dir else None
+        self.memo = SingleFlightMemo()
+        self._ensured: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        self._ensure_lock = threading.Lock()
+        self.token = _token or f"{id(self)}-{next(_CONTEXT_IDS)}"
+        _CONTEXTS[self.token] = self
+
+    def __reduce__(self):
+        return (
+            _restore_context,
+            (
+                self.token,
+                str(self.alpaca_cache_dir) if self.alpaca_cache_dir else None,
+                str(self.finnhub_cache_dir) if self.finnhub_cache_dir else None,
+            ),
+        )
+
+    def resolve_cache_dirs(
+        self, alpaca_cache_dir: Optional[Path], finnhub_cache_dir: Optional[Path]
+    ) -> Tuple[Path, Path]:
+        """Explicit per-run dirs win; then the context's; then the defaults."""
+        return (
+            Path(alpaca_cache_dir or self.alpaca_cache_dir or get_alpaca_cache_dir()),
+            Path(finnhub_cache_dir or self.finnhub_cache_dir or get_finnhub_cache_dir()),
+        )
+
+    def ensure_data(
+        self,
+        fetch: Callable[..., Dict[str, Any]],
+        *,
+        symbols: List[str],
+        start: date,
+        end: date,
+        refresh: bool,
+        alpaca_cache_dir: Path,
+        finnhub_cache_dir: Path,
+    ) -> Dict[str, Any]:
+        """Run ``fetch`` (``ensure_historical_data``) once per symbols/period/caches.
+
+        ``refresh`` only applies to the first call, so a refreshing sweep
+        re-downloads once rather than once per candidate.
+        """
+        key = (tuple(sorted(symbols)), start, end, str(alpaca_cache_dir), str(finnhub_cache_dir))
+        with self._ensure_lock:
+            if key not in self._ensured:
+                self._ensured[key] = fetch(
+                    symbols=symbols,
+                    start=start,
+                    end=end,
+                    refresh=refresh,
+                    alpaca_cache_dir=alpaca_cache_dir,
+                    finnhub_cache_dir=finnhub_cache_dir,
+                )
+            return self._ensured[key]
+
+    def market_provider(self, **kwargs: Any) -> SharedHistoricalAlpacaProvider:
+        """New point-in-time view (own ``as_of_date``); kwargs as ``HistoricalAlpacaProvider``."""
+        return SharedHistoricalAlpacaProvider(self.memo, **kwargs)
+
+    def news_provider(self, **kwargs: Any) -> SharedHistoricalFinnhubProvider:
+        """New point-in-time view (own ``as_of_date``); kwargs as ``HistoricalFinnhubProvider``."""
+        return SharedHistoricalFinnhubProvider(self.memo, **kwargs)
+
+    def shared(self, key: Tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """Memoize any other candidate-independent result (e.g. benchmarks)."""
+        return self.memo.get_or_compute(key, compute)
+
+    def stats(self) -> Dict[str, int]:
+        return {"computed": self.memo.misses, "shared": self.memo.hits}
@@ -7,20 +7,25 @@ import time
 import uuid
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from trading_agent.backtest.benchmarks import _equity_curve_buy_and_hold, run_benchmarks
 from trading_agent.backtest.broker import BacktestBroker
+from trading_agent.backtest.checkpoint import load_engine_checkpoint, save_engine_checkpoint
 from trading_agent.backtest.metrics import compute_metrics
-from trading_agent.backtest.models import BacktestConfig, BacktestRun
+from trading_agent.backtest.models import DECISION_POLICIES, BacktestConfig, BacktestRun
+from trading_agent.backtest.surrogate import RuleBasedAgentRun
 from trading_agent.backtest.status import (
     equity_deployment,
     last_trade_date,
     resolve_run_status,
     summarize_cycles,
+    sum_stage_timings,
 )
+from trading_agent.concurrency import DEFAULT_MAX_WORKERS, map_bounded
 from trading_agent.llm.client import build_llm_client
 from trading_agent.llm.failover_client import FailoverLLMClient
+from trading_agent.llm.memo_client import MemoizingLLMClient
 from trading_agent.market_data.alpaca_historical import (
     DEFAULT_INDICES,
     HistoricalAlpacaProvider,
@@ -35,6 +40,9 @@ from trading_agent.market_data.finnhub_historical import (
 from trading_agent.market_data.mock_fundamentals_provider import MockFundamentalsProvider
 from trading_agent.orchestrator.agent_run import BacktestAgentRun
 
+if TYPE_CHECKING:
+    from trading_agent.backtest.data_context import BacktestDataContext
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,6 +96,78 @@ def ensure_historical_data(
     return result
 
 
+class _CandidateRun:
+    """Mutable per-config state while one or more configs replay the same days."""
+
+    def __init__(self, config: BacktestConfig):
+        self.config = config
+        self.run_id = str(uuid.uuid4())
+        self.timestamp = datetime.now().isoformat()
+        self.notes = [
+            "FMP fundamentals are TTM snapshots (not true point-in-time) — using mock/empty slice in backtest.",
+        ]
+        self.symbols: List[str] = []
+        self.alpaca_cache: Optional[Path] = None
+        self.market: Any = None
+        self.news: Any = None
+        self.broker: Optional[BacktestBroker] = None
+        self.llm: Optional[Any] = None
+        self.llm_memo: Optional[MemoizingLLMClient] = None
+        self.agent: Optional[Any] = None
+        self.rebalance_dates: set = set()
+        self.equity_curve: List[Dict[str, Any]] = []
+        self.trade_log: List[Dict[str, Any]] = []
+        self.cycle_summaries: List[Dict[str, Any]] = []
+        self.resume_after: Optional[date] = None
+        self.save_checkpoints = True
+        self.result: Optional[BacktestRun] = None
+
+    def replayed(self, day: date) -> bool:
+        """True for days already covered by the checkpoint this run resumed from."""
+        return self.resume_after is not None and day <= self.resume_after
+
+    def checkpoint_state(self, day: date) -> Dict[str, Any]:
+        return {
+            "day": day.isoformat(),
+            "end": self.config.end.isoformat(),
+            "run_id": self.run_id,
+            "timestamp": self.timestamp,
+            "broker": self.broker.to_state(),
+            "equity_curve": self.equity_curve,
+            "trade_log": self.trade_log,
+            "cycle_summaries": self.cycle_summaries,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        self.resume_after = date.fromisoformat(state["day"])
+        self.broker.set_as_of_date(self.resume_after)
+        self.broker.restore_state(state["broker"])
+        self.equity_curve = list(state.get("equity_curve") or [])
+        self.trade_log = list(state.get("trade_log") or [])
+        self.cycle_summaries = list(state.get("cycle_summaries") or [])
+        if state.get("end") == self.config.end.isoformat():
+            # Same run, interrupted: keep its identity.
+            self.run_id = state.get("run_id") or self.run_id
+            self.timestamp = state.get("timestamp") or self.timestamp
+            self.notes.append(f"Resumed from checkpoint after {self.resume_after.isoformat()}")
+        else:
+            self.notes.append(
+                f"Continued from the run to {state.get('end')} "
+                f"(checkpoint after {self.resume_after.isoformat()})"
+            )
+
+    def fail(self, error: str) -> BacktestRun:
+        self.result = BacktestRun(
+            run_id=self.run_id,
+            timestamp=self.timestamp,
+            config=self.config.to_dict(),
+            status="failed",
+            error=error,
+            notes=self.notes,
+        )
+        return self.result
+
+
 class BacktestEngine:
     """Run the live TradingAgent pipeline over historical rebalance dates."""
 
@@ -95,19 +175,135 @@ class BacktestEngine:
         self,
         llm_client: Optional[Any] = None,
         skip_data_fetch: bool = False,
+        data_context: Optional["BacktestDataContext"] = None,
+        checkpoint_dir: Optional[Path] = None,
     ):
+        """
+        Args:
+            llm_client: LLM client to use instead of building one from the config
+            skip_data_fetch: Use the caches as they are (no Alpaca/Finnhub fetch)
+            data_context: Sweep-wide shared data; runs with the same context
+                fetch once and share per-date conditions, bars, news,
+                indicators and benchmarks
+            checkpoint_dir: Save each run's state after every rebalance date and
+                resume from it when the same config runs again, to the same
+                or a later ``end`` (see ``trading_agent.backtest.checkpoint``)
+        """
         self.llm_client = llm_client
         self.skip_data_fetch = skip_data_fetch
+        self.data_context = data_context
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else None
 
     def run(self, config: BacktestConfig) -> BacktestRun:
-        run_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
-        notes = [
-            "FMP fundamentals are TTM snapshots (not true point-in-time) — using mock/empty slice in backtest.",
-        ]
+        return self._run_lockstep([config], data_context=self.data_context, max_workers=1)[0]
 
-        alpaca_cache = Path(config.alpaca_cache_dir) if config.alpaca_cache_dir else get_alpaca_cache_dir()
-        finnhub_cache = Path(config.finnhub_cache_dir) if config.finnhub_cache_dir else get_finnhub_cache_dir()
+    def run_many(
+        self,
+        configs: Sequence[BacktestConfig],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[BacktestRun]:
+        """Replay several configs in lockstep over one day loop.
+
+        All configs must cover the same period. Per-day market data, news,
+        indicators and benchmarks are computed once (through the engine's
+        ``data_context``, or a private one) and each rebalance day's
+        candidate cycles — the LLM-bound part — run concurrently, at most
+        ``max_workers`` at a time. Without an injected ``llm_client`` every
+        config gets its own client. Results keep input order; a config that
+        fails does not stop the others.
+        """
+        configs = list(configs)
+        periods = {(c.start, c.end) for c in configs}
+        if len(periods) > 1:
+            raise ValueError(f"run_many needs one shared period, got {sorted(periods)}")
+        if self.data_context is not None:
+            context = self.data_context
+        else:
+            from trading_agent.backtest.data_context import BacktestDataContext
+
+            context = BacktestDataContext()
+        return self._run_lockstep(configs, data_context=context, max_workers=max_workers)
+
+    def _run_lockstep(
+        self,
+        configs: List[BacktestConfig],
+        *,
+        data_context: Optional["BacktestDataContext"],
+        max_workers: int,
+    ) -> List[BacktestRun]:
+        runs = [_CandidateRun(config) for config in configs]
+        trading_days: List[date] = []
+        for cand in runs:
+            try:
+                days = self._setup(cand, data_context)
+            except Exception as exc:
+                logger.exception("Backtest failed")
+                cand.fail(str(exc))
+                continue
+            if not days:
+                cand.fail("No trading days found in cached bars for the requested period")
+            trading_days = trading_days or days
+
+        active = [c for c in runs if c.result is None]
+        for day in trading_days:
+            if not active:
+                break
+            for cand in active:
+                cand.market.set_as_of_date(day)
+                cand.news.set_as_of_date(day)
+                cand.broker.set_as_of_date(day)
+
+            due = [
+                c for c in active
+                if c.agent is not None and day in c.rebalance_dates and not c.replayed(day)
+            ]
+            outcomes = map_bounded(
+                lambda c: self._rebalance_safely(c, day), due, max_workers=max_workers
+            )
+            failed = {id(c) for c, ok in zip(due, outcomes) if not ok}
+            pause = max((c.config.llm_pause_seconds for c in due), default=0)
+            if pause > 0:
+                time.sleep(pause)
+
+            active = [c for c in active if id(c) not in failed]
+            for cand in active:
+                if cand.replayed(day):
+                    continue
+                cand.equity_curve.append({
+                    "date": day.isoformat(),
+                    "equity": cand.broker.equity,
+                    "cash": cand.broker.cash,
+                })
+            if self.checkpoint_dir is not None:
+                for cand in due:
+                    if id(cand) not in failed:
+                        self._save_checkpoint(cand, day)
+
+        for cand in active:
+            try:
+                self._finish(cand, trading_days, data_context)
+            except Exception as exc:
+                logger.exception("Backtest failed")
+                cand.fail(str(exc))
+        return [cand.result for cand in runs]
+
+    def _setup(
+        self, cand: _CandidateRun, data_context: Optional["BacktestDataContext"]
+    ) -> List[date]:
+        """Fetch/attach data and build the broker + agent; returns the trading days."""
+        config = cand.config
+        if config.decision_policy not in DECISION_POLICIES:
+            raise ValueError(
+                f"decision_policy must be one of {DECISION_POLICIES}, got {config.decision_policy!r}"
+            )
+        if data_context is not None:
+            alpaca_cache, finnhub_cache = data_context.resolve_cache_dirs(
+                config.alpaca_cache_dir, config.finnhub_cache_dir
+            )
+        else:
+            alpaca_cache = Path(config.alpaca_cache_dir) if config.alpaca_cache_dir else get_alpaca_cache_dir()
+            finnhub_cache = Path(config.finnhub_cache_dir) if config.finnhub_cache_dir else get_finnhub_cache_dir()
+        cand.alpaca_cache = alpaca_cache
 
         prefs = config.preferences or {}
         sector_etfs = list((config.signal_config or {}).get("sector_etfs") or [])
@@ -115,187 +311,242 @@ class BacktestEngine:
         symbols = [s.upper() for s in config.symbols]
         if not symbols:
             symbols = list(config.seed_positions.keys()) or ["AAPL"]
-
-        try:
-            if not self.skip_data_fetch:
-                ensure_historical_data(
-                    symbols=symbols + sector_etfs,
-                    start=config.start,
-                    end=config.end,
-                    refresh=config.refresh_cache,
-                    alpaca_cache_dir=alpaca_cache,
-                    finnhub_cache_dir=finnhub_cache,
-                )
-
-            market = HistoricalAlpacaProvider(
-                as_of_date=config.start,
-                cache_dir=alpaca_cache,
-                sector_etfs=sector_etfs or None,
-            )
-            news = HistoricalFinnhubProvider(
-                as_of_date=config.start,
-                cache_dir=finnhub_cache,
+        cand.symbols = symbols
+
+        if not self.skip_data_fetch:
+            fetch_args = dict(
+                symbols=symbols + sector_etfs,
+                start=config.start,
+                end=config.end,
+                refresh=config.refresh_cache,
+                alpaca_cache_dir=alpaca_cache,
+                finnhub_cache_dir=finnhub_cache,
             )
+            if data_context is not None:
+                data_context.ensure_data(ensure_historical_data, **fetch_args)
+            else:
+                ensure_historical_data(**fetch_args)
+
+        market_kwargs = dict(
+            as_of_date=config.start,
+            cache_dir=alpaca_cache,
+            sector_etfs=sector_etfs or None,
+        )
+        news_kwargs = dict(as_of_date=config.start, cache_dir=finnhub_cache)
+        if data_context is not None:
+            market = data_context.market_provider(**market_kwargs)
+            news = data_context.news_provider(**news_kwargs)
+        else:
+            market = HistoricalAlpacaProvider(**market_kwargs)
+            news = HistoricalFinnhubProvider(**news_kwargs)
+        cand.market, cand.news = market, news
+
+        trading_days = market.trading_days(config.start, config.end)
+        if not trading_days:
+            return []
+
+        cand.rebalance_dates = set(
+            select_rebalance_dates(trading_days, config.rebalance_frequency)
+        )
 
-            trading_days = market.trading_days(config.start, config.end)
-            if not trading_days:
-                return BacktestRun(
-                    run_id=run_id,
-                    timestamp=timestamp,
-                    config=config.to_dict(),
-                    status="failed",
-                    error="No trading days found in cached bars for the requested period",
-                    notes=notes,
-                )
+        def price_fn(symbol: str) -> Optional[float]:
+            return market.get_close_price(symbol)
 
-            rebalance_dates = set(
-                select_rebalance_dates(trading_days, config.rebalance_frequency)
+        broker = BacktestBroker(
+            initial_cash=config.initial_cash,
+            seed_positions=config.seed_positions,
+            price_fn=price_fn,
+        )
+        broker.set_as_of_date(trading_days[0])
+        cand.broker = broker
+
+        use_llm = config.decision_policy == "llm" and not config.skip_llm
+        llm: Optional[Any] = self.llm_client if config.decision_policy == "llm" else None
+        if llm is None and use_llm:
+            llm = build_llm_client(
+                provider=config.llm_provider,
+                model=config.llm_model,
+                fallback_provider=config.llm_fallback_provider,
+                fallback_model=config.llm_fallback_model,
+                max_retries=config.llm_max_retries,
             )
-
-            def price_fn(symbol: str) -> Optional[float]:
-                return market.get_close_price(symbol)
-
-            broker = BacktestBroker(
-                initial_cash=config.initial_cash,
-                seed_positions=config.seed_positions,
-                price_fn=price_fn,
+        cand.llm = llm
+
+        if config.decision_policy == "rules":
+            cand.agent = RuleBasedAgentRun(
+                market_data_provider=market,
+                broker_client=broker,
+                universe_symbols=symbols,
+                preferences=prefs,
+                indicator_memo=data_context.memo if data_context is not None else None,
             )
-            broker.set_as_of_date(trading_days[0])
-
-            llm: Optional[Any] = self.llm_client
-            if llm is None and not config.skip_llm:
-                llm = build_llm_client(
-                    provider=config.llm_provider,
-                    model=config.llm_model,
-                    fallback_provider=config.llm_fallback_provider,
-                    fallback_model=config.llm_fallback_model,
-                    max_retries=config.llm_max_retries,
+            cand.notes.append("Rule-based surrogate policy (no LLM): screening proxy only")
+        elif use_llm:
+            if config.reuse_llm_responses and data_context is not None:
+                cand.llm_memo = MemoizingLLMClient(
+                    llm, data_context.memo, scope=(config.llm_provider, config.llm_model)
                 )
+            max_position_size = float(prefs.get("max_position_size", 0.25))
+            cand.agent = BacktestAgentRun(
+                risk_tolerance=prefs.get("risk_tolerance", "moderate"),
+                investment_goal=prefs.get("investment_goal", "growth"),
+                max_position_size=max_position_size,
+                llm_client=cand.llm_memo or llm,
+                market_data_provider=market,
+                news_provider=news,
+                fundamentals_provider=MockFundamentalsProvider(metrics={}),
+                broker_client=broker,
+                universe_symbols=symbols,
+                indicator_memo=data_context.memo if data_context is not None else None,
+            )
 
-            agent = None
-            if not config.skip_llm:
-                max_position_size = float(prefs.get("max_position_size", 0.25))
-                agent = BacktestAgentRun(
-                    risk_tolerance=prefs.get("risk_tolerance", "moderate"),
-                    investment_goal=prefs.get("investment_goal", "growth"),
-                    max_position_size=max_position_size,
-                    llm_client=llm,
-                    market_data_provider=market,
-                    news_provider=news,
-                    fundamentals_provider=MockFundamentalsProvider(metrics={}),
-                    broker_client=broker,
-                    universe_symbols=symbols,
+        if self.checkpoint_dir is not None:
+            state = load_engine_checkpoint(self.checkpoint_dir, config)
+            if state is not None and date.fromisoformat(state["day"]) > config.end:
+                # A longer run of this config got further; keep its checkpoint.
+                cand.save_checkpoints = False
+            elif state is not None:
+                cand.restore(state)
+                logger.info(
+                    "Backtest %s resuming after %s", config.run_label, cand.resume_after
                 )
+        return trading_days
 
-            equity_curve: List[Dict[str, Any]] = []
-            trade_log: List[Dict[str, Any]] = []
-            cycle_summaries: List[Dict[str, Any]] = []
-
-            for day in trading_days:
-                market.set_as_of_date(day)
-                news.set_as_of_date(day)
-                broker.set_as_of_date(day)
-
-                if agent is not None and day in rebalance_dates:
-                    cycle_result = agent.run_trading_cycle(
-                        analysis_params=config.analysis_params,
-                        strategy_params=config.strategy_params,
-                        rebalance_params=config.rebalance_params,
-                    )
-                    llm_meta: Dict[str, Any] = {}
-                    if isinstance(llm, FailoverLLMClient):
-                        llm_meta = llm.stats()
-                    cycle_summaries.append({
-                        "date": day.isoformat(),
-                        "cycle_id": cycle_result.get("cycle_id"),
-                        "status": cycle_result.get("status"),
-                        "hold": cycle_result.get("hold"),
-                        "decisions": cycle_result.get("decisions") or [],
-                        "executed_trades": cycle_result.get("executed_trades") or [],
-                        "error": cycle_result.get("error"),
-                        "llm": llm_meta,
-                    })
-                    for trade in cycle_result.get("executed_trades") or []:
-                        if trade.get("status") != "executed":
-                            continue
-                        trade_log.append({
-                            "date": day.isoformat(),
-                            "symbol": trade.get("symbol"),
-                            "side": trade.get("action"),
-                            "qty": trade.get("quantity"),
-                            "price": market.get_close_price(str(trade.get("symbol") or "")) or 0.0,
-                            "reasoning": trade.get("reasoning") or "",
-                        })
-                    if config.llm_pause_seconds > 0:
-                        time.sleep(config.llm_pause_seconds)
-
-                equity_curve.append({
-                    "date": day.isoformat(),
-                    "equity": broker.equity,
-                    "cash": broker.cash,
-                })
+    def _save_checkpoint(self, cand: _CandidateRun, day: date) -> None:
+        if not cand.save_checkpoints:
+            return
+        try:
+            save_engine_checkpoint(self.checkpoint_dir, cand.config, cand.checkpoint_state(day))
+        except OSError as exc:
+            # A missed checkpoint only costs replay time on resume.
+            logger.warning("Backtest checkpoint for %s failed: %s", cand.config.run_label, exc)
 
-            def bench_price(symbol: str, day: date) -> Optional[float]:
-                market.set_as_of_date(day)
-                return market.get_close_price(symbol)
-
-            benchmarks = run_benchmarks(
-                trading_days,
-                config.initial_cash,
-                price_fn=bench_price,
-                universe=symbols,
-                risk_free_rate=config.risk_free_rate,
-                cache_dir=alpaca_cache,
-            )
-            spy_curve = _equity_curve_buy_and_hold(
-                {"SPY": 1.0},
-                trading_days,
-                config.initial_cash,
-                bench_price,
-            )
-            strategy_metrics = compute_metrics(
-                name=f"LLM strategy ({config.run_label})",
-                curve=equity_curve,
-                initial_cash=config.initial_cash,
-                risk_free_rate=config.risk_free_rate,
-                spy_curve=spy_curve,
-                trade_count=len(trade_log),
+    def _rebalance_safely(self, cand: _CandidateRun, day: date) -> bool:
+        try:
+            self._rebalance(cand, day)
+            return True
+        except Exception as exc:
+            logger.exception("Backtest failed")
+            cand.fail(str(exc))
+            return False
+
+    def _rebalance(self, cand: _CandidateRun, day: date) -> None:
+        config, llm = cand.config, cand.llm
+        cycle_result = cand.agent.run_trading_cycle(
+            analysis_params=config.analysis_params,
+            strategy_params=config.strategy_params,
+            rebalance_params=config.rebalance_params,
+        )
+        llm_meta: Dict[str, Any] = {}
+        if isinstance(llm, FailoverLLMClient):
+            llm_meta = llm.stats()
+        cand.cycle_summaries.append({
+            "date": day.isoformat(),
+            "cycle_id": cycle_result.get("cycle_id"),
+            "status": cycle_result.get("status"),
+            "hold": cycle_result.get("hold"),
+            "decisions": cycle_result.get("decisions") or [],
+            "executed_trades": cycle_result.get("executed_trades") or [],
+            "error": cycle_result.get("error"),
+            "llm": llm_meta,
+            "timings": cycle_result.get("timings"),
+        })
+        for trade in cycle_result.get("executed_trades") or []:
+            if trade.get("status") != "executed":
+                continue
+            cand.trade_log.append({
+                "date": day.isoformat(),
+                "symbol": trade.get("symbol"),
+                "side": trade.get("action"),
+                "qty": trade.get("quantity"),
+                "price": cand.market.get_close_price(str(trade.get("symbol") or "")) or 0.0,
+                "reasoning": trade.get("reasoning") or "",
+            })
+
+    def _finish(
+        self,
+        cand: _CandidateRun,
+        trading_days: List[date],
+        data_context: Optional["BacktestDataContext"],
+    ) -> None:
+        config, market, llm = cand.config, cand.market, cand.llm
+        alpaca_cache, symbols, notes = cand.alpaca_cache, cand.symbols, cand.notes
+
+        def bench_price(symbol: str, day: date) -> Optional[float]:
+            market.set_as_of_date(day)
+            return market.get_close_price(symbol)
+
+        def compute_benchmarks():
+            return (
+                run_benchmarks(
+                    trading_days,
+                    config.initial_cash,
+                    price_fn=bench_price,
+                    universe=symbols,
+                    risk_free_rate=config.risk_free_rate,
+                    cache_dir=alpaca_cache,
+                ),
+                _equity_curve_buy_and_hold(
+                    {"SPY": 1.0},
+                    trading_days,
+                    config.initial_cash,
+                    bench_price,
+                ),
             )
 
-            cycle_stats = summarize_cycles(cycle_summaries)
-            status, status_detail = resolve_run_status(cycle_summaries)
-            deployment = equity_deployment(equity_curve)
-            if status_detail:
-                notes.append(status_detail)
-            if isinstance(llm, FailoverLLMClient):
-                notes.append(f"LLM failover stats: {llm.stats()}")
-
-            run_config = config.to_dict()
-            run_config["cycle_stats"] = cycle_stats
-            run_config["deployment"] = deployment
-            run_config["last_trade_date"] = last_trade_date(trade_log)
-
-            return BacktestRun(
-                run_id=run_id,
-                timestamp=timestamp,
-                config=run_config,
-                status=status,
-                equity_curve=equity_curve,
-                trade_log=trade_log,
-                cycle_summaries=cycle_summaries,
-                metrics=strategy_metrics.to_dict(),
-                benchmarks=[b.to_dict() for b in benchmarks],
-                notes=notes,
-                error=status_detail if status == "failed" else None,
+        if data_context is not None:
+            # Passive benchmarks do not depend on the candidate's params.
+            benchmarks, spy_curve = data_context.shared(
+                (
+                    "benchmarks", str(alpaca_cache), tuple(trading_days),
+                    config.initial_cash, tuple(symbols), config.risk_free_rate,
+                ),
+                compute_benchmarks,
             )
+        else:
+            benchmarks, spy_curve = compute_benchmarks()
+        strategy_metrics = compute_metrics(
+            name=(
+                f"Rules surrogate ({config.run_label})"
+                if config.decision_policy == "rules"
+                else f"LLM strategy ({config.run_label})"
+            ),
+            curve=cand.equity_curve,
+            initial_cash=config.initial_cash,
+            risk_free_rate=config.risk_free_rate,
+            spy_curve=spy_curve,
+            trade_count=len(cand.trade_log),
+        )
 
-        except Exception as exc:
-            logger.exception("Backtest failed")
-            return BacktestRun(
-                run_id=run_id,
-                timestamp=timestamp,
-                config=config.to_dict(),
-                status="failed",
-                error=str(exc),
-                notes=notes,
+        cycle_stats = summarize_cycles(cand.cycle_summaries)
+        status, status_detail = resolve_run_status(cand.cycle_summaries)
+        deployment = equity_deployment(cand.equity_curve)
+        if status_detail:
+            notes.append(status_detail)
+        if isinstance(llm, FailoverLLMClient):
+            notes.append(f"LLM failover stats: {llm.stats()}")
+        if cand.llm_memo is not None:
+            notes.append(
+                f"LLM responses reused from earlier runs: "
+                f"{cand.llm_memo.reused}/{cand.llm_memo.requests}"
             )
+
+        run_config = config.to_dict()
+        run_config["cycle_stats"] = cycle_stats
+        run_config["deployment"] = deployment
+        run_config["last_trade_date"] = last_trade_date(cand.trade_log)
+        run_config["stage_timings_ms"] = sum_stage_timings(cand.cycle_summaries)
+
+        cand.result = BacktestRun(
+            run_id=cand.run_id,
+            timestamp=cand.timestamp,
+            config=run_config,
+            status=status,
+            equity_curve=cand.equity_curve,
+            trade_log=cand.trade_log,
+            cycle_summaries=cand.cycle_summaries,
+            metrics=strategy_metrics.to_dict(),
+            benchmarks=[b.to_dict() for b in benchmarks],
+            notes=notes,
+            error=status_detail if status == "failed" else None,
+        )
@@ -6,6 +6,9 @@ from dataclasses import asdict, dataclass, field
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
+# "llm": the TradingAgent pipeline; "rules": the no-LLM surrogate (backtest.surrogate).
+DECISION_POLICIES = ("llm", "rules")
+
 
 @dataclass
 class EquityPoint:
@@ -57,7 +60,9 @@ class BacktestConfig:
     seed_positions: Dict[str, int] = field(default_factory=dict)
     risk_free_rate: float = 0.04
     refresh_cache: bool = False
-    skip_llm: bool = False
+    skip_llm: bool = False  # hold cash, no decisions (decision_policy="llm" only)
+    decision_policy: str = "llm"
+    reuse_llm_responses: bool = False  # identical prompts answered once per data context
     analysis_params: Dict[str, Any] = field(default_factory=dict)
     strategy_params: Dict[str, Any] = field(default_factory=dict)
     rebalance_params: Dict[str, Any] = field(default_factory=dict)
@@ -84,6 +89,8 @@ class BacktestConfig:
             "risk_free_rate": self.risk_free_rate,
             "refresh_cache": self.refresh_cache,
             "skip_llm": self.skip_llm,
+            "decision_policy": self.decision_policy,
+            "reuse_llm_responses": self.reuse_llm_responses,
             "analysis_params": dict(self.analysis_params),
             "strategy_params": dict(self.strategy_params),
             "rebalance_params": dict(self.rebalance_params),
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from trading_agent.tracing import stage_totals
+
 # Below this success rate the whole run is marked failed (not merely degraded).
 MIN_CYCLE_SUCCESS_RATE = 0.8
 
@@ -91,3 +93,12 @@ def last_trade_date(trade_log: Sequence[Dict[str, Any]]) -> Optional[str]:
     if not trade_log:
         return None
     return str(trade_log[-1].get("date") or "") or None
+
+
+def sum_stage_timings(cycle_summaries: Sequence[Dict[str, Any]]) -> Dict[str, float]:
+    """Total milliseconds per top-level agent stage across all traced cycles."""
+    totals: Dict[str, float] = {}
+    for c in cycle_summaries:
+        for name, ms in stage_totals(c.get("timings")).items():
+            totals[name] = round(totals.get(name, 0.0) + ms, 3)
+    return totals
@@ -0,0 +1,270 @@
+"""Rule-based surrogate for the LLM agent — cheap, deterministic backtests.
+
+``BacktestConfig(decision_policy="rules")`` makes the engine replay
+``RuleBasedAgentRun`` instead of ``BacktestAgentRun``: no LLM, no news, same
+broker, rebalance dates and metrics. It reads the same technical indicators
+the analysis prompt gets (RSI-14, SMA-20/50, MACD histogram) and the same
+tunable params, so sweeps can screen many candidates with it and send only
+the best to full LLM backtests. It is a proxy for ranking candidates, not a
+prediction of what the LLM would trade.
+
+Per rebalance date and symbol:
+
+1. ``strategy_params.timeframe`` picks the indicator votes (+1 / -1 / 0):
+   immediate = RSI mean reversion + MACD, short-term = MACD + close vs SMA-20,
+   long-term = close vs SMA-50 + SMA-20 vs SMA-50. The score is their mean.
+2. ``risk_management`` sets the entry score and the cash reserve.
+3. ``position_sizing`` sets the weight of each entered symbol (half of
+   ``max_position_size``, score-scaled, or full), scaled by
+   ``preferences.risk_tolerance`` and capped at ``max_position_size``.
+4. Symbols whose target weight differs from the current one by at least
+   ``rebalance_params.threshold`` are traded: sells first, then buys.
+
+Indicators are computed once per symbol over the whole cached history
+(``compute_indicator_series`` is causal) and looked up by date.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from trading_agent.domain.broker import BrokerError, OrderSide
+from trading_agent.domain.cycle import ExecutedTrade, TradingDecision
+from trading_agent.signals.indicators import compute_indicator_series
+
+logger = logging.getLogger(__name__)
+
+# risk_management → minimum score to hold a symbol, share of equity kept in cash.
+_ENTRY_SCORE = {"conservative": 0.5, "standard": 0.25, "aggressive": 0.0}
+_CASH_RESERVE = {"conservative": 0.2, "standard": 0.1, "aggressive": 0.0}
+# risk_tolerance → gross exposure multiplier before the max_position_size cap.
+_EXPOSURE = {"conservative": 0.75, "moderate": 1.0, "aggressive": 1.25}
+_TIMEFRAME_VOTES = {
+    "immediate": ("rsi", "macd"),
+    "short-term": ("macd", "sma_20"),
+    "long-term": ("sma_50", "sma_cross"),
+}
+_COLUMNS = ("close", "rsi_14", "sma_20", "sma_50", "macd_histogram")
+
+_Series = Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]]
+
+
+def _vote(kind: str, row: Dict[str, float]) -> Optional[int]:
+    close = row["close"]
+    if kind == "rsi":
+        rsi = row["rsi_14"]
+        return None if math.isnan(rsi) else (1 if rsi < 30 else -1 if rsi > 70 else 0)
+    if kind == "macd":
+        hist = row["macd_histogram"]
+        return None if math.isnan(hist) else (1 if hist > 0 else -1)
+    if kind == "sma_20":
+        sma = row["sma_20"]
+        return None if math.isnan(sma) else (1 if close > sma else -1)
+    if kind == "sma_50":
+        sma = row["sma_50"]
+        return None if math.isnan(sma) else (1 if close > sma else -1)
+    fast, slow = row["sma_20"], row["sma_50"]
+    return None if math.isnan(fast) or math.isnan(slow) else (1 if fast > slow else -1)
+
+
+def score_symbol(row: Dict[str, float], timeframe: str) -> Optional[float]:
+    """Mean indicator vote in [-1, 1] for ``timeframe``; None before indicators warm up."""
+    kinds = _TIMEFRAME_VOTES.get(timeframe, _TIMEFRAME_VOTES["short-term"])
+    votes = [v for v in (_vote(kind, row) for kind in kinds) if v is not None]
+    return sum(votes) / len(votes) if votes else None
+
+
+def target_weights(
+    scores: Dict[str, Optional[float]],
+    *,
+    strategy_params: Dict[str, Any],
+    preferences: Dict[str, Any],
+) -> Dict[str, float]:
+    """Target portfolio weight per scored symbol (see module docstring, steps 2–3)."""
+    risk = str(strategy_params.get("risk_management") or "standard")
+    sizing = str(strategy_params.get("position_sizing") or "dynamic")
+    max_position = float(preferences.get("max_position_size", 0.25))
+    exposure = _EXPOSURE.get(str(preferences.get("risk_tolerance") or "moderate"), 1.0)
+    entry = _ENTRY_SCORE.get(risk, _ENTRY_SCORE["standard"])
+
+    weights: Dict[str, float] = {}
+    for symbol, score in scores.items():
+        if score is None:
+            continue
+        if score <= entry:
+            weights[symbol] = 0.0
+            continue
+        if sizing == "conservative":
+            raw = 0.5 * max_position
+        elif sizing == "aggressive":
+            raw = max_position
+        else:
+            raw = score * max_position
+        weights[symbol] = min(max_position, raw * exposure)
+
+    budget = 1.0 - _CASH_RESERVE.get(risk, _CASH_RESERVE["standard"])
+    total = sum(weights.values())
+    if total > budget > 0:
+        weights = {s: w * budget / total for s, w in weights.items()}
+    return weights
+
+
+class RuleBasedAgentRun:
+    """Drop-in for ``BacktestAgentRun`` that trades by fixed indicator rules."""
+
+    may_trigger_retrospection = False
+
+    def __init__(
+        self,
+        *,
+        market_data_provider: Any,
+        broker_client: Any,
+        universe_symbols: List[str],
+        preferences: Optional[Dict[str, Any]] = None,
+        indicator_memo: Optional[Any] = None,
+    ):
+        """
+        Args:
+            market_data_provider: Point-in-time provider with ``full_history``
+                (``HistoricalAlpacaProvider``)
+            indicator_memo: ``SingleFlightMemo`` shared by a sweep's candidates,
+                so each symbol's indicator series is computed once per sweep
+        """
+        self.market = market_data_provider
+        self.broker = broker_client
+        self.symbols = [s.upper() for s in universe_symbols]
+        self.preferences = dict(preferences or {})
+        self.indicator_memo = indicator_memo
+        self._series: Dict[str, _Series] = {}
+
+    def _compute_series(self, symbol: str) -> _Series:
+        frame = compute_indicator_series(self.market.full_history(symbol))
+        if frame.empty:
+            return None
+        return (
+            frame.index.normalize().values,
+            {c: frame[c].to_numpy(dtype=float) for c in _COLUMNS},
+        )
+
+    def _indicators(self, symbol: str, day: date) -> Optional[Dict[str, float]]:
+        if symbol not in self._series:
+            if self.indicator_memo is None:
+                self._series[symbol] = self._compute_series(symbol)
+            else:
+                key = ("indicator_series", str(getattr(self.market, "cache_dir", "")), symbol)
+                self._series[symbol] = self.indicator_memo.get_or_compute(
+                    key, lambda: self._compute_series(symbol)
+                )
+        series = self._series[symbol]
+        if series is None:
+            return None
+        days, columns = series
+        i = int(np.searchsorted(days, np.datetime64(day, "ns"), side="right"))
+        if not i:
+            return None
+        return {c: float(values[i - 1]) for c, values in columns.items()}
+
+    def run_trading_cycle(
+        self,
+        analysis_params: Optional[Dict[str, Any]] = None,
+        strategy_params: Optional[Dict[str, Any]] = None,
+        rebalance_params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        del analysis_params  # no LLM analysis step
+        strategy_params = dict(strategy_params or {})
+        threshold = float((rebalance_params or {}).get("threshold", 0.05))
+        timeframe = str(strategy_params.get("timeframe") or "short-term")
+        day = self.market.as_of_date
+
+        rows = {s: self._indicators(s, day) for s in self.symbols}
+        scores = {s: score_symbol(row, timeframe) if row else None for s, row in rows.items()}
+        targets = target_weights(
+            scores, strategy_params=strategy_params, preferences=self.preferences
+        )
+
+        equity = self.broker.mark_to_market()
+        held = {s: int(p["qty"]) for s, p in self.broker.positions.items()}
+        decisions: List[TradingDecision] = []
+        for symbol, target in targets.items():
+            price = rows[symbol]["close"] if rows.get(symbol) else None
+            if not price or equity <= 0:
+                continue
+            current = held.get(symbol, 0) * price / equity
+            if abs(target - current) < threshold and not (target == 0.0 < current):
+                continue
+            qty = int(abs(target - current) * equity // price)
+            if target == 0.0:
+                qty = held.get(symbol, 0)
+            if qty <= 0:
+                continue
+            decisions.append(
+                TradingDecision(
+                    action="BUY" if target > current else "SELL",
+                    symbol=symbol,
+                    quantity=qty,
+                    reasoning=(
+                        f"rules: score={scores[symbol]:+.2f} ({timeframe}), "
+                        f"weight {current:.1%} → {target:.1%}"
+                    ),
+                    source="rules",
+                )
+            )
+        # Sells first so their cash funds the buys.
+        decisions.sort(key=lambda d: d.action != "SELL")
+        executed = [self._execute(d) for d in decisions]
+        return {
+            "cycle_id": f"rules-{day.isoformat()}",
+            "status": "success",
+            "hold": not any(t["status"] == "executed" for t in executed),
+            "decisions": [d.to_dict() for d in decisions],
+            "executed_trades": executed,
+            "error": None,
+        }
+
+    def _execute(self, decision: TradingDecision) -> Dict[str, Any]:
+        qty = int(decision.quantity)
+        if decision.action == "BUY":
+            price = self.market.get_close_price(decision.symbol) or 0.0
+            qty = min(qty, int(self.broker.cash // price)) if price > 0 else 0
+        if qty <= 0:
+            return ExecutedTrade(
+                symbol=decision.symbol,
+                action=decision.action,
+                quantity=decision.quantity,
+                status="skipped",
+                failure_detail="No cash left for this buy",
+            ).to_dict()
+        try:
+            order = self.broker.place_market_order(
+                symbol=decision.symbol,
+                qty=qty,
+                side=OrderSide.BUY if decision.action == "BUY" else OrderSide.SELL,
+            )
+        except BrokerError as exc:
+            return ExecutedTrade(
+                symbol=decision.symbol,
+                action=decision.action,
+                quantity=qty,
+                status="failed",
+                error=str(exc),
+            ).to_dict()
+        trade = ExecutedTrade(
+            symbol=decision.symbol,
+            action=decision.action,
+            quantity=qty,
+            status="executed",
+            order_id=str(order.order_id),
+        ).to_dict()
+        trade["reasoning"] = decision.reasoning
+        return trade
+
+    def emit_retrospection_signal(self, **payload: Any) -> None:
+        raise RuntimeError(
+            "Backtest runs must not trigger retrospection or sweep "
+            "(circular-trigger rule; Phase 4.5.2)"
+        )
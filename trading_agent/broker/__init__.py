@@ -1,4 +1,3 @@
-from trading_agent.broker.alpaca_client import AlpacaBrokerClient, AlpacaTradingClient
 from trading_agent.broker.base import BrokerClient
 from trading_agent.broker.factory import build_broker_client, get_broker_client
 from trading_agent.broker.mock_client import MockAlpacaTradingClient, MockBrokerClient
@@ -12,3 +11,12 @@ __all__ = [
     "build_broker_client",
     "get_broker_client",
 ]
+
+
+def __getattr__(name: str):
+    # Lazy: alpaca-py is only imported when an Alpaca client is used.
+    if name in ("AlpacaBrokerClient", "AlpacaTradingClient"):
+        from trading_agent.broker import alpaca_client
+
+        return getattr(alpaca_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,6 +21,7 @@ from trading_agent.domain.broker import (
     OrderSide,
     PortfolioHistory,
 )
+from trading_agent.tracing import traced
 
 
 class AlpacaBrokerClient:
@@ -45,15 +46,19 @@ class AlpacaBrokerClient:
 
         self.client = TradingClient(self.api_key, self.secret_key, paper=paper)
 
+    @traced("broker.alpaca.get_account")
     def get_account(self) -> BrokerAccount:
         return map_alpaca_account(self.client.get_account())
 
+    @traced("broker.alpaca.get_positions")
     def get_positions(self) -> List[BrokerPosition]:
         return [map_alpaca_position(p) for p in self.client.get_all_positions()]
 
+    @traced("broker.alpaca.get_orders")
     def get_orders(self) -> List[BrokerOrder]:
         return [map_alpaca_order(o) for o in self.client.get_orders()]
 
+    @traced("broker.alpaca.place_market_order")
     def place_market_order(
         self, symbol: str, qty: int, side: OrderSide
     ) -> BrokerOrderResult:
@@ -71,6 +76,7 @@ class AlpacaBrokerClient:
         """Get all available assets (Alpaca-specific, not on BrokerClient protocol)."""
         return self.client.get_all_assets()
 
+    @traced("broker.alpaca.get_portfolio_history")
     def get_portfolio_history(
         self,
         period: str = "1M",
@@ -1,10 +1,9 @@
+import importlib
 import logging
 import os
 from typing import Optional
 
-from trading_agent.broker.alpaca_client import AlpacaBrokerClient
 from trading_agent.broker.base import BrokerClient
-from trading_agent.broker.mock_client import MockBrokerClient
 from trading_agent.config import AppConfig, get_config
 from trading_agent.domain.user.brokerage_config import BrokerageConfig
 
@@ -16,9 +15,10 @@ __all__ = [
     "get_broker_client",
 ]
 
+# alpaca-py is imported only when an Alpaca client is actually built.
 _CLIENTS = {
-    "alpaca": AlpacaBrokerClient,
-    "mock": MockBrokerClient,
+    "alpaca": ("trading_agent.broker.alpaca_client", "AlpacaBrokerClient"),
+    "mock": ("trading_agent.broker.mock_client", "MockBrokerClient"),
 }
 
 
@@ -47,7 +47,8 @@ def get_broker_client(provider: str = "alpaca", **kwargs) -> BrokerClient:
             f"Unsupported broker provider: {provider}. "
             f"Supported: {', '.join(list(_CLIENTS) + ['robinhood'])}"
         )
-    return _CLIENTS[provider](**kwargs)
+    module_name, class_name = _CLIENTS[provider]
+    return getattr(importlib.import_module(module_name), class_name)(**kwargs)
 
 
 def build_broker_client(
@@ -11,6 +11,7 @@ from trading_agent.domain.broker import (
     OrderStatus,
     PortfolioHistory,
 )
+from trading_agent.tracing import traced
 
 
 class MockBrokerClient:
@@ -43,6 +44,7 @@ class MockBrokerClient:
         }
         self.orders: List[Dict[str, Any]] = []
 
+    @traced("broker.mock.get_account")
     def get_account(self) -> BrokerAccount:
         data = self.mock_account
         return BrokerAccount(
@@ -58,6 +60,7 @@ class MockBrokerClient:
             long_market_value=float(data.get("long_market_value", 50000.0)),
         )
 
+    @traced("broker.mock.get_portfolio_history")
     def get_portfolio_history(
         self,
         period: str = "1M",
@@ -78,6 +81,7 @@ class MockBrokerClient:
             timeframe=timeframe or "1D",
         )
 
+    @traced("broker.mock.get_positions")
     def get_positions(self) -> List[BrokerPosition]:
         positions: List[BrokerPosition] = []
         for p in self.mock_account["positions"]:
@@ -95,6 +99,7 @@ class MockBrokerClient:
             )
         return positions
 
+    @traced("broker.mock.get_orders")
     def get_orders(self) -> List[BrokerOrder]:
         return [
             BrokerOrder(
@@ -107,6 +112,7 @@ class MockBrokerClient:
             for o in self.orders
         ]
 
+    @traced("broker.mock.place_market_order")
     def place_market_order(
         self, symbol: str, qty: int, side: OrderSide
     ) -> BrokerOrderResult:
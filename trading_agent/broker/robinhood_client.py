@@ -20,6 +20,7 @@ from trading_agent.domain.broker import (
     OrderSide,
     PortfolioHistory,
 )
+from trading_agent.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +95,7 @@ class RobinhoodBrokerClient:
             "Robinhood may restrict third-party API access."
         )
 
+    @traced("broker.robinhood.get_account")
     def get_account(self) -> BrokerAccount:
         try:
             profile = self._rh.profiles.load_account_profile() or {}
@@ -102,6 +104,7 @@ class RobinhoodBrokerClient:
         except Exception as exc:
             raise BrokerError(str(exc), provider=self.provider_name) from exc
 
+    @traced("broker.robinhood.get_positions")
     def get_positions(self) -> List[BrokerPosition]:
         try:
             raw_positions = self._rh.account.get_open_stock_positions() or []
@@ -118,6 +121,7 @@ class RobinhoodBrokerClient:
         except Exception as exc:
             raise BrokerError(str(exc), provider=self.provider_name) from exc
 
+    @traced("broker.robinhood.get_orders")
     def get_orders(self) -> List[BrokerOrder]:
         try:
             raw_orders = self._rh.orders.get_all_open_stock_orders() or []
@@ -125,6 +129,7 @@ class RobinhoodBrokerClient:
         except Exception as exc:
             raise BrokerError(str(exc), provider=self.provider_name) from exc
 
+    @traced("broker.robinhood.place_market_order")
     def place_market_order(
         self, symbol: str, qty: int, side: OrderSide
     ) -> BrokerOrderResult:
@@ -144,6 +149,7 @@ class RobinhoodBrokerClient:
         except Exception as exc:
             raise BrokerError(str(exc), provider=self.provider_name) from exc
 
+    @traced("broker.robinhood.get_portfolio_history")
     def get_portfolio_history(
         self,
         period: str = "1M",
@@ -0,0 +1,120 @@
+"""Bounded thread-pool helpers for blocking provider I/O.
+
+Tasks run in a copy of the caller's ``contextvars`` context so tracing spans
+opened inside a worker nest under the span that submitted them.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def max_workers_from_env(name: str, default: int = DEFAULT_MAX_WORKERS) -> int:
+    """Read a positive worker count from ``name``; invalid values use ``default``."""
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return max(1, value)
+
+
+def submit_in_context(
+    executor: ThreadPoolExecutor, fn: Callable[..., R], *args: Any, **kwargs: Any
+) -> "Future[R]":
+    ctx = contextvars.copy_context()
+    return executor.submit(ctx.run, fn, *args, **kwargs)
+
+
+def map_bounded(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[R]:
+    """Apply ``fn`` to each item with at most ``max_workers`` threads; keep input order.
+
+    Runs inline when there is nothing to parallelize. The first exception
+    raised by a task propagates after all tasks have finished.
+    """
+    work = list(items)
+    if max_workers <= 1 or len(work) <= 1:
+        return [fn(item) for item in work]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(work))) as pool:
+        futures = [submit_in_context(pool, fn, item) for item in work]
+        return [f.result() for f in futures]
+
+
+def run_concurrently(
+    tasks: Dict[str, Callable[[], Any]],
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run independent zero-arg callables in parallel; return results by key."""
+    if not tasks:
+        return {}
+    workers = max_workers or len(tasks)
+    if workers <= 1 or len(tasks) == 1:
+        return {key: task() for key, task in tasks.items()}
+    with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = {key: submit_in_context(pool, task) for key, task in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+class SingleFlightMemo:
+    """Thread-safe memo where concurrent callers of one key share one computation.
+
+    A failed computation is not stored; the next caller (or a waiter) retries.
+    ``clear()`` starts a fresh generation, e.g. once per scheduling interval.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: Dict[Hashable, Any] = {}
+        self._inflight: Dict[Hashable, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], R]) -> R:
+        while True:
+            with self._lock:
+                if key in self._values:
+                    self.hits += 1
+                    return self._values[key]
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    self.misses += 1
+                    owner = True
+                else:
+                    owner = False
+            if not owner:
+                event.wait()
+                continue
+            try:
+                value = compute()
+            except BaseException:
+                with self._lock:
+                    self._inflight.pop(key, None)
+                event.set()
+                raise
+            with self._lock:
+                self._values[key] = value
+                self._inflight.pop(key, None)
+            event.set()
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
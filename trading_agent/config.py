@@ -35,6 +35,9 @@ class AppConfig:
     robinhood_session_path: str
     robinhood_live_trading_ack: bool
     log_level: str
+    market_hours_only: bool = False
+    cycle_open_offset_minutes: float = 5.0
+    health_check_interval_minutes: float = 60.0
 
 
 def _normalize_fallback(raw: Optional[str]) -> Optional[str]:
@@ -65,6 +68,12 @@ def get_config() -> AppConfig:
         robinhood_live_trading_ack=os.getenv("ROBINHOOD_LIVE_TRADING_ACK", "").lower()
         in ("1", "true", "yes"),
         log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        market_hours_only=os.getenv("TRADING_MARKET_HOURS_ONLY", "false").lower()
+        in ("1", "true", "yes"),
+        cycle_open_offset_minutes=float(os.getenv("TRADING_OPEN_OFFSET_MINUTES", "5")),
+        health_check_interval_minutes=float(
+            os.getenv("TRADING_HEALTH_CHECK_INTERVAL_MINUTES", "60")
+        ),
     )
 
 
@@ -156,6 +165,7 @@ def config_summary(config: AppConfig) -> Dict[str, object]:
         "broker_provider": config.broker_provider,
         "alpaca_paper": config.alpaca_paper,
         "trading_cycle_interval": config.trading_cycle_interval,
+        "market_hours_only": config.market_hours_only,
     }
 
 
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional
 import os
 from anthropic import Anthropic
 from .base import LLMClient
+from trading_agent.tracing import annotate, traced
 
 class ClaudeClient(LLMClient):
     """Anthropic's Claude API client implementation."""
@@ -33,6 +34,7 @@ class ClaudeClient(LLMClient):
         self.client = Anthropic(api_key=self.api_key)
         self.model = self.AVAILABLE_MODELS.get(model, model) or self.DEFAULT_MODEL
     
+    @traced("llm.claude")
     def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a response using Claude's API.
@@ -66,6 +68,11 @@ class ClaudeClient(LLMClient):
                 timeout=30  # 30 second timeout
             )
             
+            usage = getattr(message, "usage", None)
+            annotate(
+                input_tokens=getattr(usage, "input_tokens", None),
+                output_tokens=getattr(usage, "output_tokens", None),
+            )
             return message.content[0].text
             
         except Exception as e:
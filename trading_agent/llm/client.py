@@ -2,36 +2,44 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
-from typing import Optional
+from typing import Optional, Type
 
 from trading_agent.llm.base import LLMClient
-from trading_agent.llm.claude_client import ClaudeClient
 from trading_agent.llm.failover_client import FailoverLLMClient
-from trading_agent.llm.gemini_client import GeminiClient
-from trading_agent.llm.huggingface_client import HuggingFaceClient
-from trading_agent.llm.mock_client import MockLLMClient
-from trading_agent.llm.openai_client import OpenAIClient
 
 __all__ = [
     "LLMClient",
     "get_llm_client",
     "build_llm_client",
+    "resolve_llm_client_class",
     "FailoverLLMClient",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Provider SDKs are slow to import (seconds for anthropic + openai + genai), so
+# client classes are resolved by name and imported on first use.
 _CLIENTS = {
-    "openai": OpenAIClient,
-    "huggingface": HuggingFaceClient,
-    "claude": ClaudeClient,
-    "gemini": GeminiClient,
-    "mock": MockLLMClient,
+    "openai": ("trading_agent.llm.openai_client", "OpenAIClient"),
+    "huggingface": ("trading_agent.llm.huggingface_client", "HuggingFaceClient"),
+    "claude": ("trading_agent.llm.claude_client", "ClaudeClient"),
+    "gemini": ("trading_agent.llm.gemini_client", "GeminiClient"),
+    "mock": ("trading_agent.llm.mock_client", "MockLLMClient"),
 }
 
 
+def resolve_llm_client_class(client_type: str) -> Type[LLMClient]:
+    """Import and return the client class for a provider name."""
+    client_type = (client_type or "").lower()
+    if client_type not in _CLIENTS:
+        raise ValueError(f"Unsupported LLM client type: {client_type}")
+    module_name, class_name = _CLIENTS[client_type]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def get_llm_client(client_type: str = "claude", **kwargs) -> LLMClient:
     """
     Factory function to get the appropriate LLM client.
@@ -43,10 +51,7 @@ def get_llm_client(client_type: str = "claude", **kwargs) -> LLMClient:
     Returns:
         An instance of the requested LLM client
     """
-    client_type = (client_type or "").lower()
-    if client_type not in _CLIENTS:
-        raise ValueError(f"Unsupported LLM client type: {client_type}")
-    return _CLIENTS[client_type](**kwargs)
+    return resolve_llm_client_class(client_type)(**kwargs)
 
 
 def build_llm_client(
@@ -6,6 +6,7 @@ import logging
 from typing import Any, Dict, Optional
 
 from trading_agent.llm.base import LLMClient
+from trading_agent.tracing import traced
 from trading_agent.llm.retry import (
     is_auth_error,
     is_retryable_error,
@@ -41,6 +42,7 @@ class FailoverLLMClient(LLMClient):
         self.primary_failures = 0
         self.secondary_failures = 0
 
+    @traced("llm.failover")
     def generate_response(
         self,
         prompt: str,
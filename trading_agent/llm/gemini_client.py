@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional
 import os
 import google.generativeai as genai
 from .base import LLMClient
+from trading_agent.tracing import annotate, traced
 
 class GeminiClient(LLMClient):
     """Google's Gemini API client implementation."""
@@ -34,6 +35,7 @@ class GeminiClient(LLMClient):
         self.model = self.AVAILABLE_MODELS.get(model, model) or self.DEFAULT_MODEL
         self.client = genai.GenerativeModel(self.model)
     
+    @traced("llm.gemini")
     def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a response using Gemini's API.
@@ -66,6 +68,11 @@ class GeminiClient(LLMClient):
                 }
             )
 
+            usage = getattr(response, "usage_metadata", None)
+            annotate(
+                input_tokens=getattr(usage, "prompt_token_count", None),
+                output_tokens=getattr(usage, "candidates_token_count", None),
+            )
             if not response.candidates:
                 raise ValueError("Gemini returned no candidates")
 
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional
 import os
 from huggingface_hub import InferenceClient
 from .base import LLMClient
+from trading_agent.tracing import traced
 
 class HuggingFaceClient(LLMClient):
     """HuggingFace Inference API client implementation."""
@@ -33,6 +34,7 @@ class HuggingFaceClient(LLMClient):
         self.client = InferenceClient(token=self.api_key)
         self.model = self.AVAILABLE_MODELS.get(model, model) or self.DEFAULT_MODEL
     
+    @traced("llm.huggingface")
     def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a response using HuggingFace's Inference API.
@@ -0,0 +1,52 @@
+"""LLM client that reuses responses to identical prompts within one backtest sweep."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+from trading_agent.llm.base import LLMClient
+
+
+class MemoizingLLMClient(LLMClient):
+    """Wrap ``inner`` so identical (prompt, context) pairs hit the LLM once.
+
+    ``memo`` is a ``SingleFlightMemo`` shared by every backtest that may see
+    the same prompts (e.g. a ``BacktestDataContext``): walk-forward windows
+    that overlap replay the same dates, and the market-analysis prompt for a
+    date does not depend on the portfolio. Concurrent callers of one prompt
+    wait for the first. Only for backtests: a live cycle must not be answered
+    from an earlier response.
+
+    Hits are not traced, so cost / latency profiles count real calls only.
+    """
+
+    def __init__(self, inner: LLMClient, memo: Any, *, scope: Hashable = None):
+        self.inner = inner
+        self.memo = memo
+        self.scope = scope  # provider / model, so different LLMs never share answers
+        self.requests = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        digest = hashlib.sha256(prompt.encode("utf-8"))
+        if context:
+            digest.update(json.dumps(context, sort_keys=True, default=str).encode("utf-8"))
+        key = ("llm_response", self.scope, digest.hexdigest())
+
+        def call() -> str:
+            with self._lock:
+                self.calls += 1
+            return self.inner.generate_response(prompt, context)
+
+        with self._lock:
+            self.requests += 1
+        return self.memo.get_or_compute(key, call)
+
+    @property
+    def reused(self) -> int:
+        """Responses this client got from the memo instead of the LLM."""
+        return self.requests - self.calls
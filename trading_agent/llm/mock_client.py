@@ -2,6 +2,7 @@ import json
 from typing import Dict, Any, Optional
 
 from .base import LLMClient
+from trading_agent.tracing import traced
 
 
 class MockLLMClient(LLMClient):
@@ -11,6 +12,7 @@ class MockLLMClient(LLMClient):
         self.responses = responses or {}
         self.smart_defaults = smart_defaults
 
+    @traced("llm.mock")
     def generate_response(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
         if prompt in self.responses:
             return self.responses[prompt]
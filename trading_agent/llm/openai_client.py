@@ -9,6 +9,7 @@ import openai
 from dotenv import load_dotenv
 
 from trading_agent.llm.base import LLMClient
+from trading_agent.tracing import annotate, traced
 
 _JSON_SYSTEM_PROMPT = (
     "You are a trading assistant. Follow the user's schema exactly. "
@@ -39,6 +40,7 @@ class OpenAIClient(LLMClient):
         self.model = self.AVAILABLE_MODELS.get(resolved, resolved)
         self.client = openai.OpenAI(api_key=self.api_key)
 
+    @traced("llm.openai")
     def generate_response(
         self,
         prompt: str,
@@ -58,6 +60,11 @@ class OpenAIClient(LLMClient):
                 kwargs["temperature"] = 0.7
 
             response = self.client.chat.completions.create(**kwargs)
+            usage = getattr(response, "usage", None)
+            annotate(
+                input_tokens=getattr(usage, "prompt_tokens", None),
+                output_tokens=getattr(usage, "completion_tokens", None),
+            )
             content = response.choices[0].message.content
             if not content:
                 raise ValueError("OpenAI returned empty content")
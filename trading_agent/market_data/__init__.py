@@ -5,23 +5,32 @@ Provides interfaces and implementations for market data providers.
 """
 
 from .base import MarketDataProvider
-from .alpaca_provider import AlpacaMarketDataProvider
 from .finnhub_provider import FinnhubNewsProvider
 from .fmp_provider import FMPFundamentalsProvider
 from .fundamentals_base import FundamentalDataProvider
 from .mock_fundamentals_provider import MockFundamentalsProvider
 from .mock_news_provider import MockNewsProvider
 from .mock_provider import MockMarketDataProvider
-from .news_base import NewsDataProvider
+from .news_base import NewsDataProvider, NewsResult
 
 __all__ = [
     "MarketDataProvider",
     "AlpacaMarketDataProvider",
     "MockMarketDataProvider",
     "NewsDataProvider",
+    "NewsResult",
     "FinnhubNewsProvider",
     "MockNewsProvider",
     "FundamentalDataProvider",
     "FMPFundamentalsProvider",
     "MockFundamentalsProvider",
 ]
+
+
+def __getattr__(name: str):
+    # Lazy: alpaca-py is only imported when the live Alpaca provider is used.
+    if name == "AlpacaMarketDataProvider":
+        from .alpaca_provider import AlpacaMarketDataProvider
+
+        return AlpacaMarketDataProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+import threading
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -35,22 +36,40 @@ def bars_path(symbol: str, cache_dir: Optional[Path] = None) -> Path:
     return root / "bars" / f"{symbol.upper()}.csv"
 
 
+# Parsed bar files by path, valid while (mtime_ns, size) is unchanged. Every
+# engine/provider in the process (and forked sweep workers) shares one frame per
+# symbol instead of re-parsing the CSV; callers must treat it as read-only.
+_PARSED_BARS: Dict[Path, Tuple[Tuple[int, int], pd.DataFrame]] = {}
+_PARSED_BARS_LOCK = threading.Lock()
+
+
 def read_cached_bars(
     symbol: str,
     cache_dir: Optional[Path] = None,
 ) -> Optional[pd.DataFrame]:
+    """Cached daily bars for ``symbol`` (shared, read-only frame) or None."""
     path = bars_path(symbol, cache_dir)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None
+    signature = (st.st_mtime_ns, st.st_size)
+    with _PARSED_BARS_LOCK:
+        hit = _PARSED_BARS.get(path)
+    if hit is not None and hit[0] == signature:
+        return hit[1]
     try:
         df = pd.read_csv(path, index_col=0, parse_dates=True)
         if df.empty:
             return None
         df.index = pd.to_datetime(df.index).tz_localize(None)
-        return df.sort_index()
+        df = df.sort_index()
     except (OSError, ValueError) as exc:
         logger.warning("Failed to read Alpaca bar cache %s: %s", path, exc)
         return None
+    with _PARSED_BARS_LOCK:
+        _PARSED_BARS[path] = (signature, df)
+    return df
 
 
 def write_cached_bars(
@@ -175,6 +194,7 @@ class HistoricalAlpacaProvider(MarketDataProvider):
         self.sector_etfs = list(sector_etfs) if sector_etfs is not None else list(DEFAULT_SECTOR_ETFS)
         self.indices = list(indices) if indices is not None else list(DEFAULT_INDICES)
         self._bars: Dict[str, pd.DataFrame] = {}
+        self._closes: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
 
     def set_as_of_date(self, as_of_date: date) -> None:
         self.as_of_date = as_of_date if isinstance(as_of_date, date) else date.fromisoformat(str(as_of_date)[:10])
@@ -190,11 +210,23 @@ class HistoricalAlpacaProvider(MarketDataProvider):
     def get_bars(self, symbol: str, days: int = 100) -> Optional[pd.DataFrame]:
         return slice_bars_as_of(self._load_bars(symbol), self.as_of_date, days=days)
 
+    def full_history(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Every cached bar for ``symbol`` (shared, read-only), including days after
+        ``as_of_date`` — only for causal precomputation indexed by date."""
+        return self._load_bars(symbol)
+
     def get_close_price(self, symbol: str) -> Optional[float]:
-        bars = slice_bars_as_of(self._load_bars(symbol), self.as_of_date)
-        if bars is None or bars.empty:
-            return None
-        return float(bars["close"].iloc[-1])
+        # Binary search on the sorted bar dates instead of slicing a frame per call:
+        # the engine marks every position to market on every replayed day.
+        sym = symbol.upper()
+        if sym not in self._closes:
+            bars = self._load_bars(sym)
+            if bars is None or bars.empty:
+                return None
+            self._closes[sym] = (bars.index.normalize().values, bars["close"].to_numpy(dtype=float))
+        days, values = self._closes[sym]
+        i = int(np.searchsorted(days, np.datetime64(self.as_of_date, "ns"), side="right"))
+        return float(values[i - 1]) if i else None
 
     def get_market_conditions(self) -> Dict[str, Any]:
         return {
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from datetime import datetime
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class MarketDataProvider(ABC):
@@ -15,7 +15,8 @@ from trading_agent.market_data.historical_cache import (
     save_manifest,
     update_symbol_coverage,
 )
-from trading_agent.market_data.news_base import NewsDataProvider
+from trading_agent.market_data.news_base import NewsDataProvider, NewsResult
+from trading_agent.market_data.news_sentiment import sentiment_from_headlines
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +24,6 @@ MAX_SYMBOLS = 13
 MAX_HEADLINES_PER_SYMBOL = 5
 MAX_GENERAL_HEADLINES = 10
 
-_BULLISH_KEYWORDS = {"rally", "surge", "gain", "beat", "growth", "upgrade", "record", "optimism"}
-_BEARISH_KEYWORDS = {"fall", "drop", "decline", "miss", "cut", "downgrade", "crash", "warning", "layoff"}
-
 
 def get_finnhub_cache_dir() -> Path:
     return get_provider_cache_dir("finnhub")
@@ -142,29 +140,6 @@ def fetch_and_cache_news(
     return summary
 
 
-def _sentiment_from_headlines(headlines: List[Dict[str, Any]]) -> str:
-    if not headlines:
-        return "No recent news sentiment available."
-    bullish = 0
-    bearish = 0
-    for h in headlines:
-        title = h.get("title", "").lower()
-        if any(k in title for k in _BULLISH_KEYWORDS):
-            bullish += 1
-        if any(k in title for k in _BEARISH_KEYWORDS):
-            bearish += 1
-    if bullish > bearish:
-        tone = "positive"
-    elif bearish > bullish:
-        tone = "negative"
-    else:
-        tone = "neutral"
-    return (
-        f"{tone.capitalize()} news tone "
-        f"({len(headlines)} headlines, {bullish} bullish / {bearish} bearish cues)"
-    )
-
-
 class HistoricalFinnhubProvider(NewsDataProvider):
     """Point-in-time news from the Finnhub cache."""
 
@@ -194,7 +169,7 @@ class HistoricalFinnhubProvider(NewsDataProvider):
         symbols: List[str],
         as_of: Optional[date] = None,
         lookback_days: Optional[int] = None,
-    ) -> Dict[str, Any]:
+    ) -> NewsResult:
         as_of = as_of or self.as_of_date
         lookback = lookback_days if lookback_days is not None else self.lookback_days
         window_start = as_of - timedelta(days=lookback)
@@ -214,15 +189,14 @@ class HistoricalFinnhubProvider(NewsDataProvider):
                         break
                 day += timedelta(days=1)
 
-        return {
-            "headlines": headlines[:20],
-            "symbols": [s.upper() for s in symbols[:MAX_SYMBOLS]],
-            "as_of": as_of.isoformat(),
-        }
+        return NewsResult(
+            headlines=headlines[:20],
+            symbols=[s.upper() for s in symbols[:MAX_SYMBOLS]],
+            as_of=as_of.isoformat(),
+        )
 
-    def get_news(self, symbols: List[str]) -> Dict[str, Any]:
+    def get_news(self, symbols: List[str]) -> NewsResult:
         return self.get_news_as_of(symbols)
 
     def get_sentiment_summary(self, symbols: List[str]) -> str:
-        news = self.get_news(symbols)
-        return _sentiment_from_headlines(news.get("headlines") or [])
+        return sentiment_from_headlines(self.get_news(symbols).headlines)
@@ -1,13 +1,20 @@
 import json
 import logging
 import os
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
-from .news_base import NewsDataProvider
+from trading_agent.concurrency import SingleFlightMemo, map_bounded, max_workers_from_env
+from trading_agent.tracing import span
+
+from .http_transport import (
+    HTTPStatusError,
+    HTTPTransport,
+    TransportError,
+    get_shared_transport,
+)
+from .news_base import NewsDataProvider, NewsResult
 
 logger = logging.getLogger(__name__)
 
@@ -16,25 +23,46 @@ MAX_SYMBOLS = 13
 MAX_HEADLINES_PER_SYMBOL = 5
 MAX_GENERAL_HEADLINES = 10
 
-_BULLISH_KEYWORDS = {"rally", "surge", "gain", "beat", "growth", "upgrade", "record", "optimism"}
-_BEARISH_KEYWORDS = {"fall", "drop", "decline", "miss", "cut", "downgrade", "crash", "warning", "layoff"}
-
 
 class FinnhubNewsProvider(NewsDataProvider):
     """Finnhub news provider."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        transport: Optional[HTTPTransport] = None,
+        memo: Optional[SingleFlightMemo] = None,
+    ):
         self.api_key = api_key or os.getenv("FINNHUB_API_KEY")
-
-    def get_news(self, symbols: List[str]) -> Dict[str, Any]:
+        self.base_url = (base_url or FINNHUB_BASE_URL).rstrip("/")
+        self.max_workers = max_workers or max_workers_from_env("FINNHUB_MAX_WORKERS")
+        self.transport = transport or get_shared_transport()
+        # Shared per-interval memo (multi-account service): one request per
+        # distinct call across all accounts, even when they run concurrently.
+        self.memo = memo
+
+    def get_news(self, symbols: List[str]) -> NewsResult:
         if not self.api_key:
-            return {"headlines": [], "note": "Finnhub API key not configured"}
+            return NewsResult(headlines=[], note="Finnhub API key not configured")
+
+        capped = symbols[:MAX_SYMBOLS]
+        # One request per symbol plus general news, fetched on a bounded pool;
+        # merge order stays symbol order so dedup is deterministic.
+        fetches: List[Callable[[], List[Dict[str, Any]]]] = [
+            partial(self._fetch_company_news, symbol) for symbol in capped
+        ]
+        fetches.append(self._fetch_general_news)
+        *company_batches, general_items = map_bounded(
+            lambda fetch: fetch(), fetches, self.max_workers
+        )
 
         headlines: List[Dict[str, Any]] = []
         seen_titles: set = set()
 
-        for symbol in symbols[:MAX_SYMBOLS]:
-            for item in self._fetch_company_news(symbol):
+        for symbol, batch in zip(capped, company_batches):
+            for item in batch:
                 title = item.get("title", "")
                 if not title or title in seen_titles:
                     continue
@@ -43,7 +71,7 @@ class FinnhubNewsProvider(NewsDataProvider):
                 if sum(1 for h in headlines if h.get("symbol") == symbol) >= MAX_HEADLINES_PER_SYMBOL:
                     break
 
-        for item in self._fetch_general_news():
+        for item in general_items:
             title = item.get("title", "")
             if not title or title in seen_titles:
                 continue
@@ -52,34 +80,10 @@ class FinnhubNewsProvider(NewsDataProvider):
             if len([h for h in headlines if not h.get("symbol")]) >= MAX_GENERAL_HEADLINES:
                 break
 
-        return {"headlines": headlines[:20], "symbols": symbols[:MAX_SYMBOLS]}
+        return NewsResult(headlines=headlines[:20], symbols=capped)
 
     def get_sentiment_summary(self, symbols: List[str]) -> str:
-        news = self.get_news(symbols)
-        if news.get("note"):
-            return news["note"]
-
-        headlines = news.get("headlines") or []
-        if not headlines:
-            return "No recent news sentiment available."
-
-        bullish = 0
-        bearish = 0
-        for h in headlines:
-            title = h.get("title", "").lower()
-            if any(k in title for k in _BULLISH_KEYWORDS):
-                bullish += 1
-            if any(k in title for k in _BEARISH_KEYWORDS):
-                bearish += 1
-
-        if bullish > bearish:
-            tone = "positive"
-        elif bearish > bullish:
-            tone = "negative"
-        else:
-            tone = "neutral"
-
-        return f"{tone.capitalize()} news tone ({len(headlines)} headlines, {bullish} bullish / {bearish} bearish cues)"
+        return NewsResult.coerce(self.get_news(symbols)).sentiment_summary
 
     def fetch_company_news(
         self,
@@ -129,14 +133,19 @@ class FinnhubNewsProvider(NewsDataProvider):
         return headline
 
     def _get_json(self, path: str, **params: Any) -> Any:
+        if self.memo is None:
+            return self._request_json(path, **params)
+        key = ("finnhub", path, tuple(sorted(params.items())))
+        return self.memo.get_or_compute(key, lambda: self._request_json(path, **params))
+
+    def _request_json(self, path: str, **params: Any) -> Any:
         query = dict(params)
         if "from_" in query:
             query["from"] = query.pop("from_")
         query["token"] = self.api_key
-        url = f"{FINNHUB_BASE_URL}/{path}?{urllib.parse.urlencode(query)}"
         try:
-            with urllib.request.urlopen(url, timeout=15) as resp:
-                return json.loads(resp.read().decode())
-        except (urllib.error.URLError, urllib.error.HTTPError, json.JSONDecodeError) as exc:
+            with span("http.finnhub", path=path):
+                return self.transport.get_json(f"{self.base_url}/{path}", params=query)
+        except (TransportError, HTTPStatusError, json.JSONDecodeError) as exc:
             logger.warning("Finnhub request failed for %s: %s", path, exc)
             return None
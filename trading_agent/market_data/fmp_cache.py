@@ -2,20 +2,76 @@ import json
 import logging
 import os
 import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
 
 from trading_agent.market_data.historical_cache import (
     load_manifest,
     save_manifest,
     update_symbol_coverage,
 )
+from trading_agent.storage.atomic import atomic_write_json
 from trading_agent.storage.paths import get_cache_dir
 
 logger = logging.getLogger(__name__)
 
 _CACHE_ENABLED_VALUES = {"1", "true", "yes"}
+DEFAULT_MEMORY_CACHE_SIZE = 512
+_MANIFEST_NOTE = (
+    "FMP stable endpoints are TTM/current — not true point-in-time historical fundamentals."
+)
+
+
+class _PayloadLRU:
+    """Process-local LRU over decoded payloads, keyed by (cache dir, day, key)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Tuple[str, str, str], payload: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = payload
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def _memory_cache_size() -> int:
+    try:
+        return int(os.getenv("FMP_MEMORY_CACHE_SIZE") or DEFAULT_MEMORY_CACHE_SIZE)
+    except ValueError:
+        return DEFAULT_MEMORY_CACHE_SIZE
+
+
+_memory = _PayloadLRU(_memory_cache_size())
+# (cache dir, day) -> cache keys present on disk; one scandir per day partition
+# instead of a stat per hit (misses still stat, see read_cache).
+_day_index: Dict[Tuple[str, str], Set[str]] = {}
+_index_lock = threading.Lock()
+
+# Manifest coverage is buffered and flushed once per batch (see coverage_batch).
+_MANIFEST_LOCK = threading.Lock()
+_pending_coverage: Dict[Path, Dict[str, Tuple[date, date]]] = {}
+_batch_depth = 0
 
 
 def is_cache_enabled() -> bool:
@@ -47,18 +103,69 @@ def cache_file_path(endpoint: str, day: date, **params: Any) -> Path:
     return get_fmp_cache_dir() / day.isoformat() / f"{key}.json"
 
 
+def clear_memory_cache() -> None:
+    """Drop the in-process payload LRU and day-partition index."""
+    _memory.clear()
+    with _index_lock:
+        _day_index.clear()
+
+
+def _partition_keys(cache_dir: Path, day: date) -> Set[str]:
+    index_key = (str(cache_dir), day.isoformat())
+    with _index_lock:
+        keys = _day_index.get(index_key)
+        if keys is not None:
+            return keys
+    found: Set[str] = set()
+    try:
+        with os.scandir(cache_dir / day.isoformat()) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and not entry.name.startswith("."):
+                    found.add(entry.name[: -len(".json")])
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.warning("Failed to scan FMP cache partition %s: %s", day, exc)
+    with _index_lock:
+        return _day_index.setdefault(index_key, found)
+
+
+def _index_add(cache_dir: Path, day: date, key: str) -> None:
+    _partition_keys(cache_dir, day)
+    with _index_lock:
+        _day_index[(str(cache_dir), day.isoformat())].add(key)
+
+
 def read_cache(endpoint: str, day: Optional[date] = None, **params: Any) -> Optional[Any]:
+    """Return the cached payload for today's partition, or None.
+
+    Order: in-process LRU, then the day-partition index, then the envelope
+    file. Payloads are shared with the LRU — treat them as read-only.
+    """
     if not is_cache_enabled():
         return None
 
     day = day or datetime.now(timezone.utc).date()
-    path = cache_file_path(endpoint, day, **params)
-    if not path.exists():
-        return None
+    cache_dir = get_fmp_cache_dir()
+    key = build_cache_key(endpoint, **params)
+    memo_key = (str(cache_dir), day.isoformat(), key)
+    cached = _memory.get(memo_key)
+    if cached is not None:
+        return cached
+
+    path = cache_dir / day.isoformat() / f"{key}.json"
+    if key not in _partition_keys(cache_dir, day):
+        # Another process (sweep worker, live service) may have written it
+        # after the partition was scanned; misses cost a fetch, so one stat is cheap.
+        if not path.exists():
+            return None
+        _index_add(cache_dir, day, key)
 
     try:
         with path.open(encoding="utf-8") as f:
             envelope = json.load(f)
+    except FileNotFoundError:
+        return None
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Failed to read FMP cache %s: %s", path, exc)
         return None
@@ -76,7 +183,9 @@ def read_cache(endpoint: str, day: Optional[date] = None, **params: Any) -> Opti
         return None
 
     logger.debug("FMP cache hit: %s", endpoint)
-    return envelope.get("payload")
+    payload = envelope.get("payload")
+    _memory.put(memo_key, payload)
+    return payload
 
 
 def write_cache(endpoint: str, payload: Any, day: Optional[date] = None, **params: Any) -> None:
@@ -84,8 +193,9 @@ def write_cache(endpoint: str, payload: Any, day: Optional[date] = None, **param
         return
 
     day = day or datetime.now(timezone.utc).date()
-    path = cache_file_path(endpoint, day, **params)
-    path.parent.mkdir(parents=True, exist_ok=True)
+    cache_dir = get_fmp_cache_dir()
+    key = build_cache_key(endpoint, **params)
+    path = cache_dir / day.isoformat() / f"{key}.json"
 
     envelope = {
         "fetched_at": datetime.now(timezone.utc).isoformat(),
@@ -93,9 +203,9 @@ def write_cache(endpoint: str, payload: Any, day: Optional[date] = None, **param
         "params": {k: v for k, v in params.items() if k != "apikey"},
         "payload": payload,
     }
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(envelope, f, indent=2)
-        f.write("\n")
+    atomic_write_json(path, envelope, fsync=False)
+    _index_add(cache_dir, day, key)
+    _memory.put((str(cache_dir), day.isoformat(), key), payload)
 
     symbol = params.get("symbol")
     if symbol:
@@ -103,11 +213,55 @@ def write_cache(endpoint: str, payload: Any, day: Optional[date] = None, **param
 
 
 def record_symbol_coverage(symbol: str, day: date) -> None:
-    """Track that FMP data was fetched for symbol on day (TTM, not true PIT)."""
+    """Track that FMP data was fetched for symbol on day (TTM, not true PIT).
+
+    Inside ``coverage_batch()`` the update is buffered; otherwise it is
+    flushed to ``manifest.json`` immediately.
+    """
     cache_dir = get_fmp_cache_dir()
-    manifest = load_manifest(cache_dir)
-    update_symbol_coverage(manifest, symbol, day, day)
-    manifest["note"] = (
-        "FMP stable endpoints are TTM/current — not true point-in-time historical fundamentals."
-    )
-    save_manifest(cache_dir, manifest)
+    with _MANIFEST_LOCK:
+        per_dir = _pending_coverage.setdefault(cache_dir, {})
+        sym = symbol.upper()
+        earliest, latest = per_dir.get(sym, (day, day))
+        per_dir[sym] = (min(earliest, day), max(latest, day))
+        if _batch_depth == 0:
+            _flush_coverage_locked()
+
+
+@contextmanager
+def coverage_batch() -> Iterator[None]:
+    """Buffer manifest coverage updates; write the manifest once on exit.
+
+    Nested and concurrent batches share one buffer, flushed when the
+    outermost batch exits.
+    """
+    global _batch_depth
+    with _MANIFEST_LOCK:
+        _batch_depth += 1
+    try:
+        yield
+    finally:
+        with _MANIFEST_LOCK:
+            _batch_depth -= 1
+            if _batch_depth == 0:
+                _flush_coverage_locked()
+
+
+def flush_coverage() -> None:
+    with _MANIFEST_LOCK:
+        _flush_coverage_locked()
+
+
+def _flush_coverage_locked() -> None:
+    while _pending_coverage:
+        cache_dir, symbols = _pending_coverage.popitem()
+        # Re-read just before writing so updates from other processes survive;
+        # save_manifest replaces the file atomically.
+        manifest = load_manifest(cache_dir)
+        for sym, (earliest, latest) in symbols.items():
+            update_symbol_coverage(manifest, sym, earliest, latest)
+        manifest["note"] = _MANIFEST_NOTE
+        try:
+            save_manifest(cache_dir, manifest)
+        except OSError as exc:
+            logger.warning("Failed to write FMP manifest in %s: %s", cache_dir, exc)
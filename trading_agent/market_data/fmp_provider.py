@@ -1,14 +1,20 @@
 import json
 import logging
 import os
-import urllib.error
-import urllib.parse
-import urllib.request
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .fmp_cache import read_cache, write_cache
+from trading_agent.concurrency import SingleFlightMemo, map_bounded, max_workers_from_env
+from trading_agent.tracing import span
+
+from .fmp_cache import coverage_batch, read_cache, write_cache
 from .fundamentals_base import FundamentalDataProvider
+from .http_transport import (
+    HTTPStatusError,
+    HTTPTransport,
+    TransportError,
+    get_shared_transport,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,24 +22,51 @@ logger = logging.getLogger(__name__)
 FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 MAX_SYMBOLS = 13
 
+# (endpoint, params) for one FMP GET.
+_Request = Tuple[str, Dict[str, Any]]
+
 
 class FMPFundamentalsProvider(FundamentalDataProvider):
     """Financial Modeling Prep fundamentals provider (stable API)."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        transport: Optional[HTTPTransport] = None,
+        memo: Optional[SingleFlightMemo] = None,
+    ):
         self.api_key = api_key or os.getenv("FMP_API_KEY")
+        self.base_url = (base_url or FMP_BASE_URL).rstrip("/")
+        self.max_workers = max_workers or max_workers_from_env("FMP_MAX_WORKERS")
+        self.transport = transport or get_shared_transport()
+        self.memo = memo  # see FinnhubNewsProvider.memo
 
     def get_fundamentals(self, symbols: List[str]) -> Dict[str, Any]:
         if not self.api_key:
             return {"metrics": {}, "note": "FMP API key not configured"}
 
         capped = symbols[:MAX_SYMBOLS]
-        earnings_by_symbol = self._fetch_recent_earnings(capped)
+        if not capped:
+            return {"metrics": {}, "symbols": capped}
 
-        metrics: Dict[str, Any] = {}
+        # Earnings calendar + three endpoints per symbol as one flat, bounded batch.
+        requests: List[_Request] = [self._earnings_request()]
         for symbol in capped:
-            symbol_metrics = self._fetch_symbol_metrics(
-                symbol, earnings_by_symbol.get(symbol)
+            requests.extend(self._symbol_requests(symbol))
+        # Coverage for the whole batch lands in manifest.json in one write.
+        with coverage_batch():
+            payloads = map_bounded(
+                lambda req: self._get_json(req[0], **req[1]), requests, self.max_workers
+            )
+        earnings_by_symbol = _index_earnings(payloads[0], capped)
+
+        metrics: Dict[str, Any] = {}
+        for i, symbol in enumerate(capped):
+            ratios, key_metrics, growth = payloads[1 + 3 * i : 4 + 3 * i]
+            symbol_metrics = _build_symbol_metrics(
+                ratios, key_metrics, growth, earnings_by_symbol.get(symbol)
             )
             if symbol_metrics:
                 metrics[symbol] = symbol_metrics
@@ -67,86 +100,37 @@ class FMPFundamentalsProvider(FundamentalDataProvider):
 
         return "; ".join(parts)
 
-    def _fetch_symbol_metrics(
-        self,
-        symbol: str,
-        earnings_row: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        ratios = self._get_json("ratios-ttm", symbol=symbol)
-        key_metrics = self._get_json("key-metrics-ttm", symbol=symbol)
-        growth = self._get_json("financial-growth", symbol=symbol, limit=1)
-
-        result: Dict[str, Any] = {}
-        ratio_row = _first_record(ratios)
-        if ratio_row:
-            result["pe"] = _safe_float(
-                ratio_row.get("priceToEarningsRatioTTM")
-                or ratio_row.get("peRatioTTM")
-            )
-            result["pb"] = _safe_float(ratio_row.get("priceToBookRatioTTM"))
-            result["eps"] = _safe_float(ratio_row.get("netIncomePerShareTTM"))
-
-        km_row = _first_record(key_metrics)
-        if km_row:
-            result["roe"] = _safe_float(km_row.get("returnOnEquityTTM"))
-            if result["roe"] is not None:
-                result["roe"] = round(result["roe"] * 100, 2)
-            if result.get("eps") is None:
-                result["eps"] = _safe_float(km_row.get("netIncomePerShareTTM"))
-
-        growth_row = _first_record(growth)
-        if growth_row:
-            rev_growth = _safe_float(growth_row.get("revenueGrowth"))
-            if rev_growth is not None:
-                result["revenue_growth_yoy"] = round(rev_growth * 100, 2)
-
-        if earnings_row:
-            eps_est = _safe_float(earnings_row.get("epsEstimated"))
-            eps_act = _safe_float(earnings_row.get("eps"))
-            if eps_est is not None and eps_act is not None:
-                beat = "beat" if eps_act >= eps_est else "miss"
-                result["latest_earnings"] = (
-                    f"{earnings_row.get('date', 'recent')} EPS {eps_act} "
-                    f"({beat} est {eps_est})"
-                )
-            elif earnings_row.get("date"):
-                result["latest_earnings"] = str(earnings_row.get("date"))
-
-        return result
-
-    def _fetch_recent_earnings(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
-        if not symbols:
-            return {}
+    @staticmethod
+    def _symbol_requests(symbol: str) -> List[_Request]:
+        return [
+            ("ratios-ttm", {"symbol": symbol}),
+            ("key-metrics-ttm", {"symbol": symbol}),
+            ("financial-growth", {"symbol": symbol, "limit": 1}),
+        ]
 
+    @staticmethod
+    def _earnings_request() -> _Request:
         end = date.today()
         start = end - timedelta(days=90)
-        calendar = self._get_json(
-            "earnings-calendar",
-            **{"from": start.isoformat(), "to": end.isoformat()},
-        )
-        if not isinstance(calendar, list):
-            return {}
-
-        wanted = set(symbols)
-        by_symbol: Dict[str, Dict[str, Any]] = {}
-        for row in calendar:
-            sym = row.get("symbol")
-            if sym in wanted and sym not in by_symbol:
-                by_symbol[sym] = row
-        return by_symbol
+        return ("earnings-calendar", {"from": start.isoformat(), "to": end.isoformat()})
 
     def _get_json(self, endpoint: str, **params: Any) -> Any:
+        if self.memo is None:
+            return self._request_json(endpoint, **params)
+        key = ("fmp", endpoint, tuple(sorted(params.items())))
+        return self.memo.get_or_compute(key, lambda: self._request_json(endpoint, **params))
+
+    def _request_json(self, endpoint: str, **params: Any) -> Any:
         cached = read_cache(endpoint, **params)
         if cached is not None:
             return cached
 
         query = dict(params)
         query["apikey"] = self.api_key
-        url = f"{FMP_BASE_URL}/{endpoint}?{urllib.parse.urlencode(query)}"
         try:
-            with urllib.request.urlopen(url, timeout=15) as resp:
-                payload = json.loads(resp.read().decode())
-        except urllib.error.HTTPError as exc:
+            with span("http.fmp", endpoint=endpoint):
+                payload = self.transport.get_json(f"{self.base_url}/{endpoint}", params=query)
+        except HTTPStatusError as exc:
             if exc.code in (402, 403) and endpoint == "earnings-calendar":
                 logger.debug(
                     "FMP earnings calendar unavailable on current plan (%s)",
@@ -160,7 +144,7 @@ class FMPFundamentalsProvider(FundamentalDataProvider):
             else:
                 logger.warning("FMP request failed for %s: %s", endpoint, exc)
             return None
-        except (urllib.error.URLError, json.JSONDecodeError) as exc:
+        except (TransportError, json.JSONDecodeError) as exc:
             logger.warning("FMP request failed for %s: %s", endpoint, exc)
             return None
 
@@ -168,6 +152,65 @@ class FMPFundamentalsProvider(FundamentalDataProvider):
         return payload
 
 
+def _build_symbol_metrics(
+    ratios: Any,
+    key_metrics: Any,
+    growth: Any,
+    earnings_row: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    ratio_row = _first_record(ratios)
+    if ratio_row:
+        result["pe"] = _safe_float(
+            ratio_row.get("priceToEarningsRatioTTM")
+            or ratio_row.get("peRatioTTM")
+        )
+        result["pb"] = _safe_float(ratio_row.get("priceToBookRatioTTM"))
+        result["eps"] = _safe_float(ratio_row.get("netIncomePerShareTTM"))
+
+    km_row = _first_record(key_metrics)
+    if km_row:
+        result["roe"] = _safe_float(km_row.get("returnOnEquityTTM"))
+        if result["roe"] is not None:
+            result["roe"] = round(result["roe"] * 100, 2)
+        if result.get("eps") is None:
+            result["eps"] = _safe_float(km_row.get("netIncomePerShareTTM"))
+
+    growth_row = _first_record(growth)
+    if growth_row:
+        rev_growth = _safe_float(growth_row.get("revenueGrowth"))
+        if rev_growth is not None:
+            result["revenue_growth_yoy"] = round(rev_growth * 100, 2)
+
+    if earnings_row:
+        eps_est = _safe_float(earnings_row.get("epsEstimated"))
+        eps_act = _safe_float(earnings_row.get("eps"))
+        if eps_est is not None and eps_act is not None:
+            beat = "beat" if eps_act >= eps_est else "miss"
+            result["latest_earnings"] = (
+                f"{earnings_row.get('date', 'recent')} EPS {eps_act} "
+                f"({beat} est {eps_est})"
+            )
+        elif earnings_row.get("date"):
+            result["latest_earnings"] = str(earnings_row.get("date"))
+
+    return result
+
+
+def _index_earnings(calendar: Any, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    if not isinstance(calendar, list):
+        return {}
+    wanted = set(symbols)
+    by_symbol: Dict[str, Dict[str, Any]] = {}
+    for row in calendar:
+        if not isinstance(row, dict):
+            continue
+        sym = row.get("symbol")
+        if sym in wanted and sym not in by_symbol:
+            by_symbol[sym] = row
+    return by_symbol
+
+
 def _first_record(data: Any) -> Optional[Dict[str, Any]]:
     if isinstance(data, list) and data:
         row = data[0]
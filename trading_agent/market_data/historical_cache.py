@@ -8,6 +8,7 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from trading_agent.storage.atomic import atomic_write_json
 from trading_agent.storage.paths import get_cache_dir
 
 logger = logging.getLogger(__name__)
@@ -33,10 +34,7 @@ def save_manifest(cache_dir: Path, manifest: Dict[str, Any]) -> None:
     cache_dir.mkdir(parents=True, exist_ok=True)
     manifest = dict(manifest)
     manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
-    path = cache_dir / "manifest.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
-        f.write("\n")
+    atomic_write_json(cache_dir / "manifest.json", manifest)
 
 
 def update_symbol_coverage(
@@ -0,0 +1,347 @@
+"""Shared pooled HTTP transport for market-data providers.
+
+Stdlib-only (``http.client``) so no new dependency: per-host keep-alive
+connection pools with a concurrency cap, gzip responses, and conditional
+GETs (``If-None-Match`` / ``If-Modified-Since``) that replay the last body on
+``304 Not Modified``. Finnhub and FMP share one transport per process via
+``get_shared_transport()``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import json
+import logging
+import os
+import ssl
+import threading
+import urllib.parse
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PER_HOST = 8
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_VALIDATOR_CACHE_SIZE = 256
+MAX_REDIRECTS = 3
+USER_AGENT = "trading-agent/1.0"
+
+# Errors that mean a pooled keep-alive connection went stale before we used it.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class TransportError(OSError):
+    """Network-level failure (DNS, connect, timeout, reset)."""
+
+
+class HTTPStatusError(Exception):
+    """Non-2xx response. ``code`` mirrors ``urllib.error.HTTPError.code``."""
+
+    def __init__(self, code: int, url: str, reason: str = "", body: bytes = b""):
+        super().__init__(f"HTTP {code} {reason} for {_redact(url)}".strip())
+        self.code = code
+        self.url = url
+        self.reason = reason
+        self.body = body
+
+
+@dataclass
+class HTTPResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    url: str
+    revalidated: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    not_modified: int = 0
+    retries: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+@dataclass
+class _Validator:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class _HostPool:
+    """Idle keep-alive connections for one (scheme, host, port), capped by a semaphore."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], limit: int, timeout: float):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(limit)
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context() if scheme == "https" else None
+
+    def acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        self._slots.acquire()
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._new_connection(), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                self._idle.append(conn)
+        else:
+            conn.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self._ssl_context
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+
+class HTTPTransport:
+    """Thread-safe pooled HTTP GET client for JSON APIs."""
+
+    def __init__(
+        self,
+        max_per_host: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        conditional: bool = True,
+        validator_cache_size: int = DEFAULT_VALIDATOR_CACHE_SIZE,
+    ):
+        self.max_per_host = max(1, max_per_host or _env_int(
+            "MARKET_DATA_HTTP_MAX_PER_HOST", DEFAULT_MAX_PER_HOST
+        ))
+        self.timeout = timeout
+        self.conditional = conditional
+        self.validator_cache_size = validator_cache_size
+        self._pools: Dict[Tuple[str, str, Optional[int]], _HostPool] = {}
+        self._validators: "OrderedDict[str, _Validator]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = TransportStats()
+
+    def get_json(self, url: str, params: Optional[Mapping[str, Any]] = None) -> Any:
+        return self.get(url, params=params).json()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> HTTPResponse:
+        full_url = _with_query(url, params)
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._get_once(full_url, headers)
+            if response.status in (301, 302, 303, 307, 308) and response.headers.get("location"):
+                full_url = urllib.parse.urljoin(full_url, response.headers["location"])
+                continue
+            return response
+        raise TransportError(f"Too many redirects for {_redact(full_url)}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return self._stats.to_dict()
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def _get_once(self, url: str, extra_headers: Optional[Mapping[str, str]]) -> HTTPResponse:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise TransportError(f"Unsupported URL: {_redact(url)}")
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        headers = {
+            "Host": parsed.netloc,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            "User-Agent": USER_AGENT,
+        }
+        validator = self._validator(url) if self.conditional else None
+        if validator is not None:
+            if validator.etag:
+                headers["If-None-Match"] = validator.etag
+            if validator.last_modified:
+                headers["If-Modified-Since"] = validator.last_modified
+        headers.update(extra_headers or {})
+
+        pool = self._pool(parsed.scheme, parsed.hostname, parsed.port)
+        conn, reused = pool.acquire()
+        reusable = False
+        try:
+            status, reason, resp_headers, body, will_close = self._send(
+                conn, reused, target, headers
+            )
+            reusable = not will_close
+        except _STALE_CONNECTION_ERRORS as exc:
+            raise TransportError(f"Connection to {parsed.hostname} failed: {exc}") from exc
+        except (OSError, http.client.HTTPException) as exc:
+            raise TransportError(f"Request to {parsed.hostname} failed: {exc}") from exc
+        except (EOFError, zlib.error) as exc:
+            # Truncated gzip / corrupt deflate body (BadGzipFile is an OSError).
+            raise TransportError(
+                f"Undecodable response body from {parsed.hostname}: {exc}"
+            ) from exc
+        finally:
+            pool.release(conn, reusable)
+
+        if status == 304 and validator is not None:
+            with self._lock:
+                self._stats.not_modified += 1
+            return HTTPResponse(200, dict(validator.headers), validator.body, url, revalidated=True)
+        if status >= 400:
+            raise HTTPStatusError(status, url, reason, body)
+
+        if self.conditional and 200 <= status < 300:
+            self._remember(url, resp_headers, body)
+        return HTTPResponse(status, resp_headers, body, url)
+
+    def _send(
+        self,
+        conn: http.client.HTTPConnection,
+        reused: bool,
+        target: str,
+        headers: Dict[str, str],
+    ) -> Tuple[int, str, Dict[str, str], bytes, bool]:
+        with self._lock:
+            self._stats.requests += 1
+            if reused:
+                self._stats.connections_reused += 1
+            else:
+                self._stats.connections_opened += 1
+        try:
+            return self._roundtrip(conn, target, headers)
+        except _STALE_CONNECTION_ERRORS:
+            if not reused:
+                raise
+            # Server closed an idle keep-alive socket; retry once on a fresh one.
+            # The caller releases the original object, so reconnect it in place.
+            conn.close()
+            with self._lock:
+                self._stats.retries += 1
+                self._stats.connections_opened += 1
+            return self._roundtrip(conn, target, headers)
+
+    @staticmethod
+    def _roundtrip(
+        conn: http.client.HTTPConnection, target: str, headers: Dict[str, str]
+    ) -> Tuple[int, str, Dict[str, str], bytes, bool]:
+        conn.request("GET", target, headers=headers)
+        resp = conn.getresponse()
+        raw = resp.read()
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        body = _decode_body(raw, resp_headers.get("content-encoding", ""))
+        return resp.status, resp.reason, resp_headers, body, resp.will_close
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> _HostPool:
+        key = (scheme, host.lower(), port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(scheme, host, port, self.max_per_host, self.timeout)
+                self._pools[key] = pool
+            return pool
+
+    def _validator(self, url: str) -> Optional[_Validator]:
+        with self._lock:
+            validator = self._validators.get(url)
+            if validator is not None:
+                self._validators.move_to_end(url)
+            return validator
+
+    def _remember(self, url: str, headers: Dict[str, str], body: bytes) -> None:
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        kept = {k: v for k, v in headers.items() if k in ("content-type", "etag", "last-modified")}
+        with self._lock:
+            self._validators[url] = _Validator(etag, last_modified, body, kept)
+            self._validators.move_to_end(url)
+            while len(self._validators) > self.validator_cache_size:
+                self._validators.popitem(last=False)
+
+
+_shared: Optional[HTTPTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_transport() -> HTTPTransport:
+    """Process-wide transport so every provider instance reuses the same pools."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = HTTPTransport()
+        return _shared
+
+
+def _decode_body(raw: bytes, encoding: str) -> bytes:
+    encoding = encoding.lower().strip()
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+def _with_query(url: str, params: Optional[Mapping[str, Any]]) -> str:
+    if not params:
+        return url
+    query = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+    separator = "&" if urllib.parse.urlsplit(url).query else "?"
+    return f"{url}{separator}{query}"
+
+
+def _redact(url: str) -> str:
+    """Hide API keys (``token`` / ``apikey``) in error messages and logs."""
+    parts = urllib.parse.urlsplit(url)
+    if not parts.query:
+        return url
+    pairs = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    safe = [(k, "***" if k.lower() in ("token", "apikey", "api_key") else v) for k, v in pairs]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(safe)))
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name) or default)
+    except ValueError:
+        return default
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List
 
-from .news_base import NewsDataProvider
+from .news_base import NewsDataProvider, NewsResult
 
 
 class MockNewsProvider(NewsDataProvider):
@@ -23,14 +23,22 @@ class MockNewsProvider(NewsDataProvider):
             },
         ]
 
-    def get_news(self, symbols: List[str]) -> Dict[str, Any]:
-        return {"headlines": self.headlines, "symbols": symbols}
+    def get_news(self, symbols: List[str]) -> NewsResult:
+        return NewsResult(
+            headlines=self.headlines,
+            symbols=symbols,
+            sentiment_fn=_mock_sentiment,
+        )
 
     def get_sentiment_summary(self, symbols: List[str]) -> str:
-        bullish = sum(1 for h in self.headlines if "rally" in h.get("title", "").lower())
-        bearish = sum(1 for h in self.headlines if "fall" in h.get("title", "").lower() or "crash" in h.get("title", "").lower())
-        if bullish > bearish:
-            return f"Mixed-positive sentiment ({len(self.headlines)} headlines, {bullish} bullish cues)"
-        if bearish > bullish:
-            return f"Mixed-negative sentiment ({len(self.headlines)} headlines, {bearish} bearish cues)"
-        return f"Neutral sentiment ({len(self.headlines)} headlines)"
+        return _mock_sentiment(self.headlines)
+
+
+def _mock_sentiment(headlines: List[Dict[str, Any]]) -> str:
+    bullish = sum(1 for h in headlines if "rally" in h.get("title", "").lower())
+    bearish = sum(1 for h in headlines if "fall" in h.get("title", "").lower() or "crash" in h.get("title", "").lower())
+    if bullish > bearish:
+        return f"Mixed-positive sentiment ({len(headlines)} headlines, {bullish} bullish cues)"
+    if bearish > bullish:
+        return f"Mixed-negative sentiment ({len(headlines)} headlines, {bearish} bearish cues)"
+    return f"Neutral sentiment ({len(headlines)} headlines)"
@@ -1,5 +1,50 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .news_sentiment import sentiment_from_headlines
+
+SentimentFn = Callable[[List[Dict[str, Any]]], str]
+
+
+class NewsResult(dict):
+    """``get_news`` payload with a lazily computed ``sentiment_summary``.
+
+    Still a plain dict (``headlines``, ``symbols``, optional ``note``/``as_of``)
+    so existing consumers and JSON artifacts are unchanged. Sentiment is
+    derived from the headlines already fetched — never a second fetch.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        sentiment_fn: Optional[SentimentFn] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.setdefault("headlines", [])
+        self._sentiment_fn = sentiment_fn or sentiment_from_headlines
+        self._sentiment: Optional[str] = None
+
+    @property
+    def headlines(self) -> List[Dict[str, Any]]:
+        return self.get("headlines") or []
+
+    @property
+    def sentiment_summary(self) -> str:
+        if self._sentiment is None:
+            note = self.get("note")
+            self._sentiment = str(note) if note else self._sentiment_fn(self.headlines)
+        return self._sentiment
+
+    @classmethod
+    def coerce(
+        cls,
+        news: Optional[Mapping[str, Any]],
+        sentiment_fn: Optional[SentimentFn] = None,
+    ) -> "NewsResult":
+        if isinstance(news, NewsResult):
+            return news
+        return cls(dict(news or {}), sentiment_fn=sentiment_fn)
 
 
 class NewsDataProvider(ABC):
@@ -10,3 +55,13 @@ class NewsDataProvider(ABC):
     @abstractmethod
     def get_sentiment_summary(self, symbols: List[str]) -> str:
         pass
+
+    def summarize_sentiment(self, news: Mapping[str, Any], symbols: List[str]) -> str:
+        """Sentiment for an already-fetched ``get_news`` result.
+
+        Providers returning ``NewsResult`` reuse its headlines; plain-dict
+        providers fall back to ``get_sentiment_summary``.
+        """
+        if isinstance(news, NewsResult):
+            return news.sentiment_summary
+        return self.get_sentiment_summary(symbols)
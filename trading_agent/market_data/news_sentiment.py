@@ -0,0 +1,68 @@
+"""Keyword-cue news sentiment shared by live and historical news providers."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Pattern, Sequence, Set, Tuple
+
+BULLISH_KEYWORDS = frozenset(
+    {"rally", "surge", "gain", "beat", "growth", "upgrade", "record", "optimism"}
+)
+BEARISH_KEYWORDS = frozenset(
+    {"fall", "drop", "decline", "miss", "cut", "downgrade", "crash", "warning", "layoff"}
+)
+
+# Titles are joined with this separator; it cannot occur inside a keyword,
+# so a match never spans two headlines.
+_SEPARATOR = "\n"
+
+
+def _compile(keywords: Iterable[str]) -> Pattern[str]:
+    # Longest first so alternation prefers the longest cue at a position.
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in ordered))
+
+
+_BULLISH_RE = _compile(BULLISH_KEYWORDS)
+_BEARISH_RE = _compile(BEARISH_KEYWORDS)
+
+
+def _matching_titles(pattern: Pattern[str], text: str, offsets: Sequence[int]) -> Set[int]:
+    return {bisect_right(offsets, m.start()) - 1 for m in pattern.finditer(text)}
+
+
+def count_keyword_cues(titles: Sequence[str]) -> Tuple[int, int]:
+    """Count titles with at least one bullish / bearish cue (substring match).
+
+    All titles are lower-cased and scanned in a single regex pass per
+    polarity instead of ``len(titles) * len(keywords)`` substring checks.
+    """
+    if not titles:
+        return 0, 0
+    lowered = [str(t or "").lower() for t in titles]
+    offsets: List[int] = []
+    pos = 0
+    for title in lowered:
+        offsets.append(pos)
+        pos += len(title) + len(_SEPARATOR)
+    text = _SEPARATOR.join(lowered)
+    bullish = len(_matching_titles(_BULLISH_RE, text, offsets))
+    bearish = len(_matching_titles(_BEARISH_RE, text, offsets))
+    return bullish, bearish
+
+
+def sentiment_from_headlines(headlines: List[Dict[str, Any]]) -> str:
+    if not headlines:
+        return "No recent news sentiment available."
+    bullish, bearish = count_keyword_cues([h.get("title", "") for h in headlines])
+    if bullish > bearish:
+        tone = "positive"
+    elif bearish > bullish:
+        tone = "negative"
+    else:
+        tone = "neutral"
+    return (
+        f"{tone.capitalize()} news tone "
+        f"({len(headlines)} headlines, {bullish} bullish / {bearish} bearish cues)"
+    )
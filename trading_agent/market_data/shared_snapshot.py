@@ -0,0 +1,92 @@
+"""Market data shared by several accounts' trading cycles within one interval.
+
+``SharedMarketSnapshot`` owns one ``SingleFlightMemo`` per interval. Market
+conditions, daily bars, Finnhub news and FMP fundamentals requested by any
+account are fetched once and served to the others from memory, including when
+accounts run concurrently. Call ``new_interval()`` before each round so prices
+and headlines are refreshed.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from trading_agent.concurrency import SingleFlightMemo
+from trading_agent.market_data.base import MarketDataProvider
+from trading_agent.market_data.finnhub_provider import FinnhubNewsProvider
+from trading_agent.market_data.fmp_provider import FMPFundamentalsProvider
+
+
+class SharedMarketDataProvider(MarketDataProvider):
+    """Memoizing view of a market data provider; bars are shared across views."""
+
+    def __init__(self, inner: MarketDataProvider, memo: SingleFlightMemo, key: Tuple[str, ...]):
+        self.inner = inner
+        self.memo = memo
+        self.key = key
+
+    def get_market_conditions(self) -> Dict[str, Any]:
+        return self.memo.get_or_compute(
+            ("market_conditions", self.key), self.inner.get_market_conditions
+        )
+
+    def get_bars(self, symbol: str, days: int = 100):
+        # Callers only read bars (indicators, last close); sharing the frame is safe.
+        return self.memo.get_or_compute(
+            ("bars", symbol.upper(), days), lambda: self.inner.get_bars(symbol, days)
+        )
+
+    def get_market_volatility(self) -> str:
+        return self.get_market_conditions().get("volatility", "unknown")
+
+    def get_market_trend(self) -> str:
+        return self.get_market_conditions().get("trend", "unknown")
+
+    def get_economic_cycle(self) -> str:
+        return self.get_market_conditions().get("economic_cycle", "unknown")
+
+    def get_market_phase(self) -> str:
+        return self.get_market_conditions().get("market_phase", "unknown")
+
+    def get_supported_indicators(self) -> Dict[str, str]:
+        return self.inner.get_supported_indicators()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+class SharedMarketSnapshot:
+    """Per-interval shared providers for the multi-account service."""
+
+    def __init__(
+        self,
+        provider_factory: Callable[..., MarketDataProvider],
+        news_provider: Optional[FinnhubNewsProvider] = None,
+        fundamentals_provider: Optional[FMPFundamentalsProvider] = None,
+    ):
+        self.memo = SingleFlightMemo()
+        self.provider_factory = provider_factory
+        self.news_provider = news_provider or FinnhubNewsProvider(memo=self.memo)
+        self.fundamentals_provider = fundamentals_provider or FMPFundamentalsProvider(
+            memo=self.memo
+        )
+        self._providers: Dict[Tuple[str, ...], SharedMarketDataProvider] = {}
+        self._lock = threading.Lock()
+
+    def market_data_provider(self, sector_etfs: List[str]) -> SharedMarketDataProvider:
+        """Provider for one sector ETF list (market conditions depend on it; bars do not)."""
+        key = tuple(s.upper() for s in sector_etfs)
+        with self._lock:
+            provider = self._providers.get(key)
+            if provider is None:
+                inner = self.provider_factory(sector_etfs=list(sector_etfs))
+                provider = self._providers[key] = SharedMarketDataProvider(inner, self.memo, key)
+            return provider
+
+    def new_interval(self) -> None:
+        """Forget memoized data; providers and their HTTP clients stay warm."""
+        self.memo.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"fetched": self.memo.misses, "shared": self.memo.hits}
@@ -1,15 +1,33 @@
-from trading_agent.orchestrator.agent import TradingAgent
-from trading_agent.orchestrator.agent_run import (
-    AgentRunMode,
-    BacktestAgentRun,
-    LiveAgentRun,
-)
-from trading_agent.orchestrator.trading_cycle import TradingCycle
+"""Trading orchestration entry points.
+
+Exports resolve lazily so lightweight commands (e.g. ``run_account_history``)
+can import ``trading_agent.orchestrator.account_history`` without loading the
+whole analysis/strategy pipeline.
+"""
+
+import importlib
 
 __all__ = [
     "AgentRunMode",
     "BacktestAgentRun",
     "LiveAgentRun",
+    "MultiAccountCycle",
     "TradingAgent",
     "TradingCycle",
 ]
+
+_EXPORTS = {
+    "AgentRunMode": "trading_agent.orchestrator.agent_run",
+    "BacktestAgentRun": "trading_agent.orchestrator.agent_run",
+    "LiveAgentRun": "trading_agent.orchestrator.agent_run",
+    "MultiAccountCycle": "trading_agent.orchestrator.multi_account",
+    "TradingAgent": "trading_agent.orchestrator.agent",
+    "TradingCycle": "trading_agent.orchestrator.trading_cycle",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
+from trading_agent.concurrency import SingleFlightMemo
+
 from trading_agent.agents.coordinator import CycleCoordinator
 from strategy_learning.knowledge import KnowledgeBase
 from trading_agent.agents.registry import AgentRegistry, build_default_registry
@@ -19,7 +21,6 @@ from trading_agent.execution import (
     TradePreparer,
 )
 from trading_agent.execution.validator import TradeValidator
-from trading_agent.market_data.alpaca_provider import AlpacaMarketDataProvider
 from trading_agent.market_data.base import MarketDataProvider
 from trading_agent.market_data.finnhub_provider import FinnhubNewsProvider
 from trading_agent.market_data.fmp_provider import FMPFundamentalsProvider
@@ -69,6 +70,7 @@ class TradingAgent:
         log_dir: Optional[Path] = None,
         universe_symbols: Optional[List[str]] = None,
         disabled: Optional[List[str]] = None,
+        indicator_memo: Optional[SingleFlightMemo] = None,
         **kwargs,
     ):
         load_dotenv()
@@ -84,7 +86,11 @@ class TradingAgent:
         self.analysis_runner = AnalysisRunner(llm_client=self.llm_client)
         self.trading_strategy = GeneralTradingStrategy(llm_client=self.llm_client)
         self.portfolio_rebalancer = PortfolioRebalancer(llm_client=self.llm_client)
-        self.market_data_provider = market_data_provider or AlpacaMarketDataProvider()
+        if market_data_provider is None:
+            from trading_agent.market_data.alpaca_provider import AlpacaMarketDataProvider
+
+            market_data_provider = AlpacaMarketDataProvider()
+        self.market_data_provider = market_data_provider
         self.news_provider = news_provider or FinnhubNewsProvider()
         self.fundamentals_provider = fundamentals_provider or FMPFundamentalsProvider()
         self.universe_symbols = [s.upper() for s in (universe_symbols or [])]
@@ -93,6 +99,7 @@ class TradingAgent:
             self.news_provider,
             self.fundamentals_provider,
             universe_symbols=self.universe_symbols,
+            indicator_memo=indicator_memo,
         )
         self.broker_client = broker_client or alpaca_client or build_broker_client()
         self.snapshot_builder = PortfolioSnapshotBuilder()
@@ -0,0 +1,166 @@
+"""Multi-account live service: one market snapshot per interval, fan-out per account.
+
+Each subdirectory of ``TRADING_ACCOUNTS_DIR`` is an account: its config files
+and knowledge base live there (KB ``user_id`` = directory name) and its cycle
+artifacts go to ``logs/accounts/<account>/``. Broker credentials default to
+the service's and can be overridden per account with
+``ALPACA_API_KEY_<ACCOUNT>`` / ``ALPACA_SECRET_KEY_<ACCOUNT>`` (account name
+upper-cased, non-alphanumerics as ``_``).
+
+Market conditions, bars, news and fundamentals are fetched once per interval
+through a ``SharedMarketSnapshot``, and indicators over the shared bars are
+computed once; strategy and execution then run for every account
+concurrently, each cycle's log lines prefixed with ``[account_id]``. A failing
+account is logged and reported without affecting the others.
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from trading_agent.concurrency import map_bounded, max_workers_from_env
+from trading_agent.config import AppConfig, get_config
+from trading_agent.market_data.shared_snapshot import SharedMarketSnapshot
+from trading_agent.orchestrator.trading_cycle import LOG_DIR, TradingCycle
+from trading_agent.storage.atomic import atomic_write_json
+from trading_agent.storage.paths import get_example_data_dir
+
+KB_FILENAME = "knowledge_base.json"
+
+
+def discover_accounts(accounts_dir: Path) -> List[str]:
+    """Account ids (subdirectory names) under ``accounts_dir``, sorted."""
+    return sorted(
+        p.name for p in Path(accounts_dir).iterdir() if p.is_dir() and not p.name.startswith(".")
+    )
+
+
+def account_config(base: AppConfig, account_id: str) -> AppConfig:
+    """``base`` with this account's broker credentials from the environment, if set."""
+    suffix = re.sub(r"[^A-Z0-9]", "_", account_id.upper())
+    return replace(
+        base,
+        alpaca_api_key=os.getenv(f"ALPACA_API_KEY_{suffix}", base.alpaca_api_key),
+        alpaca_secret_key=os.getenv(f"ALPACA_SECRET_KEY_{suffix}", base.alpaca_secret_key),
+    )
+
+
+def ensure_account_knowledge_base(data_dir: Path, account_id: str) -> None:
+    """Seed the account's KB from data.example/ stamped with its ``user_id``.
+
+    The generic seed says ``user_id: default``, which ``KnowledgeBase`` would
+    reject for any other account. Existing files are left untouched.
+    """
+    path = Path(data_dir) / KB_FILENAME
+    if path.exists():
+        return
+    with (get_example_data_dir() / KB_FILENAME).open(encoding="utf-8") as f:
+        doc = json.load(f)
+    doc["user_id"] = account_id
+    atomic_write_json(path, doc, indent=2)
+
+
+class MultiAccountCycle:
+    """Runs one ``TradingCycle`` per account against shared market data."""
+
+    def __init__(
+        self,
+        accounts_dir: Path,
+        config: Optional[AppConfig] = None,
+        log_dir: Path = LOG_DIR,
+        max_workers: Optional[int] = None,
+        snapshot: Optional[SharedMarketSnapshot] = None,
+        cycle_factory: Callable[..., TradingCycle] = TradingCycle,
+    ):
+        """
+        Args:
+            accounts_dir: Directory with one subdirectory per account
+            config: Base app config; None reads env
+            log_dir: Root for per-account artifacts (``<log_dir>/accounts/<id>``)
+            max_workers: Accounts run concurrently; None reads MULTI_ACCOUNT_MAX_WORKERS
+            snapshot: Shared market data; None builds one over Alpaca
+            cycle_factory: Builds each account's cycle (injectable for tests)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.accounts_dir = Path(accounts_dir)
+        self.config = config or get_config()
+        self.log_dir = Path(log_dir)
+        self.max_workers = max_workers or max_workers_from_env("MULTI_ACCOUNT_MAX_WORKERS")
+        if snapshot is None:
+            from trading_agent.market_data.alpaca_provider import AlpacaMarketDataProvider
+
+            snapshot = SharedMarketSnapshot(provider_factory=AlpacaMarketDataProvider)
+        self.snapshot = snapshot
+        self.cycle_factory = cycle_factory
+        self.cycles: Dict[str, TradingCycle] = {}
+        self.refresh_accounts()
+
+    def refresh_accounts(self) -> List[str]:
+        """Pick up added/removed account directories. Returns the newly added ids."""
+        account_ids = discover_accounts(self.accounts_dir)
+        for gone in set(self.cycles) - set(account_ids):
+            self.logger.info("Account %s removed", gone)
+            del self.cycles[gone]
+        added = []
+        for account_id in account_ids:
+            if account_id in self.cycles:
+                continue
+            data_dir = self.accounts_dir / account_id
+            try:
+                ensure_account_knowledge_base(data_dir, account_id)
+                self.cycles[account_id] = self.cycle_factory(
+                    account_id=account_id,
+                    data_dir=data_dir,
+                    log_dir=self.log_dir / "accounts" / account_id,
+                    config=account_config(self.config, account_id),
+                    shared_market=self.snapshot,
+                )
+            except Exception as exc:
+                # Retried on the next interval; other accounts still run.
+                self.logger.error("Account %s could not be set up: %s", account_id, exc)
+                continue
+            added.append(account_id)
+        if added:
+            self.logger.info("Accounts added: %s", ", ".join(added))
+        return added
+
+    def execute(self) -> Dict[str, Dict[str, Any]]:
+        """Run every account's cycle for this interval. Returns per-account outcomes."""
+        self.refresh_accounts()
+        self.snapshot.new_interval()
+        started = time.perf_counter()
+        account_ids = sorted(self.cycles)
+        outcomes = map_bounded(self._run_account, account_ids, max_workers=self.max_workers)
+        summary = dict(zip(account_ids, outcomes))
+
+        failed = [a for a, o in summary.items() if o["status"] != "success"]
+        self.logger.info(
+            "Multi-account interval: %d accounts, %d failed%s in %.1fs; market data %s",
+            len(summary),
+            len(failed),
+            f" ({', '.join(failed)})" if failed else "",
+            time.perf_counter() - started,
+            self.snapshot.stats(),
+        )
+        return summary
+
+    def _run_account(self, account_id: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            results = self.cycles[account_id].execute() or {}
+            outcome = {
+                "status": results.get("status", "unknown"),
+                "cycle_id": results.get("cycle_id"),
+                "artifact_path": results.get("artifact_path"),
+                "error": results.get("error"),
+            }
+        except Exception as exc:
+            self.logger.error("Account %s cycle failed: %s", account_id, exc)
+            outcome = {"status": "error", "cycle_id": None, "artifact_path": None, "error": str(exc)}
+        outcome["seconds"] = round(time.perf_counter() - started, 3)
+        return outcome
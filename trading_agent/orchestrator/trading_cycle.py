@@ -1,8 +1,9 @@
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
@@ -12,78 +13,233 @@ from trading_agent.llm.client import build_llm_client
 from trading_agent.market_data.alpaca_provider import AlpacaMarketDataProvider
 from trading_agent.models import trade_result_detail
 from trading_agent.orchestrator.agent_run import LiveAgentRun
-from trading_agent.storage import (
-    AnalysisConfigStore,
-    BrokerageConfigStore,
-    PreferencesStore,
-    RebalanceConfigStore,
-    SignalConfigStore,
-    StrategyConfigStore,
-    WatchlistStore,
-)
+from trading_agent.storage.config_bundle import ConfigBundle, ConfigBundleLoader
+from trading_agent.tracing import format_stage_totals
+
+if TYPE_CHECKING:
+    from trading_agent.config import AppConfig
+    from trading_agent.market_data.shared_snapshot import SharedMarketSnapshot
 
 LOG_DIR = Path("logs")
 
 
+class AccountLogAdapter(logging.LoggerAdapter):
+    """Prefixes messages with ``[account_id]`` so concurrent accounts' lines can be told apart."""
+
+    def process(self, msg: Any, kwargs: Any) -> Any:
+        kwargs["extra"] = {**self.extra, **(kwargs.get("extra") or {})}
+        return f"[{self.extra['account_id']}] {msg}", kwargs
+
+
 class TradingCycle:
     """Handles the execution of a single trading cycle."""
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    account_id: str = "default"
+    data_dir: Optional[Path] = None
+    log_dir: Optional[Path] = None
+    shared_market: Optional["SharedMarketSnapshot"] = None
+
+    def __init__(
+        self,
+        account_id: str = "default",
+        data_dir: Optional[Path] = None,
+        log_dir: Optional[Path] = None,
+        config: Optional["AppConfig"] = None,
+        shared_market: Optional["SharedMarketSnapshot"] = None,
+    ):
+        """
+        Args:
+            account_id: KB ``user_id`` and log label (multi-account service)
+            data_dir: Per-account config/KB directory; None uses DATA_DIR
+            log_dir: Per-account artifact directory; None uses ``logs/``
+            config: App config (per-account broker credentials); None reads env
+            shared_market: Market data shared with other accounts this interval
+        """
+        self.logger: Any = logging.getLogger(__name__)
+        if account_id != "default":
+            self.logger = AccountLogAdapter(self.logger, {"account_id": account_id})
         load_dotenv()
-        self.config = get_config()
-
-        self.preferences_store = PreferencesStore()
-        self.brokerage_config_store = BrokerageConfigStore()
-        self.analysis_config_store = AnalysisConfigStore()
-        self.strategy_config_store = StrategyConfigStore()
-        self.rebalance_config_store = RebalanceConfigStore()
-        self.signal_config_store = SignalConfigStore()
-        self.watchlist_store = WatchlistStore()
-
-        self.user_preferences = self.preferences_store.load_preferences()
-        self.brokerage_config = self.brokerage_config_store.load_config()
-        self.analysis_params = self.analysis_config_store.load()
-        self.strategy_params = self.strategy_config_store.load()
-        self.rebalance_params = self.rebalance_config_store.load()
-        self.signal_config = self.signal_config_store.load_config()
-        self.watchlist = self.watchlist_store.load_watchlist()
-
-    def initialize_components(self):
-        self.logger.info("Initializing components...")
-        self.logger.info("Config: %s", json.dumps(config_summary(self.config)))
-
-        self.logger.info("Initializing LLM client (%s, fallback=%s)...",
-                         self.config.llm_provider, self.config.llm_fallback_provider)
-        self.llm_client = build_llm_client(
-            provider=self.config.llm_provider,
-            model=self.config.llm_model,
-            fallback_provider=self.config.llm_fallback_provider,
-            fallback_model=self.config.llm_fallback_model,
-            max_retries=self.config.llm_max_retries,
+        self.config = config or get_config()
+        self.account_id = account_id
+        self.data_dir = data_dir
+        self.log_dir = log_dir
+        self.shared_market = shared_market
+
+        self.config_loader = ConfigBundleLoader(data_dir=data_dir)
+        self._apply_config(self.config_loader.load())
+        # Build key per component; see initialize_components().
+        self._component_keys: Dict[str, Any] = {}
+        # When the warm broker connection was last known good (monotonic), and
+        # whether the last cycle failed; see _health_check_due().
+        self._healthy_at: Optional[float] = None
+        self._probe_next = False
+
+    def _apply_config(self, bundle: ConfigBundle) -> None:
+        self.config_bundle = bundle
+        self.user_preferences = bundle.preferences
+        self.brokerage_config = bundle.brokerage_config
+        self.analysis_params = bundle.analysis_params
+        self.strategy_params = bundle.strategy_params
+        self.rebalance_params = bundle.rebalance_params
+        self.signal_config = bundle.signal_config
+        self.watchlist = bundle.watchlist
+
+    def refresh_config(self) -> bool:
+        """Re-read config files that changed since the last cycle. True if any did."""
+        bundle = self.config_loader.load()
+        if bundle is self.config_bundle:
+            return False
+        self.logger.info("Config files changed; now %s", bundle.config_hash())
+        self._apply_config(bundle)
+        return True
+
+    def initialize_components(self, force: bool = False) -> List[str]:
+        """Build components whose inputs changed; reuse the rest across cycles.
+
+        The LLM client depends only on app config, the market data provider on
+        the sector ETF list, the broker on brokerage config, and the agent on all
+        three plus preferences and watchlist. Returns the names that were
+        (re)built; ``force`` rebuilds everything.
+        """
+        if force:
+            self._component_keys = {}
+        built: List[str] = []
+
+        llm_key = (
+            self.config.llm_provider,
+            self.config.llm_model,
+            self.config.llm_fallback_provider,
+            self.config.llm_fallback_model,
+            self.config.llm_max_retries,
         )
+        if self._component_keys.get("llm_client") != llm_key:
+            self.logger.info("Config: %s", json.dumps(config_summary(self.config)))
+            self.logger.info("Initializing LLM client (%s, fallback=%s)...",
+                             self.config.llm_provider, self.config.llm_fallback_provider)
+            self.llm_client = build_llm_client(
+                provider=self.config.llm_provider,
+                model=self.config.llm_model,
+                fallback_provider=self.config.llm_fallback_provider,
+                fallback_model=self.config.llm_fallback_model,
+                max_retries=self.config.llm_max_retries,
+            )
+            self._component_keys["llm_client"] = llm_key
+            built.append("llm_client")
+
+        market_key = tuple(self.signal_config.sector_etfs)
+        if self._component_keys.get("market_data_provider") != market_key:
+            self.logger.info("Initializing market data provider...")
+            if self.shared_market is not None:
+                self.market_data_provider = self.shared_market.market_data_provider(
+                    self.signal_config.sector_etfs
+                )
+            else:
+                self.market_data_provider = AlpacaMarketDataProvider(
+                    sector_etfs=self.signal_config.sector_etfs,
+                )
+            self._component_keys["market_data_provider"] = market_key
+            built.append("market_data_provider")
 
-        self.logger.info("Initializing market data provider...")
-        self.market_data_provider = AlpacaMarketDataProvider(
-            sector_etfs=self.signal_config.sector_etfs,
+        broker_key = (
+            self.config.broker_provider,
+            json.dumps(self.brokerage_config.to_dict(), sort_keys=True),
         )
-
-        self.logger.info("Initializing broker client (%s)...", self.config.broker_provider)
-        self.broker_client = build_broker_client(
-            config=self.config,
-            brokerage_config=self.brokerage_config,
+        if self._component_keys.get("broker_client") != broker_key:
+            self.logger.info("Initializing broker client (%s)...", self.config.broker_provider)
+            self.broker_client = build_broker_client(
+                config=self.config,
+                brokerage_config=self.brokerage_config,
+            )
+            self._component_keys["broker_client"] = broker_key
+            self._healthy_at = time.monotonic()
+            self._probe_next = False
+            built.append("broker_client")
+
+        agent_key = (
+            id(self.llm_client),
+            id(self.market_data_provider),
+            id(self.broker_client),
+            self.user_preferences.risk_tolerance,
+            self.user_preferences.investment_goal,
+            self.user_preferences.max_position_size,
+            tuple(self.watchlist.symbols or []),
         )
+        if self._component_keys.get("agent") != agent_key:
+            self.logger.info("Creating live agent run...")
+            self.agent = LiveAgentRun(
+                risk_tolerance=self.user_preferences.risk_tolerance,
+                investment_goal=self.user_preferences.investment_goal,
+                max_position_size=self.user_preferences.max_position_size,
+                llm_client=self.llm_client,
+                market_data_provider=self.market_data_provider,
+                broker_client=self.broker_client,
+                universe_symbols=list(self.watchlist.symbols or []),
+                **self._account_agent_kwargs(),
+            )
+            self._component_keys["agent"] = agent_key
+            built.append("agent")
+
+        if built:
+            self.logger.info("Initialized components: %s", ", ".join(built))
+        else:
+            self.logger.info("Reusing warm components")
+        return built
+
+    def _account_agent_kwargs(self) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if self.shared_market is not None:
+            kwargs["news_provider"] = self.shared_market.news_provider
+            kwargs["fundamentals_provider"] = self.shared_market.fundamentals_provider
+            # Same bars for every account → compute their indicators once per interval.
+            kwargs["indicator_memo"] = self.shared_market.memo
+        if self.data_dir is not None or self.account_id != "default":
+            from strategy_learning.knowledge import KnowledgeBase
+
+            kwargs["knowledge_base"] = KnowledgeBase(
+                data_dir=self.data_dir, user_id=self.account_id
+            )
+        if self.log_dir is not None:
+            kwargs["log_dir"] = self.log_dir
+        return kwargs
 
-        self.logger.info("Creating live agent run...")
-        self.agent = LiveAgentRun(
-            risk_tolerance=self.user_preferences.risk_tolerance,
-            investment_goal=self.user_preferences.investment_goal,
-            max_position_size=self.user_preferences.max_position_size,
-            llm_client=self.llm_client,
-            market_data_provider=self.market_data_provider,
-            broker_client=self.broker_client,
-            universe_symbols=list(self.watchlist.symbols or []),
-        )
+    def invalidate_components(self) -> None:
+        """Drop warm components so the next cycle rebuilds them from scratch."""
+        self._component_keys = {}
+
+    def health_check(self) -> Dict[str, Any]:
+        """Probe the reused broker connection. ``{"ok": bool, "error": str|None}``.
+
+        Only meaningful once components exist; a failed probe is what triggers a
+        full reinitialize before the cycle runs.
+        """
+        if "broker_client" not in self._component_keys:
+            return {"ok": False, "error": "components not initialized"}
+        try:
+            self.broker_client.get_account()
+        except Exception as exc:
+            return {"ok": False, "error": f"broker: {exc}"}
+        self._healthy_at = time.monotonic()
+        self._probe_next = False
+        return {"ok": True, "error": None}
+
+    def _health_check_due(self) -> bool:
+        """Probe warm components only after a failed cycle or once the
+        connection has gone ``health_check_interval_minutes`` without being
+        known good; a cycle that raises already forces a rebuild."""
+        if self._probe_next or self._healthy_at is None:
+            return True
+        interval = self.config.health_check_interval_minutes * 60
+        return time.monotonic() - self._healthy_at >= interval
+
+    def _prepare_components(self) -> None:
+        if self._component_keys and self._health_check_due():
+            health = self.health_check()
+            if not health["ok"]:
+                self.logger.warning("Health check failed (%s); reinitializing components",
+                                    health["error"])
+                self.initialize_components(force=True)
+                return
+        self.initialize_components()
 
     def execute(self):
         cycle_start_time = datetime.now()
@@ -92,8 +248,12 @@ class TradingCycle:
         self.logger.info("=" * 80)
 
         try:
-            self.initialize_components()
+            init_started = time.perf_counter()
+            self.refresh_config()
+            self._prepare_components()
+            init_seconds = time.perf_counter() - init_started
 
+            self.logger.info("Config hash: %s", self.config_bundle.config_hash())
             self.logger.info("User preferences: %s", json.dumps(self.user_preferences.to_dict(), indent=2))
             self.logger.info("Signal config: %s", json.dumps(self.signal_config.to_dict(), indent=2))
             self.logger.info("Watchlist: %s", json.dumps(self.watchlist.to_dict(), indent=2))
@@ -108,6 +268,10 @@ class TradingCycle:
             )
 
             self.logger.info("Trading cycle completed with status: %s", results["status"])
+            if results["status"] == "success":
+                self._healthy_at = time.monotonic()
+            else:
+                self._probe_next = True
 
             if results["status"] == "success":
                 self.logger.info("Cycle ID: %s", results.get("cycle_id"))
@@ -145,6 +309,11 @@ class TradingCycle:
             self.logger.info("Start Time: %s", cycle_start_time)
             self.logger.info("End Time: %s", cycle_end_time)
             self.logger.info("Duration: %s", cycle_duration)
+            self.logger.info("Component init: %.2fs", init_seconds)
+            if results.get("timings"):
+                self.logger.info("Stage timings: %s", format_stage_totals(results["timings"]))
+            if results.get("profile_path"):
+                self.logger.info("Profile: %s", results["profile_path"])
             self.logger.info("Status: %s", results["status"])
 
             if results["status"] == "success":
@@ -191,6 +360,8 @@ class TradingCycle:
 
         except Exception as exc:
             self.logger.error("Error in trading cycle: %s", exc)
+            # Clients may be left in a bad state (dropped sessions, expired auth).
+            self.invalidate_components()
             import traceback
             self.logger.error("Traceback: %s", traceback.format_exc())
             raise
@@ -210,7 +381,7 @@ class TradingCycle:
             )
 
             thresholds = default_thresholds()
-            log_dir = LOG_DIR
+            log_dir = self.log_dir or LOG_DIR
             pending = has_pending_trigger(log_dir)
             cooling = cooldown_active(
                 log_dir,
@@ -249,6 +420,7 @@ class TradingCycle:
                 eval=evaluation,
                 log_dir=str(log_dir),
                 cycle_artifact_path=results.get("artifact_path"),
+                user_id=self.account_id,
             )
             if path:
                 self.logger.info(
@@ -1,3 +1,4 @@
+from trading_agent.scheduler.market_calendar import MarketCalendar
 from trading_agent.scheduler.scheduler import TradingScheduler
 
-__all__ = ["TradingScheduler"]
+__all__ = ["MarketCalendar", "TradingScheduler"]
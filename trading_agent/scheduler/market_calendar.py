@@ -0,0 +1,151 @@
+"""US equity market calendar for the live scheduler.
+
+Trading days follow NYSE holiday rules, corrected by the cached SPY daily bars
+(the exchange's own record of which days traded) where the cache covers a date.
+A rules trading day missing from the cache counts as closed only when the cache
+has bars for the trading days on both sides of it; a longer run of missing days
+is a gap in the cache, not a closure. Sessions are 09:30-16:00
+America/New_York, with 13:00 early closes on the usual half days.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, Iterable, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+MARKET_TZ = ZoneInfo("America/New_York")
+REGULAR_OPEN = time(9, 30)
+REGULAR_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+
+
+class MarketCalendar:
+    """Which days the market trades and when each session opens and closes."""
+
+    def __init__(self, known_trading_days: Iterable[date] = ()):
+        days = sorted(set(known_trading_days))
+        self._known: FrozenSet[date] = frozenset(days)
+        self._known_range: Optional[Tuple[date, date]] = (days[0], days[-1]) if days else None
+
+    @classmethod
+    def from_cache(cls, symbol: str = "SPY", cache_dir: Optional[Path] = None) -> "MarketCalendar":
+        """Calendar seeded from cached daily bars; rules only when no cache exists."""
+        from trading_agent.market_data.alpaca_historical import read_cached_bars
+
+        bars = read_cached_bars(symbol, cache_dir)
+        if bars is None:
+            logger.info("No cached %s bars; market calendar uses holiday rules only", symbol)
+            return cls()
+        return cls(ts.date() for ts in bars.index)
+
+    def is_trading_day(self, day: date) -> bool:
+        if day in self._known:
+            return True
+        if not _is_rules_trading_day(day):
+            return False
+        if not (self._known_range and self._known_range[0] < day < self._known_range[1]):
+            return True
+        # Unscheduled closure (e.g. a national day of mourning) vs a hole in the cache.
+        before, after = _rules_neighbour(day, -1), _rules_neighbour(day, 1)
+        return not (before in self._known and after in self._known)
+
+    def session(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """(open, close) as aware datetimes in market time, or None when closed."""
+        if not self.is_trading_day(day):
+            return None
+        close = EARLY_CLOSE if day in nyse_early_closes(day.year) else REGULAR_CLOSE
+        return (
+            datetime.combine(day, REGULAR_OPEN, tzinfo=MARKET_TZ),
+            datetime.combine(day, close, tzinfo=MARKET_TZ),
+        )
+
+    def next_trading_day(self, day: date) -> date:
+        """First trading day strictly after ``day``."""
+        nxt = day + timedelta(days=1)
+        while not self.is_trading_day(nxt):
+            nxt += timedelta(days=1)
+        return nxt
+
+
+def _is_rules_trading_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def _rules_neighbour(day: date, step: int) -> date:
+    nxt = day + timedelta(days=step)
+    while not _is_rules_trading_day(nxt):
+        nxt += timedelta(days=step)
+    return nxt
+
+
+@lru_cache(maxsize=32)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    """Full-day NYSE closures for ``year`` (weekend holidays moved to the observed day)."""
+    days = {
+        _observed(date(year, 1, 1)),
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _last_weekday(year, 5, 0),  # Memorial Day
+        _observed(date(year, 7, 4)),
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),
+    }
+    if year >= 2022:
+        days.add(_observed(date(year, 6, 19)))
+    # NYSE does not observe New Year's Day on the prior Friday (Dec 31).
+    return frozenset(d for d in days if d.year == year)
+
+
+@lru_cache(maxsize=32)
+def nyse_early_closes(year: int) -> FrozenSet[date]:
+    """13:00 closes: Jul 3, the day after Thanksgiving and Christmas Eve, when trading days."""
+    candidates = (
+        date(year, 7, 3),
+        _nth_weekday(year, 11, 3, 4) + timedelta(days=1),
+        date(year, 12, 24),
+    )
+    holidays = nyse_holidays(year)
+    return frozenset(d for d in candidates if d.weekday() < 5 and d not in holidays)
+
+
+def _observed(day: date) -> date:
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    nxt = date(year + (month == 12), month % 12 + 1, 1)
+    last = nxt - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
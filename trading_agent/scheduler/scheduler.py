@@ -1,53 +1,161 @@
-import schedule
-import time
 import logging
-from typing import Callable
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, Optional
+
+from trading_agent.scheduler.market_calendar import MARKET_TZ, MarketCalendar
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class TradingScheduler:
-    """Scheduler for running trading cycles at regular intervals."""
+    """Runs trading cycles at fixed wall-clock slots.
+
+    Without a calendar, slots are ``anchor + k * interval`` from the time
+    ``start`` is called. With a ``MarketCalendar``, slots are
+    ``open + offset + k * interval`` within each session and nothing runs
+    while the market is closed. Slots never drift with cycle runtime; a slot
+    that passes while a cycle is still running is skipped (no overlap) and
+    recorded as missed, and a cycle that starts more than ``late_after_seconds``
+    after its slot is recorded as late.
+    """
 
-    def __init__(self, interval_minutes: int = 30):
+    def __init__(
+        self,
+        interval_minutes: float = 30,
+        calendar: Optional[MarketCalendar] = None,
+        open_offset_minutes: float = 0,
+        late_after_seconds: float = 60,
+        clock: Callable[[], datetime] = _utc_now,
+        history_size: int = 200,
+    ):
         """
         Initialize the trading scheduler.
 
         Args:
             interval_minutes: Interval between trading cycles in minutes
+            calendar: Market calendar; None runs around the clock
+            open_offset_minutes: First slot of each session, minutes after the open
+            late_after_seconds: Start delay beyond which a run is recorded as late
+            clock: Returns the current aware datetime (injectable for tests)
+            history_size: Number of run/missed records kept in ``history``
         """
-        self.interval_minutes = interval_minutes
+        self.interval = timedelta(minutes=interval_minutes)
+        if self.interval <= timedelta(0):
+            raise ValueError("interval_minutes must be positive")
+        self.calendar = calendar
+        self.open_offset = timedelta(minutes=open_offset_minutes)
+        self.late_after = timedelta(seconds=late_after_seconds)
+        self.clock = clock
         self.logger = logging.getLogger(__name__)
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=history_size)
+        self._anchor: Optional[datetime] = None
+        self._stop_event = threading.Event()
         self._running = False
 
+    def next_run_time(self, after: datetime) -> Optional[datetime]:
+        """First slot at or after ``after`` (None if the calendar has no session ahead)."""
+        if self.calendar is None:
+            anchor = self._anchor or after
+            steps = -(-(after - anchor) // self.interval)  # ceil division
+            return anchor + max(steps, 0) * self.interval
+
+        day = after.astimezone(MARKET_TZ).date()
+        for _ in range(366):
+            session = self.calendar.session(day)
+            if session is not None:
+                open_at, close_at = session
+                first = open_at + self.open_offset
+                if after <= first:
+                    return first
+                steps = -(-(after - first) // self.interval)
+                slot = first + steps * self.interval
+                if slot < close_at:
+                    return slot
+            day = self.calendar.next_trading_day(day)
+        return None
+
     def start(self, trading_cycle_func: Callable):
         """
-        Start the scheduler with the given trading cycle function.
+        Run ``trading_cycle_func`` at every slot until ``stop`` is called.
 
         Args:
             trading_cycle_func: Function to execute for each trading cycle
         """
-        self.logger.info(f"Starting trading scheduler with {self.interval_minutes} minute interval")
-
-        # Schedule the trading cycle
-        schedule.every(self.interval_minutes).minutes.do(trading_cycle_func)
+        self._stop_event.clear()
+        self._running = True
+        self._anchor = self.clock()
+        self.logger.info(
+            "Starting trading scheduler: every %s%s",
+            self.interval,
+            " during market sessions" if self.calendar else "",
+        )
 
-        # Run immediately on startup
-        trading_cycle_func()
+        first = self._anchor + self.interval if self.calendar is None else self._anchor
+        slot = self.next_run_time(first)
+        while self._running and slot is not None:
+            self.logger.debug("Next trading cycle at %s", slot.isoformat())
+            if not self._sleep_until(slot):
+                break
 
-        # Keep the scheduler running
-        self._running = True
-        while self._running:
+            started = self.clock()
+            late = started - slot
+            if late > self.late_after:
+                self.logger.warning("Trading cycle for %s started %.0fs late",
+                                    slot.isoformat(), late.total_seconds())
+            status, error = "ok", None
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                trading_cycle_func()
             except KeyboardInterrupt:
                 self.logger.info("Trading scheduler stopped by user")
                 break
             except Exception as e:
-                self.logger.error(f"Error in scheduler: {str(e)}")
-                time.sleep(60)  # Wait a minute before retrying
+                status, error = "error", str(e)
+                self.logger.error(f"Error in scheduled trading cycle: {str(e)}")
+            finished = self.clock()
+            self._record(slot, status, started=started, finished=finished, error=error)
+
+            slot = self.next_run_time(slot + self.interval)
+            # Slots that passed while the cycle ran are skipped, not run back-to-back.
+            while slot is not None and slot < finished - self.late_after:
+                self._record(slot, "missed", error="previous cycle still running")
+                self.logger.warning("Skipped trading cycle for %s (previous cycle overran)",
+                                    slot.isoformat())
+                slot = self.next_run_time(slot + self.interval)
+        self._running = False
+
+    def _sleep_until(self, when: datetime) -> bool:
+        """Block until ``when``; False if stopped first. Re-reads the clock at least hourly."""
+        while True:
+            remaining = (when - self.clock()).total_seconds()
+            if remaining <= 0:
+                return True
+            if self._stop_event.wait(min(remaining, 3600)):
+                return False
+
+    def _record(
+        self,
+        slot: datetime,
+        status: str,
+        started: Optional[datetime] = None,
+        finished: Optional[datetime] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        self.history.append({
+            "scheduled": slot.isoformat(),
+            "status": status,
+            "started": started.isoformat() if started else None,
+            "finished": finished.isoformat() if finished else None,
+            "late_seconds": round((started - slot).total_seconds(), 3) if started else None,
+            "late": bool(started and started - slot > self.late_after),
+            "error": error,
+        })
 
     def stop(self):
-        """Stop the scheduler."""
+        """Stop the scheduler (wakes it if it is sleeping until the next slot)."""
         self.logger.info("Stopping trading scheduler")
         self._running = False
-        schedule.clear()  # Clear all scheduled jobs
+        self._stop_event.set()
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from trading_agent.concurrency import SingleFlightMemo, run_concurrently
 from trading_agent.domain.portfolio.portfolio_snapshot import PortfolioSnapshot
 from trading_agent.domain.signals.market_conditions import MarketConditions
 from trading_agent.domain.signals.market_signals import (
@@ -24,6 +25,7 @@ from trading_agent.signals.sources import (
     SignalCollectionContext,
     summarize_sector_rotation,
 )
+from trading_agent.tracing import span
 
 
 class SignalAggregator:
@@ -35,11 +37,17 @@ class SignalAggregator:
         news_provider: Optional[NewsDataProvider] = None,
         fundamentals_provider: Optional[FundamentalDataProvider] = None,
         universe_symbols: Optional[List[str]] = None,
+        concurrent: bool = True,
+        indicator_memo: Optional[SingleFlightMemo] = None,
     ):
         self.market_data_provider = market_data_provider
         self.news_provider = news_provider or FinnhubNewsProvider()
         self.fundamentals_provider = fundamentals_provider or FMPFundamentalsProvider()
         self.universe_symbols = [s.upper() for s in (universe_symbols or [])]
+        # Technical bars, news and fundamentals are independent I/O; overlap them.
+        self.concurrent = concurrent
+        # Shared with other aggregators reading the same bars (sweep candidates).
+        self.indicator_memo = indicator_memo
 
     def collect(
         self,
@@ -53,7 +61,17 @@ class SignalAggregator:
             portfolio,
             universe_symbols=universe,
         )
-        technical_indicators = self._collect_technical_indicators(ctx)
+        fetched = run_concurrently(
+            {
+                "technical": lambda: self._timed_technical(ctx),
+                "news": lambda: self._timed_news(ctx.symbols),
+                "fundamentals": lambda: self._timed_fundamentals(ctx.symbols),
+            },
+            max_workers=None if self.concurrent else 1,
+        )
+        technical_indicators = fetched["technical"]
+        news, sentiment_summary = fetched["news"]
+        fundamentals_data = fetched["fundamentals"]
         sector_summary = summarize_sector_rotation(market_conditions.sector_etfs)
 
         market_summary_parts = [
@@ -62,9 +80,6 @@ class SignalAggregator:
         if sector_summary:
             market_summary_parts.append(sector_summary)
 
-        news = self.news_provider.get_news(ctx.symbols)
-        fundamentals_data = self.fundamentals_provider.get_fundamentals(ctx.symbols)
-
         return MarketSignals(
             market_data=MarketDataSignals(
                 indices=market_conditions.indices,
@@ -77,7 +92,7 @@ class SignalAggregator:
             ),
             news=NewsSignals(
                 headlines=news.get("headlines", []),
-                sentiment_summary=self.news_provider.get_sentiment_summary(ctx.symbols),
+                sentiment_summary=sentiment_summary,
             ),
             fundamentals=FundamentalSignals(
                 metrics=fundamentals_data.get("metrics") or {},
@@ -87,6 +102,21 @@ class SignalAggregator:
             ),
         )
 
+    def _timed_technical(self, ctx: SignalCollectionContext) -> dict:
+        with span("signals.technical", symbols=len(ctx.symbols)):
+            return self._collect_technical_indicators(ctx)
+
+    def _timed_news(self, symbols: List[str]) -> Tuple[Dict[str, Any], str]:
+        with span("signals.news", symbols=len(symbols)):
+            news = self.news_provider.get_news(symbols)
+        with span("signals.sentiment"):
+            sentiment_summary = self.news_provider.summarize_sentiment(news, symbols)
+        return news, sentiment_summary
+
+    def _timed_fundamentals(self, symbols: List[str]) -> Dict[str, Any]:
+        with span("signals.fundamentals", symbols=len(symbols)):
+            return self.fundamentals_provider.get_fundamentals(symbols)
+
     def _collect_technical_indicators(self, ctx: SignalCollectionContext) -> dict:
         symbols = ["SPY"] + [s for s in ctx.symbols if s != "SPY"]
         indicators = {}
@@ -98,12 +128,19 @@ class SignalAggregator:
                 bars = self.market_data_provider.get_bars(symbol, BAR_LOOKBACK_DAYS)
                 ctx.bar_cache[symbol] = bars
 
-            computed = compute_indicators_for_bars(bars)
+            computed = self._indicators_for_bars(symbol, bars)
             if computed:
                 indicators[symbol] = computed
 
         return indicators
 
+    def _indicators_for_bars(self, symbol: str, bars) -> Dict[str, Any]:
+        if self.indicator_memo is None or bars is None or bars.empty or "close" not in bars.columns:
+            return compute_indicators_for_bars(bars)
+        key = ("indicators", symbol, len(bars), bars.index[0], bars.index[-1],
+               float(bars["close"].iloc[-1]))
+        return dict(self.indicator_memo.get_or_compute(key, lambda: compute_indicators_for_bars(bars)))
+
     @staticmethod
     def market_conditions_from_dict(data: dict) -> MarketConditions:
         ts = data.get("timestamp")
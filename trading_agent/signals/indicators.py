@@ -90,6 +90,38 @@ def compute_indicators_for_bars(bars: pd.DataFrame) -> Dict[str, Any]:
     return result
 
 
+def compute_indicator_series(bars: pd.DataFrame) -> pd.DataFrame:
+    """Per-bar close, RSI-14, SMA-20/50 and MACD histogram over the whole history.
+
+    Same formulas as ``compute_indicators_for_bars``, evaluated once for every
+    date; all are causal, so a row only depends on bars up to its date.
+    """
+    if bars is None or bars.empty or "close" not in bars.columns:
+        return pd.DataFrame(columns=["close", "rsi_14", "sma_20", "sma_50", "macd_histogram"])
+
+    close = bars["close"].astype(float)
+    delta = close.diff()
+    avg_gain = delta.clip(lower=0).rolling(window=14).mean()
+    avg_loss = (-delta.clip(upper=0)).rolling(window=14).mean()
+    rsi = 100 - (100 / (1 + avg_gain / avg_loss.replace(0, np.nan)))
+    rsi = rsi.mask(rsi.isna() & (avg_loss == 0) & (avg_gain > 0), 100.0)
+
+    macd_line = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    histogram = macd_line - macd_line.ewm(span=9, adjust=False).mean()
+    histogram.iloc[: 26 + 9 - 1] = np.nan  # same warm-up as compute_macd
+
+    return pd.DataFrame(
+        {
+            "close": close,
+            "rsi_14": rsi,
+            "sma_20": close.rolling(window=20).mean(),
+            "sma_50": close.rolling(window=50).mean(),
+            "macd_histogram": histogram,
+        },
+        index=bars.index,
+    )
+
+
 def summarize_technical_indicators(indicators: Dict[str, Any]) -> str:
     """Build a human-readable summary from per-symbol indicator dicts."""
     if not indicators:
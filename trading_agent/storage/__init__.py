@@ -1,6 +1,9 @@
 from .brokerage_config_store import BrokerageConfigStore
 from .analysis_config_store import AnalysisConfigStore
+from .atomic import atomic_write_json, atomic_write_text
 from .base import JsonFileStore
+from .config_bundle import ConfigBundle, ConfigBundleLoader, load_config_bundle
+from .locking import file_lock
 from .paths import get_cache_dir, get_data_dir, get_example_data_dir, get_repo_root
 from .preferences_store import PreferencesStore
 from .rebalance_config_store import RebalanceConfigStore
@@ -10,14 +13,20 @@ from .watchlist_store import WatchlistStore
 
 __all__ = [
     "BrokerageConfigStore",
+    "ConfigBundle",
+    "ConfigBundleLoader",
     "JsonFileStore",
     "PreferencesStore",
     "RebalanceConfigStore",
     "SignalConfigStore",
     "StrategyConfigStore",
     "WatchlistStore",
+    "atomic_write_json",
+    "atomic_write_text",
+    "file_lock",
     "get_cache_dir",
     "get_data_dir",
     "get_example_data_dir",
     "get_repo_root",
+    "load_config_bundle",
 ]
@@ -0,0 +1,56 @@
+"""Crash- and concurrency-safe file replacement (write temp, fsync, rename)."""
+
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+# Process umask, read once (os.umask can only be read by setting it, which
+# would race with other threads creating files).
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_text(path: Path, text: str, fsync: bool = True) -> None:
+    """Replace ``path`` with ``text`` so readers see the old or new file, never a partial one.
+
+    The temp file lives in the target directory so ``os.replace`` is a
+    same-filesystem rename (atomic on POSIX and Windows). ``mkstemp`` creates
+    it 0600, so it gets the existing file's mode (or ``0666 & ~umask`` for a
+    new file) before the rename.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        os.chmod(tmp_name, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(
+    path: Path,
+    data: Any,
+    indent: Optional[int] = 2,
+    fsync: bool = True,
+) -> None:
+    """Atomically write ``data`` as JSON; ``indent=None`` writes compact JSON."""
+    separators = (",", ":") if indent is None else None
+    text = json.dumps(data, indent=indent, separators=separators)
+    atomic_write_text(path, text + "\n", fsync=fsync)
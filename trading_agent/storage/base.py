@@ -1,24 +1,34 @@
 import json
 import logging
-import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
+from .atomic import atomic_write_json, atomic_write_text
+from .locking import file_lock
 from .paths import get_data_dir, get_example_data_dir
 
 logger = logging.getLogger(__name__)
 
 
 class JsonFileStore:
-    """Read/write a single JSON file; seeds from data.example/ when missing."""
+    """Read/write a single JSON file; seeds from data.example/ when missing.
+
+    Saves are atomic (temp file + rename), so readers never see a partial
+    document. Wrap read-modify-write sequences in ``locked()`` (or use
+    ``update()``) when other threads or processes may write the same file.
+    ``compact=True`` drops indentation for large machine-owned files.
+    """
 
     def __init__(
         self,
         filename: str,
         data_dir: Optional[Path] = None,
         example_dir: Optional[Path] = None,
+        compact: bool = False,
     ):
         self.filename = filename
+        self.compact = compact
         self.data_dir = data_dir or get_data_dir()
         self.example_dir = example_dir or get_example_data_dir()
         self.path = self.data_dir / filename
@@ -33,19 +43,40 @@ class JsonFileStore:
         return data
 
     def save(self, data: Dict[str, Any]) -> None:
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")
+        atomic_write_json(self.path, data, indent=None if self.compact else 2)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Exclusive advisory lock on this file for a read-modify-write block."""
+        with file_lock(self.path):
+            yield
+
+    def update(self, mutate: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """Load, apply ``mutate``, and save under the file lock; returns the saved data."""
+        with self.locked():
+            data = mutate(self.load())
+            self.save(data)
+            return data
+
+    def signature(self) -> Optional[Tuple[int, int, int]]:
+        """(mtime_ns, size, inode) of the file, or None if missing; changes on every rewrite."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
 
     def ensure_exists(self) -> None:
         if self.path.exists():
             return
 
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        if self.example_path.exists():
-            shutil.copy2(self.example_path, self.path)
-            logger.info("Seeded %s from %s", self.path, self.example_path)
-        else:
-            self.save({})
-            logger.warning("Created empty %s (no example at %s)", self.path, self.example_path)
+        with self.locked():
+            # Re-check: another writer may have seeded it while we waited.
+            if self.path.exists():
+                return
+            if self.example_path.exists():
+                atomic_write_text(self.path, self.example_path.read_text(encoding="utf-8"))
+                logger.info("Seeded %s from %s", self.path, self.example_path)
+            else:
+                self.save({})
+                logger.warning("Created empty %s (no example at %s)", self.path, self.example_path)
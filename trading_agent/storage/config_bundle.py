@@ -0,0 +1,153 @@
+"""All user config files loaded in one pass, cached until a file changes.
+
+``ConfigBundleLoader.load()`` stats the seven config files and re-reads only
+the ones whose (mtime, size, inode) signature moved, so a long-running
+service can call it every cycle and pick up promotions or operator edits
+without re-parsing unchanged files. ``load_config_bundle()`` shares one loader
+per data directory across the process.
+"""
+
+import copy
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from strategy_learning.knowledge.records import config_hash
+from trading_agent.domain.user.brokerage_config import BrokerageConfig
+from trading_agent.domain.user.signal_config import SignalConfig
+from trading_agent.domain.user.user_preferences import UserPreferences
+from trading_agent.domain.user.watchlist import Watchlist
+
+from .base import JsonFileStore
+from .paths import get_data_dir, get_example_data_dir
+
+CONFIG_FILES = {
+    "preferences": "preferences.json",
+    "brokerage_config": "brokerage_config.json",
+    "analysis_params": "analysis_params.json",
+    "strategy_params": "strategy_params.json",
+    "rebalance_params": "rebalance_params.json",
+    "signal_config": "signal_config.json",
+    "watchlist": "watchlist.json",
+}
+
+Signature = Optional[Tuple[int, int, int]]
+
+
+@dataclass(frozen=True)
+class ConfigBundle:
+    """Immutable view of every config file. Accessors return fresh copies."""
+
+    raw: Dict[str, Dict[str, Any]]
+    signatures: Dict[str, Signature]
+
+    @property
+    def preferences(self) -> UserPreferences:
+        return UserPreferences.from_dict(self.raw["preferences"])
+
+    @property
+    def brokerage_config(self) -> BrokerageConfig:
+        return BrokerageConfig.from_dict(self.raw["brokerage_config"])
+
+    @property
+    def signal_config(self) -> SignalConfig:
+        return SignalConfig.from_dict(self.raw["signal_config"])
+
+    @property
+    def watchlist(self) -> Watchlist:
+        return Watchlist.from_dict(self.raw["watchlist"])
+
+    @property
+    def analysis_params(self) -> Dict[str, Any]:
+        return copy.deepcopy(self.raw["analysis_params"])
+
+    @property
+    def strategy_params(self) -> Dict[str, Any]:
+        return copy.deepcopy(self.raw["strategy_params"])
+
+    @property
+    def rebalance_params(self) -> Dict[str, Any]:
+        return copy.deepcopy(self.raw["rebalance_params"])
+
+    def active_snapshot(self) -> Dict[str, Any]:
+        """The promotion-scoped config (what recommendations may change)."""
+        return {
+            "strategy_params": self.strategy_params,
+            "preferences": self.preferences.to_dict(),
+            "rebalance_params": self.rebalance_params,
+        }
+
+    def config_hash(self) -> str:
+        """Hash of ``active_snapshot()``; matches KB ``config_hash`` fields."""
+        return config_hash(self.active_snapshot())
+
+    def content_hash(self) -> str:
+        """Hash over all seven files' contents."""
+        return config_hash(self.raw)
+
+
+class ConfigBundleLoader:
+    """Loads a ``ConfigBundle`` and reuses it while no config file has changed."""
+
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        example_dir: Optional[Path] = None,
+    ):
+        self._stores = {
+            name: JsonFileStore(filename, data_dir=data_dir, example_dir=example_dir)
+            for name, filename in CONFIG_FILES.items()
+        }
+        self._bundle: Optional[ConfigBundle] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ConfigBundle:
+        with self._lock:
+            current = self._bundle
+            signatures = {name: store.signature() for name, store in self._stores.items()}
+            if current is not None and signatures == current.signatures:
+                return current
+
+            raw = dict(current.raw) if current is not None else {}
+            for name, store in self._stores.items():
+                if current is not None and signatures[name] == current.signatures.get(name):
+                    continue
+                if signatures[name] is None:
+                    store.ensure_exists()
+                    signatures[name] = store.signature()
+                # Signature taken before the read: a write in between just
+                # triggers one more reload next time.
+                raw[name] = store.load()
+            self._bundle = ConfigBundle(raw=raw, signatures=signatures)
+            return self._bundle
+
+    def changed(self) -> bool:
+        """True if any file differs from the last loaded bundle."""
+        with self._lock:
+            if self._bundle is None:
+                return True
+            return any(
+                store.signature() != self._bundle.signatures.get(name)
+                for name, store in self._stores.items()
+            )
+
+
+_loaders: Dict[Tuple[str, str], ConfigBundleLoader] = {}
+_loaders_lock = threading.Lock()
+
+
+def load_config_bundle(
+    data_dir: Optional[Path] = None,
+    example_dir: Optional[Path] = None,
+) -> ConfigBundle:
+    """Current bundle from the process-wide loader for these directories."""
+    data_dir = data_dir or get_data_dir()
+    example_dir = example_dir or get_example_data_dir()
+    key = (str(data_dir), str(example_dir))
+    with _loaders_lock:
+        loader = _loaders.get(key)
+        if loader is None:
+            loader = ConfigBundleLoader(data_dir=data_dir, example_dir=example_dir)
+            _loaders[key] = loader
+    return loader.load()
@@ -0,0 +1,70 @@
+"""Advisory inter-process file locks for read-modify-write on shared data files."""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+# Fallback when fcntl is unavailable: serialize threads in this process only.
+_process_locks: Dict[str, threading.RLock] = {}
+_process_locks_guard = threading.Lock()
+
+
+def lock_path_for(path: Path) -> Path:
+    path = Path(path)
+    return path.with_name(f"{path.name}.lock")
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``<path>.lock`` for the block.
+
+    Blocks until other holders (threads or processes) release it. Re-entrant
+    within a thread, so a locked method may call another locked method.
+    Readers do not need the lock: writers replace files atomically.
+    """
+    lock_path = lock_path_for(path)
+    key = str(lock_path.resolve())
+    held: Dict[str, int] = getattr(_local, "held", None) or {}
+    _local.held = held
+    if held.get(key):
+        held[key] += 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        with _process_locks_guard:
+            rlock = _process_locks.setdefault(key, threading.RLock())
+        with rlock:
+            held[key] = 1
+            try:
+                yield
+            finally:
+                held.pop(key, None)
+        return
+
+    fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        held[key] = 1
+        try:
+            yield
+        finally:
+            held.pop(key, None)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
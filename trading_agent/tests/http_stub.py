@@ -0,0 +1,127 @@
+"""Local HTTP stub for provider tests (no network, no API keys)."""
+
+from __future__ import annotations
+
+import gzip as gzip_lib
+import hashlib
+import json
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Union
+
+Route = Union[Any, Callable[[Dict[str, str]], Any]]
+
+
+class StubHTTPServer:
+    """Serve JSON by path on 127.0.0.1; record requests and peak concurrency.
+
+    ``routes`` maps a URL path (e.g. ``/api/v1/news``) to a JSON-serializable
+    payload or a callable taking the flattened query dict. Unknown paths 404.
+    Speaks HTTP/1.1 keep-alive; ``gzip`` compresses when the client accepts
+    it and ``etag`` answers matching ``If-None-Match`` with 304.
+    ``corrupt_gzip`` sends a truncated gzip body (still labelled gzip).
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, Route],
+        delay: float = 0.0,
+        gzip: bool = False,
+        etag: bool = False,
+        corrupt_gzip: bool = False,
+    ):
+        self.routes = routes
+        self.delay = delay
+        self.gzip = gzip
+        self.etag = etag
+        self.corrupt_gzip = corrupt_gzip
+        self.requests: List[Dict[str, Any]] = []
+        self.connections: set = set()
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubHTTPServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                parsed = urllib.parse.urlparse(self.path)
+                query = {k: v[-1] for k, v in urllib.parse.parse_qs(parsed.query).items()}
+                with stub._lock:
+                    stub._in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub._in_flight)
+                    stub.connections.add(self.client_address)
+                    stub.requests.append({
+                        "path": parsed.path,
+                        "query": query,
+                        "headers": {k.lower(): v for k, v in self.headers.items()},
+                        "connection": self.client_address,
+                    })
+                try:
+                    if stub.delay:
+                        time.sleep(stub.delay)
+                    route = stub.routes.get(parsed.path)
+                    if route is None:
+                        self.send_error(404)
+                        return
+                    payload = route(query) if callable(route) else route
+                    body = json.dumps(payload).encode()
+                    tag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                    if stub.etag and self.headers.get("If-None-Match") == tag:
+                        self.send_response(304)
+                        self.send_header("ETag", tag)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    encoding = None
+                    if stub.gzip and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                        body = gzip_lib.compress(body)
+                        encoding = "gzip"
+                    if stub.corrupt_gzip:
+                        body = gzip_lib.compress(body)[:-12]
+                        encoding = "gzip"
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    if encoding:
+                        self.send_header("Content-Encoding", encoding)
+                    if stub.etag:
+                        self.send_header("ETag", tag)
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return [r["path"] for r in self.requests]
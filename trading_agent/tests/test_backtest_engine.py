@@ -1,12 +1,17 @@
 """End-to-end backtest engine tests with fixture bars and mock LLM."""
 
+import pickle
 import tempfile
+import threading
+import time
 import unittest
-from datetime import date
+from dataclasses import replace
+from datetime import date, timedelta
 from pathlib import Path
 
 import pandas as pd
 
+from trading_agent.backtest.data_context import BacktestDataContext
 from trading_agent.backtest.engine import BacktestEngine, select_rebalance_dates
 from trading_agent.backtest.models import BacktestConfig
 from trading_agent.llm.mock_client import MockLLMClient
@@ -33,6 +38,42 @@ def _write_fixture_bars(cache_dir: Path, symbols, start="2024-01-01", periods=80
     return [d.date() for d in dates]
 
 
+class _SlowMockLLM(MockLLMClient):
+    """Records how many candidates' LLM calls overlap."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+
+    def generate_response(self, prompt, context=None):
+        with self._lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        try:
+            time.sleep(0.01)
+            return super().generate_response(prompt, context)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+class _CountingMockLLM(MockLLMClient):
+    """Counts LLM calls; raises KeyboardInterrupt (a crash) on call ``interrupt_at``."""
+
+    def __init__(self, interrupt_at=None):
+        super().__init__()
+        self.calls = 0
+        self.interrupt_at = interrupt_at
+
+    def generate_response(self, prompt, context=None):
+        self.calls += 1
+        if self.calls == self.interrupt_at:
+            raise KeyboardInterrupt
+        return super().generate_response(prompt, context)
+
+
 class TestBacktestEngine(unittest.TestCase):
     def test_select_rebalance_dates_weekly(self):
         days = [date(2024, 1, d) for d in range(1, 15) if date(2024, 1, d).weekday() < 5]
@@ -44,36 +85,7 @@ class TestBacktestEngine(unittest.TestCase):
 
     def test_engine_run_with_mock_llm(self):
         with tempfile.TemporaryDirectory() as tmp:
-            alpaca_cache = Path(tmp) / "alpaca"
-            finnhub_cache = Path(tmp) / "finnhub"
-            alpaca_cache.mkdir()
-            finnhub_cache.mkdir()
-            days = _write_fixture_bars(
-                alpaca_cache,
-                ["SPY", "QQQ", "AGG", "AAPL", "XLK"],
-            )
-
-            config = BacktestConfig(
-                start=days[50],
-                end=days[-1],
-                initial_cash=100_000,
-                rebalance_frequency="weekly",
-                run_label="mock-test",
-                symbols=["AAPL"],
-                analysis_params={"time_horizon": "short_term"},
-                strategy_params={"risk_management": "standard"},
-                rebalance_params={"threshold": 0.05},
-                preferences={
-                    "risk_tolerance": "moderate",
-                    "investment_goal": "growth",
-                    "max_position_size": 0.2,
-                },
-                signal_config={"sector_etfs": ["XLK"]},
-                alpaca_cache_dir=str(alpaca_cache),
-                finnhub_cache_dir=str(finnhub_cache),
-                llm_provider="mock",
-            )
-
+            config = self._fixture_config(tmp)
             engine = BacktestEngine(
                 llm_client=MockLLMClient(),
                 skip_data_fetch=True,
@@ -85,6 +97,205 @@ class TestBacktestEngine(unittest.TestCase):
             self.assertTrue(any(b["name"].startswith("SPY") for b in result.benchmarks))
             self.assertGreater(len(result.cycle_summaries), 0)
 
+    def test_shared_data_context_matches_independent_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = self._fixture_config(tmp)
+            solo = BacktestEngine(llm_client=MockLLMClient(), skip_data_fetch=True).run(config)
+
+            context = BacktestDataContext()
+            runs = [
+                BacktestEngine(
+                    llm_client=MockLLMClient(), skip_data_fetch=True, data_context=context
+                ).run(config)
+                for _ in range(2)
+            ]
+            for run in runs:
+                self.assertEqual(run.status, "success", run.error)
+                self.assertEqual(run.equity_curve, solo.equity_curve)
+                self.assertEqual(run.metrics, solo.metrics)
+                self.assertEqual(run.benchmarks, solo.benchmarks)
+            stats = context.stats()
+            # The second run is served entirely from the first run's results.
+            self.assertGreater(stats["shared"], stats["computed"])
+
+    def test_data_context_unpickles_to_live_instance(self):
+        context = BacktestDataContext()
+        self.assertIs(pickle.loads(pickle.dumps(context)), context)
+
+    def test_run_many_lockstep_matches_individual_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = self._fixture_config(tmp)
+            configs = [
+                base,
+                replace(
+                    base,
+                    run_label="aggressive",
+                    preferences={**base.preferences, "max_position_size": 0.5},
+                ),
+            ]
+            solo = [
+                BacktestEngine(llm_client=MockLLMClient(), skip_data_fetch=True).run(c)
+                for c in configs
+            ]
+            llm = _SlowMockLLM()
+            batch = BacktestEngine(llm_client=llm, skip_data_fetch=True).run_many(
+                configs, max_workers=2
+            )
+            self.assertEqual([r.status for r in batch], ["success", "success"])
+            for got, want in zip(batch, solo):
+                self.assertEqual(got.equity_curve, want.equity_curve)
+                self.assertEqual(got.metrics, want.metrics)
+            self.assertEqual(batch[1].config["run_label"], "aggressive")
+            self.assertEqual(llm.peak, 2)
+
+    def test_run_many_requires_one_period(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = self._fixture_config(tmp)
+            with self.assertRaises(ValueError):
+                BacktestEngine(skip_data_fetch=True).run_many(
+                    [base, replace(base, end=base.start)]
+                )
+
+    def test_checkpoint_resumes_interrupted_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = self._fixture_config(tmp)
+            full_llm = _CountingMockLLM()
+            full = BacktestEngine(llm_client=full_llm, skip_data_fetch=True).run(config)
+            per_cycle = full_llm.calls // len(full.cycle_summaries)
+
+            checkpoints = Path(tmp) / "checkpoints"
+            with self.assertRaises(KeyboardInterrupt):
+                BacktestEngine(
+                    llm_client=_CountingMockLLM(interrupt_at=2 * per_cycle + 1),
+                    skip_data_fetch=True,
+                    checkpoint_dir=checkpoints,
+                ).run(config)
+
+            llm = _CountingMockLLM()
+            resumed = BacktestEngine(
+                llm_client=llm, skip_data_fetch=True, checkpoint_dir=checkpoints
+            ).run(replace(config, run_label="retry"))
+            self.assertEqual(resumed.status, "success", resumed.error)
+            self.assertEqual(llm.calls, full_llm.calls - 2 * per_cycle)
+            self.assertEqual(resumed.equity_curve, full.equity_curve)
+            self.assertEqual(resumed.trade_log, full.trade_log)
+            self.assertEqual(len(resumed.cycle_summaries), len(full.cycle_summaries))
+            self.assertEqual(resumed.metrics["sharpe"], full.metrics["sharpe"])
+            self.assertTrue(any(n.startswith("Resumed from checkpoint") for n in resumed.notes))
+
+    def test_longer_run_continues_from_shorter_runs_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = self._fixture_config(tmp)
+            full_llm = _CountingMockLLM()
+            full = BacktestEngine(llm_client=full_llm, skip_data_fetch=True).run(config)
+            # A week-end prefix, so its last rebalance date is one of the full run's.
+            prefix_end = next(
+                config.start + timedelta(days=d) for d in range(10, 17)
+                if (config.start + timedelta(days=d)).weekday() == 4
+            )
+            prefix = replace(config, end=prefix_end, run_label="rung1")
+
+            checkpoints = Path(tmp) / "checkpoints"
+            prefix_llm = _CountingMockLLM()
+            short = BacktestEngine(
+                llm_client=prefix_llm, skip_data_fetch=True, checkpoint_dir=checkpoints
+            ).run(prefix)
+            llm = _CountingMockLLM()
+            longer = BacktestEngine(
+                llm_client=llm, skip_data_fetch=True, checkpoint_dir=checkpoints
+            ).run(config)
+
+            self.assertEqual(longer.status, "success", longer.error)
+            self.assertEqual(llm.calls, full_llm.calls - prefix_llm.calls)
+            self.assertEqual(longer.equity_curve, full.equity_curve)
+            self.assertNotEqual(longer.run_id, short.run_id)
+            self.assertTrue(any(n.startswith("Continued from the run to") for n in longer.notes))
+
+            # A shorter run starts over and leaves the longer checkpoint in place.
+            again = _CountingMockLLM()
+            BacktestEngine(
+                llm_client=again, skip_data_fetch=True, checkpoint_dir=checkpoints
+            ).run(prefix)
+            self.assertEqual(again.calls, prefix_llm.calls)
+            final = _CountingMockLLM()
+            BacktestEngine(llm_client=final, skip_data_fetch=True, checkpoint_dir=checkpoints).run(config)
+            self.assertEqual(final.calls, 0)
+
+    def test_reuse_llm_responses_answers_repeated_prompts_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = replace(self._fixture_config(tmp), reuse_llm_responses=True)
+            context = BacktestDataContext()
+            llm = _CountingMockLLM()
+            first = BacktestEngine(llm_client=llm, skip_data_fetch=True, data_context=context).run(config)
+            calls = llm.calls
+            second = BacktestEngine(llm_client=llm, skip_data_fetch=True, data_context=context).run(config)
+        self.assertEqual(first.status, "success", first.error)
+        self.assertGreater(calls, 0)
+        # Same dates and portfolio path → every prompt was seen by the first run.
+        self.assertEqual(llm.calls, calls)
+        self.assertEqual(second.equity_curve, first.equity_curve)
+        self.assertIn(f"LLM responses reused from earlier runs: {calls}/{calls}", second.notes)
+
+    def test_rules_policy_trades_without_llm(self):
+        class _NoLLM(MockLLMClient):
+            def generate_response(self, prompt, context=None):
+                raise AssertionError("rules policy must not call the LLM")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            config = replace(self._fixture_config(tmp), decision_policy="rules")
+            runs = [
+                BacktestEngine(llm_client=_NoLLM(), skip_data_fetch=True).run(config)
+                for _ in range(2)
+            ]
+        for run in runs:
+            self.assertEqual(run.status, "success", run.error)
+            self.assertIn("Rules surrogate", run.metrics["name"])
+        self.assertEqual(runs[0].equity_curve, runs[1].equity_curve)
+        trades = [
+            t for c in runs[0].cycle_summaries for t in c["executed_trades"] if t["status"] == "executed"
+        ]
+        # Steady uptrend: close above SMA-20 and MACD positive → buy AAPL.
+        self.assertEqual(trades[0]["action"], "BUY")
+        self.assertEqual(trades[0]["symbol"], "AAPL")
+
+    def test_unknown_decision_policy_fails_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = replace(self._fixture_config(tmp), decision_policy="oracle")
+            run = BacktestEngine(skip_data_fetch=True).run(config)
+        self.assertEqual(run.status, "failed")
+        self.assertIn("decision_policy", run.error)
+
+    def _fixture_config(self, tmp: str) -> BacktestConfig:
+        alpaca_cache = Path(tmp) / "alpaca"
+        finnhub_cache = Path(tmp) / "finnhub"
+        alpaca_cache.mkdir()
+        finnhub_cache.mkdir()
+        days = _write_fixture_bars(
+            alpaca_cache,
+            ["SPY", "QQQ", "AGG", "AAPL", "XLK"],
+        )
+
+        return BacktestConfig(
+            start=days[50],
+            end=days[-1],
+            initial_cash=100_000,
+            rebalance_frequency="weekly",
+            run_label="mock-test",
+            symbols=["AAPL"],
+            analysis_params={"time_horizon": "short_term"},
+            strategy_params={"risk_management": "standard"},
+            rebalance_params={"threshold": 0.05},
+            preferences={
+                "risk_tolerance": "moderate",
+                "investment_goal": "growth",
+                "max_position_size": 0.2,
+            },
+            signal_config={"sector_etfs": ["XLK"]},
+            alpaca_cache_dir=str(alpaca_cache),
+            finnhub_cache_dir=str(finnhub_cache),
+            llm_provider="mock",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,54 @@
+"""Rule-based surrogate policy: indicator votes and target weights."""
+
+import math
+import unittest
+
+from trading_agent.backtest.surrogate import score_symbol, target_weights
+
+_BULLISH = {"close": 110.0, "rsi_14": 55.0, "sma_20": 105.0, "sma_50": 100.0, "macd_histogram": 0.4}
+
+
+class TestScoreSymbol(unittest.TestCase):
+    def test_timeframe_picks_votes(self):
+        self.assertEqual(score_symbol(_BULLISH, "short-term"), 1.0)
+        self.assertEqual(score_symbol(_BULLISH, "long-term"), 1.0)
+        # RSI 55 is neutral, MACD bullish.
+        self.assertEqual(score_symbol(_BULLISH, "immediate"), 0.5)
+        oversold = dict(_BULLISH, rsi_14=25.0, macd_histogram=-0.1)
+        self.assertEqual(score_symbol(oversold, "immediate"), 0.0)
+
+    def test_warm_up_values_are_skipped(self):
+        row = dict(_BULLISH, sma_50=math.nan, macd_histogram=math.nan)
+        self.assertEqual(score_symbol(row, "short-term"), 1.0)
+        self.assertIsNone(score_symbol(row, "long-term"))
+
+
+class TestTargetWeights(unittest.TestCase):
+    PREFS = {"max_position_size": 0.2, "risk_tolerance": "moderate"}
+
+    def test_entry_score_and_sizing(self):
+        scores = {"A": 1.0, "B": 0.5, "C": 0.0, "D": None}
+        dynamic = target_weights(
+            scores, strategy_params={"risk_management": "standard"}, preferences=self.PREFS
+        )
+        self.assertEqual(dynamic, {"A": 0.2, "B": 0.1, "C": 0.0})
+        strict = target_weights(
+            scores,
+            strategy_params={"risk_management": "conservative", "position_sizing": "aggressive"},
+            preferences=self.PREFS,
+        )
+        self.assertEqual(strict, {"A": 0.2, "B": 0.0, "C": 0.0})
+
+    def test_weights_capped_and_scaled_to_cash_reserve(self):
+        scores = {s: 1.0 for s in "ABCDEF"}
+        weights = target_weights(
+            scores,
+            strategy_params={"risk_management": "standard", "position_sizing": "aggressive"},
+            preferences={"max_position_size": 0.25, "risk_tolerance": "aggressive"},
+        )
+        self.assertAlmostEqual(sum(weights.values()), 0.9)
+        self.assertTrue(all(w <= 0.25 for w in weights.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
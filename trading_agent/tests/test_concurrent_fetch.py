@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from trading_agent.concurrency import map_bounded, run_concurrently
+from trading_agent.domain.signals.market_conditions import MarketConditions
+from trading_agent.market_data.finnhub_provider import FinnhubNewsProvider
+from trading_agent.market_data.fmp_provider import FMPFundamentalsProvider
+from trading_agent.market_data.mock_fundamentals_provider import MockFundamentalsProvider
+from trading_agent.market_data.mock_news_provider import MockNewsProvider
+from trading_agent.market_data.mock_provider import MockMarketDataProvider
+from trading_agent.signals.aggregator import SignalAggregator
+from trading_agent.tests.http_stub import StubHTTPServer
+from trading_agent.tracing import span, start_trace
+
+SYMBOLS = ["AAPL", "MSFT", "NVDA", "AMZN"]
+
+
+def _company_news(query):
+    symbol = query["symbol"]
+    return [
+        {"headline": f"{symbol} headline {i}", "source": "stub", "datetime": 1720000000}
+        for i in range(2)
+    ]
+
+
+class TestBoundedHelpers(unittest.TestCase):
+    def test_map_bounded_keeps_order_and_limits_threads(self):
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def work(x):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+            return x * 2
+
+        self.assertEqual(map_bounded(work, range(8), max_workers=3), [0, 2, 4, 6, 8, 10, 12, 14])
+        self.assertLessEqual(active["peak"], 3)
+
+    def test_spans_from_workers_nest_under_submitter(self):
+        def work(name):
+            with span(name):
+                return name
+
+        with start_trace() as tracer:
+            with span("batch"):
+                run_concurrently({"a": lambda: work("a"), "b": lambda: work("b")})
+        batch = tracer.to_dict()["children"][0]
+        self.assertEqual(sorted(c["name"] for c in batch["children"]), ["a", "b"])
+
+
+class TestFinnhubConcurrentFetch(unittest.TestCase):
+    def test_fetches_symbols_in_parallel_against_stub(self):
+        routes = {
+            "/api/v1/company-news": _company_news,
+            "/api/v1/news": [{"headline": "Markets open", "source": "stub", "datetime": 1720000000}],
+        }
+        with StubHTTPServer(routes, delay=0.2) as server:
+            provider = FinnhubNewsProvider(
+                api_key="test-key", base_url=f"{server.base_url}/api/v1", max_workers=8
+            )
+            started = time.perf_counter()
+            news = provider.get_news(SYMBOLS)
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(server.requests), len(SYMBOLS) + 1)
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertLess(elapsed, 0.2 * (len(SYMBOLS) + 1))
+        titles = [h["title"] for h in news["headlines"]]
+        self.assertEqual(titles[0], "AAPL headline 0")
+        self.assertEqual(titles[-1], "Markets open")
+        self.assertEqual([h.get("symbol") for h in news["headlines"][:2]], ["AAPL", "AAPL"])
+
+
+class TestFMPConcurrentFetch(unittest.TestCase):
+    def test_flat_batch_builds_metrics_per_symbol(self):
+        routes = {
+            "/stable/ratios-ttm": lambda q: [{"priceToEarningsRatioTTM": 20.0 + len(q["symbol"])}],
+            "/stable/key-metrics-ttm": [{"returnOnEquityTTM": 0.25}],
+            "/stable/financial-growth": [{"revenueGrowth": 0.1}],
+            "/stable/earnings-calendar": [
+                {"symbol": "MSFT", "date": "2024-07-01", "eps": 3.0, "epsEstimated": 2.5}
+            ],
+        }
+        with patch.dict(os.environ, {"FMP_CACHE_ENABLED": "false"}):
+            with StubHTTPServer(routes, delay=0.05) as server:
+                provider = FMPFundamentalsProvider(
+                    api_key="test-key", base_url=f"{server.base_url}/stable", max_workers=6
+                )
+                data = provider.get_fundamentals(SYMBOLS)
+
+        self.assertEqual(data["symbols"], SYMBOLS)
+        # One earnings calendar call plus three endpoints per symbol, all in one batch.
+        self.assertEqual(len(server.requests), 1 + 3 * len(SYMBOLS))
+        self.assertEqual(data["metrics"]["AAPL"]["pe"], 24.0)
+        self.assertNotIn("latest_earnings", data["metrics"]["AAPL"])
+        self.assertEqual(data["metrics"]["NVDA"]["pe"], 24.0)
+        self.assertEqual(data["metrics"]["AAPL"]["roe"], 25.0)
+        self.assertIn("beat", data["metrics"]["MSFT"]["latest_earnings"])
+        self.assertGreater(server.max_in_flight, 1)
+
+
+class _SlowNews(MockNewsProvider):
+    def get_news(self, symbols):
+        time.sleep(0.2)
+        return super().get_news(symbols)
+
+
+class _SlowFundamentals(MockFundamentalsProvider):
+    def get_fundamentals(self, symbols):
+        time.sleep(0.2)
+        return super().get_fundamentals(symbols)
+
+
+class TestAggregatorConcurrency(unittest.TestCase):
+    def _conditions(self):
+        return MarketConditions(volatility="low", trend="bullish", indices={}, sector_etfs={})
+
+    def test_news_and_fundamentals_overlap(self):
+        agg = SignalAggregator(
+            MockMarketDataProvider(),
+            _SlowNews(),
+            _SlowFundamentals(),
+            universe_symbols=["AAPL"],
+        )
+        started = time.perf_counter()
+        with start_trace() as tracer:
+            signals = agg.collect(self._conditions())
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.38)
+        self.assertGreater(len(signals.news.headlines), 0)
+        self.assertIn("AAPL", signals.fundamentals.metrics)
+        names = {c["name"] for c in tracer.to_dict()["children"]}
+        self.assertTrue({"signals.technical", "signals.news", "signals.fundamentals"} <= names)
+
+    def test_serial_mode_produces_same_signals(self):
+        kwargs = dict(universe_symbols=["AAPL"])
+        concurrent = SignalAggregator(
+            MockMarketDataProvider(), MockNewsProvider(), MockFundamentalsProvider(), **kwargs
+        ).collect(self._conditions())
+        serial = SignalAggregator(
+            MockMarketDataProvider(),
+            MockNewsProvider(),
+            MockFundamentalsProvider(),
+            concurrent=False,
+            **kwargs,
+        ).collect(self._conditions())
+        self.assertEqual(concurrent.news.headlines, serial.news.headlines)
+        self.assertEqual(concurrent.fundamentals.metrics, serial.fundamentals.metrics)
+        self.assertEqual(concurrent.technical.indicators, serial.technical.indicators)
+
+
+if __name__ == "__main__":
+    unittest.main()
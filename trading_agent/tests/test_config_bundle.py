@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from strategy_learning.knowledge import config_hash
+from trading_agent.storage import JsonFileStore, StrategyConfigStore
+from trading_agent.storage.config_bundle import (
+    CONFIG_FILES,
+    ConfigBundleLoader,
+    load_config_bundle,
+)
+
+REPO_EXAMPLE_DIR = Path(__file__).resolve().parents[2] / "data.example"
+
+
+class TestConfigBundle(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name) / "data"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _loader(self) -> ConfigBundleLoader:
+        return ConfigBundleLoader(data_dir=self.data_dir, example_dir=REPO_EXAMPLE_DIR)
+
+    def test_seeds_all_files_and_matches_store_values(self):
+        bundle = self._loader().load()
+        for filename in CONFIG_FILES.values():
+            self.assertTrue((self.data_dir / filename).exists(), filename)
+        store = StrategyConfigStore(data_dir=self.data_dir, example_dir=REPO_EXAMPLE_DIR)
+        self.assertEqual(bundle.strategy_params, store.load())
+        self.assertEqual(
+            bundle.config_hash(),
+            config_hash({
+                "strategy_params": bundle.strategy_params,
+                "preferences": bundle.preferences.to_dict(),
+                "rebalance_params": bundle.rebalance_params,
+            }),
+        )
+
+    def test_reuses_bundle_until_a_file_changes(self):
+        loader = self._loader()
+        first = loader.load()
+        with patch.object(JsonFileStore, "load", side_effect=AssertionError("re-read")):
+            self.assertIs(loader.load(), first)
+        self.assertFalse(loader.changed())
+
+        store = StrategyConfigStore(data_dir=self.data_dir, example_dir=REPO_EXAMPLE_DIR)
+        store.update(lambda current: {**current, "risk_management": "changed-for-test"})
+        self.assertTrue(loader.changed())
+
+        reads = []
+        original = JsonFileStore.load
+
+        def counting_load(store_self):
+            reads.append(store_self.path.name)
+            return original(store_self)
+
+        with patch.object(JsonFileStore, "load", counting_load):
+            second = loader.load()
+        self.assertEqual(reads, ["strategy_params.json"])
+        self.assertEqual(second.strategy_params["risk_management"], "changed-for-test")
+        self.assertNotEqual(second.config_hash(), first.config_hash())
+        self.assertEqual(second.content_hash(), loader.load().content_hash())
+
+    def test_accessors_return_copies(self):
+        bundle = self._loader().load()
+        bundle.strategy_params["risk_management"] = "mutated"
+        self.assertNotEqual(bundle.strategy_params.get("risk_management"), "mutated")
+
+    def test_shared_loader_follows_data_dir_env(self):
+        with patch.dict(
+            os.environ,
+            {"DATA_DIR": str(self.data_dir), "EXAMPLE_DATA_DIR": str(REPO_EXAMPLE_DIR)},
+        ):
+            bundle = load_config_bundle()
+            self.assertIs(load_config_bundle(), bundle)
+        on_disk = json.loads((self.data_dir / "watchlist.json").read_text())
+        self.assertEqual(bundle.watchlist.to_dict()["symbols"], on_disk.get("symbols", []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,3 @@
-import json
 import os
 import tempfile
 import unittest
@@ -8,10 +7,15 @@ from unittest.mock import patch
 
 from trading_agent.market_data.fmp_cache import (
     build_cache_key,
+    cache_file_path,
+    clear_memory_cache,
+    coverage_batch,
     read_cache,
     write_cache,
 )
+from trading_agent.market_data.historical_cache import load_manifest, save_manifest
 from trading_agent.market_data.fmp_provider import FMPFundamentalsProvider
+from trading_agent.market_data.http_transport import HTTPTransport
 
 
 class TestFMPCache(unittest.TestCase):
@@ -20,10 +24,12 @@ class TestFMPCache(unittest.TestCase):
         self.cache_dir = Path(self.tmp.name) / "cache" / "fmp"
         os.environ["FMP_CACHE_DIR"] = str(self.cache_dir)
         os.environ["FMP_CACHE_ENABLED"] = "true"
+        clear_memory_cache()
 
     def tearDown(self):
         os.environ.pop("FMP_CACHE_DIR", None)
         os.environ.pop("FMP_CACHE_ENABLED", None)
+        clear_memory_cache()
         self.tmp.cleanup()
 
     def test_build_cache_key_excludes_apikey(self):
@@ -51,28 +57,94 @@ class TestFMPCache(unittest.TestCase):
         self.assertIsNone(cached)
         self.assertFalse(any(self.cache_dir.rglob("*.json")))
 
-    @patch("trading_agent.market_data.fmp_provider.urllib.request.urlopen")
-    def test_provider_skips_http_when_cache_hit(self, mock_urlopen):
-        provider = FMPFundamentalsProvider(api_key="test-key")
+    def test_provider_skips_http_when_cache_hit(self):
+        transport = HTTPTransport()
+        provider = FMPFundamentalsProvider(api_key="test-key", transport=transport)
         payload = [{"peRatioTTM": 25.0}]
         today = datetime.now(timezone.utc).date()
         write_cache("ratios-ttm", payload, day=today, symbol="AAPL")
 
-        result = provider._get_json("ratios-ttm", symbol="AAPL")
+        with patch.object(transport, "get_json") as mock_get:
+            result = provider._get_json("ratios-ttm", symbol="AAPL")
 
         self.assertEqual(result, payload)
-        mock_urlopen.assert_not_called()
+        mock_get.assert_not_called()
 
-    @patch("trading_agent.market_data.fmp_provider.urllib.request.urlopen")
-    def test_provider_fetches_on_cache_miss(self, mock_urlopen):
-        provider = FMPFundamentalsProvider(api_key="test-key")
-        mock_response = mock_urlopen.return_value.__enter__.return_value
-        mock_response.read.return_value = json.dumps([{"peRatioTTM": 30.0}]).encode()
+    def test_provider_fetches_on_cache_miss(self):
+        transport = HTTPTransport()
+        provider = FMPFundamentalsProvider(api_key="test-key", transport=transport)
 
-        result = provider._get_json("ratios-ttm", symbol="MSFT")
+        with patch.object(
+            transport, "get_json", return_value=[{"peRatioTTM": 30.0}]
+        ) as mock_get:
+            result = provider._get_json("ratios-ttm", symbol="MSFT")
 
         self.assertEqual(result, [{"peRatioTTM": 30.0}])
-        mock_urlopen.assert_called_once()
+        mock_get.assert_called_once()
+
+
+    def test_memory_tier_serves_repeat_reads(self):
+        today = datetime.now(timezone.utc).date()
+        write_cache("ratios-ttm", [{"peRatioTTM": 20.0}], day=today, symbol="AAPL")
+
+        with patch("pathlib.Path.open") as mock_open:
+            cached = read_cache("ratios-ttm", day=today, symbol="AAPL")
+        self.assertEqual(cached, [{"peRatioTTM": 20.0}])
+        mock_open.assert_not_called()
+
+    def test_disk_hit_after_memory_reset(self):
+        today = datetime.now(timezone.utc).date()
+        write_cache("ratios-ttm", [{"peRatioTTM": 20.0}], day=today, symbol="AAPL")
+        clear_memory_cache()
+        self.assertEqual(
+            read_cache("ratios-ttm", day=today, symbol="AAPL"), [{"peRatioTTM": 20.0}]
+        )
+
+    def test_partition_index_skips_read_on_miss(self):
+        today = datetime.now(timezone.utc).date()
+        write_cache("ratios-ttm", [{"peRatioTTM": 20.0}], day=today, symbol="AAPL")
+        clear_memory_cache()
+        read_cache("ratios-ttm", day=today, symbol="AAPL")
+
+        with patch("pathlib.Path.open") as mock_open:
+            self.assertIsNone(read_cache("ratios-ttm", day=today, symbol="MSFT"))
+        mock_open.assert_not_called()
+
+    def test_sees_files_written_after_partition_scan(self):
+        today = datetime.now(timezone.utc).date()
+        write_cache("ratios-ttm", [{"peRatioTTM": 20.0}], day=today, symbol="AAPL")
+        clear_memory_cache()
+        self.assertIsNone(read_cache("ratios-ttm", day=today, symbol="MSFT"))
+
+        # Another process writes MSFT after this one indexed the partition.
+        source = cache_file_path("ratios-ttm", today, symbol="AAPL")
+        cache_file_path("ratios-ttm", today, symbol="MSFT").write_bytes(source.read_bytes())
+        self.assertEqual(
+            read_cache("ratios-ttm", day=today, symbol="MSFT"), [{"peRatioTTM": 20.0}]
+        )
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        today = datetime.now(timezone.utc).date()
+        write_cache("ratios-ttm", [{"peRatioTTM": 20.0}], day=today, symbol="AAPL")
+        path = cache_file_path("ratios-ttm", today, symbol="AAPL")
+        self.assertTrue(path.exists())
+        self.assertEqual(list(self.cache_dir.rglob("*.tmp")), [])
+
+    def test_coverage_batch_writes_manifest_once(self):
+        day = date(2026, 7, 11)
+        with patch(
+            "trading_agent.market_data.fmp_cache.save_manifest", wraps=save_manifest
+        ) as mock_save:
+            with coverage_batch():
+                for symbol in ("AAPL", "MSFT", "NVDA"):
+                    write_cache("ratios-ttm", [{}], day=day, symbol=symbol)
+                    write_cache("key-metrics-ttm", [{}], day=day, symbol=symbol)
+                mock_save.assert_not_called()
+
+        mock_save.assert_called_once()
+        manifest = load_manifest(self.cache_dir)
+        self.assertEqual(set(manifest["symbols"]), {"AAPL", "MSFT", "NVDA"})
+        self.assertEqual(manifest["symbols"]["AAPL"]["latest"], "2026-07-11")
 
 
 if __name__ == "__main__":
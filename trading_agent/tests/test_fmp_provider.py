@@ -11,11 +11,12 @@ class TestFMPProvider(unittest.TestCase):
     def test_builds_stable_api_url(self):
         provider = FMPFundamentalsProvider(api_key="test-key")
         with patch.object(provider, "_get_json", return_value=[{"peRatioTTM": 25.0}]) as mock_get:
-            metrics = provider._fetch_symbol_metrics("AAPL")
+            data = provider.get_fundamentals(["AAPL"])
         mock_get.assert_any_call("ratios-ttm", symbol="AAPL")
         mock_get.assert_any_call("key-metrics-ttm", symbol="AAPL")
         mock_get.assert_any_call("financial-growth", symbol="AAPL", limit=1)
-        self.assertEqual(metrics.get("pe"), 25.0)
+        self.assertEqual(mock_get.call_args_list[0].args, ("earnings-calendar",))
+        self.assertEqual(data["metrics"]["AAPL"].get("pe"), 25.0)
 
     def test_get_summary_reuses_prefetched_data(self):
         provider = FMPFundamentalsProvider(api_key="test-key")
@@ -69,6 +69,18 @@ class TestHistoricalCache(unittest.TestCase):
             self.assertLessEqual(len(sliced), 5)
             self.assertLessEqual(sliced.index.max().date(), as_of)
 
+    def test_parsed_bars_shared_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            write_cached_bars("SPY", _make_bars(date(2024, 1, 1), 40), cache_dir)
+            first = read_cached_bars("SPY", cache_dir)
+            self.assertIs(read_cached_bars("SPY", cache_dir), first)
+
+            write_cached_bars("SPY", _make_bars(date(2024, 1, 1), 45), cache_dir)
+            reloaded = read_cached_bars("SPY", cache_dir)
+            self.assertIsNot(reloaded, first)
+            self.assertEqual(len(reloaded), 45)
+
     def test_merge_bars_dedupes(self):
         a = _make_bars(date(2024, 1, 1), 5, 100)
         b = _make_bars(date(2024, 1, 3), 5, 200)
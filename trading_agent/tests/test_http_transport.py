@@ -0,0 +1,109 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from trading_agent.concurrency import map_bounded
+from trading_agent.market_data.finnhub_provider import FinnhubNewsProvider
+from trading_agent.market_data.fmp_provider import FMPFundamentalsProvider
+from trading_agent.market_data.http_transport import (
+    HTTPStatusError,
+    HTTPTransport,
+    TransportError,
+)
+from trading_agent.tests.http_stub import StubHTTPServer
+
+ROUTES = {"/quote": lambda q: {"symbol": q.get("symbol"), "price": 100.0}}
+
+
+class TestHTTPTransport(unittest.TestCase):
+    def test_reuses_keep_alive_connection(self):
+        transport = HTTPTransport()
+        with StubHTTPServer(ROUTES) as server:
+            for symbol in ("AAPL", "MSFT", "NVDA"):
+                data = transport.get_json(f"{server.base_url}/quote", params={"symbol": symbol})
+                self.assertEqual(data["symbol"], symbol)
+            transport.close()
+        self.assertEqual(len(server.connections), 1)
+        stats = transport.stats()
+        self.assertEqual(stats["connections_opened"], 1)
+        self.assertEqual(stats["connections_reused"], 2)
+
+    def test_decodes_gzip(self):
+        transport = HTTPTransport()
+        with StubHTTPServer(ROUTES, gzip=True) as server:
+            response = transport.get(f"{server.base_url}/quote", params={"symbol": "AAPL"})
+            transport.close()
+        self.assertEqual(response.headers.get("content-encoding"), "gzip")
+        self.assertEqual(response.json()["price"], 100.0)
+        self.assertIn("gzip", server.requests[0]["headers"]["accept-encoding"])
+
+    def test_corrupt_gzip_body_is_a_transport_error(self):
+        transport = HTTPTransport()
+        with StubHTTPServer(ROUTES, corrupt_gzip=True) as server:
+            with self.assertRaises(TransportError):
+                transport.get_json(f"{server.base_url}/quote", params={"symbol": "AAPL"})
+            transport.close()
+
+    def test_conditional_get_replays_body_on_304(self):
+        transport = HTTPTransport()
+        with StubHTTPServer(ROUTES, etag=True) as server:
+            first = transport.get(f"{server.base_url}/quote", params={"symbol": "AAPL"})
+            second = transport.get(f"{server.base_url}/quote", params={"symbol": "AAPL"})
+            transport.close()
+        self.assertFalse(first.revalidated)
+        self.assertTrue(second.revalidated)
+        self.assertEqual(second.json(), first.json())
+        self.assertIn("if-none-match", server.requests[1]["headers"])
+        self.assertEqual(transport.stats()["not_modified"], 1)
+
+    def test_caps_concurrency_per_host(self):
+        transport = HTTPTransport(max_per_host=2)
+        with StubHTTPServer(ROUTES, delay=0.05) as server:
+            url = f"{server.base_url}/quote"
+            map_bounded(lambda s: transport.get_json(url, params={"symbol": s}), range(8), 8)
+            transport.close()
+        self.assertLessEqual(server.max_in_flight, 2)
+        self.assertLessEqual(len(server.connections), 2)
+
+    def test_errors(self):
+        transport = HTTPTransport()
+        with StubHTTPServer(ROUTES) as server:
+            with self.assertRaises(HTTPStatusError) as ctx:
+                transport.get(f"{server.base_url}/missing", params={"token": "secret"})
+            transport.close()
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertNotIn("secret", str(ctx.exception))
+        with self.assertRaises(TransportError):
+            HTTPTransport(timeout=1).get("http://127.0.0.1:9/quote")
+
+
+class TestProvidersUseTransport(unittest.TestCase):
+    def test_finnhub_and_fmp_share_pooled_connections(self):
+        routes = {
+            "/api/v1/company-news": [{"headline": "Apple beats", "datetime": 1720000000}],
+            "/api/v1/news": [],
+            "/stable/ratios-ttm": [{"priceToEarningsRatioTTM": 30.0}],
+            "/stable/key-metrics-ttm": [{"returnOnEquityTTM": 0.2}],
+            "/stable/financial-growth": [{"revenueGrowth": 0.05}],
+            "/stable/earnings-calendar": [],
+        }
+        transport = HTTPTransport()
+        with patch.dict(os.environ, {"FMP_CACHE_ENABLED": "false"}):
+            with StubHTTPServer(routes, gzip=True) as server:
+                news = FinnhubNewsProvider(
+                    api_key="k", base_url=f"{server.base_url}/api/v1",
+                    max_workers=1, transport=transport,
+                ).get_news(["AAPL"])
+                fundamentals = FMPFundamentalsProvider(
+                    api_key="k", base_url=f"{server.base_url}/stable",
+                    max_workers=1, transport=transport,
+                ).get_fundamentals(["AAPL"])
+                transport.close()
+        self.assertEqual(news["headlines"][0]["title"], "Apple beats")
+        self.assertEqual(fundamentals["metrics"]["AAPL"]["pe"], 30.0)
+        self.assertEqual(len(server.requests), 6)
+        self.assertEqual(len(server.connections), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
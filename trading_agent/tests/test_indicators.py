@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from trading_agent.signals.indicators import (
+    compute_indicator_series,
     compute_indicators_for_bars,
     compute_macd,
     compute_rsi,
@@ -55,6 +56,21 @@ class TestIndicators(unittest.TestCase):
         self.assertIn("sma_20", result)
         self.assertIn("macd", result)
 
+    def test_indicator_series_matches_point_in_time_values(self):
+        close = _uptrend_closes()
+        series = compute_indicator_series(pd.DataFrame({"close": close}))
+        for end in (30, 40, 80):
+            row = series.iloc[end - 1]
+            prefix = close.iloc[:end]
+            self.assertAlmostEqual(row["rsi_14"], compute_rsi(prefix))
+            self.assertAlmostEqual(row["sma_20"], compute_sma(prefix, 20))
+            hist = compute_macd(prefix)["histogram"]
+            if hist is None:
+                self.assertTrue(np.isnan(row["macd_histogram"]))
+            else:
+                self.assertAlmostEqual(row["macd_histogram"], hist)
+        self.assertTrue(np.isnan(series["sma_50"].iloc[48]))
+
     def test_summarize_technical_indicators(self):
         indicators = {
             "SPY": {"rsi_14": 65.0, "macd": {"histogram": 0.5}, "sma_20": 450.0, "sma_50": 440.0},
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import unittest
+
+from scripts.bench_import_time import LAZY_SDKS, measure
+from trading_agent.llm.client import get_llm_client, resolve_llm_client_class
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_entry_points_do_not_import_llm_sdks(self):
+        for module in ("run_backtest", "run_sweep", "run_account_history"):
+            with self.subTest(module=module):
+                self.assertEqual(measure(module)["sdks_loaded"], [])
+
+    def test_account_history_skips_pipeline_and_alpaca(self):
+        code = (
+            "import sys, run_account_history; "
+            "print(sorted(m for m in ('alpaca', 'pandas', 'trading_agent.agents') if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(out.strip(), "[]")
+
+    def test_mock_client_resolves_without_provider_sdks(self):
+        code = (
+            "import sys; from trading_agent.llm.client import get_llm_client; "
+            "get_llm_client('mock'); "
+            f"print(sorted(m for m in {LAZY_SDKS!r} if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(out.strip(), "[]")
+
+    def test_resolve_by_name(self):
+        self.assertEqual(resolve_llm_client_class("MOCK").__name__, "MockLLMClient")
+        self.assertEqual(type(get_llm_client("mock")).__name__, "MockLLMClient")
+        with self.assertRaises(ValueError):
+            resolve_llm_client_class("nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from trading_agent.scheduler.market_calendar import (
+    MARKET_TZ,
+    MarketCalendar,
+    nyse_early_closes,
+    nyse_holidays,
+)
+from trading_agent.scheduler.scheduler import TradingScheduler
+
+
+def _et(*args) -> datetime:
+    return datetime(*args, tzinfo=MARKET_TZ)
+
+
+class TestMarketCalendar(unittest.TestCase):
+    def test_holiday_rules(self):
+        self.assertEqual(
+            sorted(nyse_holidays(2024)),
+            [
+                date(2024, 1, 1), date(2024, 1, 15), date(2024, 2, 19), date(2024, 3, 29),
+                date(2024, 5, 27), date(2024, 6, 19), date(2024, 7, 4), date(2024, 9, 2),
+                date(2024, 11, 28), date(2024, 12, 25),
+            ],
+        )
+        # Saturday New Year is not observed on the prior Friday; Sunday Juneteenth moves to Monday.
+        self.assertNotIn(date(2021, 12, 31), nyse_holidays(2021))
+        self.assertIn(date(2022, 6, 20), nyse_holidays(2022))
+        self.assertEqual(
+            sorted(nyse_early_closes(2024)),
+            [date(2024, 7, 3), date(2024, 11, 29), date(2024, 12, 24)],
+        )
+
+    def test_cached_days_take_precedence_inside_their_range(self):
+        cal = MarketCalendar([date(2024, 1, 2), date(2024, 1, 4)])
+        self.assertTrue(cal.is_trading_day(date(2024, 1, 2)))
+        self.assertFalse(cal.is_trading_day(date(2024, 1, 3)))
+        self.assertTrue(cal.is_trading_day(date(2024, 1, 8)))
+        self.assertFalse(cal.is_trading_day(date(2024, 1, 15)))
+
+    def test_cache_gap_falls_back_to_holiday_rules(self):
+        cal = MarketCalendar([date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 10)])
+        self.assertTrue(cal.is_trading_day(date(2024, 1, 4)))
+        self.assertTrue(cal.is_trading_day(date(2024, 1, 9)))
+        self.assertFalse(cal.is_trading_day(date(2024, 1, 6)))
+        self.assertEqual(cal.next_trading_day(date(2024, 1, 3)), date(2024, 1, 4))
+
+    def test_session_times(self):
+        cal = MarketCalendar()
+        self.assertIsNone(cal.session(date(2024, 7, 6)))
+        self.assertEqual(cal.session(date(2024, 7, 3))[1], _et(2024, 7, 3, 13, 0))
+        self.assertEqual(cal.session(date(2024, 7, 5))[0], _et(2024, 7, 5, 9, 30))
+
+
+class TestSchedulerSlots(unittest.TestCase):
+    def _scheduler(self, **kwargs) -> TradingScheduler:
+        return TradingScheduler(
+            interval_minutes=30, calendar=MarketCalendar(), open_offset_minutes=5, **kwargs
+        )
+
+    def test_weekend_rolls_to_next_session(self):
+        slot = self._scheduler().next_run_time(_et(2024, 7, 6, 12, 0))
+        self.assertEqual(slot, _et(2024, 7, 8, 9, 35))
+
+    def test_mid_session_aligns_to_fixed_offsets(self):
+        scheduler = self._scheduler()
+        self.assertEqual(scheduler.next_run_time(_et(2024, 7, 8, 10, 1)), _et(2024, 7, 8, 10, 5))
+        self.assertEqual(scheduler.next_run_time(_et(2024, 7, 8, 10, 5)), _et(2024, 7, 8, 10, 5))
+        self.assertEqual(scheduler.next_run_time(_et(2024, 7, 8, 15, 36)), _et(2024, 7, 9, 9, 35))
+
+    def test_early_close_and_holiday(self):
+        scheduler = self._scheduler()
+        # 12:35 is the last slot before the 13:00 close; Jul 4 is skipped.
+        self.assertEqual(scheduler.next_run_time(_et(2024, 7, 3, 12, 30)), _et(2024, 7, 3, 12, 35))
+        self.assertEqual(scheduler.next_run_time(_et(2024, 7, 3, 12, 36)), _et(2024, 7, 5, 9, 35))
+
+    def test_overrunning_cycle_skips_slots_and_records_them(self):
+        now = [datetime(2024, 7, 8, 13, 40, tzinfo=timezone.utc)]  # 09:40 ET
+        scheduler = self._scheduler(clock=lambda: now[0])
+        runs = []
+
+        def fake_wait(seconds):
+            now[0] += timedelta(seconds=seconds)
+            return False
+
+        scheduler._stop_event.wait = fake_wait
+
+        def cycle():
+            runs.append(now[0].astimezone(MARKET_TZ).strftime("%H:%M"))
+            if len(runs) == 1:
+                now[0] += timedelta(minutes=70)
+            if len(runs) == 2:
+                scheduler.stop()
+
+        scheduler.start(cycle)
+        self.assertEqual(runs, ["10:05", "11:35"])
+        statuses = [(h["scheduled"][11:16], h["status"]) for h in scheduler.history]
+        self.assertEqual(
+            statuses,
+            [("10:05", "ok"), ("10:35", "missed"), ("11:05", "missed"), ("11:35", "ok")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
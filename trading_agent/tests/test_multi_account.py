@@ -0,0 +1,188 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from trading_agent.concurrency import SingleFlightMemo, map_bounded
+from trading_agent.config import get_config
+from trading_agent.market_data.finnhub_provider import FinnhubNewsProvider
+from trading_agent.market_data.mock_provider import MockMarketDataProvider
+from trading_agent.market_data.shared_snapshot import SharedMarketSnapshot
+from trading_agent.orchestrator.multi_account import (
+    MultiAccountCycle,
+    account_config,
+    ensure_account_knowledge_base,
+)
+from trading_agent.orchestrator.trading_cycle import TradingCycle
+from trading_agent.tests.http_stub import StubHTTPServer
+
+
+class CountingProvider(MockMarketDataProvider):
+    built = 0
+
+    def __init__(self, sector_etfs=None):
+        super().__init__()
+        CountingProvider.built += 1
+        self.sector_etfs = sector_etfs
+        self.condition_calls = 0
+
+    def get_market_conditions(self):
+        self.condition_calls += 1
+        time.sleep(0.05)
+        return super().get_market_conditions()
+
+
+class FakeCycle:
+    def __init__(self, account_id, data_dir, log_dir, config, shared_market):
+        self.account_id = account_id
+        self.config = config
+        self.shared_market = shared_market
+
+    def execute(self):
+        provider = self.shared_market.market_data_provider(["XLK", "XLF"])
+        provider.get_market_conditions()
+        if self.account_id == "broken":
+            raise RuntimeError("broker down")
+        return {"status": "success", "cycle_id": f"{self.account_id}-1"}
+
+
+class TestSingleFlightMemo(unittest.TestCase):
+    def test_concurrent_callers_share_one_computation(self):
+        memo = SingleFlightMemo()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"value": 42}
+
+        results = map_bounded(lambda _: memo.get_or_compute("k", compute), range(8), max_workers=8)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual((memo.misses, memo.hits), (1, 7))
+
+    def test_failures_are_not_cached(self):
+        memo = SingleFlightMemo()
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError("boom")
+            return "ok"
+
+        with self.assertRaises(ValueError):
+            memo.get_or_compute("k", flaky)
+        self.assertEqual(memo.get_or_compute("k", flaky), "ok")
+        memo.clear()
+        self.assertEqual(memo.get_or_compute("k", flaky), "ok")
+        self.assertEqual(len(attempts), 3)
+
+
+class TestSharedMarketSnapshot(unittest.TestCase):
+    def setUp(self):
+        CountingProvider.built = 0
+
+    def test_market_conditions_fetched_once_per_interval(self):
+        snapshot = SharedMarketSnapshot(provider_factory=CountingProvider)
+        views = [snapshot.market_data_provider(["XLK", "XLF"]) for _ in range(4)]
+        map_bounded(lambda v: v.get_market_volatility(), views, max_workers=4)
+        self.assertEqual(CountingProvider.built, 1)
+        self.assertEqual(views[0].inner.condition_calls, 1)
+
+        snapshot.new_interval()
+        views[0].get_market_trend()
+        self.assertEqual(views[0].inner.condition_calls, 2)
+        # A different sector list gets its own provider.
+        snapshot.market_data_provider(["XLE"]).get_market_conditions()
+        self.assertEqual(CountingProvider.built, 2)
+
+    def test_news_requests_shared_across_accounts(self):
+        routes = {
+            "/api/v1/company-news": lambda q: [
+                {"headline": f"{q['symbol']} up", "source": "stub", "datetime": 1720000000}
+            ],
+            "/api/v1/news": [],
+        }
+        with StubHTTPServer(routes, delay=0.05) as server:
+            memo = SingleFlightMemo()
+            providers = [
+                FinnhubNewsProvider(api_key="k", base_url=f"{server.base_url}/api/v1", memo=memo)
+                for _ in range(3)
+            ]
+            map_bounded(lambda p: p.get_news(["AAPL", "MSFT"]), providers, max_workers=3)
+            # Two company-news symbols plus one general-news call, for all three accounts.
+            self.assertEqual(len(server.requests), 3)
+
+
+class TestMultiAccountCycle(unittest.TestCase):
+    def setUp(self):
+        CountingProvider.built = 0
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for name in ("alice", "bob", "broken"):
+            (self.root / "accounts" / name).mkdir(parents=True)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _service(self, **kwargs):
+        return MultiAccountCycle(
+            self.root / "accounts",
+            config=get_config(),
+            log_dir=self.root / "logs",
+            max_workers=3,
+            snapshot=SharedMarketSnapshot(provider_factory=CountingProvider),
+            cycle_factory=FakeCycle,
+            **kwargs,
+        )
+
+    def test_fan_out_isolates_failures_and_shares_market_data(self):
+        service = self._service()
+        summary = service.execute()
+        self.assertEqual(summary["alice"]["status"], "success")
+        self.assertEqual(summary["bob"]["cycle_id"], "bob-1")
+        self.assertEqual(summary["broken"]["status"], "error")
+        self.assertIn("broker down", summary["broken"]["error"])
+        self.assertEqual(service.snapshot.stats(), {"fetched": 1, "shared": 2})
+
+    def test_account_kb_seeded_with_account_user_id(self):
+        self._service()
+        with (self.root / "accounts" / "alice" / "knowledge_base.json").open() as f:
+            self.assertEqual(json.load(f)["user_id"], "alice")
+
+    def test_new_account_directories_are_picked_up(self):
+        service = self._service()
+        (self.root / "accounts" / "carol").mkdir()
+        self.assertIn("carol", service.execute())
+
+    def test_account_cycles_label_logs_and_share_indicator_memo(self):
+        snapshot = SharedMarketSnapshot(provider_factory=CountingProvider)
+        data_dir = self.root / "accounts" / "alice"
+        ensure_account_knowledge_base(data_dir, "alice")
+        cycle = TradingCycle(
+            account_id="alice",
+            data_dir=data_dir,
+            log_dir=self.root / "logs",
+            config=get_config(),
+            shared_market=snapshot,
+        )
+        self.assertIs(cycle._account_agent_kwargs()["indicator_memo"], snapshot.memo)
+        with self.assertLogs("trading_agent.orchestrator.trading_cycle") as logs:
+            cycle.logger.info("Reusing warm components")
+        self.assertEqual(logs.records[0].getMessage(), "[alice] Reusing warm components")
+        self.assertEqual(logs.records[0].account_id, "alice")
+
+    def test_per_account_credentials(self):
+        base = get_config()
+        with patch.dict(os.environ, {"ALPACA_API_KEY_PAPER_2": "k2"}):
+            config = account_config(base, "paper-2")
+        self.assertEqual(config.alpaca_api_key, "k2")
+        self.assertEqual(config.alpaca_secret_key, base.alpaca_secret_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
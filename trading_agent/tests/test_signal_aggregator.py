@@ -12,6 +12,11 @@ from trading_agent.market_data.mock_news_provider import MockNewsProvider
 from trading_agent.market_data.mock_provider import MockMarketDataProvider
 from trading_agent.signals.aggregator import SignalAggregator
 from trading_agent.market_data.finnhub_provider import FinnhubNewsProvider
+from trading_agent.market_data.news_sentiment import (
+    BEARISH_KEYWORDS,
+    BULLISH_KEYWORDS,
+    count_keyword_cues,
+)
 
 
 def _sample_conditions() -> MarketConditions:
@@ -104,6 +109,34 @@ class TestSignalAggregator(unittest.TestCase):
             summary = provider.get_sentiment_summary(["AAPL"])
         self.assertIn("Positive", summary)
 
+    def test_collect_fetches_finnhub_news_once(self):
+        provider = FinnhubNewsProvider(api_key="test-key", max_workers=1)
+        payload = [{"headline": "Apple shares surge on record quarter", "datetime": 1720000000}]
+        agg = SignalAggregator(
+            MockMarketDataProvider(),
+            provider,
+            MockFundamentalsProvider(),
+            universe_symbols=["AAPL"],
+        )
+        with patch.object(provider, "_get_json", return_value=payload) as mock_get:
+            signals = agg.collect(_sample_conditions(), _sample_portfolio())
+        # One company-news request for AAPL plus general news; no refetch for sentiment.
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertIn("Positive", signals.news.sentiment_summary)
+
+    def test_keyword_cues_match_per_title_substring_scan(self):
+        titles = [
+            "Stocks rally as chipmakers surge",
+            "Retailer cuts guidance after earnings miss",
+            "Fed holds rates steady",
+            "Regulators issue warning; shares gain anyway",
+            "",
+            "Record high for index despite layoffs",
+        ]
+        expected_bull = sum(any(k in t.lower() for k in BULLISH_KEYWORDS) for t in titles)
+        expected_bear = sum(any(k in t.lower() for k in BEARISH_KEYWORDS) for t in titles)
+        self.assertEqual(count_keyword_cues(titles), (expected_bull, expected_bear))
+
     def test_market_conditions_from_dict_includes_sectors(self):
         data = {
             "volatility": "low",
@@ -1,5 +1,7 @@
 import json
+import os
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -9,6 +11,7 @@ from trading_agent.domain.user.user_preferences import UserPreferences
 from trading_agent.domain.user.watchlist import Watchlist
 from trading_agent.storage import (
     AnalysisConfigStore,
+    JsonFileStore,
     PreferencesStore,
     SignalConfigStore,
     WatchlistStore,
@@ -58,6 +61,61 @@ class TestJsonFileStore(unittest.TestCase):
         self.assertEqual(data["time_horizon"], "short-term")
         self.assertEqual(data["focus_areas"], "energy")
 
+    def test_save_is_atomic_and_leaves_no_temp_files(self):
+        store = JsonFileStore("state.json", data_dir=self.data_dir, example_dir=self.example_dir)
+        store.save({"a": 1})
+        inode = store.path.stat().st_ino
+        store.save({"a": 2})
+        self.assertNotEqual(store.path.stat().st_ino, inode)
+        self.assertEqual(store.load(), {"a": 2})
+        self.assertEqual([p.name for p in self.data_dir.iterdir()], ["state.json"])
+
+    def test_failed_save_keeps_previous_file(self):
+        store = JsonFileStore("state.json", data_dir=self.data_dir, example_dir=self.example_dir)
+        store.save({"a": 1})
+        with self.assertRaises(TypeError):
+            store.save({"a": object()})
+        self.assertEqual(store.load(), {"a": 1})
+        self.assertEqual([p.name for p in self.data_dir.iterdir()], ["state.json"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX file modes")
+    def test_save_keeps_file_mode(self):
+        store = JsonFileStore("state.json", data_dir=self.data_dir, example_dir=self.example_dir)
+        umask = os.umask(0)
+        os.umask(umask)
+        store.save({"a": 1})
+        self.assertEqual(store.path.stat().st_mode & 0o777, 0o666 & ~umask)
+        store.path.chmod(0o644)
+        store.save({"a": 2})
+        self.assertEqual(store.path.stat().st_mode & 0o777, 0o644)
+        store.path.chmod(0o640)
+        store.save({"a": 3})
+        self.assertEqual(store.path.stat().st_mode & 0o777, 0o640)
+
+    def test_compact_serialization(self):
+        store = JsonFileStore(
+            "state.json", data_dir=self.data_dir, example_dir=self.example_dir, compact=True
+        )
+        store.save({"a": [1, 2]})
+        self.assertEqual(store.path.read_text(encoding="utf-8"), '{"a":[1,2]}\n')
+
+    def test_locked_update_serializes_writers(self):
+        store = JsonFileStore("counter.json", data_dir=self.data_dir, example_dir=self.example_dir)
+        store.save({"n": 0})
+
+        def bump():
+            for _ in range(20):
+                JsonFileStore(
+                    "counter.json", data_dir=self.data_dir, example_dir=self.example_dir
+                ).update(lambda d: {"n": d["n"] + 1})
+
+        threads = [threading.Thread(target=bump) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(store.load(), {"n": 80})
+
 
 class TestDomainModels(unittest.TestCase):
     def test_signal_config_defaults(self):
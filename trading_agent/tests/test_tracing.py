@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from strategy_learning.knowledge import KnowledgeBase
+from trading_agent.broker.mock_client import MockAlpacaTradingClient
+from trading_agent.llm.mock_client import MockLLMClient
+from trading_agent.market_data.mock_provider import MockMarketDataProvider
+from trading_agent.orchestrator.agent import TradingAgent
+from trading_agent.tracing import (
+    annotate,
+    maybe_profile,
+    reset_profile_capture,
+    span,
+    stage_totals,
+    start_trace,
+    traced,
+)
+
+
+def _walk(node):
+    yield node
+    for child in node.get("children") or []:
+        yield from _walk(child)
+
+
+def _seed_kb(tmp: str) -> KnowledgeBase:
+    data_dir = Path(tmp)
+    example = data_dir / "example"
+    example.mkdir()
+    (example / "knowledge_base.json").write_text(
+        '{"lessons": [], "signal_weights": {}, "strategy_preferences": {}}\n'
+    )
+    return KnowledgeBase(data_dir=data_dir, example_dir=example)
+
+
+class TestTracer(unittest.TestCase):
+    def test_nested_spans_and_stage_totals(self):
+        with start_trace("cycle") as tracer:
+            with span("agent.a"):
+                with span("inner", symbols=3):
+                    pass
+            with span("agent.b"):
+                pass
+        timings = tracer.to_dict()
+        self.assertEqual([c["name"] for c in timings["children"]], ["agent.a", "agent.b"])
+        inner = timings["children"][0]["children"][0]
+        self.assertEqual(inner["name"], "inner")
+        self.assertEqual(inner["attrs"], {"symbols": 3})
+        self.assertEqual(set(stage_totals(timings)), {"agent.a", "agent.b"})
+
+    def test_span_is_noop_without_trace(self):
+        with span("orphan") as node:
+            self.assertIsNone(node)
+
+        @traced("fn")
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(1, 2), 3)
+
+    def test_annotate_sets_attrs_on_innermost_span(self):
+        @traced("llm.fake")
+        def call():
+            annotate(input_tokens=120, output_tokens=30, cached=None)
+            return "ok"
+
+        annotate(input_tokens=1)  # no trace: no-op
+        with start_trace() as tracer:
+            call()
+        self.assertEqual(
+            tracer.to_dict()["children"][0]["attrs"], {"input_tokens": 120, "output_tokens": 30}
+        )
+
+    def test_records_error_and_reraises(self):
+        with start_trace() as tracer:
+            with self.assertRaises(ValueError):
+                with span("boom"):
+                    raise ValueError("bad")
+        self.assertIn("ValueError", tracer.to_dict()["children"][0]["error"])
+
+
+class TestCycleTimings(unittest.TestCase):
+    def test_cycle_result_and_artifact_include_timings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            agent = TradingAgent(
+                llm_client=MockLLMClient(),
+                market_data_provider=MockMarketDataProvider(),
+                alpaca_client=MockAlpacaTradingClient(),
+                knowledge_base=_seed_kb(tmp),
+                write_artifact=True,
+                log_dir=Path(tmp) / "logs",
+            )
+            results = agent.run_trading_cycle()
+            self.assertEqual(results["status"], "success")
+            timings = results["timings"]
+            stages = stage_totals(timings)
+            self.assertIn("agent.market_analyzer", stages)
+            self.assertIn("agent.trading_strategizer", stages)
+            names = {node["name"] for node in _walk(timings)}
+            self.assertIn("signals.news", names)
+            self.assertIn("analysis.general", names)
+            self.assertIn("llm.mock", names)
+            self.assertIn("broker.mock.get_account", names)
+
+            payload = json.loads(Path(results["artifact_path"]).read_text())
+            self.assertEqual(payload["timings"]["name"], "cycle")
+            self.assertIn("lessons_update", payload["agents"])
+
+
+class TestProfileCapture(unittest.TestCase):
+    def setUp(self):
+        reset_profile_capture()
+
+    def tearDown(self):
+        reset_profile_capture()
+
+    def test_profiles_only_first_block(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {"CYCLE_PROFILE": "cprofile", "CYCLE_PROFILE_DIR": tmp}
+            with patch.dict(os.environ, env):
+                with maybe_profile("first") as first:
+                    sum(range(100))
+                with maybe_profile("second") as second:
+                    pass
+            self.assertTrue(Path(first["path"]).exists())
+            self.assertNotIn("path", second)
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {"CYCLE_PROFILE": ""}):
+            with maybe_profile("x") as info:
+                pass
+        self.assertEqual(info, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from trading_agent.orchestrator.trading_cycle import TradingCycle
 
@@ -86,5 +86,84 @@ class TestTradingCycleDataLoading(unittest.TestCase):
         mock_broker.assert_called_once()
 
 
+    @patch("trading_agent.orchestrator.trading_cycle.AlpacaMarketDataProvider")
+    @patch("trading_agent.orchestrator.trading_cycle.build_broker_client")
+    @patch("trading_agent.orchestrator.trading_cycle.build_llm_client")
+    def test_components_reused_until_inputs_change(self, mock_llm, mock_broker, mock_market):
+        cycle = TradingCycle()
+        self.assertEqual(
+            cycle.initialize_components(),
+            ["llm_client", "market_data_provider", "broker_client", "agent"],
+        )
+        agent = cycle.agent
+        self.assertEqual(cycle.initialize_components(), [])
+        self.assertIs(cycle.agent, agent)
+
+        prefs_path = self.data_dir / "preferences.json"
+        prefs = json.loads(prefs_path.read_text(encoding="utf-8"))
+        prefs["risk_tolerance"] = "aggressive"
+        prefs_path.write_text(json.dumps(prefs), encoding="utf-8")
+        self.assertTrue(cycle.refresh_config())
+        self.assertEqual(cycle.initialize_components(), ["agent"])
+        self.assertEqual(cycle.agent.user_preferences.risk_tolerance, "aggressive")
+        mock_llm.assert_called_once()
+        mock_broker.assert_called_once()
+        mock_market.assert_called_once()
+
+    @patch("trading_agent.orchestrator.trading_cycle.AlpacaMarketDataProvider")
+    @patch("trading_agent.orchestrator.trading_cycle.build_broker_client")
+    @patch("trading_agent.orchestrator.trading_cycle.build_llm_client")
+    def test_failed_health_check_reinitializes(self, mock_llm, mock_broker, mock_market):
+        cycle = TradingCycle()
+        self.assertFalse(cycle.health_check()["ok"])
+        cycle.initialize_components()
+        self.assertTrue(cycle.health_check()["ok"])
+
+        cycle.broker_client.get_account.side_effect = ConnectionError("session dropped")
+        cycle._probe_next = True  # the previous cycle did not succeed
+        cycle._prepare_components()
+        self.assertEqual(mock_llm.call_count, 2)
+        self.assertEqual(mock_broker.call_count, 2)
+
+    @patch("trading_agent.orchestrator.trading_cycle.AlpacaMarketDataProvider")
+    @patch("trading_agent.orchestrator.trading_cycle.build_broker_client")
+    @patch("trading_agent.orchestrator.trading_cycle.build_llm_client")
+    def test_warm_cycles_probe_only_when_due(self, mock_llm, mock_broker, mock_market):
+        cycle = TradingCycle()
+        cycle.initialize_components()
+        probe = cycle.broker_client.get_account
+        cycle.agent = MagicMock()
+        cycle.agent.run_trading_cycle.return_value = {"status": "success"}
+
+        cycle.execute()
+        cycle.execute()
+        probe.assert_not_called()
+
+        cycle.agent.run_trading_cycle.return_value = {"status": "failed"}
+        cycle.execute()
+        cycle.agent.run_trading_cycle.return_value = {"status": "success"}
+        cycle.execute()
+        self.assertEqual(probe.call_count, 1)
+
+        cycle._healthy_at -= cycle.config.health_check_interval_minutes * 60
+        cycle.execute()
+        self.assertEqual(probe.call_count, 2)
+        self.assertEqual(mock_broker.call_count, 1)
+
+    @patch("trading_agent.orchestrator.trading_cycle.AlpacaMarketDataProvider")
+    @patch("trading_agent.orchestrator.trading_cycle.build_broker_client")
+    @patch("trading_agent.orchestrator.trading_cycle.build_llm_client")
+    def test_cycle_error_drops_warm_components(self, mock_llm, mock_broker, mock_market):
+        cycle = TradingCycle()
+        cycle.initialize_components()
+        cycle.agent = MagicMock()
+        cycle.agent.run_trading_cycle.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            cycle.execute()
+        self.assertEqual(cycle.initialize_components(), [
+            "llm_client", "market_data_provider", "broker_client", "agent",
+        ])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,251 @@
+"""Span-based cycle timings and optional one-shot profiling.
+
+``CycleCoordinator`` opens one trace per cycle; agents, signal collection,
+analysis, LLM clients and broker clients add nested spans through
+``span()`` / ``traced()``. Both are no-ops when no trace is active, so
+library code can be instrumented unconditionally.
+
+Set ``CYCLE_PROFILE=cprofile`` (or ``pyinstrument``) to capture a profile of
+the next cycle into ``CYCLE_PROFILE_DIR`` (default ``logs/``).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV = "CYCLE_PROFILE"
+PROFILE_DIR_ENV = "CYCLE_PROFILE_DIR"
+PROFILE_MODES = ("cprofile", "pyinstrument")
+
+_active: contextvars.ContextVar[Optional[Tuple["Tracer", "Span"]]] = contextvars.ContextVar(
+    "trading_agent_active_span", default=None
+)
+_profile_lock = threading.Lock()
+_profile_captured = False
+
+
+@dataclass
+class Span:
+    name: str
+    start: float
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    children: List["Span"] = field(default_factory=list)
+    end: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000.0
+
+    def to_dict(self, origin: Optional[float] = None) -> Dict[str, Any]:
+        origin = self.start if origin is None else origin
+        payload: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000.0, 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+        if self.attrs:
+            payload["attrs"] = dict(self.attrs)
+        if self.error:
+            payload["error"] = self.error
+        if self.end is None:
+            payload["open"] = True
+        if self.children:
+            payload["children"] = [c.to_dict(origin) for c in list(self.children)]
+        return payload
+
+
+class Tracer:
+    """Collect a tree of timed spans under one root (one trading cycle)."""
+
+    def __init__(self, name: str = "cycle", **attrs: Any):
+        self.root = Span(name=name, start=time.perf_counter(), attrs=dict(attrs))
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attrs: Any) -> Iterator[Span]:
+        if parent is None:
+            active = _active.get()
+            parent = active[1] if active and active[0] is self else self.root
+        node = Span(name=name, start=time.perf_counter(), attrs=dict(attrs))
+        with self._lock:
+            parent.children.append(node)
+        token = _active.set((self, node))
+        try:
+            yield node
+        except BaseException as exc:
+            node.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            node.end = time.perf_counter()
+            _active.reset(token)
+
+    def finish(self) -> None:
+        if self.root.end is None:
+            self.root.end = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return self.root.to_dict()
+
+
+def current_tracer() -> Optional[Tracer]:
+    active = _active.get()
+    return active[0] if active else None
+
+
+@contextmanager
+def start_trace(name: str = "cycle", **attrs: Any) -> Iterator[Tracer]:
+    """Open a root trace and make it current for nested ``span()`` calls."""
+    tracer = Tracer(name, **attrs)
+    token = _active.set((tracer, tracer.root))
+    try:
+        yield tracer
+    finally:
+        tracer.finish()
+        _active.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Optional[Span]]:
+    """Time a block under the active trace; no-op outside a trace."""
+    active = _active.get()
+    if active is None:
+        yield None
+        return
+    tracer, parent = active
+    with tracer.span(name, parent=parent, **attrs) as node:
+        yield node
+
+
+def annotate(**attrs: Any) -> None:
+    """Add attributes (e.g. LLM token usage) to the innermost active span; no-op outside a trace."""
+    active = _active.get()
+    if active is None:
+        return
+    active[1].attrs.update({k: v for k, v in attrs.items() if v is not None})
+
+
+def traced(name: str, **attrs: Any) -> Callable:
+    """Decorator form of ``span()`` for client methods."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active.get() is None:
+                return func(*args, **kwargs)
+            with span(name, **attrs):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def stage_totals(timings: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """Top-level stage durations (ms) from a serialized trace."""
+    totals: Dict[str, float] = {}
+    for child in (timings or {}).get("children") or []:
+        name = str(child.get("name"))
+        totals[name] = round(totals.get(name, 0.0) + float(child.get("duration_ms") or 0.0), 3)
+    return totals
+
+
+def format_stage_totals(timings: Optional[Dict[str, Any]]) -> str:
+    totals = stage_totals(timings)
+    parts = [f"{name}={ms / 1000.0:.2f}s" for name, ms in totals.items()]
+    if timings and timings.get("duration_ms") is not None:
+        parts.append(f"total={float(timings['duration_ms']) / 1000.0:.2f}s")
+    return ", ".join(parts)
+
+
+def requested_profile_mode() -> Optional[str]:
+    mode = os.getenv(PROFILE_ENV, "").strip().lower()
+    if not mode or mode in ("0", "false", "off", "none"):
+        return None
+    if mode in ("1", "true", "yes"):
+        return "cprofile"
+    if mode not in PROFILE_MODES:
+        logger.warning("Unknown %s=%r; expected one of %s", PROFILE_ENV, mode, PROFILE_MODES)
+        return None
+    return mode
+
+
+def _claim_profile_slot() -> bool:
+    global _profile_captured
+    with _profile_lock:
+        if _profile_captured:
+            return False
+        _profile_captured = True
+        return True
+
+
+def reset_profile_capture() -> None:
+    """Allow another one-shot capture (tests / long-running service re-arm)."""
+    global _profile_captured
+    with _profile_lock:
+        _profile_captured = False
+
+
+@contextmanager
+def maybe_profile(label: str) -> Iterator[Dict[str, Any]]:
+    """Profile the wrapped block once per process when ``CYCLE_PROFILE`` is set.
+
+    Yields a dict that receives ``path`` once the profile has been written.
+    """
+    info: Dict[str, Any] = {}
+    mode = requested_profile_mode()
+    if mode is None or not _claim_profile_slot():
+        yield info
+        return
+
+    out_dir = Path(os.getenv(PROFILE_DIR_ENV) or "logs")
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_label = "".join(c if c.isalnum() or c in "-_" else "_" for c in label)[:16] or "cycle"
+
+    profiler = None
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+
+            profiler = Profiler()
+        except ImportError:
+            logger.warning("pyinstrument not installed; falling back to cProfile")
+            mode = "cprofile"
+    if profiler is None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+    profiler.start() if mode == "pyinstrument" else profiler.enable()
+    try:
+        yield info
+    finally:
+        try:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            if mode == "pyinstrument":
+                profiler.stop()
+                path = out_dir / f"profile_{stamp}_{safe_label}.html"
+                path.write_text(profiler.output_html(), encoding="utf-8")
+            else:
+                profiler.disable()
+                path = out_dir / f"profile_{stamp}_{safe_label}.prof"
+                profiler.dump_stats(str(path))
+            info["path"] = str(path)
+            info["mode"] = mode
+            logger.info("Cycle profile (%s) written to %s", mode, path)
+        except OSError as exc:
+            logger.warning("Could not write cycle profile: %s", exc)
@@ -1,5 +1,6 @@
 import logging
-from trading_agent.scheduler.scheduler import TradingScheduler
+import os
+from trading_agent.scheduler import MarketCalendar, TradingScheduler
 from trading_agent.orchestrator.trading_cycle import TradingCycle
 from trading_agent.config import get_config
 
@@ -22,11 +23,24 @@ def main():
     
     try:
         # Deploy path is live-only (LiveAgentRun via TradingCycle); never backtest.
-        trading_cycle = TradingCycle()
-        scheduler = TradingScheduler(interval_minutes=config.trading_cycle_interval)
+        accounts_dir = os.getenv("TRADING_ACCOUNTS_DIR")
+        if accounts_dir:
+            from trading_agent.orchestrator.multi_account import MultiAccountCycle
+
+            trading_cycle = MultiAccountCycle(accounts_dir, config=config)
+            logger.info("Multi-account mode: %s", ", ".join(trading_cycle.cycles) or "no accounts")
+        else:
+            trading_cycle = TradingCycle()
+        calendar = MarketCalendar.from_cache() if config.market_hours_only else None
+        scheduler = TradingScheduler(
+            interval_minutes=config.trading_cycle_interval,
+            calendar=calendar,
+            open_offset_minutes=config.cycle_open_offset_minutes,
+        )
         logger.info(
-            "Starting trading service (live mode, interval=%d min, llm=%s)...",
+            "Starting trading service (live mode, interval=%d min, market hours only=%s, llm=%s)...",
             config.trading_cycle_interval,
+            config.market_hours_only,
             config.llm_provider,
         )
         scheduler.start(trading_cycle.execute)